@@ -0,0 +1,181 @@
+"""
+Boundary index - one (tenant, hierarchyType) boundary tree held in memory
+
+Built from the nested tree boundary-relationships/_search returns (see
+APIUploader.search_boundary_tree / APIUploader.boundary_index), so
+questions about the hierarchy are answered without more calls:
+
+    index = uploader.boundary_index("pg.citya", "ADMIN")
+    "W1" in index                        # known boundary?
+    index.parent("W1"), index.depth("W1")
+    index.path("W1")                     # ('CITYA', 'ZONE1', 'W1')
+    index.is_within("W1", "CITYA")       # ancestor check
+    index.descendants("ZONE1")           # whole subtree, preorder
+    index.codes_of_type("Ward")
+
+Nodes are stored in preorder with their subtree size, so a subtree is a
+contiguous slice of that order.
+
+An uploader keeps its indexes in a BoundaryIndexes, shared with its forks
+and worker threads; threads that ask for a tree nobody holds yet wait for
+one fetch instead of each fetching the whole tree.
+"""
+
+import threading
+from typing import Callable, Dict, List, Optional
+
+
+class BoundaryIndex:
+    """code -> node, parent, depth, subtree size and root path for one tree"""
+
+    def __init__(self, tenant_id: str, hierarchy_type: str, roots: List[Dict] = None):
+        """
+        Args:
+            tenant_id: Tenant the tree belongs to
+            hierarchy_type: Hierarchy type (e.g. ADMIN)
+            roots: Root nodes as returned by boundary-relationships/_search
+                with includeChildren ({code, boundaryType, children})
+        """
+        self.tenant_id = tenant_id
+        self.hierarchy_type = hierarchy_type
+        self.order = []      # codes in preorder
+        self._nodes = {}     # code -> {code, boundaryType, parent, depth, size, position, path}
+        self._by_type = {}   # boundaryType -> [codes]
+
+        # Iterative DFS; (node, parent path) pairs, children pushed in reverse
+        # so preorder keeps the service's sibling order
+        stack = [(node, ()) for node in reversed(roots or [])]
+        while stack:
+            node, parent_path = stack.pop()
+            code = node.get('code')
+            if not code or code in self._nodes:
+                continue
+            path = parent_path + (code,)
+            self._nodes[code] = {
+                'code': code,
+                'boundaryType': node.get('boundaryType'),
+                'parent': parent_path[-1] if parent_path else None,
+                'depth': len(parent_path),
+                'size': 1,
+                'position': len(self.order),
+                'path': path,
+            }
+            self.order.append(code)
+            self._by_type.setdefault(node.get('boundaryType'), []).append(code)
+            for child in reversed(node.get('children') or []):
+                stack.append((child, path))
+
+        # Every node counts itself once for each ancestor on its path
+        for code in self.order:
+            for ancestor in self._nodes[code]['path'][:-1]:
+                self._nodes[ancestor]['size'] += 1
+
+    def __contains__(self, code) -> bool:
+        return code in self._nodes
+
+    def __len__(self) -> int:
+        return len(self.order)
+
+    def __iter__(self):
+        return iter(self.order)
+
+    def get(self, code: str) -> Optional[Dict]:
+        """Node dict for a code, or None"""
+        return self._nodes.get(code)
+
+    @property
+    def roots(self) -> List[str]:
+        return [code for code in self.order if self._nodes[code]['parent'] is None]
+
+    def parent(self, code: str) -> Optional[str]:
+        return self._nodes[code]['parent']
+
+    def depth(self, code: str) -> int:
+        """0 for roots"""
+        return self._nodes[code]['depth']
+
+    def boundary_type(self, code: str) -> Optional[str]:
+        return self._nodes[code]['boundaryType']
+
+    def subtree_size(self, code: str) -> int:
+        """Number of boundaries under code, itself included"""
+        return self._nodes[code]['size']
+
+    def path(self, code: str) -> tuple:
+        """Codes from the root down to code"""
+        return self._nodes[code]['path']
+
+    def ancestors(self, code: str) -> tuple:
+        """Codes from the parent up to the root"""
+        return self._nodes[code]['path'][-2::-1]
+
+    def is_within(self, code: str, ancestor: str) -> bool:
+        """True if ancestor is code or lies on its path to the root"""
+        node = self._nodes.get(code)
+        other = self._nodes.get(ancestor)
+        if node is None or other is None:
+            return False
+        return node['path'][other['depth']:other['depth'] + 1] == (ancestor,)
+
+    def descendants(self, code: str) -> List[str]:
+        """Boundaries below code, preorder"""
+        node = self._nodes[code]
+        return self.order[node['position'] + 1:node['position'] + node['size']]
+
+    def children(self, code: str) -> List[str]:
+        depth = self._nodes[code]['depth'] + 1
+        return [c for c in self.descendants(code) if self._nodes[c]['depth'] == depth]
+
+    def codes_of_type(self, boundary_type: str) -> List[str]:
+        return list(self._by_type.get(boundary_type, []))
+
+    def boundary_types(self) -> List[str]:
+        """Boundary types in the order they first appear (top level first)"""
+        return sorted(self._by_type, key=lambda t: self._nodes[self._by_type[t][0]]['depth'])
+
+
+class BoundaryIndexes:
+    """(tenant, hierarchyType) -> BoundaryIndex, built at most once at a time
+
+    Concurrent lookups of the same tree wait for a single build, like
+    multi_tenant.ReferenceCache.get. A tree discarded while it is being
+    built is handed to the callers waiting on it but not kept.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entries = {}
+        self._inflight = {}
+        self._discarded = set()
+
+    def get(self, key, build: Callable[[], BoundaryIndex], refresh: bool = False) -> BoundaryIndex:
+        """Held index for key, else build() it (refresh: build even if held)"""
+        while True:
+            with self._lock:
+                if key in self._entries and not refresh:
+                    return self._entries[key]
+                waiter = self._inflight.get(key)
+                if waiter is None:
+                    waiter = self._inflight[key] = threading.Event()
+                    self._discarded.discard(key)
+                    break
+            waiter.wait()
+            refresh = False  # the build we waited for is fresh
+
+        try:
+            index = build()
+            with self._lock:
+                if key not in self._discarded:
+                    self._entries[key] = index
+            return index
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+            waiter.set()
+
+    def discard(self, key):
+        """Forget a tree (it changed); an in-flight build of it is not kept"""
+        with self._lock:
+            self._entries.pop(key, None)
+            if key in self._inflight:
+                self._discarded.add(key)
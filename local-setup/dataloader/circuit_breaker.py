@@ -0,0 +1,191 @@
+"""
+Circuit breakers - stop calling a gateway service that is down
+
+Without them, every row of a load against a dead backend waits out three
+timeouts with backoff in APIUploader._request_with_retry, and a 10k-row
+sheet takes hours to fail. APIUploader keeps one CircuitBreaker per service
+(the first path segment, e.g. egov-hrms, boundary-service):
+
+    closed     requests go through; FAILURE_THRESHOLD consecutive failures
+               (connection errors, timeouts, 502/503/504) open the circuit
+    open       requests fail at once with ServiceUnavailable, no network
+               call; after RESET_TIMEOUT seconds the circuit goes half-open
+    half-open  one probe request is let through, the rest keep failing
+               fast; a success closes the circuit, a failure reopens it
+
+APIUploader._request_with_retry sends its attempts inside retried_request(),
+so a request that is retried counts once: the breaker is checked before the
+first attempt and told the outcome of the last one. One slow row does not
+use up the failure threshold by itself.
+
+ServiceUnavailable is a requests RequestException, so callers that already
+turn request errors into a FAILED row report "SERVICE_UNAVAILABLE: ..." for
+the remaining rows. Other services are unaffected. Forked uploaders
+(CRSLoader.fork, multi-tenant runs) share the breakers.
+"""
+
+import contextlib
+import threading
+import time
+
+import requests
+
+try:
+    from .http_metrics import split_endpoint
+except (ImportError, ModuleNotFoundError):
+    from http_metrics import split_endpoint
+
+FAILURE_THRESHOLD = 5
+RESET_TIMEOUT = 30.0
+
+# Gateway answers meaning the backend behind it is not there
+UNAVAILABLE_STATUSES = frozenset({502, 503, 504})
+
+CLOSED, OPEN, HALF_OPEN = "closed", "open", "half-open"
+SUCCESS, FAILURE = "success", "failure"
+
+# breaker -> outcome of the latest attempt, while inside retried_request()
+_retry_scope = threading.local()
+
+
+class ServiceUnavailable(requests.exceptions.RequestException):
+    """Raised instead of sending a request to a service whose circuit is open"""
+
+    def __init__(self, service: str, failures: int, retry_in: float):
+        self.service = service
+        self.failures = failures
+        self.retry_in = retry_in
+        super().__init__(f"SERVICE_UNAVAILABLE: {service} failed {failures} times in a row; "
+                         f"not calling it for another {retry_in:.0f}s")
+
+
+class CircuitBreaker:
+    """Closed / open / half-open state of one service"""
+
+    def __init__(self, service: str, failure_threshold: int = FAILURE_THRESHOLD,
+                 reset_timeout: float = RESET_TIMEOUT, clock=time.monotonic):
+        self.service = service
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = CLOSED
+        self.failures = 0
+        self.rejected = 0
+        self._clock = clock
+        self._opened_at = 0.0
+        self._probing = False
+        self._lock = threading.Lock()
+
+    def before_request(self):
+        """Raise ServiceUnavailable unless a request may be sent now"""
+        with self._lock:
+            if self.state == CLOSED:
+                return
+            waited = self._clock() - self._opened_at
+            if self.state == OPEN and waited >= self.reset_timeout:
+                self.state = HALF_OPEN
+                print(f"   🔌 {self.service}: probing after {waited:.0f}s")
+            if self.state == HALF_OPEN and not self._probing:
+                self._probing = True
+                return
+            self.rejected += 1
+            raise ServiceUnavailable(self.service, self.failures,
+                                     max(0.0, self.reset_timeout - waited))
+
+    def record_success(self):
+        with self._lock:
+            if self.state != CLOSED:
+                print(f"   🔌 {self.service}: recovered, resuming "
+                      f"({self.rejected} request(s) failed fast while it was down)")
+            self.state = CLOSED
+            self.failures = 0
+            self.rejected = 0
+            self._probing = False
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            if self.state == HALF_OPEN or (self.state == CLOSED and self.failures >= self.failure_threshold):
+                if self.state == CLOSED:
+                    print(f"   🔌 {self.service}: {self.failures} failures in a row, "
+                          f"failing its requests fast for {self.reset_timeout:.0f}s")
+                self.state = OPEN
+                self._opened_at = self._clock()
+            self._probing = False
+
+    def release(self):
+        """The request ended without telling anything about the service"""
+        with self._lock:
+            self._probing = False
+
+
+class CircuitBreakers:
+    """One CircuitBreaker per gateway service, created on first use"""
+
+    def __init__(self, failure_threshold: int = FAILURE_THRESHOLD,
+                 reset_timeout: float = RESET_TIMEOUT, clock=time.monotonic):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._clock = clock
+        self._breakers = {}
+        self._lock = threading.Lock()
+
+    def for_url(self, url: str) -> CircuitBreaker:
+        service = split_endpoint(url)[0]
+        with self._lock:
+            breaker = self._breakers.get(service)
+            if breaker is None:
+                breaker = self._breakers[service] = CircuitBreaker(
+                    service, self.failure_threshold, self.reset_timeout, self._clock)
+        return breaker
+
+    def states(self) -> dict:
+        """service -> state, for services that have been called"""
+        with self._lock:
+            return {service: breaker.state for service, breaker in self._breakers.items()}
+
+
+@contextlib.contextmanager
+def retried_request():
+    """Count every attempt sent inside the block as one request
+
+    Nested blocks belong to the outermost one.
+    """
+    if getattr(_retry_scope, "attempts", None) is not None:
+        yield
+        return
+    attempts = _retry_scope.attempts = {}
+    try:
+        yield
+    finally:
+        _retry_scope.attempts = None
+        for breaker, outcome in attempts.items():
+            if outcome == FAILURE:
+                breaker.record_failure()
+            elif outcome == SUCCESS:
+                breaker.record_success()
+            else:
+                breaker.release()
+
+
+def admit(breaker: CircuitBreaker):
+    """breaker.before_request(), only for the first attempt of a retried request"""
+    attempts = getattr(_retry_scope, "attempts", None)
+    if attempts is None:
+        breaker.before_request()
+    elif breaker not in attempts:
+        breaker.before_request()
+        attempts[breaker] = None
+
+
+def report(breaker: CircuitBreaker, outcome: str = None):
+    """Tell the breaker how an attempt went (SUCCESS, FAILURE, or None for
+    nothing learned), or keep it for the end of retried_request()"""
+    attempts = getattr(_retry_scope, "attempts", None)
+    if attempts is not None:
+        attempts[breaker] = outcome
+    elif outcome == FAILURE:
+        breaker.record_failure()
+    elif outcome == SUCCESS:
+        breaker.record_success()
+    else:
+        breaker.release()
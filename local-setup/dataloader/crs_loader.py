@@ -12,14 +12,53 @@ Usage:
     loader.load_boundaries("Boundary Master.xlsx")
     loader.load_common_masters("Common and Complaint Master.xlsx")
     loader.load_employees("Employee Master.xlsx")
+
+    # or all at once, independent phases in parallel
+    loader.onboard({"tenant": "Tenant And Branding Master.xlsx", ...})
 """
 
 try:
     from .unified_loader import UnifiedExcelReader, APIUploader
 except (ImportError, ModuleNotFoundError):
     from unified_loader import UnifiedExcelReader, APIUploader
+try:
+    from .http_metrics import HttpMetrics
+except (ImportError, ModuleNotFoundError):
+    from http_metrics import HttpMetrics
+try:
+    from .profiling import profile_phase
+except (ImportError, ModuleNotFoundError):
+    from profiling import profile_phase
+try:
+    from .progress import Progress, make_progress
+except (ImportError, ModuleNotFoundError):
+    from progress import Progress, make_progress
+try:
+    from .phase_dag import PhaseScheduler
+except (ImportError, ModuleNotFoundError):
+    from phase_dag import PhaseScheduler
+try:
+    from .localization_index import load_bundled_index
+except (ImportError, ModuleNotFoundError):
+    from localization_index import load_bundled_index
+try:
+    from .workflow_diff import (diff_workflows, instantiate, load_workflow_template,
+                                update_payload, workflow_hash)
+except (ImportError, ModuleNotFoundError):
+    from workflow_diff import (diff_workflows, instantiate, load_workflow_template,
+                               update_payload, workflow_hash)
+try:
+    from .payload_bundle import (bundle_path, write_bundle, read_bundle_header, reference_digest,
+                                 is_bundle_current, iter_bundle_records, group_records)
+except (ImportError, ModuleNotFoundError):
+    from payload_bundle import (bundle_path, write_bundle, read_bundle_header, reference_digest,
+                                is_bundle_current, iter_bundle_records, group_records)
 from typing import Optional, Dict
+import copy
+from concurrent.futures import ThreadPoolExecutor
 from copy import deepcopy
+from itertools import chain
+import functools
 import os
 import json
 import requests
@@ -34,24 +73,88 @@ except Exception:
     except Exception:
         def _send_telemetry(*a, **kw): pass
 
+# Per-phase HTTP metrics dump: DATALOADER_METRICS=json|prometheus writes
+# <phase>.metrics.json / <phase>.metrics.prom into DATALOADER_METRICS_DIR
+METRICS_FORMAT = os.environ.get('DATALOADER_METRICS', '').lower()
+METRICS_DIR = os.environ.get('DATALOADER_METRICS_DIR', '.')
+
+# Per-phase cProfile + tracemalloc reports (see profiling.py):
+# DATALOADER_PROFILE=1, written next to the workbook or into DATALOADER_PROFILE_DIR
+PROFILE = os.environ.get('DATALOADER_PROFILE', '').lower() in ('1', 'true', 'yes')
+PROFILE_DIR = os.environ.get('DATALOADER_PROFILE_DIR')
+
+# Per-record progress reporting (see progress.py): verbose (default), summary,
+# bar, quiet or jsonl:<path>, comma-separated
+PROGRESS = os.environ.get('DATALOADER_PROGRESS', '')
+
+
+def _phase(name: str):
+    """Mark a CRSLoader method as a loader phase
+
+    The phase gets its own HttpMetrics on the uploader; it is kept in
+    loader.phase_metrics[name] and dumped when metrics output is enabled.
+    With profiling on, the phase also runs under profile_phase(). Start and
+    end (with timing and record counts) are reported to loader.progress.
+    """
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            if self.uploader is None:
+                return method(self, *args, **kwargs)
+            self.uploader.metrics = HttpMetrics()
+            self.progress.phase_start(name)
+            try:
+                if not self.profile:
+                    return method(self, *args, **kwargs)
+                workbook = args[0] if args else next(iter(kwargs.values()), None)
+                with profile_phase(name, workbook if isinstance(workbook, str) else None,
+                                   self.profile_dir):
+                    return method(self, *args, **kwargs)
+            finally:
+                self.progress.phase_end()
+                self._finish_phase_metrics(name)
+        return wrapper
+    return decorator
+
+
 # kubectl API server URL (for environments without kubectl access)
 KUBECTL_API_URL = os.environ.get('KUBECTL_API_URL', 'http://localhost:8765')
 KUBECTL_API_KEY = os.environ.get('KUBECTL_API_KEY', 'dev-only-key')
 
+# Tenants with more boundaries than this are deleted with one SQL transaction
+# (kubectl / kubectl API server) instead of one boundary-service call each
+BOUNDARY_BULK_DELETE_THRESHOLD = int(os.environ.get('BOUNDARY_BULK_DELETE_THRESHOLD', '2000'))
+
 
 class CRSLoader:
     """Simple wrapper for CRS Data Loading operations"""
 
-    def __init__(self, base_url: str):
+    def __init__(self, base_url: str, metrics_format: str = None, metrics_dir: str = None,
+                 profile: bool = None, profile_dir: str = None, progress=None):
         """Initialize CRS Loader with DIGIT environment URL
 
         Args:
             base_url: DIGIT gateway URL (e.g., "https://unified-dev.digit.org")
+            metrics_format: 'json' or 'prometheus' to write HTTP metrics after
+                each phase (default: $DATALOADER_METRICS, off if unset)
+            metrics_dir: Where metrics files go (default: $DATALOADER_METRICS_DIR or '.')
+            profile: Write cProfile/tracemalloc reports for each phase
+                (default: $DATALOADER_PROFILE)
+            profile_dir: Where profile reports go (default: next to the
+                phase's workbook, or $DATALOADER_PROFILE_DIR)
+            progress: Progress instance, list of sinks or spec such as
+                "bar,jsonl:events.jsonl" (default: $DATALOADER_PROGRESS, verbose)
         """
         self.base_url = base_url.rstrip('/')
         self.uploader: Optional[APIUploader] = None
         self.tenant_id: Optional[str] = None
         self._authenticated = False
+        self.metrics_format = (metrics_format or METRICS_FORMAT or None)
+        self.metrics_dir = metrics_dir or METRICS_DIR
+        self.phase_metrics: Dict[str, HttpMetrics] = {}
+        self.profile = PROFILE if profile is None else profile
+        self.profile_dir = profile_dir or PROFILE_DIR
+        self.progress: Progress = make_progress(progress or PROGRESS)
 
     def login(self, username: str = None, password: str = None,
               tenant_id: str = "pg", user_type: str = "EMPLOYEE") -> bool:
@@ -83,6 +186,7 @@ class CRSLoader:
                 user_type=user_type,
                 tenant_id=tenant_id
             )
+            self.uploader.progress = self.progress
             self._authenticated = self.uploader.authenticated
             return self._authenticated
         except Exception as e:
@@ -94,6 +198,49 @@ class CRSLoader:
         if not self._authenticated or not self.uploader:
             raise RuntimeError("Not authenticated. Call login() first.")
 
+    def fork(self, progress=None, metrics_dir: str = None) -> 'CRSLoader':
+        """A second loader on this one's login, with its own metrics and progress
+
+        Lets phases for several tenants run at once on one token (see
+        multi_tenant.py). The uploader is a shallow copy, so the limiter and
+        reference cache attached to it are shared. Profiling is off in forks
+        since tracemalloc is process-wide.
+
+        Args:
+            progress: Progress spec or instance for the fork (default: verbose)
+            metrics_dir: Where the fork writes phase metrics (default: this loader's)
+        """
+        self._check_auth()
+        clone = CRSLoader(self.base_url, metrics_format=self.metrics_format,
+                          metrics_dir=metrics_dir or self.metrics_dir,
+                          profile=False, progress=progress)
+        clone.tenant_id = self.tenant_id
+        clone.uploader = copy.copy(self.uploader)
+        clone.uploader.metrics = HttpMetrics()
+        clone.uploader.progress = clone.progress
+        clone._authenticated = True
+        return clone
+
+    @property
+    def metrics(self) -> Optional[HttpMetrics]:
+        """HTTP metrics of the current (or last) phase"""
+        return self.uploader.metrics if self.uploader else None
+
+    def _finish_phase_metrics(self, phase: str):
+        """Keep the phase's metrics and write them out if enabled"""
+        metrics = self.uploader.metrics
+        self.phase_metrics[phase] = metrics
+        if not self.metrics_format:
+            return
+
+        ext = 'prom' if self.metrics_format in ('prom', 'prometheus') else 'json'
+        os.makedirs(self.metrics_dir, exist_ok=True)
+        path = metrics.write(os.path.join(self.metrics_dir, f"{phase}.metrics.{ext}"))
+        print(f"\n📊 HTTP metrics ({phase}):")
+        for line in metrics.summary_lines():
+            print(f"   {line}")
+        print(f"   Written: {path}")
+
     @property
     def auth_token(self) -> str:
         """Get current auth token"""
@@ -238,7 +385,7 @@ class CRSLoader:
             }
         }
 
-        resp = requests.post(create_url, json=create_payload, headers={"Content-Type": "application/json"}, timeout=REQUEST_TIMEOUT)
+        resp = self.uploader._post(create_url, json=create_payload, headers={"Content-Type": "application/json"}, timeout=REQUEST_TIMEOUT)
 
         if resp.ok:
             print(f"✅ Tenant '{tenant_code}' created successfully!")
@@ -293,7 +440,8 @@ class CRSLoader:
                 print(f"   Response: {resp.text[:200]}")
             return False
 
-    def _bootstrap_tenant_root(self, target_root: str, source_tenant: str = "pg") -> bool:
+    def _bootstrap_tenant_root(self, target_root: str, source_tenant: str = "pg",
+                               workers: int = 8) -> bool:
         """Bootstrap a new tenant root by copying schemas and essential data from an existing root.
 
         When creating a tenant like "ethiopia.kenya", the "ethiopia" root needs all
@@ -305,6 +453,7 @@ class CRSLoader:
         Args:
             target_root: New root tenant to bootstrap (e.g., "ethiopia")
             source_tenant: Existing root to copy from (default: "pg")
+            workers: Concurrent schema/record creates
 
         Returns:
             bool: True if bootstrap succeeded
@@ -312,59 +461,15 @@ class CRSLoader:
         print(f"\n🔧 Bootstrapping new tenant root '{target_root}' from '{source_tenant}'...")
 
         # Step 1: Copy all schema definitions from source to target
-        schema_search_url = f"{self.base_url}/mdms-v2/schema/v1/_search"
-        schema_create_url = f"{self.base_url}/mdms-v2/schema/v1/_create"
-
-        search_payload = {
-            "RequestInfo": {
-                "apiId": "Rainmaker",
-                "authToken": self.auth_token,
-                "userInfo": self.user_info
-            },
-            "SchemaDefCriteria": {
-                "tenantId": source_tenant,
-                "limit": 500,
-                "offset": 0
-            }
-        }
-
-        resp = requests.post(schema_search_url, json=search_payload,
-                             headers={"Content-Type": "application/json"}, timeout=REQUEST_TIMEOUT)
-        if not resp.ok:
-            print(f"   ❌ Failed to fetch schemas from '{source_tenant}': {resp.status_code}")
+        try:
+            schemas = self.uploader.search_schema_definitions(source_tenant)
+        except Exception as e:
+            print(f"   ❌ Failed to fetch schemas from '{source_tenant}': {str(e)[:100]}")
             return False
 
-        schemas = resp.json().get("SchemaDefinitions", [])
-        copied = 0
-        skipped = 0
-        failed = 0
-
-        for schema in schemas:
-            code = schema.get("code", "")
-            create_payload = {
-                "RequestInfo": {
-                    "apiId": "Rainmaker",
-                    "authToken": self.auth_token,
-                    "userInfo": self.user_info
-                },
-                "SchemaDefinition": {
-                    "tenantId": target_root,
-                    "code": code,
-                    "description": schema.get("description", code),
-                    "definition": schema.get("definition", {})
-                }
-            }
-            try:
-                r = requests.post(schema_create_url, json=create_payload,
-                                  headers={"Content-Type": "application/json"}, timeout=REQUEST_TIMEOUT)
-                if r.ok:
-                    copied += 1
-                elif any(kw in r.text.lower() for kw in ["duplicate", "already exists", "unique"]):
-                    skipped += 1
-                else:
-                    failed += 1
-            except Exception:
-                failed += 1
+        # Only the schemas the target lacks are created, concurrently
+        outcome = self.uploader.create_schema_definitions(schemas, target_root, workers=workers)
+        copied, skipped, failed = outcome['created'], outcome['exists'], outcome['failed']
 
         print(f"   📋 Schemas: {copied} copied, {skipped} already existed, {failed} failed (of {len(schemas)} total)")
 
@@ -374,8 +479,9 @@ class CRSLoader:
         # Wait for Kafka-based schema persistence before creating data.
         # Without this, create_mdms_data fails with "Schema definition not found".
         # 5 seconds needed — 3 is sometimes not enough under load.
-        import time as _time
-        _time.sleep(5)
+        if copied:
+            import time as _time
+            _time.sleep(5)
 
         # Step 2: Create root self-record (required by idgen for city code resolution)
         root_data = {
@@ -420,23 +526,21 @@ class CRSLoader:
             'INBOX.InboxQueryConfiguration',
         ]
 
+        # Source reads are independent, so fetch them together; creates stay in
+        # list order since later masters reference earlier ones
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="seed") as pool:
+            source_records = list(pool.map(
+                lambda code: self.uploader.search_mdms_data_all(schema_code=code, tenant=source_tenant),
+                essential_schemas))
+
         data_copied = 0
         data_skipped = 0
-        for schema_code in essential_schemas:
-            records = self.uploader.search_mdms_data_all(
-                schema_code=schema_code, tenant=source_tenant
-            )
+        for schema_code, records in zip(essential_schemas, source_records):
             if not records:
                 continue
 
-            # Strip internal fields before copying
-            clean_records = []
-            for r in records:
-                rec = {k: v for k, v in r.items() if not k.startswith('_')}
-                clean_records.append(rec)
-
-            result = self.uploader.create_mdms_data(
-                schema_code=schema_code, data_list=clean_records, tenant=target_root
+            result = self.uploader.copy_mdms_data(
+                schema_code=schema_code, records=records, tenant=target_root, workers=workers
             )
             data_copied += result.get('created', 0)
             data_skipped += result.get('exists', 0)
@@ -459,7 +563,7 @@ class CRSLoader:
         # Workflow search requires businessServices parameter — search for known PGR services
         known_wf_services = ["PGR"]
         try:
-            wf_resp = requests.post(
+            wf_resp = self.uploader._post(
                 wf_search_url, json=wf_request_info,
                 params={"tenantId": source_tenant, "businessServices": ",".join(known_wf_services)},
                 headers={"Content-Type": "application/json"}, timeout=REQUEST_TIMEOUT)
@@ -471,7 +575,7 @@ class CRSLoader:
 
                     # Check if workflow already exists on target
                     try:
-                        existing_wf = requests.post(
+                        existing_wf = self.uploader._post(
                             wf_search_url, json=wf_request_info,
                             params={"tenantId": target_root, "businessServices": bs_name},
                             headers={"Content-Type": "application/json"}, timeout=REQUEST_TIMEOUT)
@@ -521,7 +625,7 @@ class CRSLoader:
                         "BusinessServices": [bs_copy]
                     }
                     try:
-                        r = requests.post(wf_create_url, json=create_wf,
+                        r = self.uploader._post(wf_create_url, json=create_wf,
                                           headers={"Content-Type": "application/json"}, timeout=REQUEST_TIMEOUT)
                         if r.ok:
                             wf_copied += 1
@@ -624,7 +728,7 @@ class CRSLoader:
             "RequestInfo": {"apiId": "Rainmaker"}
         }
 
-        resp = requests.post(search_url, json=search_payload, headers={"Content-Type": "application/json"}, timeout=REQUEST_TIMEOUT)
+        resp = self.uploader._post(search_url, json=search_payload, headers={"Content-Type": "application/json"}, timeout=REQUEST_TIMEOUT)
         if not resp.ok:
             print(f"   ⚠️  Could not fetch citymodule config for {module_code}")
             return
@@ -733,7 +837,7 @@ class CRSLoader:
 
         existing_roles = set()
         try:
-            resp = requests.post(search_url, json=search_payload, headers={"Content-Type": "application/json"}, timeout=REQUEST_TIMEOUT)
+            resp = self.uploader._post(search_url, json=search_payload, headers={"Content-Type": "application/json"}, timeout=REQUEST_TIMEOUT)
             if resp.ok:
                 roles_data = resp.json().get("MdmsRes", {}).get("ACCESSCONTROL-ROLES", {}).get("roles", [])
                 existing_roles = {r.get("code") for r in roles_data}
@@ -772,7 +876,7 @@ class CRSLoader:
             }
 
             try:
-                resp = requests.post(create_url, json=create_payload, headers={"Content-Type": "application/json"}, timeout=REQUEST_TIMEOUT)
+                resp = self.uploader._post(create_url, json=create_payload, headers={"Content-Type": "application/json"}, timeout=REQUEST_TIMEOUT)
                 if resp.ok:
                     print(f"   ✅ Created role '{role_code}' for tenant '{state_tenant}'")
                 elif "already exists" in resp.text.lower() or "duplicate" in resp.text.lower():
@@ -849,7 +953,7 @@ class CRSLoader:
         }
 
         try:
-            resp = requests.post(create_url, json=user_payload, headers={"Content-Type": "application/json"}, timeout=REQUEST_TIMEOUT)
+            resp = self.uploader._post(create_url, json=user_payload, headers={"Content-Type": "application/json"}, timeout=REQUEST_TIMEOUT)
 
             if resp.ok:
                 result = resp.json()
@@ -872,6 +976,7 @@ class CRSLoader:
         except Exception as e:
             print(f"   ❌ Error creating user '{username}': {str(e)}")
 
+    @_phase('tenant')
     def load_tenant(self, excel_path: str, target_tenant: str = None) -> Dict:
         """Phase 1: Load tenant configuration and branding
 
@@ -975,6 +1080,122 @@ class CRSLoader:
         # Ensure output directory exists
         os.makedirs(output_dir, exist_ok=True)
 
+        if not self._define_hierarchy(name, levels, tenant):
+            return None
+
+        # Step 4: Poll for completion and download
+        print(f"\n[4/4] Waiting for template...")
+        poll_result = self.uploader.poll_boundary_template_status(tenant, name)
+
+        if not poll_result or poll_result.get('status') == 'failed':
+            print(f"   ERROR: Template generation failed")
+            error = poll_result.get('error') if poll_result else 'Unknown error'
+            print(f"   Details: {error}")
+            return None
+
+        filestore_id = poll_result.get('fileStoreid')
+        if not filestore_id:
+            print(f"   ERROR: No filestore ID returned")
+            return None
+
+        # Download template
+        output_path = os.path.join(output_dir, f"Boundary_Template_{tenant}_{name}.xlsx")
+        downloaded_path = self.uploader.download_boundary_template(
+            tenant_id=tenant,
+            filestore_id=filestore_id,
+            hierarchy_type=name,
+            output_path=output_path
+        )
+
+        if downloaded_path:
+            print(f"\n{'─'*40}")
+            print(f"Template downloaded: {downloaded_path}")
+            print(f"{'─'*40}")
+            print(f"\nNext steps:")
+            print(f"1. Open {downloaded_path}")
+            print(f"2. Fill in boundary data (codes and names)")
+            print(f"3. Use loader.load_boundaries() to upload")
+            return downloaded_path
+        else:
+            print(f"   ERROR: Failed to download template")
+            return None
+
+    def load_hierarchies(self, hierarchies: Dict, target_tenant: str = None,
+                         output_dir: str = "upload", workers: int = 4) -> Dict:
+        """Phase 2a for several hierarchies: generate their templates in parallel
+
+        Creates every hierarchy and starts its template generation, then
+        waits for all of them on one poller
+        (APIUploader.wait_for_boundary_templates). Each template is downloaded
+        on a worker thread the moment its generation completes, instead of
+        one hierarchy generating, polling and downloading after another.
+
+        Args:
+            hierarchies: Hierarchy name -> list of level names, top to bottom
+                   (e.g., {"ADMIN": ["State", "District"], "REVENUE": [...]})
+            target_tenant: Target tenant ID
+            output_dir: Directory to save the templates (default: "upload")
+            workers: Concurrent downloads
+
+        Returns:
+            Dict of hierarchy name -> downloaded template path (None if failed)
+
+        Example:
+            templates = loader.load_hierarchies({
+                "ADMIN": ["State", "District", "Ward"],
+                "REVENUE": ["State", "Zone", "Block"],
+            }, target_tenant="statea")
+        """
+        self._check_auth()
+
+        print(f"\n{'='*60}")
+        print(f"PHASE 2a: BOUNDARY HIERARCHIES & TEMPLATES")
+        print(f"{'='*60}")
+
+        tenant = target_tenant or self.tenant_id
+        print(f"Tenant: {tenant}")
+        print(f"Hierarchies: {', '.join(hierarchies)}")
+
+        os.makedirs(output_dir, exist_ok=True)
+
+        results = {name: None for name in hierarchies}
+        generating = []
+        for name, levels in hierarchies.items():
+            print(f"\n--- {name}: {' -> '.join(levels)} ---")
+            if self._define_hierarchy(name, levels, tenant):
+                generating.append(name)
+
+        def download(name, filestore_id):
+            return self.uploader.download_boundary_template(
+                tenant_id=tenant,
+                filestore_id=filestore_id,
+                hierarchy_type=name,
+                output_path=os.path.join(output_dir, f"Boundary_Template_{tenant}_{name}.xlsx")
+            )
+
+        print(f"\n[4/4] Waiting for {len(generating)} template(s)...")
+        downloads = {}
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="template") as pool:
+            def on_complete(job, resource):
+                filestore_id = resource.get('fileStoreid')
+                if resource.get('status') == 'completed' and filestore_id:
+                    downloads[job[1]] = pool.submit(download, job[1], filestore_id)
+
+            self.uploader.wait_for_boundary_templates(
+                [(tenant, name) for name in generating], on_complete=on_complete)
+
+        for name in generating:
+            future = downloads.get(name)
+            results[name] = future.result() if future else None
+
+        print(f"\n{'─'*40}")
+        for name, path in results.items():
+            print(f"{name}: {path or 'FAILED'}")
+        print(f"{'─'*40}")
+        return results
+
+    def _define_hierarchy(self, name: str, levels: list, tenant: str) -> bool:
+        """Steps 1-3 of load_hierarchy: build, create and start template generation"""
         # Step 1: Build hierarchy data structure
         print(f"\n[1/4] Building hierarchy definition...")
         boundary_hierarchy = []
@@ -1007,7 +1228,7 @@ class CRSLoader:
                 print(f"   Hierarchy created successfully")
         except Exception as e:
             print(f"   ERROR: Failed to create hierarchy: {e}")
-            return None
+            return False
 
         # Step 3: Generate template
         print(f"\n[3/4] Generating template...")
@@ -1015,53 +1236,24 @@ class CRSLoader:
 
         if not gen_result:
             print(f"   ERROR: Template generation failed")
-            return None
-
-        # Step 4: Poll for completion and download
-        print(f"\n[4/4] Waiting for template...")
-        poll_result = self.uploader.poll_boundary_template_status(tenant, name)
-
-        if not poll_result or poll_result.get('status') == 'failed':
-            print(f"   ERROR: Template generation failed")
-            error = poll_result.get('error') if poll_result else 'Unknown error'
-            print(f"   Details: {error}")
-            return None
-
-        filestore_id = poll_result.get('fileStoreid')
-        if not filestore_id:
-            print(f"   ERROR: No filestore ID returned")
-            return None
-
-        # Download template
-        output_path = os.path.join(output_dir, f"Boundary_Template_{tenant}_{name}.xlsx")
-        downloaded_path = self.uploader.download_boundary_template(
-            tenant_id=tenant,
-            filestore_id=filestore_id,
-            hierarchy_type=name,
-            output_path=output_path
-        )
+            return False
 
-        if downloaded_path:
-            print(f"\n{'─'*40}")
-            print(f"Template downloaded: {downloaded_path}")
-            print(f"{'─'*40}")
-            print(f"\nNext steps:")
-            print(f"1. Open {downloaded_path}")
-            print(f"2. Fill in boundary data (codes and names)")
-            print(f"3. Use loader.load_boundaries() to upload")
-            return downloaded_path
-        else:
-            print(f"   ERROR: Failed to download template")
-            return None
+        return True
 
+    @_phase('boundaries')
     def load_boundaries(self, excel_path: str, target_tenant: str = None,
-                       hierarchy_type: str = "ADMIN") -> Dict:
+                       hierarchy_type: str = "ADMIN", stream: bool = False,
+                       workers: int = 4) -> Dict:
         """Phase 2: Load boundary hierarchy from Excel
 
         Args:
             excel_path: Path to "Boundary Master.xlsx"
             target_tenant: Target tenant ID
             hierarchy_type: Hierarchy type (default: "ADMIN")
+            stream: Read rows lazily and upload with a worker pool instead of
+                loading the whole sheet first (for state-scale files); rows
+                already in the boundary tree are skipped
+            workers: Upload threads used in streaming mode
 
         Returns:
             dict: Processing result with status
@@ -1076,41 +1268,42 @@ class CRSLoader:
 
         tenant = target_tenant or self.tenant_id
 
-        # 1. Upload Excel to FileStore
-        print(f"\n[1/2] Uploading boundary file...")
-        filestore_id = self.uploader.upload_file_to_filestore(
-            file_path=excel_path,
-            tenant_id=tenant,
-            module="HCM-ADMIN-CONSOLE"
-        )
-
-        if not filestore_id:
-            print("   Failed to upload file")
-            return {'status': 'failed', 'error': 'File upload failed'}
-
-        print(f"   FileStore ID: {filestore_id}")
-
-        # 2. Process boundaries
-        print(f"\n[2/2] Processing boundary data...")
-        result = self.uploader.process_boundary_data(
-            tenant_id=tenant,
-            filestore_id=filestore_id,
-            hierarchy_type=hierarchy_type,
-            action="create",
-            excel_file=excel_path
-        )
+        # Boundaries are created from the local workbook through
+        # boundary-service, so nothing needs the file in filestore
+        print(f"\nProcessing boundary data...")
+        if stream:
+            result = self.uploader.process_boundary_data_streaming(
+                tenant_id=tenant,
+                excel_file=excel_path,
+                hierarchy_type=hierarchy_type,
+                workers=workers,
+                skip_existing=True
+            )
+        else:
+            result = self.uploader.process_boundary_data(
+                tenant_id=tenant,
+                hierarchy_type=hierarchy_type,
+                action="create",
+                excel_file=excel_path
+            )
 
         status = result.get('status', 'unknown')
         print(f"\n   Status: {status}")
 
         return result
 
-    def load_common_masters(self, excel_path: str, target_tenant: str = None) -> Dict:
+    @_phase('common_masters')
+    def load_common_masters(self, excel_path: str, target_tenant: str = None,
+                            defer_localizations: bool = False) -> Dict:
         """Phase 3: Load departments, designations, and complaint types
 
         Args:
             excel_path: Path to "Common and Complaint Master.xlsx"
             target_tenant: Target tenant ID
+            defer_localizations: Don't upload the department/designation/
+                complaint type labels; return them in
+                results['pending_localizations'] for load_master_localizations()
+                (lets onboard() upload them alongside later phases)
 
         Returns:
             dict: Summary of operations for each master type
@@ -1126,6 +1319,13 @@ class CRSLoader:
         tenant = target_tenant or self.tenant_id
         reader = UnifiedExcelReader(excel_path)
         results = {'departments': None, 'designations': None, 'complaint_types': None}
+        pending = []
+
+        def upload_labels(messages):
+            if defer_localizations:
+                pending.extend(messages)
+            else:
+                self.uploader.create_localization_messages(messages, tenant)
 
         # 1. Load departments and designations
         print(f"\n[1/2] Loading departments & designations...")
@@ -1145,7 +1345,7 @@ class CRSLoader:
 
             # Department localizations
             if dept_loc:
-                self.uploader.create_localization_messages(dept_loc, tenant)
+                upload_labels(dept_loc)
 
         # Upload designations
         if desig_data:
@@ -1160,7 +1360,7 @@ class CRSLoader:
 
             # Designation localizations
             if desig_loc:
-                self.uploader.create_localization_messages(desig_loc, tenant)
+                upload_labels(desig_loc)
 
         # Re-fetch to show accurate after-counts
         after_desigs = self.uploader.fetch_designations(tenant)
@@ -1195,11 +1395,31 @@ class CRSLoader:
 
             # Complaint type localizations
             if complaint_loc:
-                self.uploader.create_localization_messages(complaint_loc, tenant)
+                upload_labels(complaint_loc)
 
+        if defer_localizations:
+            results['pending_localizations'] = pending
         self._print_summary("Common Masters", results)
         return results
 
+    @_phase('master_localizations')
+    def load_master_localizations(self, messages: list, target_tenant: str = None) -> Dict:
+        """Upload the labels load_common_masters(defer_localizations=True) held back
+
+        Args:
+            messages: results['pending_localizations'] from load_common_masters
+            target_tenant: Target tenant ID
+
+        Returns:
+            dict: Localization upload summary
+        """
+        self._check_auth()
+        tenant = target_tenant or self.tenant_id
+        results = {'localization': None}
+        if messages:
+            results['localization'] = self.uploader.create_localization_messages(messages, tenant)
+        return results
+
     def create_employee(self, tenant: str, username: str, password: str,
                         name: str = None, mobile: str = "9999999999",
                         roles: list = None, department: str = None,
@@ -1269,7 +1489,7 @@ class CRSLoader:
             hrms_svc = os.environ.get("HRMS_SERVICE", "/egov-hrms")
             headers = {"Content-Type": "application/json"}
             try:
-                sr = requests.post(f"{self.base_url}{hrms_svc}/employees/_search",
+                sr = self.uploader._post(f"{self.base_url}{hrms_svc}/employees/_search",
                     json={"RequestInfo": {"apiId": "Rainmaker", "authToken": self.auth_token,
                           "userInfo": self.user_info}, "codes": [username], "tenantId": tenant},
                     headers=headers, params={"tenantId": tenant, "codes": username},
@@ -1303,7 +1523,7 @@ class CRSLoader:
                                 f"dept {prev_dept} -> {department}, "
                                 f"desig {prev_desig} -> {designation}"
                             )
-                    requests.post(f"{self.base_url}{hrms_svc}/employees/_update",
+                    self.uploader._post(f"{self.base_url}{hrms_svc}/employees/_update",
                         json={"RequestInfo": {"apiId": "Rainmaker", "authToken": self.auth_token,
                               "userInfo": self.user_info}, "Employees": [emp]},
                         headers=headers, timeout=REQUEST_TIMEOUT)
@@ -1313,12 +1533,17 @@ class CRSLoader:
 
         return created
 
-    def load_employees(self, excel_path: str, target_tenant: str = None) -> Dict:
+    @_phase('employees')
+    def load_employees(self, excel_path: str, target_tenant: str = None,
+                       stream: bool = False, workers: int = 4) -> Dict:
         """Phase 4: Load employee master data
 
         Args:
             excel_path: Path to "Employee Master.xlsx"
             target_tenant: Target tenant ID
+            stream: Build payloads row by row and upload with a worker pool
+                while the sheet is still being read (for state-scale files)
+            workers: HRMS upload threads used in streaming mode
 
         Returns:
             dict: Summary of employee creation results
@@ -1333,6 +1558,18 @@ class CRSLoader:
         tenant = target_tenant or self.tenant_id
         reader = UnifiedExcelReader(excel_path)
 
+        if stream:
+            print(f"\n[1/1] Streaming employees (workers: {workers})...")
+            results = self.uploader.create_employees_streaming(
+                reader.iter_employees(tenant, self.uploader),
+                tenant=tenant,
+                sheet_name='Employee Master',
+                excel_file=excel_path,
+                workers=workers
+            )
+            self._print_summary("Employees", {'employees': results})
+            return results
+
         # 1. Read employee data (converts names to codes internally)
         print(f"\n[1/2] Reading employee data...")
         employees = reader.read_employees_bulk(tenant, self.uploader)
@@ -1377,7 +1614,7 @@ class CRSLoader:
         try:
             source_messages = []
             try:
-                resp = requests.post(
+                resp = self.uploader._post(
                     loc_search_url,
                     params={"tenantId": source_tenant, "locale": "en_IN"},
                     json={"RequestInfo": {"apiId": "Rainmaker"}},
@@ -1401,7 +1638,7 @@ class CRSLoader:
 
             existing_codes = set()
             try:
-                tr = requests.post(
+                tr = self.uploader._post(
                     loc_search_url,
                     params={"tenantId": target_tenant, "locale": "en_IN"},
                     json={"RequestInfo": {"apiId": "Rainmaker"}},
@@ -1438,7 +1675,7 @@ class CRSLoader:
                     "tenantId": target_tenant,
                     "messages": batch,
                 }
-                r = requests.post(loc_upsert_url, json=upsert_payload,
+                r = self.uploader._post(loc_upsert_url, json=upsert_payload,
                                   headers={"Content-Type": "application/json"},
                                   timeout=60)
                 if r.ok:
@@ -1463,7 +1700,7 @@ class CRSLoader:
                 "messages": [{"code": tenant_key, "message": display_name,
                               "module": "rainmaker-common", "locale": "en_IN"}],
             }
-            r = requests.post(loc_upsert_url, json=upsert_payload,
+            r = self.uploader._post(loc_upsert_url, json=upsert_payload,
                               headers={"Content-Type": "application/json"},
                               timeout=REQUEST_TIMEOUT)
             if r.ok:
@@ -1477,33 +1714,17 @@ class CRSLoader:
         """Load localization messages from bundled JSONs in templates/localisations/.
 
         Falls back to these when the source tenant API doesn't have enough
-        messages (fresh install with minimal DB seed).
+        messages (fresh install with minimal DB seed). The JSONs are compiled
+        into a cached index once and shared by every tenant seeded in this
+        process (see localization_index.py).
         """
-        templates_dir = os.path.join(
-            os.path.dirname(os.path.abspath(__file__)), "templates", "localisations"
-        )
-        if not os.path.isdir(templates_dir):
+        try:
+            return load_bundled_index().messages()
+        except Exception as e:
+            print(f"   ⚠️  Failed to load bundled localizations: {e}")
             return []
 
-        messages = []
-        seen_codes = set()
-        for fname in sorted(os.listdir(templates_dir)):
-            if not fname.endswith(".json"):
-                continue
-            fpath = os.path.join(templates_dir, fname)
-            try:
-                with open(fpath, "r") as f:
-                    data = json.load(f)
-                for msg in data:
-                    code = msg.get("code", "")
-                    if code and code not in seen_codes:
-                        seen_codes.add(code)
-                        messages.append(msg)
-            except Exception as e:
-                print(f"   ⚠️  Failed to load {fname}: {e}")
-
-        return messages
-
+    @_phase('localizations')
     def load_localizations(self, excel_path: str, target_tenant: str = None,
                           language_label: str = None, locale_code: str = None) -> Dict:
         """Phase 5: Load bulk localization messages from Excel
@@ -1573,6 +1794,7 @@ class CRSLoader:
         self._print_summary("Localizations", results)
         return results
 
+    @_phase('workflow')
     def load_workflow(self, json_path: str, target_tenant: str = None,
                       business_service: str = "PGR") -> Dict:
         """Phase 6: Load/update workflow business service configuration from JSON file
@@ -1609,50 +1831,115 @@ class CRSLoader:
         workflow_config['businessService'] = business_service
         print(f"   Loaded {len(workflow_config.get('states', []))} states")
 
+        return self._sync_workflow(tenant, workflow_config)
+
+    @_phase('workflow')
+    def load_workflows(self, json_path: str, tenants: list, business_service: str = "PGR",
+                       workers: int = 4) -> Dict:
+        """Load one workflow template into many tenants concurrently
+
+        The JSON is parsed once; each tenant gets its own copy with the
+        {tenantid} placeholders filled in, and is synced as in load_workflow
+        (one search when unchanged, a partial update when changed).
+
+        Args:
+            json_path: Path to workflow JSON file (e.g., PgrWorkflowConfig.json)
+            tenants: Target tenant IDs
+            business_service: Business service code (default: 'PGR')
+            workers: Tenants synced at once
+
+        Returns:
+            dict: {tenant: load_workflow result}
+        """
+        self._check_auth()
+        _send_telemetry("dataloader", "load", "workflow")
+
+        print(f"\n{'='*60}")
+        print(f"PHASE 6: WORKFLOW ({len(tenants)} tenants)")
+        print(f"{'='*60}")
+        print(f"File: {os.path.basename(json_path)}")
+        print(f"Business Service: {business_service}")
+
+        try:
+            template = load_workflow_template(json_path)
+        except (OSError, ValueError) as e:
+            print(f"   ERROR: Failed to load workflow: {e}")
+            return {tenant: {'status': 'failed', 'error': str(e)} for tenant in tenants}
+
+        def sync(tenant):
+            workflow_config = instantiate(template, tenant)
+            workflow_config['businessService'] = business_service
+            try:
+                return self._sync_workflow(tenant, workflow_config, verbose=False)
+            except Exception as e:
+                return {'status': 'failed', 'error': str(e)}
+
+        with ThreadPoolExecutor(max_workers=max(1, min(workers, len(tenants))),
+                                thread_name_prefix="workflow") as pool:
+            results = dict(zip(tenants, pool.map(sync, tenants)))
+
+        for tenant, result in results.items():
+            detail = result.get('error') or f"{result.get('states', 0)} states"
+            print(f"   {tenant}: {result['status']} ({detail})")
+        return results
+
+    def _sync_workflow(self, tenant: str, workflow_config: Dict, verbose: bool = True) -> Dict:
+        """Create the business service, or update only what differs from the deployed one"""
+        log = print if verbose else (lambda *args, **kwargs: None)
+        business_service = workflow_config.get('businessService')
+
         # Check if workflow already exists
-        print(f"\n[2/3] Checking for existing workflow...")
+        log(f"\n[2/3] Checking for existing workflow...")
         existing = self.uploader.search_workflow(tenant, business_service)
+        new_states = len(workflow_config.get('states', []))
 
         if existing:
-            print(f"   Found existing workflow: {existing.get('businessService')}")
-            print(f"   States: {len(existing.get('states', []))}")
-
-            # Check if we should update
-            existing_states = len(existing.get('states', []))
-            new_states = len(workflow_config.get('states', []))
-
-            if existing_states == new_states:
-                print(f"\n[3/3] Workflow already configured (same state count)")
-                return {'status': 'exists', 'error': None, 'states': existing_states}
+            log(f"   Found existing workflow: {existing.get('businessService')}")
+            log(f"   States: {len(existing.get('states', []))}")
+
+            if workflow_hash(existing) == workflow_hash(workflow_config):
+                log(f"\n[3/3] Workflow already configured (unchanged)")
+                return {'status': 'exists', 'error': None, 'states': len(existing.get('states', []))}
+
+            diff = diff_workflows(existing, workflow_config)
+            if diff['removed']:
+                # _update can't drop states; they stay in the deployed workflow
+                log(f"   ⚠️  States not in the config are kept: {', '.join(s or '(start)' for s in diff['removed'])}")
+            if not diff['changed']:
+                log(f"\n[3/3] Workflow already configured (no states to add or change)")
+                return {'status': 'exists', 'error': None, 'states': len(existing.get('states', [])),
+                        'removed': diff['removed']}
 
             # Update existing workflow
-            print(f"\n[3/3] Updating workflow ({existing_states} -> {new_states} states)...")
+            log(f"\n[3/3] Updating workflow ({len(diff['added'])} added, "
+                f"{len(diff['changed_states'])} changed states"
+                f"{', fields: ' + ', '.join(diff['fields']) if diff['fields'] else ''})...")
 
-            # Copy UUIDs from existing to new config for update
-            workflow_config = self._merge_workflow_uuids(existing, workflow_config)
+            # Send only the states that differ; copy UUIDs from existing for update
+            workflow_config = self._merge_workflow_uuids(existing, update_payload(workflow_config, diff))
 
             result = self.uploader.update_workflow(tenant, workflow_config)
 
             if result.get('updated'):
-                print(f"   Workflow updated successfully")
-                return {'status': 'updated', 'error': None, 'states': new_states}
+                log(f"   Workflow updated successfully")
+                return {'status': 'updated', 'error': None, 'states': new_states,
+                        'added': diff['added'], 'changed': diff['changed_states']}
             else:
-                print(f"   Update failed: {result.get('error')}")
+                log(f"   Update failed: {result.get('error')}")
                 return {'status': 'failed', 'error': result.get('error')}
 
         else:
             # Create new workflow
-            print(f"   No existing workflow found")
-            print(f"\n[3/3] Creating workflow...")
+            log(f"   No existing workflow found")
+            log(f"\n[3/3] Creating workflow...")
 
             result = self.uploader.create_workflow(tenant, workflow_config)
 
             if result.get('created'):
-                states = len(workflow_config.get('states', []))
-                print(f"   Workflow created successfully ({states} states)")
-                return {'status': 'created', 'error': None, 'states': states}
+                log(f"   Workflow created successfully ({new_states} states)")
+                return {'status': 'created', 'error': None, 'states': new_states}
             else:
-                print(f"   Create failed: {result.get('error')}")
+                log(f"   Create failed: {result.get('error')}")
                 return {'status': 'failed', 'error': result.get('error')}
 
     def _load_workflow_from_json(self, json_path: str, tenant: str) -> Optional[Dict]:
@@ -1666,24 +1953,8 @@ class CRSLoader:
             BusinessService config dict, or None if failed
         """
         try:
-            with open(json_path, 'r') as f:
-                data = json.load(f)
-
-            # Extract BusinessServices array
-            business_services = data.get('BusinessServices', [])
-            if not business_services:
-                print(f"   ERROR: No BusinessServices found in JSON")
-                return None
-
-            # Get first business service config
-            workflow_config = business_services[0]
-
-            # Replace {tenantid} placeholders with actual tenant
-            workflow_json = json.dumps(workflow_config)
-            workflow_json = workflow_json.replace('{tenantid}', tenant)
-            workflow_config = json.loads(workflow_json)
-
-            return workflow_config
+            # Parsed once per file; replace {tenantid} placeholders with actual tenant
+            return instantiate(load_workflow_template(json_path), tenant)
 
         except FileNotFoundError:
             print(f"   ERROR: File not found: {json_path}")
@@ -1725,69 +1996,575 @@ class CRSLoader:
 
         return new_config
 
-    def delete_boundaries(self, target_tenant: str = None, use_db: bool = False) -> Dict:
+    def onboard(self, workbooks: Dict, target_tenant: str = None, workers: int = 3) -> Dict:
+        """Run a full onboarding, independent phases in parallel (see phase_dag.py)
+
+        Args:
+            workbooks: {phase: workbook path, or dict of load_* kwargs with
+                "path"}, for any of tenant, boundaries, common_masters,
+                employees, localizations, workflow
+            target_tenant: Target tenant ID
+            workers: Phases run at once
+
+        Returns:
+            dict: Per-phase status and timings, plus the critical path
+        """
+        return PhaseScheduler(self, workers=workers).run(workbooks, target_tenant)
+
+    BUNDLE_PHASES = ('tenant', 'boundaries', 'common_masters', 'employees', 'localizations')
+
+    def compile_bundle(self, phase: str, excel_path: str, target_tenant: str = None,
+                       output_path: str = None, hierarchy_type: str = "ADMIN",
+                       compress: bool = True, source_hash: str = None) -> str:
+        """Compile an Excel template into a payload bundle for later replay
+
+        Reads the template once and writes the payloads the matching load_*
+        phase would send, as NDJSON (gzip by default). Replaying the bundle
+        with replay_bundle() skips Excel parsing entirely.
+
+        Name->code lookups use the live environment when logged in (required
+        for employees); otherwise payloads are resolved offline, e.g. new
+        department codes start at DEPT_1 as on a fresh tenant.
+
+        Args:
+            phase: One of BUNDLE_PHASES
+            excel_path: Template for that phase
+            target_tenant: Tenant the payloads are for
+            output_path: Bundle path (default: <tenant>.<phase>.ndjson.gz next to the template)
+            hierarchy_type: Boundary hierarchy type (boundaries phase only)
+            compress: gzip the bundle when output_path is not given
+            source_hash: Recorded instead of the template's SHA-256 (see load_via_bundle)
+
+        Returns:
+            str: Path of the written bundle
+        """
+        if phase not in self.BUNDLE_PHASES:
+            raise ValueError(f"Unknown bundle phase '{phase}'. Expected one of: {', '.join(self.BUNDLE_PHASES)}")
+
+        uploader = self.uploader if self._authenticated else None
+        if phase == 'employees':
+            self._check_auth()
+
+        tenant = target_tenant or self.tenant_id
+        if not tenant:
+            raise ValueError("target_tenant is required when not logged in")
+
+        output_path = output_path or bundle_path(
+            os.path.dirname(os.path.abspath(excel_path)), phase, tenant, compress)
+
+        print(f"\n📦 Compiling {phase} bundle")
+        print(f"   Template: {os.path.basename(excel_path)}")
+        print(f"   Tenant: {tenant}")
+
+        context = self._bundle_context(phase, tenant, uploader, hierarchy_type)
+        reader = UnifiedExcelReader(excel_path)
+        records = getattr(self, f"_compile_{phase}")(reader, tenant, uploader, hierarchy_type)
+        count = write_bundle(output_path, phase, tenant, records,
+                             source=excel_path, source_hash=source_hash, context=context)
+
+        print(f"   ✅ {count} payloads → {output_path}")
+        return output_path
+
+    def _bundle_context(self, phase, tenant, uploader, hierarchy_type="ADMIN"):
+        """Gateway and digest of the reference data a phase's payloads are resolved from
+
+        None for phases (or offline compiles) that look nothing up.
+        """
+        if uploader is None or phase not in ('common_masters', 'employees', 'boundaries'):
+            return None
+
+        def codes(records):
+            return sorted((str(r.get('code')), str(r.get('name'))) for r in records or [])
+
+        if phase == 'boundaries':
+            hierarchy = uploader._get_boundary_hierarchy(tenant, hierarchy_type) or {}
+            reference = [h.get('boundaryType') for h in hierarchy.get('boundaryHierarchy', [])]
+        else:
+            tenants = [tenant] if phase == 'employees' else list(dict.fromkeys([tenant, tenant.split('.')[0]]))
+            reference = {t: {'departments': codes(uploader.fetch_departments(t)),
+                             'designations': codes(uploader.fetch_designations(t))} for t in tenants}
+            if phase == 'employees':
+                reference['roles'] = codes(uploader.fetch_roles(tenant))
+        return {'gateway': self.base_url, 'referenceSha256': reference_digest(reference)}
+
+    def _compile_tenant(self, reader, tenant, uploader, hierarchy_type):
+        """Bundle records for load_tenant"""
+        tenants, localizations = reader.read_tenant_info()
+        root = self.tenant_id or tenant.split('.')[0]
+        for data in tenants:
+            yield {'kind': 'mdms', 'key': 'tenants', 'tenant': root, 'schema': 'tenant.tenants', 'data': data}
+        for data in reader.read_tenant_branding(tenant):
+            yield {'kind': 'mdms', 'key': 'branding', 'tenant': tenant,
+                   'schema': 'common-masters.StateInfo', 'data': data}
+        for data in localizations:
+            yield {'kind': 'localization', 'key': 'localization', 'tenant': tenant, 'data': data}
+
+    def _compile_common_masters(self, reader, tenant, uploader, hierarchy_type):
+        """Bundle records for load_common_masters (same upload order)"""
+        dept_data, desig_data, dept_loc, desig_loc, dept_name_to_code = \
+            reader.read_departments_designations(tenant, uploader)
+
+        for data in dept_data:
+            yield {'kind': 'mdms', 'key': 'departments', 'tenant': tenant,
+                   'schema': 'common-masters.Department', 'data': data}
+        for data in dept_loc:
+            yield {'kind': 'localization', 'tenant': tenant, 'data': data}
+        for data in desig_data:
+            yield {'kind': 'mdms', 'key': 'designations', 'tenant': tenant,
+                   'schema': 'common-masters.Designation', 'data': data}
+        for data in desig_loc:
+            yield {'kind': 'localization', 'tenant': tenant, 'data': data}
+
+        complaint_data, complaint_loc = reader.read_complaint_types(tenant, dept_name_to_code)
+        if complaint_data:
+            yield {'kind': 'mdms', 'key': 'complaint_hierarchy_definition', 'tenant': tenant,
+                   'schema': 'RAINMAKER-PGR.ComplaintHierarchyDefinition',
+                   'data': reader.complaint_hierarchy_definition()}
+            for data in complaint_data:
+                yield {'kind': 'mdms', 'key': 'complaint_types', 'tenant': tenant,
+                       'schema': 'RAINMAKER-PGR.ComplaintHierarchy', 'data': data}
+            for data in complaint_loc:
+                yield {'kind': 'localization', 'tenant': tenant, 'data': data}
+
+    def _compile_employees(self, reader, tenant, uploader, hierarchy_type):
+        """Bundle records for load_employees"""
+        for row_index, employee in reader.iter_employees(tenant, uploader):
+            yield {'kind': 'employee', 'key': 'employees', 'tenant': tenant,
+                   'row': row_index, 'data': employee}
+
+    def _compile_boundaries(self, reader, tenant, uploader, hierarchy_type):
+        """Bundle records for load_boundaries"""
+        boundary_types = []
+        if uploader:
+            hierarchy = uploader._get_boundary_hierarchy(tenant, hierarchy_type)
+            if hierarchy:
+                boundary_types = [h['boundaryType'] for h in hierarchy.get('boundaryHierarchy', [])]
+
+        for code, boundary_type, parent_code in APIUploader._iter_boundary_specs(reader.excel_file, boundary_types):
+            yield {'kind': 'boundary', 'key': 'boundaries', 'tenant': tenant, 'hierarchyType': hierarchy_type,
+                   'code': code, 'boundaryType': boundary_type, 'parent': parent_code}
+
+    def _compile_localizations(self, reader, tenant, uploader, hierarchy_type):
+        """Bundle records for load_localizations"""
+        for data in reader.read_localization():
+            yield {'kind': 'localization', 'key': 'messages', 'tenant': tenant, 'data': data}
+
+    def load_via_bundle(self, phase: str, excel_path: str, target_tenant: str = None,
+                        bundle_dir: str = None, workers: int = 4,
+                        source_hash: str = None, **kwargs) -> Dict:
+        """Replay a cached bundle for a template, compiling it first if stale
+
+        The bundle is reused as long as the template's SHA-256 matches the one
+        recorded at compile time, and it was compiled against this gateway
+        with the same department/designation/role codes or boundary types
+        (see _bundle_context), so repeated CI runs and environment rebuilds
+        parse each template only once.
+
+        Args:
+            phase: One of BUNDLE_PHASES
+            excel_path: Template for that phase
+            target_tenant: Target tenant ID
+            bundle_dir: Where bundles are cached (default: next to the template)
+            workers: Upload threads for employee/boundary records
+            source_hash: Cache key to use instead of the template's SHA-256,
+                e.g. the hash of the input a generated template was built from
+            **kwargs: Forwarded to compile_bundle (e.g. hierarchy_type)
+
+        Returns:
+            dict: Results keyed like the matching load_* phase
+        """
+        tenant = target_tenant or self.tenant_id
+        path = bundle_path(bundle_dir or os.path.dirname(os.path.abspath(excel_path)), phase, tenant)
+
+        context = self._bundle_context(phase, tenant, self.uploader if self._authenticated else None,
+                                       kwargs.get('hierarchy_type', 'ADMIN'))
+        if is_bundle_current(path, phase, tenant, excel_path, source_hash, context):
+            print(f"\n📦 Using cached {phase} bundle: {path}")
+        else:
+            self.compile_bundle(phase, excel_path, target_tenant=tenant, output_path=path,
+                                source_hash=source_hash, **kwargs)
+
+        return self.replay_bundle(path, workers=workers)
+
+    @_phase('replay')
+    def replay_bundle(self, bundle_file: str, workers: int = 4) -> Dict:
+        """Upload a payload bundle written by compile_bundle()
+
+        Records are sent in bundle order with the same uploader calls as the
+        matching load_* phase, but nothing is read from Excel and no status
+        columns are written back.
+
+        Args:
+            bundle_file: Path to a .ndjson or .ndjson.gz bundle
+            workers: Upload threads for employee/boundary records
+
+        Returns:
+            dict: Results keyed like the matching load_* phase
+        """
+        self._check_auth()
+
+        header = read_bundle_header(bundle_file)
+        phase = header.get('phase')
+
+        print(f"\n{'='*60}")
+        print(f"REPLAY: {phase} ({header.get('tenant')})")
+        print(f"{'='*60}")
+        print(f"Bundle: {os.path.basename(bundle_file)}")
+        if header.get('source'):
+            print(f"Compiled from: {header['source']} at {header.get('compiledAt')}")
+
+        results = {}
+        for kind, key, tenant, schema, group in group_records(iter_bundle_records(bundle_file)):
+            if kind == 'mdms':
+                data_list = [r['data'] for r in group]
+                print(f"\n   {schema}: {len(data_list)} record(s) → {tenant}")
+                result = self.uploader.create_mdms_data(
+                    schema_code=schema, data_list=data_list, tenant=tenant)
+            elif kind == 'localization':
+                messages = [r['data'] for r in group]
+                result = self.uploader.create_localization_messages(messages, tenant)
+            elif kind == 'employee':
+                result = self.uploader.create_employees_streaming(
+                    ((r.get('row', 0), r['data']) for r in group), tenant=tenant, workers=workers)
+            elif kind == 'boundary':
+                first = next(group)
+                hierarchy_type = first.get('hierarchyType') or 'ADMIN'
+                hierarchy = self.uploader._get_boundary_hierarchy(tenant, hierarchy_type) or {}
+                specs = ((r['code'], r['boundaryType'], r.get('parent')) for r in chain([first], group))
+                result = self.uploader.create_boundaries_from_specs(
+                    tenant, hierarchy_type, specs, workers=workers,
+                    boundary_types=[h['boundaryType'] for h in hierarchy.get('boundaryHierarchy', [])])
+            else:
+                print(f"   ⚠️  Skipping unknown record kind '{kind}'")
+                continue
+
+            if key:
+                results[key] = result
+
+        self._print_summary(f"Replay ({phase})", results)
+        return results
+
+    def export_tenant_snapshot(self, tenant: str = None, path: str = None,
+                               localizations: bool = False, locales: tuple = ("en_IN",),
+                               boundaries: bool = False, page_size: int = 200) -> str:
+        """Stream a tenant's MDMS configuration into a snapshot bundle
+
+        Writes every schema definition of the tenant's root and every active
+        MDMS record of the tenant, page by page, as a gzip NDJSON payload
+        bundle (phase 'snapshot'). Nothing is held in memory beyond one page.
+        import_tenant_snapshot() replays it into another tenant.
+
+        Args:
+            tenant: Tenant to export (default: login tenant)
+            path: Output path (default: ./<tenant>.snapshot.ndjson.gz)
+            localizations: Also export localization messages for locales
+            locales: Locales to export with localizations
+            boundaries: Also export boundary hierarchies and trees
+            page_size: MDMS records fetched per search
+
+        Returns:
+            str: Path of the written snapshot
+        """
+        self._check_auth()
+        tenant = tenant or self.tenant_id
+        path = path or bundle_path('.', 'snapshot', tenant)
+
+        print(f"\n📤 Exporting snapshot of {tenant}")
+        counts = {}
+        records = self._snapshot_records(tenant, localizations, locales, boundaries, page_size, counts)
+        total = write_bundle(path, 'snapshot', tenant, records)
+
+        print(f"   " + ", ".join(f"{n} {kind}" for kind, n in counts.items()))
+        print(f"   ✅ {total} records → {path}")
+        return path
+
+    def _snapshot_records(self, tenant, localizations, locales, boundaries, page_size, counts):
+        """Snapshot records in import order: schemas, MDMS, localizations, boundaries"""
+        def counted(kind, record):
+            counts[kind] = counts.get(kind, 0) + 1
+            return record
+
+        root = tenant.split('.')[0]
+        schemas = self._schema_order(self.uploader.search_schema_definitions(root))
+        for schema in schemas:
+            yield counted('schema', {'kind': 'schema', 'tenant': root, 'code': schema.get('code'),
+                                     'description': schema.get('description'),
+                                     'definition': schema.get('definition', {})})
+
+        for schema in schemas:
+            code = schema.get('code')
+            offset = 0
+            while True:
+                page = self.uploader.search_mdms_data(code, tenant, limit=page_size, offset=offset,
+                                                      include_inactive=False)
+                for data in page:
+                    yield counted('mdms', {'kind': 'mdms', 'key': code, 'tenant': tenant, 'schema': code,
+                                           'uniqueIdentifier': data.get('_uniqueIdentifier'),
+                                           'data': {k: v for k, v in data.items() if not k.startswith('_')}})
+                if len(page) < page_size:
+                    break
+                offset += page_size
+
+        if localizations:
+            for locale in locales:
+                for message in self.uploader.search_localization_messages(tenant, locale):
+                    yield counted('localization', {
+                        'kind': 'localization', 'key': 'localization', 'tenant': tenant,
+                        'data': {'code': message.get('code'), 'message': message.get('message'),
+                                 'module': message.get('module'), 'locale': message.get('locale', locale)}})
+
+        if boundaries:
+            for hierarchy in self.uploader.search_boundary_hierarchies(tenant):
+                hierarchy_type = hierarchy.get('hierarchyType')
+                yield counted('hierarchy', {'kind': 'hierarchy', 'key': hierarchy_type, 'tenant': tenant,
+                                            'hierarchyType': hierarchy_type,
+                                            'data': {'boundaryHierarchy': hierarchy.get('boundaryHierarchy', [])}})
+                stack = [(node, None) for node in reversed(self.uploader.search_boundary_tree(tenant, hierarchy_type))]
+                while stack:
+                    node, parent = stack.pop()
+                    yield counted('boundary', {'kind': 'boundary', 'key': hierarchy_type, 'tenant': tenant,
+                                               'hierarchyType': hierarchy_type, 'code': node.get('code'),
+                                               'boundaryType': node.get('boundaryType'), 'parent': parent})
+                    stack.extend((child, node.get('code')) for child in reversed(node.get('children') or []))
+
+    @staticmethod
+    def _schema_order(schemas: list) -> list:
+        """Schemas sorted by code, each after the schemas its x-ref-schema fields point to"""
+        by_code = {s.get('code'): s for s in schemas}
+        ordered, seen = [], set()
+
+        def visit(code):
+            if code in seen or code not in by_code:
+                return
+            seen.add(code)
+            for ref in (by_code[code].get('definition') or {}).get('x-ref-schema') or []:
+                visit(ref.get('schemaCode'))
+            ordered.append(by_code[code])
+
+        for code in sorted(by_code):
+            visit(code)
+        return ordered
+
+    @_phase('snapshot')
+    def import_tenant_snapshot(self, path: str, target_tenant: str = None, workers: int = 8) -> Dict:
+        """Replay a snapshot from export_tenant_snapshot() into a tenant
+
+        Records for the exported tenant go to target_tenant and schemas for its
+        root go to the target's root. Every write is idempotent: schemas and
+        MDMS records the target already has are found with one search per
+        schema and skipped, the rest are created concurrently; localizations
+        are upserts; existing boundaries are left as they are. Tenant codes
+        inside record data are copied unchanged.
+
+        Args:
+            path: Snapshot file
+            target_tenant: Tenant to import into (default: the exported tenant)
+            workers: Concurrent writes
+
+        Returns:
+            dict: Results per schema code plus schemas/localization/boundaries
+        """
+        self._check_auth()
+        header = read_bundle_header(path)
+        if header.get('phase') != 'snapshot':
+            raise ValueError(f"Not a tenant snapshot: {path} (phase '{header.get('phase')}')")
+
+        source = header.get('tenant')
+        target = target_tenant or source
+        source_root, target_root = source.split('.')[0], target.split('.')[0]
+
+        def remap(tenant):
+            return target if tenant == source else target_root if tenant == source_root else tenant
+
+        print(f"\n{'='*60}")
+        print(f"SNAPSHOT IMPORT: {source} → {target}")
+        print(f"{'='*60}")
+        print(f"Snapshot: {os.path.basename(path)} ({header.get('compiledAt')})")
+
+        results = {}
+        for kind, key, tenant, schema, group in group_records(iter_bundle_records(path)):
+            tenant = remap(tenant)
+            if kind == 'schema':
+                results['schemas'] = outcome = self.uploader.create_schema_definitions(
+                    list(group), tenant, workers=workers)
+                print(f"   📋 Schemas: {outcome['created']} created, {outcome['exists']} already existed, "
+                      f"{outcome['failed']} failed")
+                if outcome['created']:
+                    import time as _time
+                    _time.sleep(5)  # schema persistence is async (see _bootstrap_tenant_root)
+            elif kind == 'mdms':
+                records = [dict(r['data'], _uniqueIdentifier=r.get('uniqueIdentifier')) for r in group]
+                results[schema] = outcome = self.uploader.copy_mdms_data(
+                    schema, records, tenant, workers=workers)
+                print(f"   {schema}: {outcome['created']} created, {outcome['exists']} existed, "
+                      f"{outcome['failed']} failed")
+            elif kind == 'localization':
+                results['localization'] = self.uploader.create_localization_messages(
+                    [r['data'] for r in group], tenant)
+            elif kind == 'hierarchy':
+                for record in group:
+                    if not self.uploader._get_boundary_hierarchy(tenant, record['hierarchyType']):
+                        self.uploader.create_boundary_hierarchy({
+                            'tenantId': tenant, 'hierarchyType': record['hierarchyType'],
+                            'boundaryHierarchy': record['data']['boundaryHierarchy']})
+            elif kind == 'boundary':
+                specs = ((r['code'], r['boundaryType'], r.get('parent')) for r in group)
+                results[f'boundaries:{key}'] = self.uploader.create_boundaries_from_specs(
+                    tenant, key, specs, workers=workers,
+                    existing=self.uploader.boundary_index(tenant, key, refresh=True))
+            else:
+                print(f"   ⚠️  Skipping unknown record kind '{kind}'")
+
+        self._print_summary("Snapshot import", results)
+        return results
+
+    def delete_boundaries(self, target_tenant: str = None, use_db: bool = False,
+                          bulk_threshold: int = None, workers: int = 8,
+                          include_hierarchies: bool = False) -> Dict:
         """Delete all boundary entities for a tenant
 
+        Small tenants go through the boundary service (leaf level first,
+        concurrent within a level). Above bulk_threshold boundaries, or with
+        use_db, everything is removed in one SQL transaction instead (kubectl,
+        then the kubectl API server). Either path falls back to the other if
+        it can't finish, and both leave the hierarchy definitions alone unless
+        include_hierarchies is set (see also delete_hierarchy, reset_boundaries).
+
         Args:
             target_tenant: Tenant ID (e.g., 'statea', 'pg.citya')
             use_db: If True, use direct DB access (requires kubectl). Default: False (use API)
+            bulk_threshold: Boundary count above which the SQL path is used
+                (default: $BOUNDARY_BULK_DELETE_THRESHOLD, 2000)
+            workers: Concurrent boundary-service deletes
+            include_hierarchies: Also delete the tenant's hierarchy definitions
 
         Returns:
-            dict: {deleted: int, relationships_deleted: int, status: str}
+            dict: {deleted: int, relationships_deleted: int, status: str,
+                   method: str, tables: {table: rows deleted}}
         """
         self._check_auth()
         tenant = target_tenant or self.tenant_id
+        if bulk_threshold is None:
+            bulk_threshold = BOUNDARY_BULK_DELETE_THRESHOLD
 
         print(f"\n{'='*60}")
         print(f"DELETING BOUNDARIES")
         print(f"{'='*60}")
         print(f"Tenant: {tenant}")
 
-        if use_db:
-            return self._delete_boundaries_via_db(tenant)
-        else:
-            return self._delete_boundaries_via_api(tenant)
+        plan = self._build_boundary_cleanup_plan(tenant, include_hierarchies)
+        print(f"Boundaries: {len(plan['boundary_codes'])} "
+              f"(hierarchies: {', '.join(plan['hierarchy_types']) or 'none'})")
+
+        if use_db or len(plan['boundary_codes']) > bulk_threshold:
+            result = self._delete_boundaries_bulk(plan)
+            if result.get('status') == 'success' or use_db:
+                return result
+            print("   Bulk delete unavailable, deleting through the boundary service...")
+            return self._delete_boundaries_via_api(plan, workers)
+
+        result = self._delete_boundaries_via_api(plan, workers)
+        if result.get('status') == 'success':
+            return result
+
+        print("   Boundary API didn't delete everything, trying DB method...")
+        bulk = self._delete_boundaries_bulk(plan)
+        return bulk if bulk.get('status') == 'success' else result
+
+    def _build_boundary_cleanup_plan(self, tenant: str, include_hierarchies: bool = False) -> Dict:
+        """Hierarchy types and boundary codes of a tenant, for either delete path"""
+        hierarchy_types = [h.get('hierarchyType') for h in self.uploader.search_boundary_hierarchies(tenant) or []
+                           if h.get('hierarchyType')]
+        codes = []
+        for hierarchy_type in hierarchy_types:
+            codes.extend(self._fetch_boundary_codes_for_hierarchy(tenant, hierarchy_type))
+        # Entities that never got a relationship are in no tree
+        codes.extend(self._fetch_boundary_codes_from_service(tenant))
+        return {
+            'tenant': tenant,
+            'hierarchy_types': hierarchy_types,
+            'boundary_codes': list(dict.fromkeys(codes)),
+            'include_hierarchies': include_hierarchies,
+        }
 
-    def _delete_boundaries_via_api(self, tenant: str) -> Dict:
-        """Delete boundaries using the boundary service API
+    def _fetch_boundary_codes_for_hierarchy(self, tenant: str, hierarchy_type: str) -> list:
+        """Codes in a hierarchy's tree, parents first"""
+        return list(self.uploader.boundary_index(tenant, hierarchy_type, refresh=True))
 
-        Fallback chain:
-        1. Boundary service API (delete_all_boundaries)
-        2. Direct kubectl DB access
-        3. kubectl API server (for CI environments)
-        """
-        # Try boundary service API first
-        result = self.uploader.delete_all_boundaries(tenant)
+    def _fetch_boundary_codes_from_service(self, tenant: str) -> list:
+        """Codes of every boundary entity, paged from boundary/_search"""
+        try:
+            return self.uploader.search_boundary_codes(tenant)
+        except Exception as e:
+            print(f"   ⚠️  Could not list boundary entities: {str(e)[:100]}")
+            return []
+
+    @staticmethod
+    def _build_boundary_cleanup_sql(plan: Dict) -> list:
+        """DELETE statements for a cleanup plan: relationships, entities and,
+        with include_hierarchies, hierarchies"""
+        def literal(value):
+            return "'" + str(value).replace("'", "''") + "'"
+
+        def in_list(values):
+            return ", ".join(literal(v) for v in values if v)
+
+        tenant = literal(plan['tenant'])
+        hierarchies = in_list(plan.get('hierarchy_types') or [])
+        codes = in_list(plan.get('boundary_codes') or [])
+        by_hierarchy = f" AND hierarchytype IN ({hierarchies})" if hierarchies else ""
+        by_code = f" AND code IN ({codes})" if codes else ""
+        statements = [
+            f"DELETE FROM boundary_relationship WHERE tenantid = {tenant}{by_hierarchy};",
+            f"DELETE FROM boundary WHERE tenantid = {tenant}{by_code};",
+        ]
+        if plan.get('include_hierarchies'):
+            statements.append(f"DELETE FROM boundary_hierarchy WHERE tenantid = {tenant}{by_hierarchy};")
+        return statements
+
+    @staticmethod
+    def _table_counts(output: str) -> Dict:
+        """Rows deleted per table from psql output of _build_boundary_cleanup_sql"""
+        counts = [int(line.split()[1]) for line in output.strip().split('\n')
+                  if line.strip().startswith('DELETE') and len(line.split()) > 1]
+        tables = ['boundary_relationship', 'boundary', 'boundary_hierarchy']
+        return {table: counts[i] for i, table in enumerate(tables) if i < len(counts)}
+
+    def _delete_boundaries_via_api(self, plan: Dict, workers: int = 8) -> Dict:
+        """Delete boundaries using the boundary service API (delete_all_boundaries)"""
+        result = self.uploader.delete_all_boundaries(
+            plan['tenant'], codes=plan['boundary_codes'],
+            hierarchy_types=plan['hierarchy_types'], workers=workers)
 
         deleted = result.get('deleted', 0)
         failed = result.get('failed', 0)
+        tables = {'boundary': deleted}
+        print(f"   Boundaries deleted: {deleted}")
+        print(f"   Failed: {failed}")
+        if plan.get('include_hierarchies') and failed == 0:
+            outcomes = [self.uploader.delete_boundary_hierarchy(plan['tenant'], hierarchy_type)
+                        for hierarchy_type in plan['hierarchy_types']]
+            tables['boundary_hierarchy'] = sum(o.get('status') == 'success' for o in outcomes)
+            failed += len(outcomes) - tables['boundary_hierarchy']
+        print(f"{'='*60}")
+        return {
+            'deleted': deleted,
+            'relationships_deleted': 0,
+            'failed': failed,
+            'method': 'api',
+            'tables': tables,
+            'status': 'success' if failed == 0 else 'partial'
+        }
 
-        # If API worked, return result
-        if deleted > 0 or (deleted == 0 and failed == 0):
-            print(f"   Boundaries deleted: {deleted}")
-            print(f"   Failed: {failed}")
-            print(f"{'='*60}")
-            return {
-                'deleted': deleted,
-                'relationships_deleted': 0,
-                'failed': failed,
-                'status': 'success' if failed == 0 else 'partial'
-            }
-
-        # Try direct kubectl DB access
-        print("   Boundary API didn't delete, trying DB method...")
-        db_result = self._delete_boundaries_via_db(tenant)
-        if db_result.get('status') == 'success':
-            return db_result
-
-        # Try kubectl API server (for CI without kubectl)
+    def _delete_boundaries_bulk(self, plan: Dict) -> Dict:
+        """One-transaction SQL delete: kubectl first, then the kubectl API server"""
+        db_result = self._delete_boundaries_via_db(plan)
         if db_result.get('status') == 'skipped':
             print("   kubectl not available, trying kubectl API server...")
-            return self._delete_boundaries_via_kubectl_api(tenant)
-
+            return self._delete_boundaries_via_kubectl_api(plan)
         return db_result
 
-    def _delete_boundaries_via_db(self, tenant: str) -> Dict:
+    def _delete_boundaries_via_db(self, plan: Dict) -> Dict:
         """Delete boundaries using direct database access (requires kubectl)"""
         import subprocess
 
@@ -1797,12 +2574,15 @@ class CRSLoader:
         db_user = os.environ.get("BOUNDARY_DB_USER", "egov")
 
         # Get DB password from K8s secret
-        pw_result = subprocess.run(
-            ["kubectl", "get", "secret", "db", "-n", "egov", "-o", "jsonpath={.data.password}"],
-            capture_output=True, text=True
-        )
+        try:
+            pw_result = subprocess.run(
+                ["kubectl", "get", "secret", "db", "-n", "egov", "-o", "jsonpath={.data.password}"],
+                capture_output=True, text=True
+            )
+        except OSError:
+            pw_result = None
 
-        if pw_result.returncode != 0:
+        if pw_result is None or pw_result.returncode != 0:
             print("   WARNING: kubectl not available, cannot delete via DB")
             print(f"{'='*60}")
             return {'deleted': 0, 'relationships_deleted': 0, 'status': 'skipped',
@@ -1821,29 +2601,35 @@ class CRSLoader:
 
         conn_str = f"postgresql://{db_user}:{db_pass}@{db_host}:5432/{db_name}"
 
-        # Delete relationships first, then boundaries (parameterized to prevent SQL injection)
-        delete_sql = "DELETE FROM boundary_relationship WHERE tenantid = :'tenant_id'; DELETE FROM boundary WHERE tenantid = :'tenant_id';"
-        result = subprocess.run(
-            ["kubectl", "exec", "-n", "egov", "db-cleanup", "--",
-             "psql", conn_str, "-t",
-             "-v", f"tenant_id={tenant}",
-             "-c", delete_sql],
-            capture_output=True, text=True
-        )
+        # The statements go in on stdin: with every code of a large tenant they
+        # are far over the per-argument limit. psql reports each DELETE count;
+        # -1 runs them in a single transaction, so a failure leaves every table
+        # untouched
+        command = ["kubectl", "exec", "-i", "-n", "egov", "db-cleanup", "--",
+                   "psql", conn_str, "-t", "-1", "-v", "ON_ERROR_STOP=1", "-f", "-"]
+        sql = "\n".join(self._build_boundary_cleanup_sql(plan)) + "\n"
+        try:
+            result = subprocess.run(command, input=sql, capture_output=True, text=True)
+        except OSError as e:
+            result = subprocess.CompletedProcess(command, 1, "", str(e))
 
-        # Parse DELETE counts
-        counts = [int(line.split()[1]) for line in result.stdout.strip().split('\n')
-                  if line.strip().startswith('DELETE')]
-        rel_deleted = counts[0] if len(counts) > 0 else 0
-        deleted = counts[1] if len(counts) > 1 else 0
+        if result.returncode != 0:
+            error = (result.stderr or result.stdout).strip()[:300]
+            print(f"   ERROR: DB delete rolled back: {error}")
+            print(f"{'='*60}")
+            return {'deleted': 0, 'relationships_deleted': 0, 'status': 'failed', 'error': error}
 
-        print(f"   Relationships deleted: {rel_deleted}")
-        print(f"   Boundaries deleted: {deleted}")
+        tables = self._table_counts(result.stdout)
+        print(f"   Relationships deleted: {tables.get('boundary_relationship', 0)}")
+        print(f"   Boundaries deleted: {tables.get('boundary', 0)}")
+        if 'boundary_hierarchy' in tables:
+            print(f"   Hierarchies deleted: {tables['boundary_hierarchy']}")
         print(f"{'='*60}")
 
-        return {'deleted': deleted, 'relationships_deleted': rel_deleted, 'status': 'success'}
+        return {'deleted': tables.get('boundary', 0), 'relationships_deleted': tables.get('boundary_relationship', 0),
+                'method': 'db', 'tables': tables, 'status': 'success'}
 
-    def _delete_boundaries_via_kubectl_api(self, tenant: str, env: str = 'chakshu') -> Dict:
+    def _delete_boundaries_via_kubectl_api(self, plan: Dict, env: str = 'chakshu') -> Dict:
         """Delete boundaries using the kubectl API server (for CI environments)
 
         The kubectl API server wraps kubectl commands and exposes them via HTTP.
@@ -1853,21 +2639,30 @@ class CRSLoader:
         try:
             response = requests.post(
                 f"{KUBECTL_API_URL}/boundaries/delete",
-                json={'tenant_id': tenant, 'env': env},
+                json={'tenant_id': plan['tenant'], 'hierarchy_types': plan['hierarchy_types'],
+                      'boundary_codes': plan['boundary_codes'],
+                      'include_hierarchies': bool(plan.get('include_hierarchies')), 'env': env},
                 headers={'X-API-Key': KUBECTL_API_KEY},
                 timeout=120
             )
 
             if response.status_code == 200:
                 data = response.json()
-                deleted = data.get('boundaries_deleted', 0)
-                rel_deleted = data.get('relationships_deleted', 0)
-                print(f"   Boundaries deleted (via kubectl API): {deleted}")
-                print(f"   Relationships deleted: {rel_deleted}")
+                tables = {
+                    'boundary_relationship': data.get('relationships_deleted', 0),
+                    'boundary': data.get('boundaries_deleted', 0),
+                }
+                print(f"   Boundaries deleted (via kubectl API): {tables['boundary']}")
+                print(f"   Relationships deleted: {tables['boundary_relationship']}")
+                if plan.get('include_hierarchies'):
+                    tables['boundary_hierarchy'] = data.get('hierarchies_deleted', 0)
+                    print(f"   Hierarchies deleted: {tables['boundary_hierarchy']}")
                 print(f"{'='*60}")
                 return {
-                    'deleted': deleted,
-                    'relationships_deleted': rel_deleted,
+                    'deleted': tables['boundary'],
+                    'relationships_deleted': tables['boundary_relationship'],
+                    'method': 'kubectl_api',
+                    'tables': tables,
                     'status': 'success'
                 }
             else:
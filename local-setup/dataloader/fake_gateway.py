@@ -0,0 +1,670 @@
+"""
+Fake DIGIT gateway - offline stand-in for loader benchmarks and tests
+
+Serves the endpoints the dataloader calls (MDMS v2, boundary-service, HRMS,
+user, localization, workflow, filestore) from in-memory state on a local
+HTTP port, so CRSLoader/APIUploader run unmodified over a real socket:
+
+    from fake_gateway import FakeGateway
+
+    with FakeGateway(default_latency=0.005) as gw:
+        gw.configure("hrms/_create", latency=0.02, error_rate=0.01)
+        gw.configure("mdms/_create", throttle_rate=0.05, retry_after=0)
+        loader = CRSLoader(gw.url)
+        loader.login("ADMIN", "eGov@123", tenant_id="pg")
+        loader.load_common_masters("Common and Complaint Master.xlsx")
+        print(gw.stats())
+
+Each endpoint has a route key (see ROUTES) that latency, 5xx error and 429
+injection are configured against. Duplicate handling mirrors the services:
+MDMS/boundary/HRMS/workflow creates of an existing key fail with the same
+error text the real services return; localization _upsert overwrites.
+duplicate_mode="phantom" makes MDMS answer duplicates with an empty 200, the
+way some mdms-v2 builds do. expire_tokens() makes requests carrying any token
+issued so far fail with 401. Boundary template generation completes after
+template_polls _generate-search calls per (tenant, hierarchyType).
+
+Standard library only.
+"""
+
+import json
+import random
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+
+# (route key, path suffix) - first match wins, so more specific suffixes come first
+ROUTES = [
+    ("mdms/schema/_search", "/schema/v1/_search"),
+    ("mdms/schema/_create", "/schema/v1/_create"),
+    ("mdms/_search", "/v2/_search"),
+    ("mdms/_create", "/v2/_create/"),
+    ("mdms/_update", "/v2/_update/"),
+    ("boundary-hierarchy/_create", "/boundary-hierarchy-definition/_create"),
+    ("boundary-hierarchy/_search", "/boundary-hierarchy-definition/_search"),
+    ("boundary-hierarchy/_delete", "/boundary-hierarchy-definition/_delete"),
+    ("boundary-relationships/_create", "/boundary-relationships/_create"),
+    ("boundary-relationships/_search", "/boundary-relationships/_search"),
+    ("boundary-management/_generate-search", "/boundary-management/v1/_generate-search"),
+    ("boundary-management/_generate", "/boundary-management/v1/_generate"),
+    ("boundary/_create", "/boundary/_create"),
+    ("boundary/_search", "/boundary/_search"),
+    ("boundary/_delete", "/boundary/_delete"),
+    ("hrms/_create", "/employees/_create"),
+    ("hrms/_search", "/employees/_search"),
+    ("hrms/_update", "/employees/_update"),
+    ("user/oauth", "/oauth/token"),
+    ("user/_updatenovalidate", "/users/_updatenovalidate"),
+    ("user/_createnovalidate", "/users/_createnovalidate"),
+    ("user/_search", "/user/_search"),
+    ("localization/_upsert", "/messages/v1/_upsert"),
+    ("localization/_search", "/messages/v1/_search"),
+    ("workflow/_search", "/businessservice/_search"),
+    ("workflow/_create", "/businessservice/_create"),
+    ("workflow/_update", "/businessservice/_update"),
+    ("filestore/url", "/v1/files/url"),
+    ("filestore/file", "/filestore/files/"),
+    ("filestore/upload", "/v1/files"),
+    ("data-handler/tenant", "/tenant/new"),
+    ("mdms/v1/_search", "/v1/_search"),
+]
+
+
+def route_for(path: str):
+    """Route key for a request path, or None"""
+    for key, suffix in ROUTES:
+        if suffix.endswith("/"):
+            if suffix in path:
+                return key
+        elif path.endswith(suffix):
+            return key
+    return None
+
+
+def _errors(code: str, message: str) -> dict:
+    return {"ResponseInfo": None, "Errors": [{"code": code, "message": message}]}
+
+
+class FakeGateway:
+    """In-memory DIGIT gateway on 127.0.0.1, run on a background thread"""
+
+    def __init__(self, default_latency: float = 0.0, seed: int = 0,
+                 duplicate_mode: str = "error", port: int = 0, template_polls: int = 2):
+        """
+        Args:
+            default_latency: Seconds added to every response
+            seed: Seed for error/429 injection, so runs are repeatable
+            duplicate_mode: "error" (HTTP 400) or "phantom" (empty 200) for MDMS duplicates
+            port: Port to bind (0 picks a free one)
+            template_polls: _generate-search calls before a template is completed
+        """
+        self.default_latency = default_latency
+        self.duplicate_mode = duplicate_mode
+        self.port = port
+        self.template_polls = template_polls
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self._behaviour = {}
+        self._stats = {}
+        self._server = None
+        self._thread = None
+        self.reset_state()
+
+    # ------------------------------------------------------------------
+    # lifecycle
+    # ------------------------------------------------------------------
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.port}"
+
+    def start(self) -> str:
+        """Start serving; returns the base URL"""
+        gateway = self
+
+        class Handler(_Handler):
+            pass
+        Handler.gateway = gateway
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", self.port), Handler)
+        self._server.daemon_threads = True
+        self.port = self._server.server_address[1]
+        self._thread = threading.Thread(target=self._server.serve_forever, args=(0.05,), daemon=True)
+        self._thread.start()
+        return self.url
+
+    def stop(self):
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    # ------------------------------------------------------------------
+    # configuration and stats
+    # ------------------------------------------------------------------
+
+    def configure(self, route: str, latency: float = None, error_rate: float = 0.0,
+                  error_status: int = 500, throttle_rate: float = 0.0, retry_after: float = 0):
+        """Set behaviour for one route key (see ROUTES) or "*" for all
+
+        Args:
+            route: Route key, e.g. "mdms/_create"
+            latency: Seconds to sleep before answering (default: default_latency)
+            error_rate: Fraction of calls answered with error_status
+            error_status: Status used for injected errors
+            throttle_rate: Fraction of calls answered 429
+            retry_after: Retry-After header sent with injected 429s
+        """
+        self._behaviour[route] = {
+            "latency": latency,
+            "error_rate": error_rate,
+            "error_status": error_status,
+            "throttle_rate": throttle_rate,
+            "retry_after": retry_after,
+        }
+
+    def stats(self) -> dict:
+        """Per-route counters: calls, errors, throttled, bytes_in, bytes_out"""
+        with self._lock:
+            return {route: dict(s) for route, s in self._stats.items()}
+
+    def reset_stats(self):
+        with self._lock:
+            self._stats = {}
+
+    def reset_state(self):
+        """Forget every record created so far"""
+        with self._lock:
+            self.mdms = {}            # (tenant, schema) -> {uniqueIdentifier: record}
+            self.schemas = {}         # (tenant, code) -> schema definition
+            self.boundaries = {}      # (tenant, code) -> entity
+            self.boundary_deletes = []  # codes in the order boundary/_delete removed them
+            self.relationships = {}   # (tenant, hierarchyType) -> {code: relationship}
+            self.hierarchies = {}     # (tenant, hierarchyType) -> definition
+            self.employees = {}       # (tenant, code) -> employee
+            self.users = {}           # uuid -> user
+            self.usernames = set()    # (tenant, userName)
+            self.messages = {}        # (tenant, locale) -> {(module, code): message}
+            self.workflows = {}       # (tenant, businessService) -> business service
+            self.files = {}           # fileStoreId -> size
+            self.templates = {}       # (tenant, hierarchyType) -> [generation resource, polls left]
+            self.tokens = set()       # access tokens issued
+            self.revoked = set()      # tokens answered with 401 (see expire_tokens)
+
+    def expire_tokens(self):
+        """Reject every token issued so far with 401, as after a token expiry"""
+        with self._lock:
+            self.revoked |= self.tokens
+            self.tokens = set()
+
+    def seed_mdms(self, tenant: str, schema_code: str, records, key: str = "code"):
+        """Preload MDMS records a real environment would already have (e.g. roles)"""
+        with self._lock:
+            existing = self.mdms.setdefault((tenant, schema_code), {})
+            for data in records:
+                existing[data[key]] = {
+                    "id": str(uuid.uuid4()), "tenantId": tenant, "schemaCode": schema_code,
+                    "uniqueIdentifier": data[key], "data": data, "isActive": True,
+                }
+
+    def _record(self, route, bytes_in, bytes_out, outcome):
+        with self._lock:
+            s = self._stats.setdefault(route, {"calls": 0, "errors": 0, "throttled": 0,
+                                               "bytes_in": 0, "bytes_out": 0})
+            s["calls"] += 1
+            s["bytes_in"] += bytes_in
+            s["bytes_out"] += bytes_out
+            if outcome == "error":
+                s["errors"] += 1
+            elif outcome == "throttled":
+                s["throttled"] += 1
+
+    def _inject(self, route):
+        """Latency to apply and an injected (status, body, headers) or None"""
+        behaviour = self._behaviour.get(route) or self._behaviour.get("*") or {}
+        latency = behaviour.get("latency")
+        if latency is None:
+            latency = self.default_latency
+
+        with self._lock:
+            roll = self._rng.random()
+        throttle_rate = behaviour.get("throttle_rate", 0.0)
+        error_rate = behaviour.get("error_rate", 0.0)
+        if roll < throttle_rate:
+            headers = {"Retry-After": str(behaviour.get("retry_after", 0))}
+            return latency, (429, _errors("TOO_MANY_REQUESTS", "Rate limit exceeded"), headers)
+        if roll < throttle_rate + error_rate:
+            status = behaviour.get("error_status", 500)
+            return latency, (status, _errors("INJECTED_ERROR", f"Injected failure ({status})"), {})
+        return latency, None
+
+    # ------------------------------------------------------------------
+    # request handling
+    # ------------------------------------------------------------------
+
+    def handle(self, route, query, body):
+        """Dispatch to the handler for route; returns (status, response_dict)"""
+        handler = getattr(self, "_" + route.replace("/", "_").replace("-", "_"), None)
+        if handler is None:
+            return 404, _errors("NOT_FOUND", f"No fake handler for {route}")
+        with self._lock:
+            return handler(query, body)
+
+    @staticmethod
+    def _tenant(query, body, *keys):
+        for key in keys:
+            node = body.get(key) if isinstance(body, dict) else None
+            if isinstance(node, dict) and node.get("tenantId"):
+                return node["tenantId"]
+        return (query.get("tenantId") or [None])[0] or (body.get("tenantId") if isinstance(body, dict) else None)
+
+    # --- MDMS ---------------------------------------------------------
+
+    def _mdms__search(self, query, body):
+        criteria = body.get("MdmsCriteria", {})
+        records = list(self.mdms.get((criteria.get("tenantId"), criteria.get("schemaCode")), {}).values())
+        ids = criteria.get("uniqueIdentifiers")
+        if ids:
+            records = [r for r in records if r["uniqueIdentifier"] in ids]
+        if criteria.get("isActive") is not None:
+            records = [r for r in records if r["isActive"] == criteria["isActive"]]
+        offset = criteria.get("offset") or 0
+        limit = criteria.get("limit") or 100
+        return 200, {"mdms": records[offset:offset + limit]}
+
+    def _mdms__create(self, query, body):
+        mdms = body.get("Mdms", {})
+        key = (mdms.get("tenantId"), mdms.get("schemaCode"))
+        data = mdms.get("data") or {}
+        unique_id = mdms.get("uniqueIdentifier") or data.get("code") or str(uuid.uuid4())
+        existing = self.mdms.setdefault(key, {})
+        if unique_id in existing:
+            if self.duplicate_mode == "phantom":
+                return 200, {"ResponseInfo": {"status": "successful"}, "mdms": []}
+            return 400, _errors("DUPLICATE_RECORD",
+                                f"Record with uniqueIdentifier {unique_id} already exists")
+        record = {
+            "id": str(uuid.uuid4()),
+            "tenantId": mdms.get("tenantId"),
+            "schemaCode": mdms.get("schemaCode"),
+            "uniqueIdentifier": unique_id,
+            "data": data,
+            "isActive": mdms.get("isActive", True),
+            "auditDetails": {"createdTime": int(time.time() * 1000)},
+        }
+        existing[unique_id] = record
+        return 200, {"mdms": [record]}
+
+    def _mdms__update(self, query, body):
+        mdms = body.get("Mdms", {})
+        records = self.mdms.get((mdms.get("tenantId"), mdms.get("schemaCode")), {})
+        unique_id = mdms.get("uniqueIdentifier")
+        if unique_id not in records:
+            return 400, _errors("NOT_FOUND", f"Record {unique_id} not found")
+        record = records[unique_id]
+        record["data"] = mdms.get("data", record["data"])
+        record["isActive"] = mdms.get("isActive", record["isActive"])
+        return 200, {"mdms": [record]}
+
+    def _mdms_v1__search(self, query, body):
+        criteria = body.get("MdmsCriteria", {})
+        tenant = criteria.get("tenantId")
+        result = {}
+        for module in criteria.get("moduleDetails", []):
+            name = module.get("moduleName")
+            for master in module.get("masterDetails", []):
+                records = self.mdms.get((tenant, f"{name}.{master.get('name')}"), {})
+                active = [r["data"] for r in records.values() if r["isActive"]]
+                if active:
+                    result.setdefault(name, {})[master.get("name")] = active
+        return 200, {"MdmsRes": result}
+
+    def _mdms_schema__search(self, query, body):
+        criteria = body.get("SchemaDefCriteria", {})
+        tenant = criteria.get("tenantId")
+        codes = criteria.get("codes")
+        found = [s for (t, code), s in self.schemas.items()
+                 if t == tenant and (not codes or code in codes)]
+        return 200, {"SchemaDefinitions": found[:criteria.get("limit") or 500]}
+
+    def _mdms_schema__create(self, query, body):
+        schema = body.get("SchemaDefinition", {})
+        key = (schema.get("tenantId"), schema.get("code"))
+        if key in self.schemas:
+            return 400, _errors("DUPLICATE_RECORD", f"Schema {key[1]} already exists")
+        self.schemas[key] = dict(schema, id=str(uuid.uuid4()), isActive=True)
+        return 200, {"SchemaDefinitions": [self.schemas[key]]}
+
+    # --- boundary-service ---------------------------------------------
+
+    def _boundary__create(self, query, body):
+        created = []
+        for entity in body.get("Boundary", []):
+            key = (entity.get("tenantId"), entity.get("code"))
+            if key in self.boundaries:
+                return 400, _errors("DUPLICATE_CODE", f"Boundary {key[1]} already exists")
+            self.boundaries[key] = dict(entity, id=str(uuid.uuid4()))
+            created.append(self.boundaries[key])
+        return 200, {"Boundary": created}
+
+    def _boundary__search(self, query, body):
+        criteria = body.get("BoundaryCriteria") or body.get("Boundary") or {}
+        tenant = criteria.get("tenantId") or (query.get("tenantId") or [None])[0]
+        codes = criteria.get("codes") or query.get("codes")
+        found = [b for (t, code), b in self.boundaries.items()
+                 if t == tenant and (not codes or code in codes)]
+        offset = int(criteria.get("offset") or (query.get("offset") or [0])[0])
+        limit = int(criteria.get("limit") or (query.get("limit") or [100])[0])
+        return 200, {"Boundary": found[offset:offset + limit]}
+
+    def _boundary__delete(self, query, body):
+        key = ((query.get("tenantId") or [None])[0], (query.get("code") or [None])[0])
+        if self.boundaries.pop(key, None) is not None:
+            self.boundary_deletes.append(key[1])
+        return 200, {"ResponseInfo": {"status": "successful"}}
+
+    def _boundary_relationships__create(self, query, body):
+        rel = body.get("BoundaryRelationship", {})
+        tenant, code = rel.get("tenantId"), rel.get("code")
+        tree = self.relationships.setdefault((tenant, rel.get("hierarchyType")), {})
+        if (tenant, code) not in self.boundaries:
+            return 400, _errors("INVALID_BOUNDARY", f"Boundary entity {code} does not exist")
+        if code in tree:
+            return 400, _errors("DUPLICATE_RECORD", f"Relationship for {code} already exists")
+        parent = rel.get("parent")
+        if parent and parent not in tree:
+            return 400, _errors("INVALID_PARENT", f"Parent {parent} does not exist in hierarchy")
+        tree[code] = dict(rel, id=str(uuid.uuid4()))
+        return 200, {"TenantBoundary": [{"tenantId": tenant, "hierarchyType": rel.get("hierarchyType"),
+                                         "boundary": [tree[code]]}]}
+
+    def _boundary_relationships__search(self, query, body):
+        tenant = (query.get("tenantId") or [None])[0]
+        hierarchy_type = (query.get("hierarchyType") or [None])[0]
+        tree = self.relationships.get((tenant, hierarchy_type), {})
+        children = {}
+        for code, rel in tree.items():
+            children.setdefault(rel.get("parent"), []).append(code)
+
+        def node(code):
+            return {"code": code, "boundaryType": tree[code].get("boundaryType"),
+                    "children": [node(c) for c in children.get(code, [])]}
+
+        offset = int((query.get("offset") or [0])[0])
+        limit = int((query.get("limit") or [10])[0])
+        roots = [node(c) for c in children.get(None, [])[offset:offset + limit]]
+        return 200, {"TenantBoundary": [{"tenantId": tenant, "hierarchyType": hierarchy_type,
+                                         "boundary": roots}] if tree else []}
+
+    def _boundary_hierarchy__create(self, query, body):
+        definition = body.get("BoundaryHierarchy", {})
+        key = (definition.get("tenantId"), definition.get("hierarchyType"))
+        if key in self.hierarchies:
+            return 400, _errors("DUPLICATE_RECORD", f"Hierarchy {key[1]} already exists")
+        self.hierarchies[key] = dict(definition, id=str(uuid.uuid4()))
+        return 200, {"BoundaryHierarchy": [self.hierarchies[key]]}
+
+    def _boundary_hierarchy__search(self, query, body):
+        criteria = body.get("BoundaryTypeHierarchySearchCriteria", {})
+        found = [h for (t, ht), h in self.hierarchies.items()
+                 if t == criteria.get("tenantId")
+                 and (not criteria.get("hierarchyType") or ht == criteria["hierarchyType"])]
+        return 200, {"BoundaryHierarchy": found}
+
+    def _boundary_hierarchy__delete(self, query, body):
+        definition = body.get("BoundaryTypeHierarchyDefinition") or body.get("BoundaryHierarchy", {})
+        self.hierarchies.pop((definition.get("tenantId"), definition.get("hierarchyType")), None)
+        return 200, {"ResponseInfo": {"status": "successful"}}
+
+    def _boundary_management__generate(self, query, body):
+        key = ((query.get("tenantId") or [None])[0], (query.get("hierarchyType") or [None])[0])
+        resource = {"id": str(uuid.uuid4()), "tenantId": key[0], "hierarchyType": key[1],
+                    "status": "inprogress", "fileStoreid": None}
+        if key not in self.hierarchies:
+            resource.update(status="failed", error=f"Hierarchy {key[1]} not found")
+        self.templates[key] = [resource, self.template_polls]
+        return 200, {"ResourceDetails": [resource]}
+
+    def _boundary_management__generate_search(self, query, body):
+        key = ((query.get("tenantId") or [None])[0], (query.get("hierarchyType") or [None])[0])
+        if key not in self.templates:
+            return 200, {"GeneratedResource": []}
+        entry = self.templates[key]
+        resource = entry[0]
+        if resource["status"] == "inprogress":
+            entry[1] -= 1
+            if entry[1] <= 0:
+                filestore_id = str(uuid.uuid4())
+                self.files[filestore_id] = 0
+                resource.update(status="completed", fileStoreid=filestore_id)
+        return 200, {"GeneratedResource": [resource]}
+
+    # --- HRMS and user ------------------------------------------------
+
+    def _hrms__create(self, query, body):
+        created = []
+        for employee in body.get("Employees", []):
+            tenant = employee.get("tenantId")
+            user = dict(employee.get("user") or {})
+            username = user.get("userName") or employee.get("code")
+            if (tenant, employee.get("code")) in self.employees or (tenant, username) in self.usernames:
+                return 400, _errors("DUPLICATE_USERNAME",
+                                    "ERROR: duplicate key value violates unique constraint "
+                                    "\"eg_user_username_key\" - user already exists")
+            user.update(uuid=str(uuid.uuid4()), userName=username, id=len(self.users) + 1)
+            user.pop("password", None)
+            self.users[user["uuid"]] = user
+            self.usernames.add((tenant, username))
+            record = dict(employee, uuid=str(uuid.uuid4()), user=user)
+            self.employees[(tenant, employee.get("code"))] = record
+            created.append(record)
+        return 200, {"Employees": created}
+
+    def _hrms__search(self, query, body):
+        tenant = (query.get("tenantId") or [None])[0]
+        codes = set(",".join(query.get("codes", [])).split(",")) - {""}
+        found = [e for (t, code), e in self.employees.items()
+                 if t == tenant and (not codes or code in codes)]
+        return 200, {"Employees": found}
+
+    def _hrms__update(self, query, body):
+        for employee in body.get("Employees", []):
+            self.employees[(employee.get("tenantId"), employee.get("code"))] = employee
+        return 200, {"Employees": body.get("Employees", [])}
+
+    def _user_oauth(self, query, body):
+        token = "fake-" + uuid.uuid4().hex
+        self.tokens.add(token)
+        return 200, {
+            "access_token": token,
+            "token_type": "bearer",
+            "expires_in": 604800,
+            "UserRequest": {"id": 1, "uuid": "fake-admin", "userName": "ADMIN", "name": "Fake Admin",
+                            "type": "EMPLOYEE", "tenantId": "pg",
+                            "roles": [{"code": "SUPERUSER", "name": "Super User", "tenantId": "pg"}]},
+        }
+
+    def _user__search(self, query, body):
+        uuids = body.get("uuid") or []
+        names = [body["userName"]] if body.get("userName") else []
+        found = [u for u in self.users.values()
+                 if u.get("uuid") in uuids or u.get("userName") in names]
+        return 200, {"user": found}
+
+    def _user__updatenovalidate(self, query, body):
+        user = dict(body.get("User") or {})
+        user.pop("password", None)
+        if user.get("uuid") in self.users:
+            self.users[user["uuid"]].update(user)
+        return 200, {"user": [user]}
+
+    def _user__createnovalidate(self, query, body):
+        user = dict(body.get("User") or {})
+        key = (user.get("tenantId"), user.get("userName"))
+        if key in self.usernames:
+            return 400, _errors("DuplicateUserNameException", "User with username already exists")
+        user.pop("password", None)
+        user.update(uuid=str(uuid.uuid4()), id=len(self.users) + 1)
+        self.users[user["uuid"]] = user
+        self.usernames.add(key)
+        return 200, {"user": [user]}
+
+    # --- localization -------------------------------------------------
+
+    def _localization__upsert(self, query, body):
+        tenant = body.get("tenantId") or (query.get("tenantId") or [None])[0]
+        upserted = []
+        for message in body.get("messages", []):
+            locale = message.get("locale") or body.get("locale")
+            store = self.messages.setdefault((tenant, locale), {})
+            store[(message.get("module"), message.get("code"))] = dict(message, locale=locale)
+            upserted.append(message)
+        return 200, {"messages": upserted}
+
+    def _localization__search(self, query, body):
+        tenant = (query.get("tenantId") or [None])[0]
+        locale = (query.get("locale") or [None])[0]
+        module = (query.get("module") or [None])[0]
+        store = self.messages.get((tenant, locale), {})
+        found = [m for (mod, _), m in store.items() if not module or mod in module.split(",")]
+        return 200, {"messages": found}
+
+    # --- workflow -----------------------------------------------------
+
+    def _workflow__search(self, query, body):
+        tenant = (query.get("tenantId") or [None])[0]
+        wanted = set(",".join(query.get("businessServices", [])).split(",")) - {""}
+        found = [bs for (t, name), bs in self.workflows.items()
+                 if t == tenant and (not wanted or name in wanted)]
+        return 200, {"BusinessServices": found}
+
+    @staticmethod
+    def _assign_uuids(business_service):
+        business_service.setdefault("uuid", str(uuid.uuid4()))
+        for state in business_service.get("states", []) or []:
+            state.setdefault("uuid", str(uuid.uuid4()))
+            for action in state.get("actions", []) or []:
+                action.setdefault("uuid", str(uuid.uuid4()))
+        return business_service
+
+    def _workflow__create(self, query, body):
+        created = []
+        for bs in body.get("BusinessServices", []):
+            key = (bs.get("tenantId"), bs.get("businessService"))
+            if key in self.workflows:
+                return 400, _errors("DUPLICATE_RECORD", f"Business service {key[1]} already exists")
+            self.workflows[key] = self._assign_uuids(json.loads(json.dumps(bs)))
+            created.append(self.workflows[key])
+        return 200, {"BusinessServices": created}
+
+    def _workflow__update(self, query, body):
+        updated = []
+        for bs in body.get("BusinessServices", []):
+            key = (bs.get("tenantId"), bs.get("businessService"))
+            if key not in self.workflows:
+                return 400, _errors("NOT_FOUND", f"Business service {key[1]} not found")
+            # Like egov-workflow: states in the request replace the stored
+            # state with the same uuid, new ones are added, the rest stay
+            bs = json.loads(json.dumps(bs))
+            stored = self.workflows[key]
+            states = {s["uuid"]: s for s in stored.get("states", [])}
+            for state in bs.pop("states", []) or []:
+                state["uuid"] = state.get("uuid") or str(uuid.uuid4())
+                states[state["uuid"]] = state
+            stored.update(bs, states=list(states.values()))
+            self.workflows[key] = self._assign_uuids(stored)
+            updated.append(self.workflows[key])
+        return 200, {"BusinessServices": updated}
+
+    # --- filestore and data handler -----------------------------------
+
+    def _filestore_upload(self, query, body):
+        filestore_id = str(uuid.uuid4())
+        self.files[filestore_id] = body.get("_size", 0)
+        return 200, {"files": [{"fileStoreId": filestore_id, "tenantId": "pg"}]}
+
+    def _filestore_url(self, query, body):
+        ids = ",".join(query.get("fileStoreIds", [])).split(",")
+        return 200, {"fileStoreIds": [{"id": i, "url": f"{self.url}/filestore/files/{i}"}
+                                      for i in ids if i in self.files]}
+
+    def _filestore_file(self, query, body):
+        return 200, {"fileStoreId": "template"}
+
+    def _data_handler_tenant(self, query, body):
+        return 200, {"ResponseInfo": {"status": "successful"}}
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """Keep-alive HTTP handler that defers to FakeGateway.handle"""
+
+    protocol_version = "HTTP/1.1"
+    gateway: FakeGateway = None
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        self._serve()
+
+    def do_POST(self):
+        self._serve()
+
+    def _serve(self):
+        parsed = urlparse(self.path)
+        length = int(self.headers.get("Content-Length") or 0)
+        raw = self.rfile.read(length) if length else b""
+        route = route_for(parsed.path)
+        gateway = self.gateway
+
+        latency, injected = gateway._inject(route) if route else (gateway.default_latency, None)
+        if latency:
+            time.sleep(latency)
+
+        headers = {}
+        outcome = None
+        if route is None:
+            status, payload = 404, _errors("NOT_FOUND", f"Unknown path {parsed.path}")
+        elif injected:
+            status, payload, headers = injected
+            outcome = "throttled" if status == 429 else "error"
+        else:
+            content_type = self.headers.get("Content-Type", "")
+            if "json" in content_type and raw:
+                try:
+                    body = json.loads(raw)
+                except ValueError:
+                    body = None
+                if not isinstance(body, dict):
+                    status, payload = 400, _errors("INVALID_JSON", "Request body is not a JSON object")
+                    body = None
+            else:
+                body = {"_size": len(raw)}
+            request_info = body.get("RequestInfo") if isinstance(body, dict) else None
+            if isinstance(request_info, dict) and request_info.get("authToken") in gateway.revoked:
+                status, payload = 401, _errors("InvalidAccessTokenException", "Invalid access token")
+            elif body is not None:
+                status, payload = gateway.handle(route, parse_qs(parsed.query), body)
+            if status >= 400:
+                outcome = "error"
+
+        out = json.dumps(payload).encode()
+        if route:
+            gateway._record(route, len(raw), len(out), outcome)
+
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(out)))
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(out)
@@ -6,10 +6,12 @@ PRESERVES existing validations, formatting, and formulas in the Translation colu
 
 import requests
 import pandas as pd
-import json
 import os
-from openpyxl import load_workbook
+from concurrent.futures import ThreadPoolExecutor
+from openpyxl import Workbook, load_workbook
+from openpyxl.cell import WriteOnlyCell
 from openpyxl.styles import Font
+from openpyxl.utils import get_column_letter
 from openpyxl.worksheet.datavalidation import DataValidation
 from copy import copy
 
@@ -23,25 +25,31 @@ PARAMS = {
 OUTPUT_FILE = "localization.xlsx"
 SHEET_NAME = "localization"
 
+REQUEST_TIMEOUT = 60
+PAGE_SIZE = 5000
+FETCH_WORKERS = 8
 
-def fetch_localization_data(url, params=None):
+
+def fetch_localization_data(url, params=None, session=None):
     """
     Fetch localization data from the API
 
     Args:
         url: Full API URL
         params: Dictionary with 'locale' and 'tenantId'. If None, uses global PARAMS
+        session: Optional requests.Session to reuse connections
 
     Returns:
         JSON response data or None if request fails
     """
     try:
-        print(f"Fetching data from: {url}")
+        print(f"Fetching data from: {url} {params or ''}")
         # Use provided params or fall back to global PARAMS
         request_params = params if params is not None else PARAMS
-        response = requests.post(
+        response = (session or requests).post(
             url,
-            params=request_params
+            params=request_params,
+            timeout=REQUEST_TIMEOUT
         )
 
         response.raise_for_status()
@@ -82,6 +90,75 @@ def parse_messages(api_response):
     return messages
 
 
+def fetch_messages_paged(url, params, page_size=PAGE_SIZE, session=None):
+    """
+    Fetch every message for one locale/tenant(/module), page by page
+
+    Pages are requested with limit/offset. A short page ends the fetch, and so
+    does a page with no new (module, code) pairs, for servers that ignore
+    limit/offset and return everything every time.
+
+    Returns:
+        List of message dictionaries, or None if the first request fails
+    """
+    messages = []
+    seen = set()
+    offset = 0
+    while True:
+        api_response = fetch_localization_data(
+            url, params=dict(params, limit=page_size, offset=offset), session=session)
+        if api_response is None:
+            return messages if offset else None
+        page = parse_messages(api_response)
+        fresh = []
+        for msg in page:
+            key = (msg.get('module'), msg.get('code'))
+            if key not in seen:
+                seen.add(key)
+                fresh.append(msg)
+        messages.extend(fresh)
+        if len(page) < page_size or not fresh:
+            return messages
+        offset += page_size
+
+
+def fetch_all_messages(base_url, tenant_id, locales, modules=None,
+                       page_size=PAGE_SIZE, workers=FETCH_WORKERS):
+    """
+    Fetch several locales (and modules) concurrently
+
+    One paged fetch runs per (locale, module) pair on a shared connection
+    pool; modules=None fetches every module in one go per locale.
+
+    Returns:
+        Dictionary mapping locale to its list of messages (None if a fetch failed)
+    """
+    url = f"{base_url.rstrip('/')}/localization/messages/v1/_search"
+    jobs = [(locale, module) for locale in locales for module in (modules or [None])]
+
+    session = requests.Session()
+    adapter = requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=max(workers, 1))
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+
+    def fetch(job):
+        locale, module = job
+        params = {'locale': locale, 'tenantId': tenant_id}
+        if module:
+            params['module'] = module
+        return fetch_messages_paged(url, params, page_size=page_size, session=session)
+
+    results = {locale: [] for locale in locales}
+    with session, ThreadPoolExecutor(max_workers=max(1, min(workers, len(jobs))),
+                                     thread_name_prefix="localization-fetch") as pool:
+        for (locale, _), messages in zip(jobs, pool.map(fetch, jobs)):
+            if messages is None or results[locale] is None:
+                results[locale] = None
+            else:
+                results[locale].extend(messages)
+    return results
+
+
 def create_dataframe(messages, selected_language_name):
     """
     Create a pandas DataFrame from messages with standard columns
@@ -93,22 +170,33 @@ def create_dataframe(messages, selected_language_name):
     Returns:
         pandas DataFrame with localization data
     """
-    data = []
-
-    for msg in messages:
-        row = {
-            'Code': msg.get('code', ''),
-            'Message': msg.get('message', ''),
-            'Module': msg.get('module', ''),
-            'Locale': selected_language_name,  # Use the selected language name for all rows
-            'Translation': ''  # Empty column for translations
-        }
-        data.append(row)
-
-    df = pd.DataFrame(data)
+    df = pd.DataFrame({
+        'Code': [msg.get('code', '') for msg in messages],
+        'Message': [msg.get('message', '') for msg in messages],
+        'Module': [msg.get('module', '') for msg in messages],
+    })
+    df['Locale'] = selected_language_name  # Use the selected language name for all rows
+    df['Translation'] = ''  # Empty column for translations
     return df
 
 
+_loaded_workbook = {}
+
+
+def _load_workbook_once(filename):
+    """load_workbook(filename), reusing the last parse while the file is unchanged
+
+    Parsing a large pack dominates an export; reading the existing
+    translations and saving over the file share one parse.
+    """
+    stat = os.stat(filename)
+    key = (os.path.abspath(filename), stat.st_mtime_ns, stat.st_size)
+    if _loaded_workbook.get('key') != key:
+        _loaded_workbook.clear()
+        _loaded_workbook.update(key=key, workbook=load_workbook(filename))
+    return _loaded_workbook['workbook']
+
+
 def read_existing_translations(filename, sheet_name):
     """
     Read existing translations from the Excel file
@@ -118,23 +206,29 @@ def read_existing_translations(filename, sheet_name):
         sheet_name: Sheet name
 
     Returns:
-        Dictionary mapping Code to Translation value
+        DataFrame with Code, Translation (and Locale, if the sheet has it)
+        columns; one row per non-empty translation, the last one per key
     """
-    translations = {}
+    translations = pd.DataFrame(columns=['Code', 'Translation'])
 
     if not os.path.exists(filename):
         return translations
 
     try:
-        existing_df = pd.read_excel(filename, sheet_name=sheet_name)
+        # Parsed once and reused by preserve_validations_and_save
+        rows = _load_workbook_once(filename)[sheet_name].iter_rows(values_only=True)
+        header = [str(h) if h is not None else '' for h in next(rows, ())]
+        wanted = [i for i, h in enumerate(header) if h in ('Code', 'Locale', 'Translation')]
+        existing_df = pd.DataFrame([[row[i] if i < len(row) else None for i in wanted] for row in rows],
+                                   columns=[header[i] for i in wanted], dtype=object)
 
-        # Create mapping of Code to Translation
         if 'Code' in existing_df.columns and 'Translation' in existing_df.columns:
-            for _, row in existing_df.iterrows():
-                code = row.get('Code', '')
-                translation = row.get('Translation', '')
-                if code and translation:  # Only save non-empty translations
-                    translations[code] = translation
+            keys = ['Code', 'Locale'] if 'Locale' in existing_df.columns else ['Code']
+            existing_df = existing_df[keys + ['Translation']]
+            # Only save non-empty translations
+            filled = existing_df['Code'].fillna('').astype(bool) & \
+                existing_df['Translation'].fillna('').astype(bool)
+            translations = existing_df[filled].astype(str).drop_duplicates(keys, keep='last')
 
         print(f"✓ Loaded {len(translations)} existing translations")
 
@@ -148,24 +242,114 @@ def merge_translations(df, existing_translations):
     """
     Merge existing translations into the new dataframe
 
+    A left join on Code (and Locale, when the existing sheet has it), so a
+    sheet holding several locales keeps each locale's translation. Rows with
+    no Code + Locale match (e.g. the sheet is re-exported for another locale)
+    fall back to the Code's translation in any locale, the last one read, so
+    translator work is not dropped.
+
     Args:
         df: New dataframe
-        existing_translations: Dictionary of Code -> Translation
+        existing_translations: DataFrame from read_existing_translations, or
+            a dictionary of Code -> Translation
 
     Returns:
         DataFrame with merged translations
     """
-    if existing_translations:
-        df['Translation'] = df['Code'].map(existing_translations).fillna('')
+    if isinstance(existing_translations, dict):
+        existing_translations = pd.DataFrame({'Code': list(existing_translations),
+                                              'Translation': list(existing_translations.values())})
+    if len(existing_translations):
+        keys = [k for k in ('Code', 'Locale') if k in existing_translations.columns]
+        merged = df.drop(columns=['Translation']).merge(
+            existing_translations[keys + ['Translation']], on=keys, how='left')
+        if keys != ['Code']:
+            by_code = existing_translations.drop_duplicates('Code', keep='last').set_index('Code')['Translation']
+            merged['Translation'] = merged['Translation'].fillna(merged['Code'].map(by_code))
+        merged['Translation'] = merged['Translation'].fillna('')
+        df = merged[df.columns]
         print(f"✓ Merged existing translations for {df['Translation'].astype(bool).sum()} records")
 
     return df
 
 
+def _column_widths(df):
+    """Column letter -> width fitted to the longest value (capped at 50)"""
+    widths = {}
+    for idx, col in enumerate(df.columns, start=1):
+        max_length = max(
+            int(df[col].astype(str).str.len().max()) if len(df) > 0 else 0,
+            len(col)
+        )
+        widths[get_column_letter(idx)] = min(max_length + 5, 50)
+    return widths
+
+
+def _save_new_workbook(df, filename, sheet_name):
+    """Stream a new workbook (write-only mode: rows are never held as cells)"""
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet(sheet_name)
+    for col_letter, width in _column_widths(df).items():
+        ws.column_dimensions[col_letter].width = width
+
+    header = []
+    for name in df.columns:
+        cell = WriteOnlyCell(ws, value=name)
+        cell.font = Font(bold=True)
+        header.append(cell)
+    ws.append(header)
+    for row in df.itertuples(index=False, name=None):
+        ws.append(list(row))
+    wb.save(filename)
+
+
+def _write_changed_cells(ws, df):
+    """Update ws to hold df; returns the number of cells written
+
+    Existing values are read once and only cells whose value differs are
+    written, so re-exporting a pack with a few new messages touches a few
+    cells. Rows past the end of df are removed.
+    """
+    headers = df.columns.tolist()
+    width = len(headers)
+    current = [tuple(row) for row in ws.iter_rows(min_row=1, max_row=ws.max_row,
+                                                   max_col=width, values_only=True)]
+    blank = (None,) * width
+    written = 0
+
+    # Write/update headers
+    for col_idx, header in enumerate(headers, start=1):
+        cell = ws.cell(row=1, column=col_idx)
+        if cell.value != header:
+            cell.value = header
+            written += 1
+        if not cell.font.bold:
+            cell.font = Font(bold=True)
+
+    # Write/update data rows; '' and None are both an empty cell
+    for row_idx, row_data in enumerate(df.itertuples(index=False, name=None), start=2):
+        old = current[row_idx - 1] if row_idx - 1 < len(current) else blank
+        if old == row_data:
+            continue
+        for col_idx, (value, old_value) in enumerate(zip(row_data, old), start=1):
+            if value != old_value and (value not in ('', None) or old_value not in ('', None)):
+                ws.cell(row=row_idx, column=col_idx, value=value)
+                written += 1
+
+    surplus = ws.max_row - (len(df) + 1)
+    if surplus > 0:
+        ws.delete_rows(len(df) + 2, surplus)
+    return written
+
+
 def preserve_validations_and_save(df, filename, sheet_name):
     """
     Save DataFrame to Excel while preserving existing validations and formatting
 
+    A new file is streamed in write-only mode. An existing workbook is loaded
+    so other sheets, formatting and validations survive; only cells whose
+    value changed are rewritten.
+
     Args:
         df: pandas DataFrame
         filename: Output Excel filename
@@ -174,60 +358,45 @@ def preserve_validations_and_save(df, filename, sheet_name):
     try:
         file_exists = os.path.exists(filename)
 
-        if file_exists:
-            # Load existing workbook to preserve everything
-            print("✓ Loading existing workbook to preserve validations...")
-            wb = load_workbook(filename)
-
-            # Check if sheet exists
-            if sheet_name in wb.sheetnames:
-                ws = wb[sheet_name]
-                # Store existing data validations exactly as they are
-                stored_validations = []
-                for dv in ws.data_validations.dataValidation:
-                    stored_validations.append({
-                        'type': dv.type,
-                        'formula1': dv.formula1,
-                        'formula2': dv.formula2,
-                        'allow_blank': dv.allow_blank,
-                        'showDropDown': dv.showDropDown,
-                        'showInputMessage': dv.showInputMessage,
-                        'showErrorMessage': dv.showErrorMessage,
-                        'errorTitle': dv.errorTitle,
-                        'error': dv.error,
-                        'promptTitle': dv.promptTitle,
-                        'prompt': dv.prompt,
-                        'ranges': [str(r) for r in dv.cells.ranges]
-                    })
-                print(f"✓ Found {len(stored_validations)} validation rules to preserve")
-            else:
-                ws = wb.create_sheet(sheet_name)
-                stored_validations = []
-        else:
-            # Create new workbook with both sheets
+        if not file_exists:
             print("✓ Creating new workbook...")
-            from openpyxl import Workbook
-            wb = Workbook()
-            ws = wb.active
-            ws.title = sheet_name
+            _save_new_workbook(df, filename, sheet_name)
+            print(f"✓ Data saved to {filename}")
+            print(f"✓ Total records: {len(df)}")
+            return
+
+        # Load existing workbook to preserve everything
+        print("✓ Loading existing workbook to preserve validations...")
+        wb = _load_workbook_once(filename)
+        _loaded_workbook.clear()
+
+        # Check if sheet exists
+        if sheet_name in wb.sheetnames:
+            ws = wb[sheet_name]
+            # Store existing data validations exactly as they are
+            stored_validations = []
+            for dv in ws.data_validations.dataValidation:
+                stored_validations.append({
+                    'type': dv.type,
+                    'formula1': dv.formula1,
+                    'formula2': dv.formula2,
+                    'allow_blank': dv.allow_blank,
+                    'showDropDown': dv.showDropDown,
+                    'showInputMessage': dv.showInputMessage,
+                    'showErrorMessage': dv.showErrorMessage,
+                    'errorTitle': dv.errorTitle,
+                    'error': dv.error,
+                    'promptTitle': dv.promptTitle,
+                    'prompt': dv.prompt,
+                    'ranges': [str(r) for r in dv.cells.ranges]
+                })
+            print(f"✓ Found {len(stored_validations)} validation rules to preserve")
+        else:
+            ws = wb.create_sheet(sheet_name)
             stored_validations = []
 
-        # Get the existing row count to know if we need to delete or add rows
-        existing_rows = ws.max_row
-        new_rows = len(df) + 1  # +1 for header
-
-        # Update existing cells instead of deleting rows
-        headers = df.columns.tolist()
-
-        # Write/update headers
-        for col_idx, header in enumerate(headers, start=1):
-            cell = ws.cell(row=1, column=col_idx, value=header)
-            cell.font = Font(bold=True)
-
-        # Write/update data rows
-        for row_idx, row_data in enumerate(df.values, start=2):
-            for col_idx, value in enumerate(row_data, start=1):
-                ws.cell(row=row_idx, column=col_idx, value=value)
+        written = _write_changed_cells(ws, df)
+        print(f"✓ Updated {written} changed cells")
 
         # Restore data validations with exact same ranges (adjusted for row count)
         if stored_validations:
@@ -264,13 +433,8 @@ def preserve_validations_and_save(df, filename, sheet_name):
                         new_dv.add(new_range)
 
         # Auto-adjust column widths
-        for idx, col in enumerate(headers, start=1):
-            max_length = max(
-                df[col].astype(str).apply(len).max() if len(df) > 0 else 0,
-                len(col)
-            )
-            col_letter = chr(64 + idx)  # A, B, C, etc.
-            ws.column_dimensions[col_letter].width = min(max_length + 5, 50)
+        for col_letter, width in _column_widths(df).items():
+            ws.column_dimensions[col_letter].width = width
 
         # Save workbook
         wb.save(filename)
@@ -312,49 +476,45 @@ def main():
         print("Error: Tenant ID is required")
         return
 
-    # Ask for locale code
-    locale_code = input("Enter the locale code (e.g., en_IN, hi_IN): ").strip()
-    if not locale_code:
+    # Ask for locale code(s)
+    locale_input = input("Enter the locale code(s) (e.g., en_IN, hi_IN; comma-separated): ").strip()
+    locales = [l.strip() for l in locale_input.split(',') if l.strip()]
+    if not locales:
         print("Error: Locale code is required")
         return
 
+    # Optional module list; each module is fetched in parallel
+    module_input = input("Enter module(s) to fetch (comma-separated, blank for all): ").strip()
+    modules = [m.strip() for m in module_input.split(',') if m.strip()] or None
+
     print(f"\n✓ Configuration:")
     print(f"  - Tenant ID: {tenant_id}")
-    print(f"  - Locale Code: {locale_code}")
-
-    # Construct full URL
-    full_url = f"{base_url}/localization/messages/v1/_search"
-
-    # Create params dict with user inputs
-    params = {
-        'locale': locale_code,
-        'tenantId': tenant_id
-    }
+    print(f"  - Locale Code(s): {', '.join(locales)}")
+    print(f"  - Modules: {', '.join(modules) if modules else 'all'}")
 
     # Step 1: Read existing translations
     print("\n[1/4] Reading existing translations...")
     existing_translations = read_existing_translations(OUTPUT_FILE, SHEET_NAME)
 
     # Step 2: Fetch data
-    print(f"\n[2/4] Fetching data from API for locale '{locale_code}'...")
-    api_response = fetch_localization_data(full_url, params=params)
+    print(f"\n[2/4] Fetching data from API for locale(s) {', '.join(locales)}...")
+    fetched = fetch_all_messages(base_url, tenant_id, locales, modules=modules)
 
-    if not api_response:
-        print("Failed to fetch data. Please check your URL and credentials.")
+    failed = [locale for locale, messages in fetched.items() if messages is None]
+    if failed:
+        print(f"Failed to fetch data for {', '.join(failed)}. Please check your URL and credentials.")
         return
 
     # Step 3: Parse messages
     print("[3/4] Parsing messages...")
-    messages = parse_messages(api_response)
-
-    if not messages:
-        print("No messages found in response. API response structure:")
-        print(json.dumps(api_response, indent=2)[:500])
+    if not any(fetched.values()):
+        print("No messages found for the requested locale(s) and module(s).")
         return
 
     # Step 4: Create DataFrame with user-specified language name and merge translations
-    print(f"[4/4] Creating Excel structure with Locale = '{locale_code}'...")
-    df = create_dataframe(messages, locale_code)
+    print(f"[4/4] Creating Excel structure with Locale = '{', '.join(locales)}'...")
+    df = pd.concat([create_dataframe(fetched[locale], locale) for locale in locales],
+                   ignore_index=True)
     df = merge_translations(df, existing_translations)
 
     # Step 5: Save to Excel with validation preservation
@@ -0,0 +1,173 @@
+"""
+Filestore cache - upload each workbook once per tenant
+
+APIUploader.upload_file_to_filestore() used to post the whole workbook on
+every call, and the boundary phase called it on every run (and every retry)
+even when nothing in the file had changed. Uploads are now remembered on
+disk per (gateway, tenant, module, SHA-256 of the file contents):
+
+    ~/.cache/crs-dataloader/filestore/<sha256 of the key>.json
+
+An unchanged file reuses its fileStoreId; an edited one hashes differently
+and is uploaded again. Set DATALOADER_FILESTORE_CACHE to another directory,
+or to "off" to always upload.
+
+MultipartFile builds the multipart/form-data body for an upload and reads
+the file from disk in chunks while the request is sent, instead of holding
+the whole workbook in memory.
+"""
+
+import hashlib
+import json
+import mimetypes
+import os
+import time
+import uuid
+
+FILESTORE_CACHE_DIR = os.environ.get('DATALOADER_FILESTORE_CACHE',
+                                     os.path.join('~', '.cache', 'crs-dataloader', 'filestore'))
+
+CHUNK_SIZE = 1024 * 1024
+
+
+def file_sha256(path: str) -> str:
+    """Hex SHA-256 of a file, read in CHUNK_SIZE blocks"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(CHUNK_SIZE), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class FilestoreCache:
+    """fileStoreIds on disk, one JSON file per (gateway, tenant, module, content)"""
+
+    def __init__(self, directory: str):
+        self.directory = os.path.expanduser(directory)
+
+    def _path(self, base_url: str, tenant_id: str, module: str, sha256: str) -> str:
+        key = "|".join([base_url.rstrip('/'), tenant_id or '', module or '', sha256])
+        return os.path.join(self.directory, hashlib.sha256(key.encode()).hexdigest()[:32] + ".json")
+
+    def load(self, base_url: str, tenant_id: str, module: str, sha256: str):
+        """Cached fileStoreId, or None"""
+        try:
+            with open(self._path(base_url, tenant_id, module, sha256), encoding="utf-8") as f:
+                return json.load(f).get("fileStoreId")
+        except (OSError, ValueError, AttributeError):
+            return None
+
+    def save(self, base_url: str, tenant_id: str, module: str, sha256: str,
+             filestore_id: str, file_name: str = None):
+        """Remember an upload; failures (read-only home, ...) are ignored"""
+        path = self._path(base_url, tenant_id, module, sha256)
+        entry = {
+            "base_url": base_url,
+            "tenant_id": tenant_id,
+            "module": module,
+            "sha256": sha256,
+            "file_name": file_name,
+            "fileStoreId": filestore_id,
+            "uploaded_at": time.time(),
+        }
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(entry, f)
+            os.replace(tmp_path, path)
+        except OSError:
+            pass
+
+    def discard(self, base_url: str, tenant_id: str, module: str, sha256: str):
+        """Forget a fileStoreId the filestore no longer resolves"""
+        try:
+            os.remove(self._path(base_url, tenant_id, module, sha256))
+        except OSError:
+            pass
+
+
+def default_filestore_cache():
+    """FilestoreCache at $DATALOADER_FILESTORE_CACHE, or None when set to off/0/false"""
+    if FILESTORE_CACHE_DIR.strip().lower() in ('', '0', 'off', 'false', 'no'):
+        return None
+    return FilestoreCache(FILESTORE_CACHE_DIR)
+
+
+class MultipartFile:
+    """multipart/form-data body with one file part, streamed from disk
+
+    Pass as data= together with the content_type header; requests sends it
+    with a Content-Length and reads it in blocks. seek(0) rewinds it so a
+    retried request sends the whole body again.
+    """
+
+    def __init__(self, path: str, fields: dict = None, field_name: str = 'file',
+                 content_type: str = None):
+        self.path = path
+        boundary = uuid.uuid4().hex
+        self.content_type = f"multipart/form-data; boundary={boundary}"
+
+        head = b""
+        for name, value in (fields or {}).items():
+            head += (f"--{boundary}\r\n"
+                     f"Content-Disposition: form-data; name=\"{name}\"\r\n\r\n"
+                     f"{value}\r\n").encode()
+        file_type = content_type or mimetypes.guess_type(path)[0] or 'application/octet-stream'
+        head += (f"--{boundary}\r\n"
+                 f"Content-Disposition: form-data; name=\"{field_name}\"; "
+                 f"filename=\"{os.path.basename(path)}\"\r\n"
+                 f"Content-Type: {file_type}\r\n\r\n").encode()
+        self._head = head
+        self._tail = f"\r\n--{boundary}--\r\n".encode()
+        self._size = os.path.getsize(path)
+        self._file = None
+        self._pos = 0
+
+    def __len__(self):
+        return len(self._head) + self._size + len(self._tail)
+
+    def tell(self) -> int:
+        return self._pos
+
+    def seek(self, offset: int, whence: int = 0) -> int:
+        if whence == 1:
+            offset += self._pos
+        elif whence == 2:
+            offset += len(self)
+        self._pos = max(0, min(offset, len(self)))
+        return self._pos
+
+    def read(self, size: int = -1) -> bytes:
+        if size is None or size < 0:
+            size = len(self) - self._pos
+        out = []
+        while size > 0 and self._pos < len(self):
+            file_start = len(self._head)
+            file_end = file_start + self._size
+            if self._pos < file_start:
+                chunk = self._head[self._pos:self._pos + size]
+            elif self._pos < file_end:
+                if self._file is None:
+                    self._file = open(self.path, 'rb')
+                self._file.seek(self._pos - file_start)
+                chunk = self._file.read(min(size, file_end - self._pos))
+                if not chunk:
+                    raise IOError(f"{self.path} shrank while being uploaded")
+            else:
+                chunk = self._tail[self._pos - file_end:self._pos - file_end + size]
+            out.append(chunk)
+            self._pos += len(chunk)
+            size -= len(chunk)
+        return b"".join(out)
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,216 @@
+"""
+HTTP metrics - per-service/endpoint request instrumentation for APIUploader
+
+Every call made through APIUploader._send()/_request_with_retry() is recorded
+against (service, endpoint), where service is the first path segment of the
+URL (mdms-v2, egov-hrms, boundary-service, ...) and endpoint is the rest of the
+path up to the last "_action" segment, so "/v2/_create/common-masters.Department"
+and "/v2/_create/RAINMAKER-PGR.ComplaintHierarchy" share "/v2/_create".
+
+    metrics = loader.metrics                 # HttpMetrics of the logged-in uploader
+    metrics.snapshot()                       # nested dict, see snapshot()
+    print(metrics.to_prometheus())           # Prometheus text exposition format
+    metrics.write("boundaries.metrics.json") # .json, or .prom for Prometheus text
+
+Standard library only.
+"""
+
+import json
+import math
+import threading
+from urllib.parse import urlparse
+
+# Upper bounds (seconds) of the Prometheus latency histogram buckets
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+
+def split_endpoint(url: str):
+    """(service, endpoint) for a gateway URL
+
+    >>> split_endpoint("http://gw/mdms-v2/v2/_create/common-masters.Department")
+    ('mdms-v2', '/v2/_create')
+    """
+    segments = [s for s in urlparse(url).path.split("/") if s]
+    if not segments:
+        return "", "/"
+    service, rest = segments[0], segments[1:]
+    for i in range(len(rest) - 1, -1, -1):
+        if rest[i].startswith("_"):
+            rest = rest[:i + 1]
+            break
+    return service, "/" + "/".join(rest)
+
+
+def _percentile(sorted_samples, fraction):
+    """Nearest-rank percentile of an ascending list"""
+    if not sorted_samples:
+        return None
+    rank = max(1, math.ceil(fraction * len(sorted_samples)))
+    return sorted_samples[rank - 1]
+
+
+def _new_endpoint():
+    return {
+        "samples": [],
+        "status": {},
+        "bytes_sent": 0,
+        "bytes_received": 0,
+        "retries": 0,
+        "backoff_seconds": 0.0,
+    }
+
+
+class HttpMetrics:
+    """Thread-safe request counters and latency samples keyed by (service, endpoint)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._endpoints = {}
+
+    def reset(self):
+        with self._lock:
+            self._endpoints = {}
+
+    def observe(self, url: str, status, seconds: float, bytes_sent: int = 0, bytes_received: int = 0):
+        """Record one request attempt
+
+        Args:
+            url: Request URL
+            status: HTTP status code, or an exception name for transport errors
+            seconds: Wall time of the attempt
+            bytes_sent: Request body size
+            bytes_received: Response body size
+        """
+        key = split_endpoint(url)
+        with self._lock:
+            stats = self._endpoints.setdefault(key, _new_endpoint())
+            stats["samples"].append(seconds)
+            stats["status"][str(status)] = stats["status"].get(str(status), 0) + 1
+            stats["bytes_sent"] += bytes_sent
+            stats["bytes_received"] += bytes_received
+
+    def observe_response(self, url: str, response, seconds: float):
+        """Record a requests.Response, taking the body sizes from it"""
+        request = getattr(response, "request", None)
+        body = getattr(request, "body", None) or b""
+        content = getattr(response, "content", None) or b""
+        self.observe(url, response.status_code, seconds,
+                     bytes_sent=len(body) if isinstance(body, (bytes, str)) else 0,
+                     bytes_received=len(content) if isinstance(content, (bytes, str)) else 0)
+
+    def observe_retry(self, url: str, backoff_seconds: float):
+        """Record that a request to url is being retried after backoff_seconds"""
+        key = split_endpoint(url)
+        with self._lock:
+            stats = self._endpoints.setdefault(key, _new_endpoint())
+            stats["retries"] += 1
+            stats["backoff_seconds"] += backoff_seconds
+
+    def snapshot(self) -> dict:
+        """Aggregated view of everything recorded so far
+
+        Returns:
+            dict: {service: {'requests', 'errors', 'seconds', 'retries', ...,
+                             'endpoints': {endpoint: {'requests', 'p50', 'p95', 'p99',
+                                                      'max', 'seconds', 'bytes_sent',
+                                                      'bytes_received', 'retries',
+                                                      'backoff_seconds', 'status'}}}}
+            Latencies are in seconds; errors counts 4xx/5xx and transport failures.
+        """
+        with self._lock:
+            endpoints = {key: dict(stats, samples=sorted(stats["samples"]), status=dict(stats["status"]))
+                         for key, stats in self._endpoints.items()}
+
+        services = {}
+        for (service, endpoint), stats in sorted(endpoints.items()):
+            samples = stats["samples"]
+            errors = sum(n for code, n in stats["status"].items() if not code.isdigit() or int(code) >= 400)
+            entry = {
+                "requests": len(samples),
+                "errors": errors,
+                "p50": _percentile(samples, 0.50),
+                "p95": _percentile(samples, 0.95),
+                "p99": _percentile(samples, 0.99),
+                "max": samples[-1] if samples else None,
+                "seconds": round(sum(samples), 6),
+                "bytes_sent": stats["bytes_sent"],
+                "bytes_received": stats["bytes_received"],
+                "retries": stats["retries"],
+                "backoff_seconds": round(stats["backoff_seconds"], 3),
+                "status": stats["status"],
+            }
+            svc = services.setdefault(service, {"requests": 0, "errors": 0, "seconds": 0.0,
+                                                "bytes_sent": 0, "bytes_received": 0,
+                                                "retries": 0, "backoff_seconds": 0.0,
+                                                "endpoints": {}})
+            svc["endpoints"][endpoint] = entry
+            for field in ("requests", "errors", "seconds", "bytes_sent", "bytes_received",
+                          "retries", "backoff_seconds"):
+                svc[field] += entry[field]
+        return services
+
+    def to_json(self) -> str:
+        return json.dumps(self.snapshot(), indent=2)
+
+    def to_prometheus(self, prefix: str = "crs_dataloader") -> str:
+        """Prometheus text exposition of the recorded requests"""
+        with self._lock:
+            endpoints = {key: dict(stats, samples=list(stats["samples"]), status=dict(stats["status"]))
+                         for key, stats in self._endpoints.items()}
+
+        lines = []
+
+        def family(name, kind, help_text):
+            lines.append(f"# HELP {prefix}_{name} {help_text}")
+            lines.append(f"# TYPE {prefix}_{name} {kind}")
+
+        def labels(service, endpoint, **extra):
+            pairs = {"service": service, "endpoint": endpoint, **extra}
+            return "{" + ",".join(f'{k}="{v}"' for k, v in pairs.items()) + "}"
+
+        family("http_requests_total", "counter", "Requests sent, by response status")
+        for (service, endpoint), stats in sorted(endpoints.items()):
+            for status, count in sorted(stats["status"].items()):
+                lines.append(f"{prefix}_http_requests_total{labels(service, endpoint, status=status)} {count}")
+
+        family("http_request_duration_seconds", "histogram", "Request latency")
+        for (service, endpoint), stats in sorted(endpoints.items()):
+            samples = stats["samples"]
+            for bound in LATENCY_BUCKETS:
+                count = sum(1 for s in samples if s <= bound)
+                lines.append(f"{prefix}_http_request_duration_seconds_bucket"
+                             f"{labels(service, endpoint, le=bound)} {count}")
+            lines.append(f"{prefix}_http_request_duration_seconds_bucket"
+                         f"{labels(service, endpoint, le='+Inf')} {len(samples)}")
+            lines.append(f"{prefix}_http_request_duration_seconds_sum{labels(service, endpoint)} {sum(samples)}")
+            lines.append(f"{prefix}_http_request_duration_seconds_count{labels(service, endpoint)} {len(samples)}")
+
+        family("http_bytes_total", "counter", "Request and response body bytes")
+        for (service, endpoint), stats in sorted(endpoints.items()):
+            lines.append(f"{prefix}_http_bytes_total{labels(service, endpoint, direction='sent')} {stats['bytes_sent']}")
+            lines.append(f"{prefix}_http_bytes_total{labels(service, endpoint, direction='received')} "
+                         f"{stats['bytes_received']}")
+
+        family("http_retries_total", "counter", "Retries after 429/503/timeouts")
+        for (service, endpoint), stats in sorted(endpoints.items()):
+            lines.append(f"{prefix}_http_retries_total{labels(service, endpoint)} {stats['retries']}")
+
+        family("http_backoff_seconds_total", "counter", "Time spent sleeping before retries")
+        for (service, endpoint), stats in sorted(endpoints.items()):
+            lines.append(f"{prefix}_http_backoff_seconds_total{labels(service, endpoint)} {stats['backoff_seconds']}")
+
+        return "\n".join(lines) + "\n"
+
+    def write(self, path: str):
+        """Write to path: Prometheus text if it ends in .prom, JSON otherwise"""
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(self.to_prometheus() if path.endswith(".prom") else self.to_json())
+        return path
+
+    def summary_lines(self):
+        """One printable line per service, slowest total time first"""
+        services = self.snapshot()
+        for service, stats in sorted(services.items(), key=lambda kv: -kv[1]["seconds"]):
+            p95 = max((e["p95"] or 0) for e in stats["endpoints"].values())
+            yield (f"{service:<24} {stats['requests']:>7} req  {stats['errors']:>5} err  "
+                   f"{stats['retries']:>4} retries  {stats['seconds']:>8.2f}s  p95 {p95 * 1000:.0f}ms")
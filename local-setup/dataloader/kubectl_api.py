@@ -62,8 +62,13 @@ def get_db_password(env: str = 'chakshu') -> str:
     return base64.b64decode(result.stdout).decode()
 
 
-def run_sql(sql: str, env: str = 'chakshu') -> dict:
-    """Run SQL command via kubectl exec"""
+def run_sql(sql, env: str = 'chakshu') -> dict:
+    """Run SQL command via kubectl exec
+
+    sql may also be a list of statements: they go to psql on stdin (no
+    per-argument size limit) and run in one transaction (psql -1), and psql
+    prints every statement's row count.
+    """
     config = DB_CONFIG.get(env, DB_CONFIG['chakshu'])
     db_pass = get_db_password(env)
 
@@ -89,12 +94,20 @@ def run_sql(sql: str, env: str = 'chakshu') -> dict:
     )
 
     # Run SQL
-    result = subprocess.run(
-        ['kubectl', '--context', config['k8s_context'],
-         'exec', '-n', config['namespace'], 'db-cleanup', '--',
-         'psql', conn_str, '-t', '-c', sql],
-        capture_output=True, text=True
-    )
+    command = ['kubectl', '--context', config['k8s_context'],
+               'exec', '-n', config['namespace'], 'db-cleanup', '--',
+               'psql', conn_str, '-t']
+    stdin = None
+    if isinstance(sql, (list, tuple)):
+        command.insert(command.index('exec') + 1, '-i')
+        command += ['-1', '-v', 'ON_ERROR_STOP=1', '-f', '-']
+        stdin = "\n".join(sql) + "\n"
+    else:
+        command += ['-c', sql]
+    try:
+        result = subprocess.run(command, input=stdin, capture_output=True, text=True)
+    except OSError as e:
+        return {'stdout': '', 'stderr': str(e), 'returncode': 1}
 
     return {
         'stdout': result.stdout,
@@ -119,6 +132,7 @@ def delete_boundaries():
         "tenant_id": "statea",
         "hierarchy_types": ["REVENUE"],
         "boundary_codes": ["STATEA", "STATEA_DISTRICT_1"],
+        "include_hierarchies": true,
         "env": "chakshu"
       }
     Headers: X-API-Key: <key>
@@ -130,6 +144,7 @@ def delete_boundaries():
     tenant_id = data.get('tenant_id')
     hierarchy_types = data.get('hierarchy_types') or []
     boundary_codes = data.get('boundary_codes') or []
+    include_hierarchies = data.get('include_hierarchies', True)
     env = data.get('env', 'chakshu')
 
     if not tenant_id:
@@ -161,17 +176,18 @@ def delete_boundaries():
         else:
             sql_parts.append(f"DELETE FROM boundary WHERE tenantid={sql_literal(tenant_id)};")
 
-        if hierarchy_types:
+        if include_hierarchies and hierarchy_types:
             hierarchy_in = sql_in(hierarchy_types)
             sql_parts.append(
                 f"DELETE FROM boundary_hierarchy "
                 f"WHERE tenantid={sql_literal(tenant_id)} AND hierarchytype IN ({hierarchy_in});"
             )
-        else:
+        elif include_hierarchies:
             sql_parts.append(f"DELETE FROM boundary_hierarchy WHERE tenantid={sql_literal(tenant_id)};")
 
-        sql = "\n".join(sql_parts)
-        result = run_sql(sql, env)
+        result = run_sql(sql_parts, env)
+        if result['returncode'] != 0:
+            return jsonify({'error': (result['stderr'] or result['stdout']).strip()}), 500
 
         delete_counts = []
         for line in result['stdout'].strip().split('\n'):
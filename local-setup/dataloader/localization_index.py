@@ -0,0 +1,245 @@
+"""
+Localization index - the bundled en_IN messages, compiled once
+
+CRSLoader._seed_essential_localizations falls back to the JSON files in
+templates/localisations/ (~450 KB) for every new tenant. Instead of parsing
+and deduplicating them on each call, they are compiled into one binary file
+keyed by code and memory-mapped:
+
+    ~/.cache/crs-dataloader/localisations/<sha256 of the sources>.idx
+
+    header   b"CRSLOC1\\n", record count, string table offset   (<8sII)
+    columns  JSON {"modules": [...], "locales": [...], "sources": [...]}
+    records  one per code, sorted by code                     (<IHIIHH)
+             code offset/length, message offset/length, module no, locale no
+    strings  UTF-8 codes and messages
+
+A code is found by binary search over the records, so nothing is decoded
+until it is asked for. The file name is the digest of the source JSONs: an
+edited bundle compiles to a new file and an old index is never read. Run
+
+    python localization_index.py
+
+at image build time to ship a warm index; otherwise the first loader run
+compiles it. Set DATALOADER_LOCALIZATION_INDEX to another directory, or to
+"off" to compile into memory on every run.
+
+Within a process load_bundled_index() returns the same index every time.
+"""
+
+import hashlib
+import json
+import mmap
+import os
+import struct
+import threading
+
+INDEX_MAGIC = b"CRSLOC1\n"
+HEADER = struct.Struct("<8sII")
+RECORD = struct.Struct("<IHIIHH")
+
+BUNDLED_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "templates", "localisations")
+
+LOCALIZATION_INDEX_DIR = os.environ.get('DATALOADER_LOCALIZATION_INDEX',
+                                        os.path.join('~', '.cache', 'crs-dataloader', 'localisations'))
+
+
+def _source_files(sources_dir: str) -> list:
+    if not os.path.isdir(sources_dir):
+        return []
+    return [os.path.join(sources_dir, name) for name in sorted(os.listdir(sources_dir))
+            if name.endswith(".json")]
+
+
+def sources_digest(sources_dir: str) -> str:
+    """SHA-256 over the names and contents of the source JSONs"""
+    digest = hashlib.sha256()
+    for path in _source_files(sources_dir):
+        digest.update(os.path.basename(path).encode() + b"\0")
+        with open(path, "rb") as f:
+            digest.update(f.read())
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def compile_messages(sources_dir: str) -> list:
+    """Messages of every source JSON (file name order), first one per code kept"""
+    messages = []
+    seen_codes = set()
+    for path in _source_files(sources_dir):
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"   ⚠️  Failed to load {os.path.basename(path)}: {e}")
+            continue
+        for msg in data:
+            code = msg.get("code", "")
+            if code and code not in seen_codes:
+                seen_codes.add(code)
+                messages.append(msg)
+    return messages
+
+
+def build_index(messages, sources: list = None) -> bytes:
+    """Encode messages (dicts with code, message, module, locale) as an index"""
+    modules, locales = [], []
+    module_no, locale_no = {}, {}
+    strings = bytearray()
+    records = []
+    for msg in sorted(messages, key=lambda m: m["code"].encode("utf-8")):
+        code = msg["code"].encode("utf-8")
+        message = str(msg.get("message", msg["code"])).encode("utf-8")
+        module = msg.get("module", "rainmaker-common")
+        locale = msg.get("locale", "en_IN")
+        if module not in module_no:
+            module_no[module] = len(modules)
+            modules.append(module)
+        if locale not in locale_no:
+            locale_no[locale] = len(locales)
+            locales.append(locale)
+        records.append(RECORD.pack(len(strings), len(code), len(strings) + len(code), len(message),
+                                   module_no[module], locale_no[locale]))
+        strings += code + message
+
+    columns = json.dumps({"modules": modules, "locales": locales, "sources": sources or []},
+                         separators=(",", ":")).encode("utf-8")
+    strings_offset = HEADER.size + 4 + len(columns) + len(records) * RECORD.size
+    return b"".join([HEADER.pack(INDEX_MAGIC, len(records), strings_offset),
+                     struct.pack("<I", len(columns)), columns] + records + [bytes(strings)])
+
+
+class LocalizationIndex:
+    """Read-only view of a compiled index (bytes or a memory-mapped file)"""
+
+    def __init__(self, buffer, path: str = None):
+        magic, count, strings_offset = HEADER.unpack_from(buffer, 0)
+        if magic != INDEX_MAGIC:
+            raise ValueError(f"Not a localization index: {path or 'buffer'}")
+        (columns_size,) = struct.unpack_from("<I", buffer, HEADER.size)
+        columns_start = HEADER.size + 4
+        columns = json.loads(bytes(buffer[columns_start:columns_start + columns_size]))
+        self.path = path
+        self.modules = columns["modules"]
+        self.locales = columns["locales"]
+        self.sources = columns["sources"]
+        self._buffer = buffer
+        self._count = count
+        self._records = columns_start + columns_size
+        self._strings = strings_offset
+        self._messages = None
+
+    @classmethod
+    def open(cls, path: str) -> "LocalizationIndex":
+        with open(path, "rb") as f:
+            return cls(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ), path)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __contains__(self, code) -> bool:
+        return self._find(code) is not None
+
+    def _record(self, i: int) -> tuple:
+        return RECORD.unpack_from(self._buffer, self._records + i * RECORD.size)
+
+    def _code(self, record) -> bytes:
+        start = self._strings + record[0]
+        return self._buffer[start:start + record[1]]
+
+    def _find(self, code: str):
+        key = code.encode("utf-8")
+        lo, hi = 0, self._count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            record = self._record(mid)
+            found = self._code(record)
+            if found == key:
+                return record
+            if found < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        return None
+
+    def _message(self, record) -> dict:
+        code_start = self._strings + record[0]
+        message_start = self._strings + record[2]
+        return {
+            "code": self._buffer[code_start:code_start + record[1]].decode("utf-8"),
+            "message": self._buffer[message_start:message_start + record[3]].decode("utf-8"),
+            "module": self.modules[record[4]],
+            "locale": self.locales[record[5]],
+        }
+
+    def get(self, code: str):
+        """Message dict for a code, or None"""
+        record = self._find(code)
+        return self._message(record) if record is not None else None
+
+    def messages(self) -> list:
+        """Every message, sorted by code; decoded on the first call only"""
+        if self._messages is None:
+            self._messages = [self._message(self._record(i)) for i in range(self._count)]
+        return self._messages
+
+
+def compile_index(sources_dir: str = BUNDLED_DIR, output: str = None) -> str:
+    """Compile the source JSONs to output (default: the cache path for their digest)"""
+    digest = sources_digest(sources_dir)
+    output = output or index_path(digest)
+    sources = [os.path.basename(path) for path in _source_files(sources_dir)]
+    data = build_index(compile_messages(sources_dir), sources)
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    tmp_path = f"{output}.{os.getpid()}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, output)
+    return output
+
+
+def index_path(digest: str, directory: str = None) -> str:
+    directory = directory or LOCALIZATION_INDEX_DIR
+    return os.path.join(os.path.expanduser(directory), f"{digest}.idx")
+
+
+_loaded = {}
+_loaded_lock = threading.Lock()
+
+
+def load_bundled_index(sources_dir: str = BUNDLED_DIR) -> LocalizationIndex:
+    """Index of the bundled messages, compiled on first use; memoized per process"""
+    with _loaded_lock:
+        if sources_dir not in _loaded:
+            _loaded[sources_dir] = _load_index(sources_dir)
+        return _loaded[sources_dir]
+
+
+def _load_index(sources_dir: str) -> LocalizationIndex:
+    digest = sources_digest(sources_dir)
+    if LOCALIZATION_INDEX_DIR.strip().lower() in ('', '0', 'off', 'false', 'no'):
+        return LocalizationIndex(build_index(compile_messages(sources_dir)))
+
+    path = index_path(digest)
+    try:
+        return LocalizationIndex.open(path)
+    except (OSError, ValueError, struct.error):
+        pass
+    try:
+        return LocalizationIndex.open(compile_index(sources_dir, path))
+    except OSError:
+        # Read-only cache directory: keep the compiled index in memory
+        return LocalizationIndex(build_index(compile_messages(sources_dir)))
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Compile the bundled localization index")
+    parser.add_argument("--sources", default=BUNDLED_DIR, help="Directory of localization JSONs")
+    parser.add_argument("--output", help="Index file (default: cache path for the sources digest)")
+    args = parser.parse_args()
+
+    path = compile_index(args.sources, args.output)
+    index = LocalizationIndex.open(path)
+    print(f"{len(index)} messages ({', '.join(index.modules)}) -> {path}")
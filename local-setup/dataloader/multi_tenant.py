@@ -0,0 +1,363 @@
+"""
+Multi-tenant onboarding - run loader phases for many tenants in parallel
+
+Onboards a list of tenants (typically every city under one state root, all
+with the same masters) from a JSON manifest:
+
+    {
+      "root": "ke",
+      "defaults": {
+        "common_masters": "templates/Common and Complaint Master.xlsx",
+        "employees": {"path": "templates/Employee Master.xlsx", "stream": true},
+        "workflow": "templates/PgrWorkflowConfig.json"
+      },
+      "concurrency": {"default": 8, "egov-hrms": 2},
+      "tenants": [
+        {"code": "ke.bomet", "name": "Bomet", "create": true},
+        {"code": "ke.kericho", "boundaries": {"path": "kericho-boundaries.xlsx",
+                                              "hierarchy_type": "ADMIN"}}
+      ]
+    }
+
+A phase value is a workbook path or a dict of the load_* keyword arguments
+with the workbook under "path"; a tenant entry overrides the defaults and
+null skips a phase. Phases run in PHASES order within a tenant; different
+tenants run on separate worker threads, each with its own forked CRSLoader
+on the shared login.
+
+All workers share:
+    ServiceLimiter   at most N requests in flight per gateway service
+                     ("concurrency" in the manifest; "default" for the rest)
+    ReferenceCache   root-level reference MDMS (roles, HRMS enums) fetched
+                     once instead of once per tenant
+
+Workbooks are copied into <work_dir>/<tenant>/ before loading, since the
+loaders write status columns back into them. Each tenant's output goes to
+<work_dir>/<tenant>/loader.log, and one report covering every tenant is
+returned (and written to <work_dir>/report.json):
+
+    orchestrator = MultiTenantLoader(loader, workers=4, work_dir="onboard-run")
+    report = orchestrator.run(load_manifest("tenants.json"))
+"""
+
+import copy
+import json
+import os
+import shutil
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+try:
+    from .http_metrics import split_endpoint
+    from .phase_results import phase_counts, phase_status
+    from .thread_output import thread_stdout
+except (ImportError, ModuleNotFoundError):
+    from http_metrics import split_endpoint
+    from phase_results import phase_counts, phase_status
+    from thread_output import thread_stdout
+
+# (phase, CRSLoader method) in load order
+PHASES = (
+    ("tenant", "load_tenant"),
+    ("boundaries", "load_boundaries"),
+    ("common_masters", "load_common_masters"),
+    ("employees", "load_employees"),
+    ("localizations", "load_localizations"),
+    ("workflow", "load_workflow"),
+)
+
+# Root-level MDMS read by every tenant's run and rarely written
+REFERENCE_SCHEMAS = frozenset({
+    "ACCESSCONTROL-ROLES.roles",
+    "common-masters.GenderType",
+    "egov-hrms.EmployeeStatus",
+    "egov-hrms.EmployeeType",
+    "egov-hrms.DeactivationReason",
+})
+
+DEFAULT_SERVICE_CONCURRENCY = 8
+
+
+class ServiceLimiter:
+    """Per-service cap on requests in flight, shared by all tenant workers"""
+
+    def __init__(self, budget: dict = None):
+        budget = dict(budget or {})
+        self.default = int(budget.pop("default", DEFAULT_SERVICE_CONCURRENCY))
+        self.budget = {service: int(n) for service, n in budget.items()}
+        self._lock = threading.Lock()
+        self._semaphores = {}
+
+    def slot(self, url: str):
+        """Semaphore for the URL's service; use as a context manager"""
+        service = split_endpoint(url)[0]
+        with self._lock:
+            sem = self._semaphores.get(service)
+            if sem is None:
+                sem = self._semaphores[service] = threading.BoundedSemaphore(
+                    self.budget.get(service, self.default))
+        return sem
+
+
+class ReferenceCache:
+    """Shared MDMS search results for REFERENCE_SCHEMAS
+
+    Concurrent lookups of the same key wait for a single fetch. Empty results
+    are not kept (the search swallows errors and returns []), and any create
+    on a schema drops its entries.
+    """
+
+    def __init__(self, schemas=REFERENCE_SCHEMAS):
+        self.schemas = frozenset(schemas)
+        self._lock = threading.Lock()
+        self._entries = {}
+        self._inflight = {}
+        self.hits = 0
+        self.misses = 0
+
+    def covers(self, schema_code: str) -> bool:
+        return schema_code in self.schemas
+
+    def get(self, key, fetch):
+        """Cached value for key, calling fetch() at most once at a time"""
+        while True:
+            with self._lock:
+                if key in self._entries:
+                    self.hits += 1
+                    return copy.deepcopy(self._entries[key])
+                waiter = self._inflight.get(key)
+                if waiter is None:
+                    waiter = self._inflight[key] = threading.Event()
+                    self.misses += 1
+                    break
+            waiter.wait()
+
+        try:
+            value = fetch()
+            with self._lock:
+                if value:
+                    self._entries[key] = copy.deepcopy(value)
+            return value
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+            waiter.set()
+
+    def invalidate(self, schema_code: str):
+        with self._lock:
+            for key in [k for k in self._entries if k[0] == schema_code]:
+                del self._entries[key]
+
+
+def load_manifest(path: str) -> dict:
+    """Read a JSON manifest; relative workbook paths resolve against its directory"""
+    with open(path, encoding="utf-8") as f:
+        manifest = json.load(f)
+    manifest.setdefault("base_dir", os.path.dirname(os.path.abspath(path)))
+    return manifest
+
+
+class MultiTenantLoader:
+    """Run the loader phases for many tenants concurrently"""
+
+    def __init__(self, loader, workers: int = 4, concurrency: dict = None,
+                 work_dir: str = None, progress: str = "quiet"):
+        """
+        Args:
+            loader: Logged-in CRSLoader (root tenant); workers fork it
+            workers: Tenants processed at the same time
+            concurrency: Per-service request budget, e.g. {"default": 8,
+                "egov-hrms": 2} (the manifest's "concurrency" wins)
+            work_dir: Workbook copies, per-tenant logs and the report
+                (default: ./multi-tenant-<timestamp>)
+            progress: Progress spec for each tenant's loader (see progress.py);
+                row output lands in that tenant's log
+        """
+        loader._check_auth()
+        self.loader = loader
+        self.workers = workers
+        self.concurrency = concurrency
+        self.work_dir = work_dir or f"multi-tenant-{datetime.now():%Y%m%d-%H%M%S}"
+        self.progress = progress
+        self.reference_cache = ReferenceCache()
+        self._print_lock = threading.Lock()
+        self._stdout = None  # the shared ThreadStdout while run() is going
+
+    def run(self, manifest: dict) -> dict:
+        """Onboard every tenant in the manifest
+
+        Returns:
+            dict: Aggregated report: per-tenant phase status/counts/timing,
+                per-phase totals and the HTTP totals per service
+        """
+        tenants = manifest.get("tenants") or []
+        defaults = manifest.get("defaults") or {}
+        base_dir = manifest.get("base_dir", ".")
+        limiter = ServiceLimiter(manifest.get("concurrency") or self.concurrency)
+        os.makedirs(self.work_dir, exist_ok=True)
+
+        print(f"\n{'='*60}")
+        print(f"MULTI-TENANT ONBOARDING: {len(tenants)} tenant(s), {self.workers} worker(s)")
+        print(f"{'='*60}")
+        print(f"Work dir: {self.work_dir}")
+
+        started = time.perf_counter()
+        self._bootstrap_roots(tenants, manifest.get("root"))
+
+        uploader = self.loader.uploader
+        saved = (uploader.limiter, uploader.reference_cache)
+        uploader.limiter, uploader.reference_cache = limiter, self.reference_cache
+        try:
+            with thread_stdout() as self._stdout, \
+                    ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="tenant") as pool:
+                futures = [pool.submit(self._run_tenant, entry, defaults, base_dir)
+                           for entry in tenants]
+                results = [f.result() for f in futures]
+        finally:
+            uploader.limiter, uploader.reference_cache = saved
+
+        report = self._report(results, time.perf_counter() - started)
+        path = os.path.join(self.work_dir, "report.json")
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2, default=str)
+        self._print_report(report)
+        print(f"Report: {path}")
+        return report
+
+    def _bootstrap_roots(self, tenants, root):
+        """Create new roots once, before any worker can race on the bootstrap"""
+        roots = {e["code"].split(".")[0] for e in tenants if e.get("create") and "." in e["code"]}
+        if root:
+            roots.add(root)
+        login_root = self.loader.tenant_id.split(".")[0]
+        for code in sorted(roots - {login_root}):
+            self.loader.create_root_tenant(code)
+
+    def _resolve(self, entry: dict, defaults: dict):
+        """(phase, method, path, kwargs) for each phase the tenant runs"""
+        for phase, method in PHASES:
+            spec = entry.get(phase, defaults.get(phase))
+            if not spec:
+                continue
+            kwargs = dict(spec) if isinstance(spec, dict) else {"path": spec}
+            path = kwargs.pop("path")
+            yield phase, method, path, kwargs
+
+    def _run_tenant(self, entry: dict, defaults: dict, base_dir: str) -> dict:
+        code = entry["code"]
+        tenant_dir = os.path.join(self.work_dir, code)
+        os.makedirs(tenant_dir, exist_ok=True)
+        outcome = {"tenant": code, "status": "ok", "phases": {}, "http": {}}
+
+        with open(os.path.join(tenant_dir, "loader.log"), "w", encoding="utf-8") as log, \
+                self._stdout.to(log):
+            self._load_tenant(entry, defaults, base_dir, outcome)
+        return outcome
+
+    def _load_tenant(self, entry: dict, defaults: dict, base_dir: str, outcome: dict):
+        """_run_tenant's body, with print() going to the tenant's log"""
+        code = entry["code"]
+        tenant_dir = os.path.join(self.work_dir, code)
+        try:
+            loader = self.loader.fork(progress=self.progress, metrics_dir=tenant_dir)
+
+            if entry.get("create"):
+                if not loader.create_tenant(code, entry.get("name")):
+                    outcome["status"] = "failed"
+                    outcome["error"] = "create_tenant failed"
+                    return
+
+            for phase, method, path, kwargs in self._resolve(entry, defaults):
+                source = path if os.path.isabs(path) else os.path.join(base_dir, path)
+                workbook = os.path.join(tenant_dir, os.path.basename(source))
+                shutil.copyfile(source, workbook)
+
+                start = time.perf_counter()
+                try:
+                    result = getattr(loader, method)(workbook, target_tenant=code, **kwargs)
+                    error = None
+                except Exception as e:
+                    result, error = None, f"{type(e).__name__}: {e}"
+                seconds = time.perf_counter() - start
+
+                status = phase_status(result, error)
+                outcome["phases"][phase] = {
+                    "status": status,
+                    "seconds": round(seconds, 2),
+                    **phase_counts(result),
+                    **({"error": error} if error else {}),
+                }
+                self._say(f"   {'✅' if status == 'ok' else '⚠️' if status == 'errors' else '❌'} "
+                          f"{code:<24} {phase:<15} {status:<7} {seconds:7.1f}s")
+                if status != "ok" and outcome["status"] == "ok":
+                    outcome["status"] = status
+                if status == "failed":
+                    break  # later phases depend on this one
+
+            outcome["http"] = {phase: metrics.snapshot()
+                               for phase, metrics in loader.phase_metrics.items()}
+        except Exception as e:
+            outcome["status"] = "failed"
+            outcome["error"] = f"{type(e).__name__}: {e}"
+
+    def _say(self, line: str):
+        """Print to the console from a worker thread"""
+        with self._print_lock:
+            self._stdout.fallback.write(line + "\n")
+            self._stdout.fallback.flush()
+
+    def _report(self, results, seconds: float) -> dict:
+        phases = {}
+        services = {}
+        for outcome in results:
+            for phase, stats in outcome["phases"].items():
+                total = phases.setdefault(phase, {"tenants": 0, "ok": 0, "errors": 0, "failed": 0,
+                                                  "created": 0, "exists": 0, "failed_records": 0,
+                                                  "seconds": 0.0})
+                total["tenants"] += 1
+                total[stats["status"]] += 1
+                total["created"] += stats["created"]
+                total["exists"] += stats["exists"]
+                total["failed_records"] += stats["failed"]
+                total["seconds"] = round(total["seconds"] + stats["seconds"], 2)
+            for snapshot in outcome["http"].values():
+                for service, stats in snapshot.items():
+                    svc = services.setdefault(service, {"requests": 0, "errors": 0, "retries": 0,
+                                                        "seconds": 0.0})
+                    for field in svc:
+                        svc[field] += stats[field]
+        for svc in services.values():
+            svc["seconds"] = round(svc["seconds"], 2)
+
+        return {
+            "finished": datetime.now().isoformat(timespec="seconds"),
+            "seconds": round(seconds, 2),
+            "workers": self.workers,
+            "tenants": {o["tenant"]: o for o in results},
+            "summary": {s: sum(1 for o in results if o["status"] == s) for s in ("ok", "errors", "failed")},
+            "phases": phases,
+            "services": services,
+            "reference_cache": {"hits": self.reference_cache.hits,
+                                "misses": self.reference_cache.misses},
+        }
+
+    @staticmethod
+    def _print_report(report: dict):
+        summary = report["summary"]
+        print(f"\n{'─'*60}")
+        print(f"Multi-tenant summary ({report['seconds']:.1f}s, {report['workers']} workers):")
+        print(f"   Tenants ok: {summary['ok']}  with errors: {summary['errors']}  failed: {summary['failed']}")
+        for phase, total in report["phases"].items():
+            print(f"   {phase:<15} {total['ok']}/{total['tenants']} ok  "
+                  f"created {total['created']}  exists {total['exists']}  "
+                  f"failed {total['failed_records']}")
+        for code, outcome in report["tenants"].items():
+            if outcome["status"] != "ok":
+                detail = outcome.get("error") or ", ".join(
+                    f"{p}={s['status']}" for p, s in outcome["phases"].items() if s["status"] != "ok")
+                print(f"   ❌ {code}: {detail}")
+        cache = report["reference_cache"]
+        print(f"   Reference cache: {cache['hits']} hits, {cache['misses']} misses")
+        print(f"{'─'*60}")
@@ -0,0 +1,171 @@
+"""
+Payload bundles - precompiled dataloader payloads
+
+A bundle is an NDJSON file holding the fully resolved API payloads of one
+loader phase for one tenant, so CI and environment rebuilds can replay a load
+without reading the Excel templates again.
+
+    line 1:  {"format": "crs-payload-bundle", "version": 1, "phase": ..., "tenant": ..., ...}
+    line 2+: {"kind": "mdms", "key": "departments", "tenant": "pg", "schema": "...", "data": {...}}
+             {"kind": "localization", "key": "localization", "tenant": "pg", "data": {...}}
+             {"kind": "employee", "key": "employees", "tenant": "pg.citya", "row": 3, "data": {...}}
+             {"kind": "boundary", "tenant": "pg", "hierarchyType": "ADMIN",
+              "code": "...", "boundaryType": "...", "parent": "..."}
+
+Tenant snapshots (CRSLoader.export_tenant_snapshot) use the same container
+with phase "snapshot" and two more kinds:
+
+             {"kind": "schema", "tenant": "pg", "code": "...", "description": ..., "definition": {...}}
+             {"kind": "hierarchy", "key": "ADMIN", "tenant": "pg.citya", "hierarchyType": "ADMIN",
+              "data": {"boundaryHierarchy": [...]}}
+
+Records are replayed in file order. Files ending in .gz are gzip-compressed.
+
+Payloads that embed codes looked up on the gateway (department, designation
+and role codes; boundary types) are only valid there and while those
+masters are unchanged. The header's "context" records the gateway and a
+digest of the looked-up reference data (see reference_digest), and a bundle
+whose context differs is not current.
+
+Only the standard library is used here so replaying never imports pandas or
+openpyxl.
+"""
+
+import gzip
+import hashlib
+import json
+import os
+from datetime import datetime, timezone
+from itertools import groupby
+
+BUNDLE_FORMAT = "crs-payload-bundle"
+BUNDLE_VERSION = 1
+
+
+def _open(path: str, mode: str, compressed: bool = None):
+    """Open a bundle for text I/O, gzip when the name ends in .gz"""
+    if compressed is None:
+        compressed = path.endswith(".gz")
+    if compressed:
+        return gzip.open(path, mode + "t", encoding="utf-8")
+    return open(path, mode, encoding="utf-8")
+
+
+def bundle_path(output_dir: str, phase: str, tenant: str, compress: bool = True) -> str:
+    """Default file name for a phase/tenant bundle"""
+    name = f"{tenant}.{phase}.ndjson" + (".gz" if compress else "")
+    return os.path.join(output_dir, name)
+
+
+def file_sha256(path: str) -> str:
+    """SHA-256 of a file, used to tell whether a bundle is stale"""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def reference_digest(reference_data) -> str:
+    """SHA-256 of JSON-serialisable lookup data, independent of key order"""
+    payload = json.dumps(reference_data, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def write_bundle(path: str, phase: str, tenant: str, records, source: str = None,
+                 source_hash: str = None, context: dict = None) -> int:
+    """Write a bundle header followed by one JSON line per record
+
+    Args:
+        path: Output path (.gz for compressed)
+        phase: Loader phase the records belong to (e.g. 'common_masters')
+        tenant: Tenant the payloads were resolved for
+        records: Iterable of record dicts; consumed lazily
+        source: Optional name of the template the bundle was compiled from
+        source_hash: Identity of the input used for staleness checks
+            (default: SHA-256 of source)
+        context: Gateway and reference-data digest the payloads were
+            resolved against, for staleness checks
+
+    Returns:
+        int: Number of records written
+    """
+    header = {
+        "format": BUNDLE_FORMAT,
+        "version": BUNDLE_VERSION,
+        "phase": phase,
+        "tenant": tenant,
+        "source": os.path.basename(source) if source else None,
+        "sourceSha256": source_hash or (file_sha256(source) if source and os.path.isfile(source) else None),
+        "context": context,
+        "compiledAt": datetime.now(timezone.utc).isoformat(),
+    }
+
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    tmp_path = path + ".tmp"
+
+    count = 0
+    with _open(tmp_path, "w", compressed=path.endswith(".gz")) as f:
+        f.write(json.dumps(header, separators=(",", ":")) + "\n")
+        for record in records:
+            f.write(json.dumps(record, separators=(",", ":"), ensure_ascii=False) + "\n")
+            count += 1
+    os.replace(tmp_path, path)
+    return count
+
+
+def read_bundle_header(path: str) -> dict:
+    """Read and validate the header line of a bundle"""
+    with _open(path, "r") as f:
+        first = f.readline()
+    if not first:
+        raise ValueError(f"Empty payload bundle: {path}")
+    header = json.loads(first)
+    if header.get("format") != BUNDLE_FORMAT:
+        raise ValueError(f"Not a payload bundle: {path}")
+    if header.get("version") != BUNDLE_VERSION:
+        raise ValueError(f"Unsupported bundle version {header.get('version')} in {path}")
+    return header
+
+
+def is_bundle_current(path: str, phase: str, tenant: str, source: str,
+                      source_hash: str = None, context: dict = None) -> bool:
+    """True if path is a bundle for phase/tenant compiled from the current source
+    against the same context (gateway and reference data)
+
+    source_hash overrides the file hash, for templates that are regenerated on
+    every run (openpyxl stamps creation times, so the bytes always change).
+    """
+    if not os.path.isfile(path):
+        return False
+    try:
+        header = read_bundle_header(path)
+    except (OSError, ValueError):
+        return False
+    return (header.get("phase") == phase and header.get("tenant") == tenant
+            and header.get("context") == context
+            and header.get("sourceSha256") == (source_hash or file_sha256(source)))
+
+
+def iter_bundle_records(path: str):
+    """Yield the records of a bundle one line at a time (header skipped)"""
+    read_bundle_header(path)
+    with _open(path, "r") as f:
+        f.readline()
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
+def group_records(records):
+    """Group consecutive records that go to the same API call
+
+    Yields (kind, key, tenant, schema, records_iterator); the inner iterator is
+    lazy, so callers can stream employees/boundaries or list() a batch.
+    """
+    def group_key(record):
+        return (record.get("kind"), record.get("key"), record.get("tenant"), record.get("schema"))
+
+    for (kind, key, tenant, schema), group in groupby(records, key=group_key):
+        yield kind, key, tenant, schema, group
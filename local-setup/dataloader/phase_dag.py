@@ -0,0 +1,272 @@
+"""
+Phase DAG - run a full onboarding with independent phases in parallel
+
+CRSLoader phases used to be run strictly one after another. Most of them only
+depend on the tenant existing, so a full onboarding can overlap them:
+
+    tenant ─┬─ boundaries ─────────────┬─ employees
+            ├─ common_masters ─────────┤
+            │        └─ master_localizations
+            ├─ localizations
+            └─ workflow
+
+Employees need the boundaries (jurisdictions) and the departments and
+designations from common_masters. The department, designation and complaint
+type labels are uploaded as their own step (master_localizations) instead of
+inline after each MDMS batch, so they no longer hold up employees.
+
+    report = loader.onboard({
+        "tenant": "Tenant And Branding Master.xlsx",
+        "boundaries": {"path": "Boundary Master.xlsx", "hierarchy_type": "ADMIN"},
+        "common_masters": "Common and Complaint Master.xlsx",
+        "employees": "Employee Master.xlsx",
+        "localizations": "Localization.xlsx",
+        "workflow": "PgrWorkflowConfig.json",
+    }, target_tenant="pg.citya", workers=3)
+
+Steps without a workbook are left out; a step whose dependency failed is
+skipped. Each step runs on a fork of the loader (own metrics and progress,
+same login) and its console output is printed as one block when it ends.
+The report has per-step start offsets and timings and the critical path,
+the chain of dependent steps that bounded the wall-clock time.
+"""
+
+import io
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from datetime import datetime
+
+try:
+    from .phase_results import phase_counts, phase_status
+    from .progress import make_progress
+    from .thread_output import thread_stdout
+except (ImportError, ModuleNotFoundError):
+    from phase_results import phase_counts, phase_status
+    from progress import make_progress
+    from thread_output import thread_stdout
+
+
+def _load(method):
+    """Step that calls loader.<method>(workbook, target_tenant=..., **kwargs)"""
+    def run(loader, tenant, spec, results):
+        kwargs = dict(spec) if isinstance(spec, dict) else {"path": spec}
+        path = kwargs.pop("path")
+        return getattr(loader, method)(path, target_tenant=tenant, **kwargs)
+    return run
+
+
+def _load_common_masters(loader, tenant, spec, results):
+    kwargs = dict(spec) if isinstance(spec, dict) else {"path": spec}
+    path = kwargs.pop("path")
+    return loader.load_common_masters(path, target_tenant=tenant, defer_localizations=True, **kwargs)
+
+
+def _load_master_localizations(loader, tenant, spec, results):
+    messages = (results.get("common_masters") or {}).get("pending_localizations") or []
+    return loader.load_master_localizations(messages, target_tenant=tenant)
+
+
+# step -> (steps it waits for, function(loader, tenant, workbook spec, results so far))
+ONBOARDING_STEPS = {
+    "tenant": ((), _load("load_tenant")),
+    "boundaries": (("tenant",), _load("load_boundaries")),
+    "common_masters": (("tenant",), _load_common_masters),
+    "master_localizations": (("common_masters",), _load_master_localizations),
+    "employees": (("boundaries", "common_masters"), _load("load_employees")),
+    "localizations": (("tenant",), _load("load_localizations")),
+    "workflow": (("tenant",), _load("load_workflow")),
+}
+
+# Steps that run whenever the step they derive from does (no workbook of their own)
+DERIVED_STEPS = {"master_localizations": "common_masters"}
+
+
+def critical_path(steps: dict, outcomes: dict):
+    """Longest chain of dependent steps by duration
+
+    Args:
+        steps: {name: (after, fn)}
+        outcomes: {name: {"seconds": ...}} for the steps that ran
+
+    Returns:
+        (list of step names in order, total seconds)
+    """
+    longest = {}
+
+    def visit(name):
+        if name not in longest:
+            best, via = 0.0, None
+            for dep in steps[name][0]:
+                if dep in outcomes and visit(dep)[0] > best:
+                    best, via = longest[dep][0], dep
+            longest[name] = (best + outcomes[name]["seconds"], via)
+        return longest[name]
+
+    for name in outcomes:
+        visit(name)
+    if not longest:
+        return [], 0.0
+    end = max(longest, key=lambda n: longest[n][0])
+    path, name = [], end
+    while name:
+        path.append(name)
+        name = longest[name][1]
+    return path[::-1], round(longest[end][0], 2)
+
+
+class PhaseScheduler:
+    """Run onboarding steps for one tenant as a dependency graph"""
+
+    def __init__(self, loader, workers: int = 3, steps: dict = None):
+        """
+        Args:
+            loader: Logged-in CRSLoader
+            workers: Steps run at once
+            steps: {name: (after, fn)} (default: ONBOARDING_STEPS)
+        """
+        self.loader = loader
+        self.workers = max(1, workers)
+        self.steps = steps or ONBOARDING_STEPS
+
+    def plan(self, workbooks: dict) -> dict:
+        """The steps to run for these workbooks, dependencies on left-out steps dropped
+
+        Raises:
+            ValueError: for an unknown step name or a dependency cycle
+        """
+        unknown = set(workbooks) - set(self.steps)
+        if unknown:
+            raise ValueError(f"Unknown onboarding step(s): {', '.join(sorted(unknown))} "
+                             f"(expected {', '.join(self.steps)})")
+        chosen = {name for name in self.steps
+                  if workbooks.get(name) or workbooks.get(DERIVED_STEPS.get(name))}
+        plan = {name: (tuple(d for d in self.steps[name][0] if d in chosen), self.steps[name][1])
+                for name in self.steps if name in chosen}
+
+        order, seen = [], set()
+        while len(order) < len(plan):
+            ready = [n for n in plan if n not in seen and all(d in seen for d in plan[n][0])]
+            if not ready:
+                raise ValueError(f"Dependency cycle among: {', '.join(sorted(set(plan) - seen))}")
+            order.extend(ready)
+            seen.update(ready)
+        return plan
+
+    def run(self, workbooks: dict, target_tenant: str = None) -> dict:
+        """Run every step with a workbook, independent steps concurrently
+
+        Args:
+            workbooks: {step: workbook path or dict of load_* kwargs with "path"}
+            target_tenant: Target tenant ID (default: the login tenant)
+
+        Returns:
+            dict: per-step status, timing and counts, plus the critical path
+        """
+        self.loader._check_auth()
+        tenant = target_tenant or self.loader.tenant_id
+        plan = self.plan(workbooks)
+
+        print(f"\n{'='*60}")
+        print(f"ONBOARDING {tenant}: {len(plan)} step(s), {self.workers} worker(s)")
+        print(f"{'='*60}")
+
+        started = time.perf_counter()
+        outcomes, results = {}, {}
+        pending, running = dict(plan), {}
+        with thread_stdout() as stdout, \
+                ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="phase") as pool:
+            while pending or running:
+                for name in self._ready(pending, outcomes):
+                    _, fn = pending.pop(name)
+                    running[pool.submit(self._run_step, stdout, name, fn, tenant,
+                                        workbooks.get(name), dict(results), started)] = name
+                if not running:
+                    break
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    name = running.pop(future)
+                    outcome, result, output = future.result()
+                    outcomes[name] = outcome
+                    results[name] = result
+                    self._echo(stdout, name, outcome, output)
+
+        for name in plan:
+            outcomes[name]["after"] = list(plan[name][0])
+        ran = {n: o for n, o in outcomes.items() if o["status"] != "skipped"}
+        path, path_seconds = critical_path(plan, ran)
+        report = {
+            "tenant": tenant,
+            "finished": datetime.now().isoformat(timespec="seconds"),
+            "seconds": round(time.perf_counter() - started, 2),
+            "serial_seconds": round(sum(o["seconds"] for o in ran.values()), 2),
+            "workers": self.workers,
+            "steps": {name: outcomes[name] for name in plan},
+            "critical_path": {"steps": path, "seconds": path_seconds},
+        }
+        self._print_report(report)
+        return report
+
+    @staticmethod
+    def _ready(pending: dict, outcomes: dict):
+        """Steps whose dependencies are done; marks those behind a failure skipped"""
+        ready = []
+        changed = True
+        while changed:
+            changed = False
+            for name in list(pending):
+                after = pending[name][0]
+                blocked = [d for d in after
+                           if d in outcomes and outcomes[d]["status"] in ("failed", "skipped")]
+                if blocked:
+                    outcomes[name] = {"status": "skipped", "start": None, "seconds": 0.0,
+                                      "error": f"{blocked[0]} {outcomes[blocked[0]]['status']}"}
+                    del pending[name]
+                    changed = True
+                elif all(d in outcomes for d in after) and name not in ready:
+                    ready.append(name)
+        return ready
+
+    def _run_step(self, stdout, name, fn, tenant, spec, results, started):
+        """Run one step on a fork; returns (outcome, result, console output)"""
+        output = io.StringIO()
+        start = time.perf_counter()
+        with stdout.to(output):
+            try:
+                loader = self.loader.fork(progress=make_progress(self.loader.progress.sinks))
+                result, error = fn(loader, tenant, spec, results), None
+                self.loader.phase_metrics.update(loader.phase_metrics)
+            except Exception as e:
+                result, error = None, f"{type(e).__name__}: {e}"
+        seconds = time.perf_counter() - start
+
+        outcome = {
+            "status": phase_status(result, error),
+            "start": round(start - started, 2),
+            "seconds": round(seconds, 2),
+            **phase_counts(result),
+            **({"error": error} if error else {}),
+        }
+        return outcome, result, output.getvalue()
+
+    @staticmethod
+    def _echo(stream, name: str, outcome: dict, output: str):
+        """Print a finished step's buffered output as one block"""
+        stream.write(f"\n{'─'*20} {name} ({outcome['status']}, {outcome['seconds']:.1f}s) {'─'*20}\n")
+        stream.write(output)
+        if outcome.get("error"):
+            stream.write(f"❌ {name}: {outcome['error']}\n")
+        stream.flush()
+
+    @staticmethod
+    def _print_report(report: dict):
+        print(f"\n{'─'*60}")
+        print(f"Onboarding {report['tenant']}: {report['seconds']:.1f}s "
+              f"(phases sum to {report['serial_seconds']:.1f}s, {report['workers']} workers)")
+        for name, step in report["steps"].items():
+            icon = {"ok": "✅", "errors": "⚠️", "failed": "❌", "skipped": "⏭"}[step["status"]]
+            start = f"+{step['start']:.1f}s" if step["start"] is not None else "-"
+            after = ", ".join(step["after"]) or "-"
+            print(f"   {icon} {name:<22} {step['status']:<7} {start:>8} {step['seconds']:7.1f}s  after: {after}")
+        critical = report["critical_path"]
+        print(f"   Critical path: {' → '.join(critical['steps']) or '-'} ({critical['seconds']:.1f}s)")
+        print(f"{'─'*60}")
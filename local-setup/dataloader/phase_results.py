@@ -0,0 +1,45 @@
+"""
+Phase results - read the counts out of a CRSLoader phase result
+
+Each load_* method returns its own dict, sometimes nested (load_common_masters
+returns one per master). The multi-tenant runner and the phase DAG both
+report a phase as ok / errors / failed with created/exists/failed totals;
+these helpers read them the same way for both.
+"""
+
+
+def phase_failures(result) -> int:
+    """Failed-record count in a phase result, -1 if the phase itself failed"""
+    if not isinstance(result, dict):
+        return 0
+    if result.get("status") == "failed":
+        return -1
+    failed = result.get("failed", 0) if isinstance(result.get("failed"), int) else 0
+    for value in result.values():
+        if isinstance(value, dict):
+            nested = phase_failures(value)
+            if nested < 0:
+                return -1
+            failed += nested
+    return failed
+
+
+def phase_counts(result) -> dict:
+    """created/exists/failed summed over a (possibly nested) phase result"""
+    counts = {"created": 0, "exists": 0, "failed": 0}
+    if not isinstance(result, dict):
+        return counts
+    for key in counts:
+        if isinstance(result.get(key), int):
+            counts[key] += result[key]
+    for value in result.values():
+        if isinstance(value, dict):
+            for key, n in phase_counts(value).items():
+                counts[key] += n
+    return counts
+
+
+def phase_status(result, error: str = None) -> str:
+    """"ok", "errors" (some records failed) or "failed" (the phase failed)"""
+    failures = phase_failures(result)
+    return "failed" if error or failures < 0 else "errors" if failures else "ok"
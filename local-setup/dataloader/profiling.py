@@ -0,0 +1,117 @@
+"""
+Phase profiling - opt-in cProfile + tracemalloc around CRSLoader phases
+
+Enabled with DATALOADER_PROFILE=1 or CRSLoader(..., profile=True). For each
+phase three files are written next to the phase's input workbook (or into
+DATALOADER_PROFILE_DIR / profile_dir):
+
+    <workbook>.<phase>.pstats        cProfile stats; python -m pstats, snakeviz
+    <workbook>.<phase>.profile.txt   top functions by cumulative time
+    <workbook>.<phase>.alloc.txt     peak traced memory and top allocation sites
+
+cProfile only sees the thread that runs the phase, so time spent in the
+streaming/upload worker threads shows up as waits on the queue; tracemalloc
+covers every thread.
+"""
+
+import io
+import os
+import time
+from contextlib import contextmanager
+
+TOP_FUNCTIONS = 40
+TOP_ALLOCATIONS = 25
+
+
+def profile_paths(phase: str, workbook: str = None, output_dir: str = None) -> dict:
+    """Output file paths for a phase's profile"""
+    stem = os.path.basename(workbook) if workbook else "crs_loader"
+    directory = output_dir or (os.path.dirname(os.path.abspath(workbook)) if workbook else ".")
+    base = os.path.join(directory, f"{stem}.{phase}")
+    return {
+        "pstats": base + ".pstats",
+        "profile": base + ".profile.txt",
+        "alloc": base + ".alloc.txt",
+    }
+
+
+@contextmanager
+def profile_phase(phase: str, workbook: str = None, output_dir: str = None):
+    """Profile the enclosed block and write the reports
+
+    Yields the dict of output paths; files are written when the block exits,
+    even if it raised.
+    """
+    import cProfile
+    import pstats
+    import tracemalloc
+
+    paths = profile_paths(phase, workbook, output_dir)
+    os.makedirs(os.path.dirname(paths["pstats"]), exist_ok=True)
+
+    started_tracing = not tracemalloc.is_tracing()
+    if started_tracing:
+        tracemalloc.start(10)
+    tracemalloc.reset_peak()
+    before = tracemalloc.take_snapshot()
+
+    profiler = cProfile.Profile()
+    try:
+        profiler.enable()
+    except ValueError:
+        # Another profiler (e.g. an outer phase or a debugger) is active
+        profiler = None
+
+    start = time.perf_counter()
+    try:
+        yield paths
+    finally:
+        elapsed = time.perf_counter() - start
+        if profiler:
+            profiler.disable()
+        after = tracemalloc.take_snapshot()
+        current, peak = tracemalloc.get_traced_memory()
+        if started_tracing:
+            tracemalloc.stop()
+
+        if profiler:
+            profiler.dump_stats(paths["pstats"])
+            out = io.StringIO()
+            stats = pstats.Stats(profiler, stream=out)
+            stats.strip_dirs().sort_stats("cumulative").print_stats(TOP_FUNCTIONS)
+            with open(paths["profile"], "w", encoding="utf-8") as f:
+                f.write(f"Phase: {phase}  wall time: {elapsed:.2f}s\n")
+                f.write(out.getvalue())
+        else:
+            paths.pop("pstats")
+            paths.pop("profile")
+
+        _write_allocations(paths["alloc"], phase, before, after, current, peak)
+        print(f"\n🔬 Profile ({phase}, {elapsed:.2f}s, peak traced {peak / 1024 / 1024:.1f} MB):")
+        for path in paths.values():
+            print(f"   {path}")
+
+
+def _write_allocations(path, phase, before, after, current, peak):
+    import tracemalloc
+
+    filters = [
+        tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+        tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+        tracemalloc.Filter(False, tracemalloc.__file__),
+    ]
+    after = after.filter_traces(filters)
+    before = before.filter_traces(filters)
+
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(f"Phase: {phase}\n")
+        f.write(f"Peak traced memory: {peak / 1024 / 1024:.1f} MB\n")
+        f.write(f"Still allocated at end: {current / 1024 / 1024:.1f} MB\n\n")
+
+        f.write(f"Top {TOP_ALLOCATIONS} allocation sites by growth during the phase:\n")
+        for stat in after.compare_to(before, "lineno")[:TOP_ALLOCATIONS]:
+            f.write(f"  {stat}\n")
+
+        f.write(f"\nTop {TOP_ALLOCATIONS} live allocation sites at the end of the phase:\n")
+        for stat in after.statistics("lineno")[:TOP_ALLOCATIONS]:
+            f.write(f"  {stat}\n")
@@ -0,0 +1,333 @@
+"""
+Progress events - structured reporting for loader phases
+
+APIUploader and CRSLoader report per-record outcomes as events instead of
+printing one line per row. Events are plain dicts:
+
+    {"event": "phase_start", "phase": "employees", "ts": ...}
+    {"event": "task_start",  "phase": ..., "task": "common-masters.Department", "total": 120}
+    {"event": "row",   "phase": ..., "task": ..., "status": "SUCCESS", "id": "DEPT_1",
+                       "done": 12, "total": 120, "error": None, "message": "   [OK] [12/120] DEPT_1"}
+    {"event": "batch", "phase": ..., "task": ..., "status": "SUCCESS", "size": 500, "done": 1500, ...}
+    {"event": "phase_end", "phase": ..., "seconds": 12.3, "counts": {"SUCCESS": 118, "FAILED": 2}}
+
+status is SUCCESS, EXISTS or FAILED. message is the line the loader used to
+print for that record.
+
+Sinks decide what to show:
+
+    verbose   print every message (the old behaviour, default)
+    summary   one line per phase plus failed rows
+    bar       live progress bar (tqdm when installed) plus failed rows
+    quiet     nothing
+    jsonl:<path>  append every event to a JSON-lines file
+
+    progress = make_progress("bar,jsonl:run-events.jsonl")
+    loader = CRSLoader(url, progress=progress)      # or DATALOADER_PROGRESS=bar
+
+Section headers and summaries printed by the loaders are not events and are
+still printed; only the per-record lines go through here.
+
+progress.cancel() asks a running upload to stop: loaders that check
+progress.cancelled stop at the next record/batch boundary, and the next
+progress.task() raises Cancelled.
+"""
+
+import json
+import sys
+import threading
+import time
+
+STATUSES = ("SUCCESS", "EXISTS", "FAILED")
+
+
+class Cancelled(Exception):
+    """Raised when a task is started after Progress.cancel()"""
+
+
+class Progress:
+    """Event emitter shared by an uploader and its loader"""
+
+    def __init__(self, sinks=None):
+        self.sinks = list(sinks) if sinks is not None else [ConsoleSink()]
+        self._lock = threading.Lock()
+        self.phase = None
+        self.task_name = None
+        self.total = None
+        self.done = 0
+        self.counts = {}
+        self._phase_started = None
+        self._cancel = threading.Event()
+
+    def cancel(self):
+        """Ask the upload reporting here to stop at the next record/batch boundary"""
+        self._cancel.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancel.is_set()
+
+    def wait(self, seconds: float) -> bool:
+        """Sleep up to seconds, waking early on cancel; True if cancelled"""
+        return self._cancel.wait(seconds)
+
+    def emit(self, event: str, **fields):
+        """Stamp an event with the current phase/task and hand it to every sink"""
+        fields.update(event=event, phase=self.phase, ts=time.time())
+        if "task" not in fields:
+            fields["task"] = self.task_name
+        for sink in self.sinks:
+            sink.handle(fields)
+        return fields
+
+    def phase_start(self, phase: str):
+        with self._lock:
+            self.phase = phase
+            self.task_name = None
+            self.total = None
+            self.done = 0
+            self.counts = {}
+            self._phase_started = time.perf_counter()
+            self.emit("phase_start")
+
+    def phase_end(self, **extra):
+        with self._lock:
+            seconds = time.perf_counter() - self._phase_started if self._phase_started else None
+            self.emit("phase_end", seconds=seconds, counts=dict(self.counts), **extra)
+            self.phase = None
+            self.task_name = None
+            self._phase_started = None
+
+    def task(self, name: str, total: int = None):
+        """Start a unit of work inside the phase (one sheet, one schema, ...)
+
+        Raises:
+            Cancelled: if cancel() has been called
+        """
+        if self.cancelled:
+            raise Cancelled(f"Cancelled before {name}")
+        with self._lock:
+            self.task_name = name
+            self.total = total
+            self.done = 0
+            self.emit("task_start", total=total)
+
+    def row(self, status: str, id=None, message: str = None, error: str = None, advance: bool = True):
+        """Outcome of one record
+
+        Args:
+            status: SUCCESS, EXISTS or FAILED
+            id: Record identifier (code, username, ...)
+            message: Human-readable line (printed by the verbose sink)
+            error: Error text for failures
+            advance: False for sub-steps that should not move the bar
+                (e.g. the boundary entity before its relationship)
+        """
+        with self._lock:
+            if advance:
+                self.done += 1
+                self.counts[status] = self.counts.get(status, 0) + 1
+            self.emit("row", status=status, id=id, message=message, error=error,
+                      done=self.done, total=self.total)
+
+    def batch(self, size: int, status: str, message: str = None, error: str = None):
+        """Outcome of a batch of records sent in one call"""
+        with self._lock:
+            self.done += size
+            self.counts[status] = self.counts.get(status, 0) + size
+            self.emit("batch", status=status, size=size, message=message, error=error,
+                      done=self.done, total=self.total)
+
+    def close(self):
+        for sink in self.sinks:
+            close = getattr(sink, "close", None)
+            if close:
+                close()
+
+
+# ============================================================================
+# SINKS
+# ============================================================================
+
+class ConsoleSink:
+    """Print each event's message, exactly as the loaders used to"""
+
+    def handle(self, event):
+        if event.get("message"):
+            print(event["message"])
+
+
+class QuietSink:
+    def handle(self, event):
+        pass
+
+
+class SummarySink:
+    """A line per phase, plus every failed record"""
+
+    def handle(self, event):
+        kind = event["event"]
+        if kind == "phase_start":
+            print(f"▶ {event['phase']}")
+        elif kind == "phase_end":
+            counts = "  ".join(f"{k}={v}" for k, v in sorted(event["counts"].items())) or "no records"
+            seconds = event.get("seconds") or 0
+            print(f"✔ {event['phase']}  {seconds:.1f}s  {counts}")
+        elif event.get("status") == "FAILED" and event.get("message"):
+            print(event["message"])
+
+
+class BarSink:
+    """Live progress bar per task (tqdm if installed, else a text bar on stderr)"""
+
+    def __init__(self, stream=None, min_interval: float = 0.2):
+        self.stream = stream or sys.stderr
+        self.min_interval = min_interval
+        self._bar = None
+        self._last_draw = 0.0
+        self._failed = 0
+        try:
+            from tqdm.auto import tqdm
+            self._tqdm = tqdm
+        except ImportError:
+            self._tqdm = None
+
+    def handle(self, event):
+        kind = event["event"]
+        if kind == "task_start":
+            self._close_bar()
+            self._failed = 0
+            label = f"{event['phase']}: {event['task']}" if event.get("phase") else event["task"]
+            if self._tqdm:
+                self._bar = self._tqdm(total=event.get("total"), desc=label, unit="rec", leave=True)
+            else:
+                self._bar = {"label": label, "done": 0, "total": event.get("total"),
+                             "start": time.perf_counter()}
+        elif kind in ("row", "batch"):
+            if event.get("status") == "FAILED":
+                self._failed += 1 if kind == "row" else event.get("size", 1)
+                if event.get("message"):
+                    self._write_line(event["message"])
+            if self._bar is None:
+                return
+            if self._tqdm:
+                self._bar.n = event["done"]
+                if event.get("total") is None:
+                    self._bar.total = None
+                self._bar.set_postfix(failed=self._failed, refresh=False)
+                now = time.perf_counter()
+                if now - self._last_draw >= self.min_interval or event["done"] == event.get("total"):
+                    self._bar.refresh()
+                    self._last_draw = now
+            else:
+                self._bar["done"] = event["done"]
+                self._draw()
+        elif kind == "phase_end":
+            self._close_bar()
+
+    def _draw(self, force: bool = False):
+        bar = self._bar
+        now = time.perf_counter()
+        finished = bar["total"] is not None and bar["done"] >= bar["total"]
+        if bar.get("drawn") == bar["done"] or (
+                not force and not finished and now - self._last_draw < self.min_interval):
+            return
+        self._last_draw = now
+        bar["drawn"] = bar["done"]
+        rate = bar["done"] / max(now - bar["start"], 1e-6)
+        if bar["total"]:
+            filled = int(30 * bar["done"] / bar["total"])
+            body = f"[{'#' * filled}{'.' * (30 - filled)}] {bar['done']}/{bar['total']}"
+        else:
+            body = f"{bar['done']}"
+        self.stream.write(f"\r{bar['label']} {body}  {rate:.1f}/s  failed={self._failed}")
+        self.stream.flush()
+
+    def _write_line(self, text):
+        if self._tqdm and self._bar is not None:
+            self._bar.write(text)
+        else:
+            if self._bar is not None:
+                self.stream.write("\n")
+                self._bar["drawn"] = None
+            print(text)
+
+    def _close_bar(self):
+        if self._bar is None:
+            return
+        if self._tqdm:
+            self._bar.close()
+        else:
+            self._draw(force=True)
+            self.stream.write("\n")
+            self.stream.flush()
+        self._bar = None
+
+    def close(self):
+        self._close_bar()
+
+
+class JsonlSink:
+    """Append every event as one JSON line"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = open(path, "a", encoding="utf-8")
+        self._lock = threading.Lock()
+
+    def handle(self, event):
+        line = json.dumps(event, default=str, ensure_ascii=False)
+        with self._lock:
+            self._file.write(line + "\n")
+            if event["event"] in ("phase_end", "task_start"):
+                self._file.flush()
+
+    def close(self):
+        with self._lock:
+            self._file.close()
+
+
+class CallbackSink:
+    """Hand every event to a function (used by the notebook UI)"""
+
+    def __init__(self, callback):
+        self.callback = callback
+
+    def handle(self, event):
+        self.callback(event)
+
+
+def make_progress(spec=None) -> Progress:
+    """Build a Progress from a spec string, a list of sinks or a Progress
+
+    Args:
+        spec: "verbose", "summary", "bar", "quiet", "jsonl:<path>", or several
+            comma-separated; None/"" means verbose
+
+    Raises:
+        ValueError: for an unknown sink name
+    """
+    if isinstance(spec, Progress):
+        return spec
+    if isinstance(spec, (list, tuple)):
+        return Progress(spec)
+
+    sinks = []
+    for part in (spec or "verbose").split(","):
+        part = part.strip()
+        name, _, arg = part.partition(":")
+        if name == "verbose":
+            sinks.append(ConsoleSink())
+        elif name == "summary":
+            sinks.append(SummarySink())
+        elif name == "bar":
+            sinks.append(BarSink())
+        elif name == "quiet":
+            sinks.append(QuietSink())
+        elif name == "jsonl":
+            if not arg:
+                raise ValueError("jsonl progress sink needs a path: jsonl:<path>")
+            sinks.append(JsonlSink(arg))
+        elif part:
+            raise ValueError(f"Unknown progress sink '{part}' (verbose, summary, bar, quiet, jsonl:<path>)")
+    return Progress(sinks)
@@ -0,0 +1,179 @@
+"""
+Service discovery - find each gateway service's path prefix once
+
+Deployments mount some services under different prefixes (MDMS is /mdms-v2
+on newer ones, /egov-mdms-service on older ones). Each service takes its
+prefix from its env var (MDMS_V2_SERVICE, BOUNDARY_SERVICE, ...), or its
+first candidate in SERVICES when the var is unset; setting the var to an
+empty value asks for auto-detection. APIUploader used to auto-detect only
+MDMS, one candidate at a time with a 5 s timeout each, on every new
+instance. Now every candidate prefix of every auto-detected service is
+probed at once, and the result is kept on disk per gateway:
+
+    ~/.cache/crs-dataloader/services/<sha256 of base_url>.json
+
+For DISCOVERY_TTL seconds (default a day) later runs against the same
+gateway use the stored prefixes without probing. Set
+DATALOADER_SERVICE_CACHE to another directory, or to "off" to probe on
+every run.
+
+A prefix counts as present when the probe gets any answer but 404 (a 401
+or 400 still means the route exists). When no candidate answers, the
+service keeps its first candidate, and nothing is stored if the gateway
+answered no probe at all.
+"""
+
+import hashlib
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+SERVICE_CACHE_DIR = os.environ.get('DATALOADER_SERVICE_CACHE',
+                                   os.path.join('~', '.cache', 'crs-dataloader', 'services'))
+
+DISCOVERY_TTL = int(os.environ.get('DATALOADER_SERVICE_CACHE_TTL', str(24 * 3600)))
+
+PROBE_TIMEOUT = 5
+
+# service -> (env var, candidate prefixes in order of preference, method, probe path)
+SERVICES = {
+    'mdms': ('MDMS_V2_SERVICE', ('/mdms-v2', '/egov-mdms-service'), 'post', '/v2/_search'),
+    'boundary': ('BOUNDARY_SERVICE', ('/boundary-service',), 'post', '/boundary/_search'),
+    'boundary_mgmt': ('BOUNDARY_MGMT_SERVICE', ('/egov-bndry-mgmnt', '/boundary-management'), 'post',
+                      '/boundary-management/v1/_generate-search'),
+    'hrms': ('HRMS_SERVICE', ('/egov-hrms',), 'post', '/employees/_search'),
+    'localization': ('LOCALIZATION_SERVICE', ('/localization',), 'post', '/messages/v1/_search'),
+    'workflow': ('WORKFLOW_SERVICE', ('/egov-workflow-v2',), 'post', '/egov-wf/businessservice/_search'),
+    'filestore': ('FILESTORE_SERVICE', ('/filestore',), 'get', '/v1/files/url'),
+}
+
+PROBE_BODY = {
+    "RequestInfo": {"apiId": "Rainmaker"},
+    "MdmsCriteria": {"tenantId": "default", "limit": 1},
+}
+
+
+class ServicePathCache:
+    """Discovered service prefixes on disk, one JSON file per gateway"""
+
+    def __init__(self, directory: str, ttl: int = DISCOVERY_TTL):
+        self.directory = os.path.expanduser(directory)
+        self.ttl = ttl
+
+    def _path(self, base_url: str) -> str:
+        key = base_url.rstrip('/')
+        return os.path.join(self.directory, hashlib.sha256(key.encode()).hexdigest()[:32] + ".json")
+
+    def load(self, base_url: str):
+        """{service: prefix} discovered within the TTL, or None"""
+        try:
+            with open(self._path(base_url), encoding="utf-8") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if entry.get("discovered_at", 0) + self.ttl <= time.time():
+            return None
+        return entry.get("paths") or None
+
+    def save(self, base_url: str, paths: dict):
+        """Store discovered prefixes; failures (read-only home, ...) are ignored"""
+        path = self._path(base_url)
+        entry = {"base_url": base_url, "paths": paths, "discovered_at": time.time()}
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(entry, f)
+            os.replace(tmp_path, path)
+        except OSError:
+            pass
+
+    def discard(self, base_url: str):
+        try:
+            os.remove(self._path(base_url))
+        except OSError:
+            pass
+
+
+def default_service_cache():
+    """ServicePathCache at $DATALOADER_SERVICE_CACHE, or None when set to off/0/false"""
+    if SERVICE_CACHE_DIR.strip().lower() in ('', '0', 'off', 'false', 'no'):
+        return None
+    return ServicePathCache(SERVICE_CACHE_DIR)
+
+
+def configured_paths(services=SERVICES) -> dict:
+    """{service: prefix} for services not left to auto-detection
+
+    The env var's value when set, else the first candidate; services whose
+    env var is set to an empty value are left out.
+    """
+    return {name: os.environ.get(env, candidates[0])
+            for name, (env, candidates, *_) in services.items() if os.environ.get(env) != ''}
+
+
+def probe_service_paths(base_url: str, services=SERVICES, timeout: float = PROBE_TIMEOUT,
+                        send=requests.request):
+    """Probe every candidate prefix of every service concurrently
+
+    send(method, url, **kwargs) sends one probe; APIUploader passes its
+    _send_once so probes are metered and go through the circuit breakers.
+
+    Returns:
+        tuple: ({service: prefix}, answered) - the first candidate per
+        service that did not answer 404 (else its first candidate), and
+        whether any probe got a response at all
+    """
+    base_url = base_url.rstrip('/')
+    probes = [(name, prefix, method, probe_path)
+              for name, (_, candidates, method, probe_path) in services.items()
+              for prefix in candidates]
+
+    def probe(job):
+        name, prefix, method, probe_path = job
+        kwargs = {"params": {"tenantId": "default"}, "timeout": timeout}
+        if method == "post":
+            kwargs.update(json=PROBE_BODY, headers={"Content-Type": "application/json"})
+        try:
+            return send(method, f"{base_url}{prefix}{probe_path}", **kwargs).status_code
+        except requests.exceptions.RequestException:
+            return None
+
+    with ThreadPoolExecutor(max_workers=max(1, len(probes)), thread_name_prefix="discover") as pool:
+        statuses = dict(zip([(name, prefix) for name, prefix, _, _ in probes], pool.map(probe, probes)))
+
+    paths = {}
+    for name, (_, candidates, _, _) in services.items():
+        found = [p for p in candidates if statuses[(name, p)] not in (None, 404)]
+        paths[name] = found[0] if found else candidates[0]
+    answered = any(status is not None for status in statuses.values())
+    return paths, answered
+
+
+def discover_service_paths(base_url: str, cache=None, services=SERVICES, send=requests.request) -> dict:
+    """{service: prefix} for every service in services
+
+    Auto-detected services (see configured_paths) come from the cache, or
+    else from one concurrent probe whose result is then cached.
+    """
+    paths = configured_paths(services)
+    missing = {name: spec for name, spec in services.items() if name not in paths}
+    if not missing:
+        return paths
+
+    cached = cache.load(base_url) if cache is not None else None
+    if cached and all(name in cached for name in missing):
+        paths.update({name: cached[name] for name in missing})
+        return paths
+
+    started = time.perf_counter()
+    probed, answered = probe_service_paths(base_url, missing, send=send)
+    print(f"   Service paths discovered in {time.perf_counter() - started:.1f}s: "
+          + ", ".join(f"{name}={prefix}" for name, prefix in probed.items()))
+    if cache is not None and answered:
+        cache.save(base_url, dict(cached or {}, **probed))
+    paths.update(probed)
+    return paths
@@ -5,18 +5,36 @@ Usage:
     send_event("dataloader", "create", "tenant")
 
 Opt-out: set environment variable TELEMETRY=false
+
+send_event() only puts the event on a bounded queue and never waits; when
+the queue is full the event is dropped. One background thread sends queued
+events to Matomo's bulk tracking endpoint, up to BATCH_SIZE per request,
+over a pooled connection. At interpreter exit whatever is still queued gets
+at most FLUSH_TIMEOUT seconds to go out. A batch Matomo rejects (non-2xx)
+or that fails to send counts as dropped.
 """
 
+import atexit
 import hashlib
 import os
+import queue
 import socket
 import threading
+import time
 import uuid
+from urllib.parse import urlencode
 
 import requests
 
 MATOMO_URL = "https://unified-demo.digit.org/matomo/matomo.php"
 MATOMO_SITE_ID = os.environ.get("MATOMO_SITE_ID", "5")
+USER_AGENT = "Mozilla/5.0 (DIGIT-LocalSetup/1.0; Linux) AppleWebKit/537.36"
+
+QUEUE_SIZE = 1000      # events waiting to be sent; more are dropped
+BATCH_SIZE = 50        # events per bulk request
+BATCH_WAIT = 1.0       # seconds to wait for a batch to fill up
+FLUSH_TIMEOUT = 2.0    # seconds allowed for sending the rest at exit
+REQUEST_TIMEOUT = 5
 
 
 def _get_visitor_id() -> str:
@@ -25,29 +43,117 @@ def _get_visitor_id() -> str:
     return hashlib.sha256(raw.encode()).hexdigest()[:16]
 
 
-def send_event(category: str, action: str, name: str = "") -> None:
-    """Send a telemetry event (fire-and-forget, non-blocking)."""
-    if os.environ.get("TELEMETRY", "true").lower() == "false":
-        return
+class TelemetrySender:
+    """Bounded event queue drained by one background thread in bulk requests"""
 
-    def _send():
+    def __init__(self, url: str = None, queue_size: int = QUEUE_SIZE,
+                 batch_size: int = BATCH_SIZE, batch_wait: float = BATCH_WAIT):
+        self.url = url
+        self.batch_size = batch_size
+        self.batch_wait = batch_wait
+        self.sent = 0
+        self.dropped = 0
+        self._queue = queue.Queue(maxsize=queue_size)
+        self._lock = threading.Lock()
+        self._thread = None
+        self._closing = threading.Event()
+        self._session = None
+        self._visitor_id = None
+
+    def enqueue(self, category: str, action: str, name: str = "") -> bool:
+        """Queue an event; False if it was dropped (queue full or closed)"""
+        if self._closing.is_set():
+            return False
+        try:
+            self._queue.put_nowait((category, action, name))
+        except queue.Full:
+            self._count(dropped=1)
+            return False
+        self._start()
+        return True
+
+    def _count(self, sent: int = 0, dropped: int = 0):
+        with self._lock:
+            self.sent += sent
+            self.dropped += dropped
+
+    def _start(self):
+        if self._thread is not None:
+            return
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="telemetry", daemon=True)
+                self._thread.start()
+
+    def _next_batch(self) -> list:
+        """Up to batch_size events: blocks for the first, waits batch_wait for the rest"""
         try:
-            requests.post(
-                MATOMO_URL,
-                data={
-                    "idsite": MATOMO_SITE_ID,
-                    "rec": "1",
-                    "e_c": category,
-                    "e_a": action,
-                    "e_n": name,
-                    "_id": _get_visitor_id(),
-                    "url": f"https://local-setup.digit.org/{category}/{action}",
-                    "apiv": "1",
-                },
-                headers={"User-Agent": "Mozilla/5.0 (DIGIT-LocalSetup/1.0; Linux) AppleWebKit/537.36"},
-                timeout=5,
+            batch = [self._queue.get(timeout=0.1 if self._closing.is_set() else 1.0)]
+        except queue.Empty:
+            return []
+        deadline = time.monotonic() + (0 if self._closing.is_set() else self.batch_wait)
+        while len(batch) < self.batch_size:
+            try:
+                batch.append(self._queue.get(timeout=max(0.0, deadline - time.monotonic())))
+            except queue.Empty:
+                break
+        return batch
+
+    def _run(self):
+        while True:
+            batch = self._next_batch()
+            if batch:
+                self._post(batch)
+            elif self._closing.is_set():
+                return
+
+    def _tracking_request(self, event) -> str:
+        category, action, name = event
+        if self._visitor_id is None:
+            self._visitor_id = _get_visitor_id()
+        return "?" + urlencode({
+            "idsite": MATOMO_SITE_ID,
+            "rec": "1",
+            "e_c": category,
+            "e_a": action,
+            "e_n": name,
+            "_id": self._visitor_id,
+            "url": f"https://local-setup.digit.org/{category}/{action}",
+            "apiv": "1",
+            "ua": USER_AGENT,
+        })
+
+    def _post(self, batch):
+        try:
+            if self._session is None:
+                self._session = requests.Session()
+                self._session.headers["User-Agent"] = USER_AGENT
+            response = self._session.post(
+                self.url or MATOMO_URL,
+                json={"requests": [self._tracking_request(event) for event in batch]},
+                timeout=REQUEST_TIMEOUT,
             )
         except Exception:
-            pass  # fire-and-forget
+            self._count(dropped=len(batch))  # fire-and-forget
+            return
+        if response.ok:
+            self._count(sent=len(batch))
+        else:
+            self._count(dropped=len(batch))
+
+    def flush(self, timeout: float = FLUSH_TIMEOUT):
+        """Stop taking events and give the worker up to timeout seconds to send the rest"""
+        self._closing.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+
+_sender = TelemetrySender()
+atexit.register(_sender.flush)
 
-    threading.Thread(target=_send, daemon=True).start()
+
+def send_event(category: str, action: str, name: str = "") -> None:
+    """Send a telemetry event (fire-and-forget, non-blocking)."""
+    if os.environ.get("TELEMETRY", "true").lower() == "false":
+        return
+    _sender.enqueue(category, action, name)
@@ -64,7 +64,7 @@ class DeleteBoundariesTests(unittest.TestCase):
 
     def test_build_boundary_cleanup_sql_deletes_relationships_then_entities_then_hierarchy(self):
         loader = _build_loader()
-        plan = loader._build_boundary_cleanup_plan("statea.citya")
+        plan = loader._build_boundary_cleanup_plan("statea.citya", include_hierarchies=True)
 
         statements = loader._build_boundary_cleanup_sql(plan)
 
@@ -77,6 +77,15 @@ class DeleteBoundariesTests(unittest.TestCase):
             ],
         )
 
+    def test_build_boundary_cleanup_sql_keeps_hierarchies_by_default(self):
+        loader = _build_loader()
+        plan = loader._build_boundary_cleanup_plan("statea.citya")
+
+        statements = loader._build_boundary_cleanup_sql(plan)
+
+        self.assertEqual(len(statements), 2)
+        self.assertFalse([s for s in statements if "boundary_hierarchy" in s])
+
     def test_delete_boundaries_falls_back_to_kubectl_api_when_db_cleanup_skipped(self):
         loader = _build_loader()
         expected_plan = loader._build_boundary_cleanup_plan("statea.citya")
@@ -0,0 +1,105 @@
+"""
+Token cache - reuse gateway logins across loader runs
+
+APIUploader.authenticate() runs an OAuth password grant. Each CI script and
+notebook restart used to log in again; with the cache, the access token and
+user info from the last grant are kept on disk per (gateway, user, tenant,
+user type) and reused until shortly before they expire:
+
+    ~/.cache/crs-dataloader/tokens/<sha256 of the key>.json   (mode 0600)
+
+The password is never written, only a salted PBKDF2 hash of it. A token is
+handed out only to a login with the same password, so wrong or rotated
+credentials still go to the gateway and fail there. Set
+DATALOADER_TOKEN_CACHE to another directory, or to "off" to always log in.
+
+A cached token the gateway no longer accepts (restart, logout) costs one 401:
+APIUploader re-authenticates and retries the request (see _reauthenticate).
+"""
+
+import hashlib
+import hmac
+import json
+import os
+import time
+
+TOKEN_CACHE_DIR = os.environ.get('DATALOADER_TOKEN_CACHE',
+                                 os.path.join('~', '.cache', 'crs-dataloader', 'tokens'))
+
+# Tokens expiring within this many seconds are not handed out
+EXPIRY_MARGIN = 300
+
+# Lifetime assumed when the token response has no expires_in
+DEFAULT_TTL = 3600
+
+PASSWORD_HASH_ITERATIONS = 100_000
+
+
+def _password_hash(password: str, salt: bytes) -> str:
+    return hashlib.pbkdf2_hmac("sha256", (password or '').encode(), salt,
+                               PASSWORD_HASH_ITERATIONS).hex()
+
+
+class TokenCache:
+    """Access tokens on disk, one JSON file per login"""
+
+    def __init__(self, directory: str):
+        self.directory = os.path.expanduser(directory)
+
+    def _path(self, base_url: str, username: str, tenant_id: str, user_type: str) -> str:
+        key = "|".join([base_url.rstrip('/'), username or '', tenant_id or '', user_type or ''])
+        return os.path.join(self.directory, hashlib.sha256(key.encode()).hexdigest()[:32] + ".json")
+
+    def load(self, base_url: str, username: str, tenant_id: str, user_type: str, password: str):
+        """Cached {access_token, user_info, expires_at}, or None if missing,
+        expiring or stored for a different password"""
+        try:
+            with open(self._path(base_url, username, tenant_id, user_type), encoding="utf-8") as f:
+                entry = json.load(f)
+            salt = bytes.fromhex(entry.get("password_salt", ""))
+        except (OSError, ValueError):
+            return None
+        if not entry.get("access_token") or entry.get("expires_at", 0) - EXPIRY_MARGIN <= time.time():
+            return None
+        if not salt or not hmac.compare_digest(entry.get("password_hash", ""), _password_hash(password, salt)):
+            return None
+        return entry
+
+    def save(self, base_url: str, username: str, tenant_id: str, user_type: str, password: str,
+             access_token: str, user_info: dict, expires_in: int = None):
+        """Store a token; failures (read-only home, ...) are ignored"""
+        path = self._path(base_url, username, tenant_id, user_type)
+        salt = os.urandom(16)
+        entry = {
+            "base_url": base_url,
+            "username": username,
+            "tenant_id": tenant_id,
+            "password_salt": salt.hex(),
+            "password_hash": _password_hash(password, salt),
+            "access_token": access_token,
+            "user_info": user_info,
+            "expires_at": time.time() + (expires_in or DEFAULT_TTL),
+        }
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(self.directory, mode=0o700, exist_ok=True)
+            fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(entry, f)
+            os.replace(tmp_path, path)
+        except OSError:
+            pass
+
+    def discard(self, base_url: str, username: str, tenant_id: str, user_type: str):
+        """Forget a token the gateway rejected"""
+        try:
+            os.remove(self._path(base_url, username, tenant_id, user_type))
+        except OSError:
+            pass
+
+
+def default_token_cache():
+    """TokenCache at $DATALOADER_TOKEN_CACHE, or None when set to off/0/false"""
+    if TOKEN_CACHE_DIR.strip().lower() in ('', '0', 'off', 'false', 'no'):
+        return None
+    return TokenCache(TOKEN_CACHE_DIR)
@@ -4,20 +4,43 @@ All code for reading Excel and generating API payloads
 Users should not modify this file directly
 """
 
-import pandas as pd
+import contextlib
 import json
 import math
 import warnings
 import requests
 import time
 import os
-from typing import Dict, List, Any
+from typing import Dict, List, Any, TYPE_CHECKING
 from datetime import datetime
-from openpyxl import load_workbook
-from openpyxl.styles import PatternFill, Font
-from openpyxl.utils import get_column_letter
 from dotenv import load_dotenv
 
+try:
+    from .http_metrics import HttpMetrics
+    from .progress import Progress
+    from .token_cache import default_token_cache
+    from .filestore_cache import MultipartFile, default_filestore_cache, file_sha256
+    from .boundary_index import BoundaryIndex, BoundaryIndexes
+    from .circuit_breaker import (CircuitBreakers, UNAVAILABLE_STATUSES, SUCCESS, FAILURE,
+                                  admit, report, retried_request)
+    from .service_discovery import default_service_cache, discover_service_paths
+except (ImportError, ModuleNotFoundError):
+    from http_metrics import HttpMetrics
+    from progress import Progress
+    from token_cache import default_token_cache
+    from filestore_cache import MultipartFile, default_filestore_cache, file_sha256
+    from boundary_index import BoundaryIndex, BoundaryIndexes
+    from circuit_breaker import (CircuitBreakers, UNAVAILABLE_STATUSES, SUCCESS, FAILURE,
+                                 admit, report, retried_request)
+    from service_discovery import default_service_cache, discover_service_paths
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+# pandas and openpyxl are imported inside the functions that read or write
+# Excel. Commands that only authenticate, create tenants or load JSON never
+# touch a workbook and should not pay their import cost.
+
 warnings.filterwarnings('ignore')
 
 # Load environment variables from .env file
@@ -31,7 +54,13 @@ load_dotenv()
 def clean_nans(obj):
     """
     Recursively clean NaN values and convert dates for JSON serialization
+
+    The loader itself no longer calls it: sheet readers normalise the
+    DataFrame up front (normalize_frame). It stays importable for notebooks
+    and scripts that build payloads by hand, and walks every leaf, so it is
+    slow on large lists.
     """
+    import pandas as pd
     if isinstance(obj, dict):
         cleaned = {}
         for k, v in obj.items():
@@ -49,6 +78,177 @@ def clean_nans(obj):
         return obj  # Keep None as None (will be null in JSON)
 
 
+def _iso_or_none(value):
+    """ISO string for datetime-like cells, None for missing ones, else unchanged"""
+    # pd.Timestamp and pd.NaT are datetime subclasses; NaT never equals itself.
+    # Checking for them this way keeps the openpyxl row reader pandas-free.
+    if isinstance(value, datetime):
+        return None if value != value else value.isoformat()
+    if value is None or (isinstance(value, float) and math.isnan(value)):
+        return None
+    return value
+
+
+def normalize_frame(df: 'pd.DataFrame') -> 'pd.DataFrame':
+    """Make a sheet DataFrame JSON-ready, one column at a time.
+
+    Dtype-aware replacement for running clean_nans over every payload:
+    - datetime64 columns become ISO strings (NaT -> None)
+    - float columns that pandas upcast only to hold NaN go back to ints
+      (so a mobile number is 9999999999, not 9999999999.0)
+    - object columns get NaN/NaT -> None, and stray Timestamps -> ISO, but the
+      per-cell pass only runs when pandas infers mixed/date content
+    - int/bool columns and columns with nothing missing are left untouched
+
+    A converted column is replaced by a new object column (datetime and float
+    columns are copied through astype(object)), so the cost is one copy per
+    converted column rather than one walk per payload. The DataFrame itself
+    is updated and returned, so callers can chain off pd.read_excel().
+    """
+    import pandas as pd
+    for col in df.columns:
+        series = df[col]
+        present = series.notna()
+        missing = not present.all()
+
+        if pd.api.types.is_datetime64_any_dtype(series):
+            values = series.astype(object).to_numpy()
+            mask = present.to_numpy()
+            values[~mask] = None
+            values[mask] = [ts.isoformat() for ts in series[present]]
+            df[col] = pd.Series(values, index=df.index, dtype=object)
+        elif pd.api.types.is_float_dtype(series):
+            if not missing:
+                continue
+            values = series.astype(object).to_numpy()
+            values[~present.to_numpy()] = None
+            kept = series[present]
+            if len(kept) and (kept % 1 == 0).all():
+                values[present.to_numpy()] = kept.astype('int64').tolist()
+            df[col] = pd.Series(values, index=df.index, dtype=object)
+        elif pd.api.types.is_object_dtype(series):
+            inferred = pd.api.types.infer_dtype(series, skipna=True)
+            if inferred in ('datetime', 'datetime64', 'date', 'mixed'):
+                df[col] = series.map(_iso_or_none)
+            elif missing:
+                df[col] = series.where(present, None)
+
+    return df
+
+
+def iter_sheet_rows(excel_file: str, sheet_names=None):
+    """Stream the data rows of a sheet without loading it into a DataFrame.
+
+    Uses a read-only openpyxl workbook, so only the current row is held in
+    memory regardless of sheet size. Values come out the way normalize_frame
+    leaves them: empty cells -> None, dates -> ISO strings.
+
+    Args:
+        excel_file: Path to the workbook
+        sheet_names: Sheet name, or list of names to try in order. Falls back
+            to the first sheet when none of them exist.
+
+    Yields:
+        (row_index, row) tuples. row_index is the 1-based data row (header is
+        row 0), the same numbering _write_status_to_excel expects. Fully blank
+        rows are skipped.
+    """
+    from openpyxl import load_workbook
+    if isinstance(sheet_names, str):
+        sheet_names = [sheet_names]
+
+    wb = load_workbook(excel_file, read_only=True, data_only=True)
+    try:
+        ws = None
+        for name in sheet_names or []:
+            if name in wb.sheetnames:
+                ws = wb[name]
+                break
+        if ws is None:
+            ws = wb.worksheets[0]
+
+        rows = ws.iter_rows(values_only=True)
+        header = next(rows, None)
+        if not header:
+            return
+        columns = [str(h).strip() if h is not None else None for h in header]
+
+        for row_index, values in enumerate(rows, 1):
+            row = {}
+            for col, value in zip(columns, values):
+                if col is None:
+                    continue
+                if isinstance(value, str) and not value.strip():
+                    value = None
+                row[col] = _iso_or_none(value)
+            if any(v is not None for v in row.values()):
+                yield row_index, row
+    finally:
+        wb.close()
+
+
+def run_pipeline(items, handle, workers: int = 4, queue_size: int = 100):
+    """Feed items from a generator to worker threads through a bounded queue.
+
+    The producer (the calling thread) pulls the next item only when there is
+    room in the queue, so parsing runs ahead of the upload by at most
+    queue_size items and memory stays flat however long the input is.
+
+    Args:
+        items: Iterable of work items, typically a lazy payload generator
+        handle: Callable run on a worker thread for each item. Returning False
+            stops the producer; items already queued are then skipped, not
+            handled (handles already running finish).
+        workers: Number of upload threads
+        queue_size: Maximum items parsed but not yet picked up
+
+    Returns:
+        Number of items passed to handle
+    """
+    import queue
+    import threading
+
+    work = queue.Queue(maxsize=max(1, queue_size))
+    stop = threading.Event()
+    done = object()
+    handled = [0]
+    count_lock = threading.Lock()
+
+    def worker():
+        while True:
+            item = work.get()
+            try:
+                if item is done:
+                    return
+                if stop.is_set():
+                    continue
+                with count_lock:
+                    handled[0] += 1
+                if handle(item) is False:
+                    stop.set()
+            except Exception as e:
+                print(f"   ❌ Worker error: {str(e)[:100]}")
+            finally:
+                work.task_done()
+
+    threads = [threading.Thread(target=worker, daemon=True) for _ in range(max(1, workers))]
+    for t in threads:
+        t.start()
+
+    try:
+        for item in items:
+            if stop.is_set():
+                break
+            work.put(item)
+    finally:
+        for _ in threads:
+            work.put(done)
+        for t in threads:
+            t.join()
+
+    return handled[0]
+
+
 # ============================================================================
 # EXCEL READER CLASS
 # ============================================================================
@@ -59,6 +259,16 @@ class UnifiedExcelReader:
     def __init__(self, excel_file: str):
         self.excel_file = excel_file
 
+    def _read_sheet(self, sheet_name):
+        """Read a sheet and normalise it (NaN -> None, dates -> ISO) before extraction"""
+        import pandas as pd
+        return normalize_frame(pd.read_excel(self.excel_file, sheet_name=sheet_name))
+
+    @staticmethod
+    def _records(df: 'pd.DataFrame') -> List[Dict]:
+        """Row dicts of a normalised sheet; keys are the column headers"""
+        return df.to_dict('records')
+
     # ========================================================================
     # TENANT MASTER READERS (PHASE 1)
     # ========================================================================
@@ -77,15 +287,16 @@ class UnifiedExcelReader:
         - Address
         - Tenant Website
         """
+        import pandas as pd
 
-        df = pd.read_excel(self.excel_file, sheet_name='Tenant Info')
+        df = self._read_sheet('Tenant Info')
 
         tenants = []
         localizations = []
         district_counter = {}  # For auto-generating district codes
         city_counter = {}   
 
-        for _, row in df.iterrows():
+        for row in self._records(df):
             
             # Skip empty rows
             if pd.isna(row.get('Tenant Display Name*')) or pd.isna(row.get('Tenant Code*\n(To be filled by ADMIN)')):
@@ -95,13 +306,13 @@ class UnifiedExcelReader:
             tenant_code_col = 'Tenant Code*\n(To be filled by ADMIN)'
             tenant_code = str(row[tenant_code_col]).strip().lower()
 
-            tenant_type = str(row.get('Tenant Type*', '')).strip()
-            logo_path = str(row.get('Logo File Path*', '')).strip()
+            tenant_type = str(row.get('Tenant Type*') or '').strip()
+            logo_path = str(row.get('Logo File Path*') or '').strip()
 
-            city_name = str(row.get('City Name', '')).strip()
-            district_name = str(row.get('District Name', '')).strip()
-            address = str(row.get('Address', '')).strip()
-            website = str(row.get('Tenant Website', '')).strip()
+            city_name = str(row.get('City Name') or '').strip()
+            district_name = str(row.get('District Name') or '').strip()
+            address = str(row.get('Address') or '').strip()
+            website = str(row.get('Tenant Website') or '').strip()
 
             latitude = float(row['Latitude']) if pd.notna(row.get('Latitude')) else 0.0
             longitude = float(row['Longitude']) if pd.notna(row.get('Longitude')) else 0.0
@@ -167,14 +378,15 @@ class UnifiedExcelReader:
         Returns:
             list: StateInfo records for MDMS upload (branding, languages, etc.)
         """
+        import pandas as pd
         try:
-            df = pd.read_excel(self.excel_file, sheet_name='Tenant Branding Details')
+            df = self._read_sheet('Tenant Branding Details')
         except Exception as e:
             print(f"⚠️ Could not read 'Tenant Branding Details' sheet: {str(e)}")
             return []
 
         branding_list = []
-        for _, row in df.iterrows():
+        for row in self._records(df):
             # Skip empty rows
             if pd.isna(row.get('Banner URL')) and pd.isna(row.get('Logo URL')):
                 continue
@@ -221,7 +433,8 @@ class UnifiedExcelReader:
         Returns:
             tuple: (departments_list, designations_list, dept_localization, desig_localization, dept_name_to_code_mapping)
         """
-        df = pd.read_excel(self.excel_file, sheet_name='Department And Desgination Mast')
+        import pandas as pd
+        df = self._read_sheet('Department And Desgination Mast')
 
         departments = []
         designations = []
@@ -298,7 +511,7 @@ class UnifiedExcelReader:
             dept_start_counter = 1
             desig_name_to_code = {}
 
-        for _, row in df.iterrows():
+        for row in self._records(df):
             dept_name = row.get('Department Name*')
             desig_name = row.get('Designation Name*')
 
@@ -422,8 +635,9 @@ class UnifiedExcelReader:
                    complaint_hierarchy_rows = interior CATEGORY nodes followed by leaf SUB_TYPE rows.
                    For the ComplaintHierarchyDefinition record, call complaint_hierarchy_definition().
         """
+        import pandas as pd
         hierarchy_type = hierarchy_type or self.COMPLAINT_HIERARCHY_TYPE
-        df = pd.read_excel(self.excel_file, sheet_name='Complaint Type Master')
+        df = self._read_sheet('Complaint Type Master')
 
         category_nodes = []   # interior nodes (RAINMAKER-PGR.ComplaintHierarchy, no department/slaHours)
         leaf_rows = []        # leaf complaint types (code == serviceCode verbatim)
@@ -435,7 +649,7 @@ class UnifiedExcelReader:
         if dept_name_to_code is None:
             dept_name_to_code = {}
 
-        for _, row in df.iterrows():
+        for row in self._records(df):
             # Check if this is a parent row (has Complaint Type* filled)
             if pd.notna(row.get('Complaint Type*')):
                 parent_type = str(row['Complaint Type*']).strip()
@@ -551,154 +765,194 @@ class UnifiedExcelReader:
         if uploader is None:
             raise ValueError("uploader parameter is required. Pass an authenticated APIUploader instance.")
 
-        df = pd.read_excel(self.excel_file, sheet_name='Employee Master')
+        df = self._read_sheet('Employee Master')
+        lookups = self._employee_lookups(tenant_id, uploader)
+
+        employees = []
+        for idx, row in enumerate(self._records(df)):
+            emp = self._employee_from_row(row, idx, tenant_id, lookups)
+            if emp is not None:
+                employees.append(emp)
+
+        return employees
+
+    def iter_employees(self, tenant_id: str, uploader=None):
+        """Streaming counterpart of read_employees_bulk
+
+        Reads the Employee Master sheet row by row from a read-only workbook
+        and builds each HRMS payload only when the consumer asks for it.
+
+        Args:
+            tenant_id: Target tenant ID (e.g., 'pg.citya')
+            uploader: Authenticated APIUploader instance (required)
+
+        Yields:
+            (row_index, employee) tuples; row_index is the 1-based data row
+        """
+        if uploader is None:
+            raise ValueError("uploader parameter is required. Pass an authenticated APIUploader instance.")
+
+        lookups = self._employee_lookups(tenant_id, uploader)
 
+        for row_index, row in iter_sheet_rows(self.excel_file, 'Employee Master'):
+            emp = self._employee_from_row(row, row_index - 1, tenant_id, lookups)
+            if emp is not None:
+                yield row_index, emp
+
+    @staticmethod
+    def _employee_lookups(tenant_id: str, uploader) -> Dict:
+        """Department/designation/role name->code maps used by the employee readers"""
         # Fetch departments and create name->code mapping
         departments = uploader.fetch_departments(tenant_id)
-        dept_name_to_code = {d.get('name'): d.get('code') for d in departments}
-
         # Fetch designations and create name->code mapping
         designations = uploader.fetch_designations(tenant_id)
-        desig_name_to_code = {d.get('name'): d.get('code') for d in designations}
-
         # Fetch roles and create name->code mapping
         roles_list = uploader.fetch_roles(tenant_id)
-        role_name_to_code = {r.get('name'): r.get('code') for r in roles_list}
-
-        employees = []
-        for idx, row in df.iterrows():
-            # Skip empty rows
-            if pd.isna(row.get('User Name*')):
-                continue
-
-            user_name = str(row['User Name*']).strip()
 
-            # Auto-generate employee code from user name
-            # Remove special characters, convert to uppercase, replace spaces with underscore
-            emp_code = ''.join(c if c.isalnum() or c.isspace() else '' for c in user_name)
-            emp_code = emp_code.upper().replace(' ', '_')
-            # If code is too long, truncate and add index
-            if len(emp_code) > 20:
-                emp_code = emp_code[:17] + f"_{idx}"
+        return {
+            'departments': {d.get('name'): d.get('code') for d in departments},
+            'designations': {d.get('name'): d.get('code') for d in designations},
+            'roles': {r.get('name'): r.get('code') for r in roles_list},
+        }
 
-            mobile = str(row['Mobile Number*']).strip()
+    @staticmethod
+    def _excel_date_to_timestamp(excel_date):
+        """Convert Excel date to timestamp in milliseconds"""
+        import pandas as pd
+        if pd.isna(excel_date):
+            return None
+        # If already a timestamp (number > 1000000000000), return as-is
+        if isinstance(excel_date, (int, float)) and excel_date > 1000000000000:
+            return int(excel_date)
+        # If it's a pandas datetime, convert to timestamp
+        if isinstance(excel_date, pd.Timestamp):
+            return int(excel_date.timestamp() * 1000)
+        # If it's a string date, parse it
+        if isinstance(excel_date, str):
+            dt = pd.to_datetime(excel_date)
+            return int(dt.timestamp() * 1000)
+        # Default: assume it's Excel serial date
+        try:
+            dt = pd.to_datetime(excel_date, unit='D', origin='1899-12-30')
+            return int(dt.timestamp() * 1000)
+        except:
+            return int(excel_date)
 
-            # Get password (optional, defaults to eGov@123)
-            password = str(row.get('Password', 'eGov@123')).strip() if pd.notna(row.get('Password')) else 'eGov@123'
+    def _employee_from_row(self, row: Dict, idx: int, tenant_id: str, lookups: Dict):
+        """Build one HRMS employee object from a sheet row (None for empty rows)"""
+        import pandas as pd
+        dept_name_to_code = lookups['departments']
+        desig_name_to_code = lookups['designations']
+        role_name_to_code = lookups['roles']
 
-            # Convert Excel dates to timestamps (milliseconds)
-            def excel_date_to_timestamp(excel_date):
-                """Convert Excel date to timestamp in milliseconds"""
-                if pd.isna(excel_date):
-                    return None
-                # If already a timestamp (number > 1000000000000), return as-is
-                if isinstance(excel_date, (int, float)) and excel_date > 1000000000000:
-                    return int(excel_date)
-                # If it's a pandas datetime, convert to timestamp
-                if isinstance(excel_date, pd.Timestamp):
-                    return int(excel_date.timestamp() * 1000)
-                # If it's a string date, parse it
-                if isinstance(excel_date, str):
-                    from datetime import datetime
-                    dt = pd.to_datetime(excel_date)
-                    return int(dt.timestamp() * 1000)
-                # Default: assume it's Excel serial date
-                try:
-                    dt = pd.to_datetime(excel_date, unit='D', origin='1899-12-30')
-                    return int(dt.timestamp() * 1000)
-                except:
-                    return int(excel_date)
-
-            # Parse dates from Excel
-            from_date = excel_date_to_timestamp(row.get('Assignment From Date*'))
-            if not from_date:
-                from_date = 1725494400000  # Default
-
-            appointment_date = excel_date_to_timestamp(row.get('Date of Appointment*'))
-            if not appointment_date:
-                appointment_date = 1718841600000  # Default
-
-            # Convert department NAME to CODE
-            dept_name = str(row.get('Department Name*', '')).strip()
-            department = dept_name_to_code.get(dept_name, dept_name)  # Fallback to name if not found
-
-            # Convert designation NAME to CODE
-            desig_name = str(row.get('Designation Name*', '')).strip()
-            designation = desig_name_to_code.get(desig_name, desig_name)  # Fallback to name if not found
-
-            # Parse role NAMES and convert to CODES
-            role_names_str = str(row.get('Role Names (comma separated)*', '')).strip()
-            role_names = [r.strip() for r in role_names_str.split(',') if r.strip()]
-            role_codes = [role_name_to_code.get(name, name) for name in role_names]  # Convert names to codes
-
-            # Build roles list for both user and jurisdiction
-            roles = []
-            for i, role_code in enumerate(role_codes):
-                # Get the original role name for this code
-                role_name = role_names[i] if i < len(role_names) else role_code
-
-                roles.append({
-                    'code': role_code,
-                    'name': role_name,
-                    'tenantId': tenant_id
-                })
+        # Skip empty rows
+        if pd.isna(row.get('User Name*')):
+            return None
 
-            # Get boundary info (defaults to City level)
-            hierarchy = str(row.get('Hierarchy Type', 'ADMIN')).strip()
-            boundary_type = str(row.get('Boundary Type', 'City')).strip()
-            boundary = str(row.get('Boundary Code', tenant_id.split('.')[0])).strip()
+        user_name = str(row['User Name*']).strip()
+
+        # Auto-generate employee code from user name
+        # Remove special characters, convert to uppercase, replace spaces with underscore
+        emp_code = ''.join(c if c.isalnum() or c.isspace() else '' for c in user_name)
+        emp_code = emp_code.upper().replace(' ', '_')
+        # If code is too long, truncate and add index
+        if len(emp_code) > 20:
+            emp_code = emp_code[:17] + f"_{idx}"
+
+        mobile = str(row['Mobile Number*']).strip()
+
+        # Get password (optional, defaults to eGov@123)
+        password = str(row.get('Password', 'eGov@123')).strip() if pd.notna(row.get('Password')) else 'eGov@123'
+
+        # Parse dates from Excel (timestamps in milliseconds)
+        from_date = self._excel_date_to_timestamp(row.get('Assignment From Date*'))
+        if not from_date:
+            from_date = 1725494400000  # Default
+
+        appointment_date = self._excel_date_to_timestamp(row.get('Date of Appointment*'))
+        if not appointment_date:
+            appointment_date = 1718841600000  # Default
+
+        # Convert department NAME to CODE
+        dept_name = str(row.get('Department Name*') or '').strip()
+        department = dept_name_to_code.get(dept_name, dept_name)  # Fallback to name if not found
+
+        # Convert designation NAME to CODE
+        desig_name = str(row.get('Designation Name*') or '').strip()
+        designation = desig_name_to_code.get(desig_name, desig_name)  # Fallback to name if not found
+
+        # Parse role NAMES and convert to CODES
+        role_names_str = str(row.get('Role Names (comma separated)*') or '').strip()
+        role_names = [r.strip() for r in role_names_str.split(',') if r.strip()]
+        role_codes = [role_name_to_code.get(name, name) for name in role_names]  # Convert names to codes
+
+        # Build roles list for both user and jurisdiction
+        roles = []
+        for i, role_code in enumerate(role_codes):
+            # Get the original role name for this code
+            role_name = role_names[i] if i < len(role_names) else role_code
+
+            roles.append({
+                'code': role_code,
+                'name': role_name,
+                'tenantId': tenant_id
+            })
 
-            # Build employee object
-            emp = {
+        # Get boundary info (defaults to City level)
+        hierarchy = str(row.get('Hierarchy Type') or 'ADMIN').strip()
+        boundary_type = str(row.get('Boundary Type') or 'City').strip()
+        boundary = str(row.get('Boundary Code') or tenant_id.split('.')[0]).strip()
+
+        # Build employee object
+        emp = {
+            'tenantId': tenant_id,
+            'code': emp_code,
+            'employeeStatus': str(row.get('Employee Status') or 'EMPLOYED').strip(),
+            'employeeType': str(row.get('Employee Type') or 'PERMANENT').strip(),
+            'dateOfAppointment': appointment_date,
+            'assignments': [{
+                'fromDate': from_date,
+                'isCurrentAssignment': True,
+                'department': department,
+                'designation': designation
+            }],
+            'jurisdictions': [{
+                'hierarchy': hierarchy,
+                'boundaryType': boundary_type,
+                'boundary': boundary,
                 'tenantId': tenant_id,
-                'code': emp_code,
-                'employeeStatus': str(row.get('Employee Status', 'EMPLOYED')).strip(),
-                'employeeType': str(row.get('Employee Type', 'PERMANENT')).strip(),
-                'dateOfAppointment': appointment_date,
-                'assignments': [{
-                    'fromDate': from_date,
-                    'isCurrentAssignment': True,
-                    'department': department,
-                    'designation': designation
-                }],
-                'jurisdictions': [{
-                    'hierarchy': hierarchy,
-                    'boundaryType': boundary_type,
-                    'boundary': boundary,
-                    'tenantId': tenant_id,
-                    'roles': roles  # Same roles assigned to jurisdiction
-                }],
-                'user': {
-                    'name': user_name,
-                    'mobileNumber': mobile,
-                    'active': True,
-                    'type': 'EMPLOYEE',
-                    'tenantId': tenant_id,
-                    'roles': roles,  # Same roles assigned to user
-                    'password': password,  # Use password from Excel or default
-                    'otpReference': '12345'
-                },
-                'serviceHistory': [],
-                'education': [],
-                'tests': []
-            }
-
-            # Add optional gender if provided
-            if pd.notna(row.get('Gender')):
-                emp['user']['gender'] = str(row['Gender']).strip()
+                'roles': roles  # Same roles assigned to jurisdiction
+            }],
+            'user': {
+                'name': user_name,
+                'mobileNumber': mobile,
+                'active': True,
+                'type': 'EMPLOYEE',
+                'tenantId': tenant_id,
+                'roles': roles,  # Same roles assigned to user
+                'password': password,  # Use password from Excel or default
+                'otpReference': '12345'
+            },
+            'serviceHistory': [],
+            'education': [],
+            'tests': []
+        }
 
-            employees.append(emp)
+        # Add optional gender if provided
+        if pd.notna(row.get('Gender')):
+            emp['user']['gender'] = str(row['Gender']).strip()
 
-        return employees
+        return emp
 
     def read_localization(self):
         """Read localization with auto-determination of module and locale based on code pattern"""
+        import pandas as pd
         try:
-            df = pd.read_excel(self.excel_file, sheet_name='Localization')
+            df = self._read_sheet('Localization')
         except:
             # Try lowercase sheet name
             try:
-                df = pd.read_excel(self.excel_file, sheet_name='localization')
+                df = self._read_sheet('localization')
             except:
                 return []
 
@@ -707,7 +961,7 @@ class UnifiedExcelReader:
 
         localizations = []
 
-        for _, row in df.iterrows():
+        for row in self._records(df):
             # Skip rows with missing required fields
             if pd.notna(row.get('Code')) and pd.notna(row.get('Message')):
                 code = str(row['Code']).strip()
@@ -761,7 +1015,8 @@ class APIUploader:
     - Localization Service: :8087 (localization/translations)
     """
 
-    def __init__(self, base_url=None, username=None, password=None, user_type=None, tenant_id=None):
+    def __init__(self, base_url=None, username=None, password=None, user_type=None, tenant_id=None,
+                 token_cache=None, filestore_cache=None, service_cache=None):
         """Initialize APIUploader with gateway authentication
 
         Args:
@@ -770,6 +1025,13 @@ class APIUploader:
             password: Password for OAuth
             user_type: EMPLOYEE or CITIZEN (default: EMPLOYEE)
             tenant_id: Tenant ID (e.g., dev, pg)
+            token_cache: TokenCache to reuse logins from (default: the one at
+                $DATALOADER_TOKEN_CACHE); False to always log in
+            filestore_cache: FilestoreCache to reuse uploads from (default: the
+                one at $DATALOADER_FILESTORE_CACHE); False to always upload
+            service_cache: ServicePathCache to reuse auto-detected service
+                paths from (default: the one at $DATALOADER_SERVICE_CACHE);
+                False to always probe
         """
         # Base gateway URL - same for all services (must be provided)
         if not base_url:
@@ -779,30 +1041,30 @@ class APIUploader:
         if self.base_url.endswith('/'):
             self.base_url = self.base_url[:-1]
 
-        # Service endpoints from .env (configurable)
-        # MDMS path - default to /mdms-v2
-        mdms_v2_service = os.getenv("MDMS_V2_SERVICE", "/mdms-v2")
-        boundary_service = os.getenv("BOUNDARY_SERVICE", "/boundary-service")
-        boundary_mgmt_service = os.getenv("BOUNDARY_MGMT_SERVICE", "/egov-bndry-mgmnt")
-        localization_service = os.getenv("LOCALIZATION_SERVICE", "/localization")
-        workflow_service = os.getenv("WORKFLOW_SERVICE", "/egov-workflow-v2")
-        filestore_service = os.getenv("FILESTORE_SERVICE", "/filestore")
-        hrms_service = os.getenv("HRMS_SERVICE", "/egov-hrms")
+        # Per-service request counts/latencies (see http_metrics.py)
+        self.metrics = HttpMetrics()
+
+        # Per-service fail-fast once a backend stops answering (see circuit_breaker.py)
+        self.breakers = CircuitBreakers()
+
+        # Service endpoints from .env (configurable); a service set to an empty
+        # value is auto-detected, concurrently and cached per gateway (see
+        # service_discovery.py). Probes go through _send_once, so they show up
+        # in the metrics and count towards the breakers.
+        self.service_cache = (default_service_cache() if service_cache is None
+                              else (service_cache or None))
+        paths = discover_service_paths(self.base_url, self.service_cache, send=self._send_once)
         data_handler_service = os.getenv("DATA_HANDLER_SERVICE", "/default-data-handler")
         auth_service = os.getenv("AUTH_SERVICE", "/user")
 
         # Build full service URLs
-        # Auto-detect MDMS path if not explicitly set
-        if mdms_v2_service:
-            self.mdms_url = f"{self.base_url}{mdms_v2_service}"
-        else:
-            self.mdms_url = self._detect_mdms_path()
-        self.boundary_url = f"{self.base_url}{boundary_service}"
-        self.boundary_mgmt_url = f"{self.base_url}{boundary_mgmt_service}"
-        self.localization_url = f"{self.base_url}{localization_service}"
-        self.workflow_url = f"{self.base_url}{workflow_service}"
-        self.filestore_url = f"{self.base_url}{filestore_service}"
-        self.hrms_url = f"{self.base_url}{hrms_service}"
+        self.mdms_url = f"{self.base_url}{paths['mdms']}"
+        self.boundary_url = f"{self.base_url}{paths['boundary']}"
+        self.boundary_mgmt_url = f"{self.base_url}{paths['boundary_mgmt']}"
+        self.localization_url = f"{self.base_url}{paths['localization']}"
+        self.workflow_url = f"{self.base_url}{paths['workflow']}"
+        self.filestore_url = f"{self.base_url}{paths['filestore']}"
+        self.hrms_url = f"{self.base_url}{paths['hrms']}"
         self.Datahandlerurl = f"{self.base_url}{data_handler_service}"
         self.auth_url = f"{self.base_url}{auth_service}"
 
@@ -816,55 +1078,40 @@ class APIUploader:
         self.auth_token = None
         self.user_info = None
         self.authenticated = False
+        self.token_cache = default_token_cache() if token_cache is None else (token_cache or None)
+        self.filestore_cache = (default_filestore_cache() if filestore_cache is None
+                                else (filestore_cache or None))
+
+        # Latest token, shared with shallow copies (CRSLoader.fork) so a 401
+        # re-authenticates once for all of them (see _reauthenticate)
+        import threading
+        self._auth_shared = {"lock": threading.Lock(), "token": None, "user_info": None, "failed": None}
+        # Boundary trees, also shared with the copies (see boundary_index)
+        self.boundary_indexes = BoundaryIndexes()
+
+        # Per-record outcomes go through here (see progress.py); prints by default
+        self.progress = Progress()
 
         # Auto-authenticate if credentials provided
         if self.username and self.password:
             self.authenticate()
 
-    def _detect_mdms_path(self):
-        """Auto-detect the MDMS v2 service path by testing available endpoints.
-
-        Different environments use different paths:
-        - /mdms-v2 (chakshu-digit, newer deployments)
-        - /egov-mdms-service (unified-dev, older deployments)
+    def authenticate(self, use_cache: bool = True):
+        """Authenticate using OAuth2 password grant and fetch user info
 
-        Returns:
-            str: The working MDMS URL (base_url + path)
+        Args:
+            use_cache: Reuse an unexpired token from self.token_cache instead
+                of logging in (a fresh token is always written back)
         """
-        # Paths to try, in order of preference
-        paths_to_try = ["/mdms-v2", "/egov-mdms-service"]
-
-        for path in paths_to_try:
-            test_url = f"{self.base_url}{path}/v2/_search"
-            try:
-                # Simple probe request - doesn't need auth for search on some envs
-                response = requests.post(
-                    test_url,
-                    json={
-                        "MdmsCriteria": {"tenantId": "default", "limit": 1},
-                        "RequestInfo": {"apiId": "Rainmaker"}
-                    },
-                    headers={"Content-Type": "application/json"},
-                    timeout=5
-                )
-
-                # If not 404, this path exists (even if auth required, we get 401/403 not 404)
-                if response.status_code != 404:
-                    print(f"   MDMS path auto-detected: {path} (status: {response.status_code})")
-                    return f"{self.base_url}{path}"
-                else:
-                    print(f"   MDMS path {path}: 404, trying next...")
-
-            except requests.exceptions.RequestException as e:
-                print(f"   MDMS path {path}: error {e}, trying next...")
-                continue
-
-        # Default fallback
-        print(f"   MDMS path: using default /mdms-v2 (no path responded)")
-        return f"{self.base_url}/mdms-v2"
+        cache_key = (self.base_url, self.username, self.tenant_id, self.user_type)
+        if use_cache and self.token_cache is not None:
+            cached = self.token_cache.load(*cache_key, self.password)
+            if cached:
+                self._set_token(cached["access_token"], cached.get("user_info") or {})
+                hours = (cached["expires_at"] - time.time()) / 3600
+                print(f"✅ Using cached token for {self.username} (expires in {hours:.1f}h)")
+                return True
 
-    def authenticate(self):
-        """Authenticate using OAuth2 password grant and fetch user info"""
         try:
             # OAuth2 token endpoint
             token_url = f"{self.auth_url}/oauth/token"
@@ -895,14 +1142,13 @@ class APIUploader:
             if response.status_code == 200:
                 token_data = response.json()
 
-                # Extract access_token as authToken
-                self.auth_token = token_data.get('access_token')
-
-                # Extract UserRequest as userInfo
-                self.user_info = token_data.get('UserRequest', {})
+                # access_token is the authToken, UserRequest the userInfo
+                self._set_token(token_data.get('access_token'), token_data.get('UserRequest', {}))
 
                 if self.auth_token and self.user_info:
-                    self.authenticated = True
+                    if self.token_cache is not None:
+                        self.token_cache.save(*cache_key, self.password, self.auth_token, self.user_info,
+                                              token_data.get('expires_in'))
                     print(f"✅ Authentication successful!")
                     print(f"   User: {self.user_info.get('userName', 'Unknown')}")
                     print(f"   Name: {self.user_info.get('name', 'Unknown')}")
@@ -922,9 +1168,118 @@ class APIUploader:
             print(f"❌ Authentication error: {str(e)}")
             return False
 
+    def _set_token(self, token: str, user_info: dict):
+        self.auth_token = token
+        self.user_info = user_info
+        self.authenticated = bool(token and user_info)
+        if self._auth_shared is not None and self.authenticated:
+            self._auth_shared.update(token=token, user_info=user_info, failed=None)
+
+    def _reauthenticate(self, stale_token: str) -> bool:
+        """Replace a token the gateway rejected; True if there is a new one
+
+        Single-flight: when many requests (threads, forks) hit a 401 with the
+        same token, the first logs in again and the rest take its token.
+        """
+        shared = self._auth_shared
+        if shared is None or not self.password:
+            return False
+        with shared["lock"]:
+            if shared["token"] and shared["token"] != stale_token:
+                self.auth_token, self.user_info = shared["token"], shared["user_info"]
+                self.authenticated = True
+                return True
+            if shared["failed"] == stale_token:
+                return False
+            print(f"🔑 Token rejected (401), logging in again as {self.username}...")
+            if self.token_cache is not None:
+                self.token_cache.discard(self.base_url, self.username, self.tenant_id, self.user_type)
+            if self.authenticate(use_cache=False):
+                return True
+            shared["failed"] = stale_token
+            return False
+
     # Default timeout for API requests (seconds)
     REQUEST_TIMEOUT = 30
 
+    # Replaced per instance in __init__; None when built without it (tests)
+    metrics = None
+    progress = None
+    breakers = None
+
+    # Set by the multi-tenant orchestrator (see multi_tenant.py): a per-service
+    # concurrency budget shared by every tenant's uploader, and a shared cache
+    # of root-level reference MDMS (roles, HRMS enums)
+    limiter = None
+    reference_cache = None
+
+    token_cache = None
+    filestore_cache = None
+    service_cache = None
+    _auth_shared = None
+
+    # BoundaryIndexes: (tenant, hierarchyType) -> BoundaryIndex, filled by boundary_index()
+    boundary_indexes = None
+
+    def _send(self, method: str, url: str, **kwargs):
+        """Single HTTP request, recorded in self.metrics
+
+        A 401 for a request carrying RequestInfo.authToken re-authenticates
+        (once across threads) and resends it with the new token.
+
+        Args:
+            method: 'get' or 'post'
+            url: Request URL
+            **kwargs: Forwarded to requests.request()
+
+        Returns:
+            requests.Response object
+        """
+        resp = self._send_once(method, url, **kwargs)
+        if resp.status_code == 401:
+            payload = kwargs.get('json')
+            request_info = payload.get('RequestInfo') if isinstance(payload, dict) else None
+            stale = request_info.get('authToken') if isinstance(request_info, dict) else None
+            if stale and self._reauthenticate(stale):
+                kwargs['json'] = dict(payload, RequestInfo=dict(request_info, authToken=self.auth_token))
+                resp = self._send_once(method, url, **kwargs)
+        return resp
+
+    def _send_once(self, method: str, url: str, **kwargs):
+        """_send() without the 401 handling
+
+        Raises ServiceUnavailable without sending when the service's circuit
+        is open (see circuit_breaker.py).
+        """
+        breaker = self.breakers.for_url(url) if self.breakers is not None else None
+        if breaker is not None:
+            admit(breaker)
+        slot = self.limiter.slot(url) if self.limiter is not None else contextlib.nullcontext()
+        with slot:
+            start = time.perf_counter()
+            try:
+                resp = requests.request(method, url, **kwargs)
+            except requests.exceptions.RequestException as e:
+                if self.metrics is not None:
+                    self.metrics.observe(url, type(e).__name__, time.perf_counter() - start)
+                if breaker is not None:
+                    transport = isinstance(e, (requests.exceptions.Timeout, requests.exceptions.ConnectionError))
+                    report(breaker, FAILURE if transport else None)
+                raise
+            except BaseException:
+                if breaker is not None:
+                    report(breaker)
+                raise
+        if self.metrics is not None:
+            self.metrics.observe_response(url, resp, time.perf_counter() - start)
+        if breaker is not None:
+            report(breaker, FAILURE if resp.status_code in UNAVAILABLE_STATUSES else SUCCESS)
+        return resp
+
+    def _post(self, url: str, **kwargs):
+        """requests.post() recorded in self.metrics (no retries)"""
+        return self._send("post", url, **kwargs)
+
     def _request_with_retry(self, url, *, json=None, data=None, headers=None,
                             params=None, timeout=None, max_retries=3, **kwargs):
         """POST request with timeout and retry on 429/503.
@@ -941,43 +1296,79 @@ class APIUploader:
 
         Returns:
             requests.Response object
+
+        Raises:
+            ServiceUnavailable: The service's circuit is open; not retried
+
+        All attempts count as one request for the service's circuit breaker
+        (see circuit_breaker.retried_request).
         """
         if timeout is None:
             timeout = self.REQUEST_TIMEOUT
 
-        last_exc = None
-        for attempt in range(max_retries):
-            try:
-                resp = requests.post(
-                    url, json=json, data=data, headers=headers,
-                    params=params, timeout=timeout, **kwargs
-                )
-                if resp.status_code in (429, 503) and attempt < max_retries - 1:
-                    retry_after = resp.headers.get("Retry-After")
-                    wait = float(retry_after) if retry_after else (2 ** attempt)
-                    print(f"   ⏳ {resp.status_code} on {url.split('/')[-1]} — retrying in {wait:.0f}s (attempt {attempt + 1}/{max_retries})")
-                    time.sleep(wait)
-                    continue
-                return resp
-            except requests.exceptions.Timeout as e:
-                last_exc = e
-                if attempt < max_retries - 1:
-                    wait = 2 ** attempt
-                    print(f"   ⏳ Timeout on {url.split('/')[-1]} — retrying in {wait}s (attempt {attempt + 1}/{max_retries})")
-                    time.sleep(wait)
-                    continue
-                raise
-            except requests.exceptions.ConnectionError as e:
-                last_exc = e
-                if attempt < max_retries - 1:
-                    wait = 2 ** attempt
-                    print(f"   ⏳ Connection error on {url.split('/')[-1]} — retrying in {wait}s (attempt {attempt + 1}/{max_retries})")
-                    time.sleep(wait)
-                    continue
-                raise
-        # Should not reach here, but just in case
-        if last_exc:
-            raise last_exc
+        with retried_request():
+            last_exc = None
+            for attempt in range(max_retries):
+                if attempt and hasattr(data, 'seek'):
+                    # A streamed body (MultipartFile) was consumed by the last attempt
+                    data.seek(0)
+                try:
+                    resp = self._post(
+                        url, json=json, data=data, headers=headers,
+                        params=params, timeout=timeout, **kwargs
+                    )
+                    if resp.status_code in (429, 503) and attempt < max_retries - 1:
+                        retry_after = resp.headers.get("Retry-After")
+                        wait = float(retry_after) if retry_after else (2 ** attempt)
+                        self._record_retry(url, wait)
+                        print(f"   ⏳ {resp.status_code} on {url.split('/')[-1]} — retrying in {wait:.0f}s (attempt {attempt + 1}/{max_retries})")
+                        time.sleep(wait)
+                        continue
+                    return resp
+                except requests.exceptions.Timeout as e:
+                    last_exc = e
+                    if attempt < max_retries - 1:
+                        wait = 2 ** attempt
+                        self._record_retry(url, wait)
+                        print(f"   ⏳ Timeout on {url.split('/')[-1]} — retrying in {wait}s (attempt {attempt + 1}/{max_retries})")
+                        time.sleep(wait)
+                        continue
+                    raise
+                except requests.exceptions.ConnectionError as e:
+                    last_exc = e
+                    if attempt < max_retries - 1:
+                        wait = 2 ** attempt
+                        self._record_retry(url, wait)
+                        print(f"   ⏳ Connection error on {url.split('/')[-1]} — retrying in {wait}s (attempt {attempt + 1}/{max_retries})")
+                        time.sleep(wait)
+                        continue
+                    raise
+            # Should not reach here, but just in case
+            if last_exc:
+                raise last_exc
+
+    def _record_retry(self, url: str, wait: float):
+        if self.metrics is not None:
+            self.metrics.observe_retry(url, wait)
+
+    def _task(self, name: str, total: int = None):
+        """Start a progress task (one sheet/schema/batch of records)"""
+        if self.progress is not None:
+            self.progress.task(name, total)
+
+    def _row(self, status: str, id=None, message: str = None, error: str = None, advance: bool = True):
+        """Report one record's outcome; prints the message when there is no progress"""
+        if self.progress is not None:
+            self.progress.row(status, id=id, message=message, error=error, advance=advance)
+        elif message:
+            print(message)
+
+    def _batch(self, size: int, status: str, message: str = None, error: str = None):
+        """Report a batch of records sent in one call; prints when there is no progress"""
+        if self.progress is not None:
+            self.progress.batch(size, status, message=message, error=error)
+        elif message:
+            print(message)
 
     def _extract_error_message(self, error_text: str) -> str:
         """Extract clean error message from API error response
@@ -1036,7 +1427,22 @@ class APIUploader:
 
         Returns:
             list: List of data objects retrieved (with 'isActive' field added from wrapper)
+
+        Schemas covered by reference_cache live at the state root, so they are
+        searched on the root tenant and every city under it shares the entry.
         """
+        cache = self.reference_cache
+        if cache is not None and cache.covers(schema_code):
+            root = tenant.split('.')[0]
+            key = (schema_code, root, tuple(unique_identifiers or ()), limit, offset, include_inactive)
+            return cache.get(key, lambda: self._search_mdms_data(
+                schema_code, root, unique_identifiers, limit, offset, include_inactive))
+        return self._search_mdms_data(schema_code, tenant, unique_identifiers, limit, offset,
+                                      include_inactive)
+
+    def _search_mdms_data(self, schema_code: str, tenant: str, unique_identifiers: List[str] = None,
+                          limit: int = 100, offset: int = 0, include_inactive: bool = True) -> List[Dict]:
+        """search_mdms_data() without the reference cache"""
         url = f"{self.mdms_url}/v2/_search"
 
         # Override userInfo tenantId to match the request tenant
@@ -1153,6 +1559,7 @@ class APIUploader:
 
             # Track row-by-row status for Excel update
             row_statuses = []
+            self._task(schema_code, len(data_list))
 
             for i, data_obj in enumerate(data_list, 1):
                 unique_id = (
@@ -1169,7 +1576,8 @@ class APIUploader:
                     )
                     if existing:
                         if existing[0].get('_isActive', True):
-                            print(f"   [EXISTS] [{i}/{len(data_list)}] {unique_id} (pre-check)")
+                            self._row("EXISTS", unique_id,
+                                      f"   [EXISTS] [{i}/{len(data_list)}] {unique_id} (pre-check)")
                             results['exists'] += 1
                             row_statuses.append({
                                 'row_index': i, 'status': 'EXISTS',
@@ -1179,7 +1587,8 @@ class APIUploader:
                         else:
                             # Inactive record — reactivate via _update
                             self._reactivate_mdms_record(existing[0], schema_code, tenant)
-                            print(f"   [REACTIVATED] [{i}/{len(data_list)}] {unique_id}")
+                            self._row("SUCCESS", unique_id,
+                                      f"   [REACTIVATED] [{i}/{len(data_list)}] {unique_id}")
                             results['created'] += 1
                             row_statuses.append({
                                 'row_index': i, 'status': 'SUCCESS',
@@ -1222,11 +1631,12 @@ class APIUploader:
                     resp_data = response.json() if response.text.strip() else {}
                     mdms_arr = resp_data.get('mdms', [])
                     if not mdms_arr and response.text.strip():
-                        print(f"   [EXISTS] [{i}/{len(data_list)}] {unique_id} (phantom 200)")
+                        self._row("EXISTS", unique_id,
+                                  f"   [EXISTS] [{i}/{len(data_list)}] {unique_id} (phantom 200)")
                         results['exists'] += 1
                         status = "EXISTS"
                     else:
-                        print(f"   [OK] [{i}/{len(data_list)}] {unique_id}")
+                        self._row("SUCCESS", unique_id, f"   [OK] [{i}/{len(data_list)}] {unique_id}")
                         results['created'] += 1
 
                 except requests.exceptions.HTTPError as e:
@@ -1247,12 +1657,14 @@ class APIUploader:
                         return results
 
                     if 'already exists' in error_text.lower() or 'duplicate' in error_text.lower():
-                        print(f"   [EXISTS] [{i}/{len(data_list)}] {unique_id} (HTTP {status_code})")
+                        self._row("EXISTS", unique_id,
+                                  f"   [EXISTS] [{i}/{len(data_list)}] {unique_id} (HTTP {status_code})")
                         results['exists'] += 1
                         status = "EXISTS"
                     else:
-                        print(f"   [FAILED] [{i}/{len(data_list)}] {unique_id} (HTTP {status_code})")
-                        print(f"   ERROR: {error_message}")
+                        self._row("FAILED", unique_id,
+                                  f"   [FAILED] [{i}/{len(data_list)}] {unique_id} (HTTP {status_code})\n"
+                                  f"   ERROR: {error_message}", error=error_message)
                         results['failed'] += 1
                         results['errors'].append({'id': unique_id, 'error': error_message})
                         status = "FAILED"
@@ -1261,7 +1673,9 @@ class APIUploader:
                     error_message = str(e)[:200]
                     status_code = 0
                     status = "FAILED"
-                    print(f"   [ERROR] [{i}/{len(data_list)}] {unique_id} - {error_message[:100]}")
+                    self._row("FAILED", unique_id,
+                              f"   [ERROR] [{i}/{len(data_list)}] {unique_id} - {error_message[:100]}",
+                              error=error_message)
                     results['failed'] += 1
                     results['errors'].append({'id': unique_id, 'error': error_message})
 
@@ -1275,6 +1689,9 @@ class APIUploader:
 
                 time.sleep(0.1)
 
+            if self.reference_cache is not None and results['created']:
+                self.reference_cache.invalidate(schema_code)
+
             # Summary
             print("="*60)
             print(f"[SUMMARY] Created: {results['created']}")
@@ -1293,6 +1710,172 @@ class APIUploader:
 
             return results
 
+    def copy_mdms_data(self, schema_code: str, records: List[Dict], tenant: str,
+                       workers: int = 8) -> Dict:
+        """Create MDMS records concurrently, skipping those the tenant already has
+
+        For bulk copies between tenants (root bootstrap) rather than Excel
+        uploads: one paginated search of the target replaces create_mdms_data's
+        per-record pre-check, the remaining creates run on a worker pool, and
+        no status is written back. Records straight from search_mdms_data()
+        keep their uniqueIdentifier; the _-prefixed wrapper fields are dropped.
+
+        Args:
+            schema_code: MDMS schema code
+            records: Data objects to create
+            tenant: Target tenant ID
+            workers: Concurrent create requests
+
+        Returns:
+            dict: {created, exists, failed, errors}
+        """
+        import threading
+
+        url = f"{self.mdms_url}/v2/_create/{schema_code}"
+        results = {'created': 0, 'exists': 0, 'failed': 0, 'errors': []}
+        lock = threading.Lock()
+
+        existing = {r.get('_uniqueIdentifier'): r for r in self.search_mdms_data_all(schema_code, tenant)}
+        self._task(schema_code, len(records))
+
+        todo = []
+        for i, record in enumerate(records, 1):
+            unique_id = (record.get('_uniqueIdentifier') or record.get('code') or
+                         record.get('serviceCode') or record.get('userName') or str(i))
+            current = existing.get(unique_id)
+            if current is None:
+                todo.append((unique_id, {k: v for k, v in record.items() if not k.startswith('_')}))
+            elif current.get('_isActive', True):
+                results['exists'] += 1
+                self._row("EXISTS", unique_id, f"   [EXISTS] {unique_id}")
+            else:
+                self._reactivate_mdms_record(current, schema_code, tenant)
+                results['created'] += 1
+                self._row("SUCCESS", unique_id, f"   [REACTIVATED] {unique_id}")
+
+        def create(item):
+            unique_id, data = item
+            payload = {
+                "RequestInfo": {
+                    "apiId": "Rainmaker",
+                    "authToken": self.auth_token,
+                    "userInfo": self.user_info,
+                    "msgId": f"{int(time.time() * 1000)}|en_IN"
+                },
+                "Mdms": {
+                    "tenantId": tenant,
+                    "schemaCode": schema_code,
+                    "uniqueIdentifier": unique_id,
+                    "data": data,
+                    "isActive": True
+                }
+            }
+            try:
+                response = self._request_with_retry(url, json=payload,
+                                                    headers={'Content-Type': 'application/json'})
+                text = response.text or ''
+                if response.ok:
+                    body = response.json() if text.strip() else {}
+                    status = "SUCCESS" if body.get('mdms') or not text.strip() else "EXISTS"
+                    error = None
+                elif 'already exists' in text.lower() or 'duplicate' in text.lower():
+                    status, error = "EXISTS", None
+                else:
+                    status = "FAILED"
+                    error = self._extract_error_message(text) if text else f"HTTP {response.status_code}"
+            except Exception as e:
+                status, error = "FAILED", str(e)[:200]
+
+            with lock:
+                if status == "SUCCESS":
+                    results['created'] += 1
+                elif status == "EXISTS":
+                    results['exists'] += 1
+                else:
+                    results['failed'] += 1
+                    results['errors'].append({'id': unique_id, 'error': error})
+            label = {"SUCCESS": "OK", "EXISTS": "EXISTS", "FAILED": "FAILED"}[status]
+            self._row(status, unique_id, f"   [{label}] {unique_id}" + (f" - {error[:100]}" if error else ""),
+                      error=error)
+
+        run_pipeline(todo, create, workers=workers, queue_size=workers * 2)
+
+        if self.reference_cache is not None and results['created']:
+            self.reference_cache.invalidate(schema_code)
+        return results
+
+    def search_schema_definitions(self, tenant: str, limit: int = 500) -> List[Dict]:
+        """MDMS v2 schema definitions registered on a (root) tenant"""
+        payload = {
+            "RequestInfo": {
+                "apiId": "Rainmaker",
+                "authToken": self.auth_token,
+                "userInfo": self.user_info
+            },
+            "SchemaDefCriteria": {"tenantId": tenant, "limit": limit, "offset": 0}
+        }
+        response = self._request_with_retry(f"{self.mdms_url}/schema/v1/_search", json=payload,
+                                            headers={'Content-Type': 'application/json'})
+        response.raise_for_status()
+        return response.json().get('SchemaDefinitions', []) or []
+
+    def create_schema_definitions(self, schemas: List[Dict], tenant: str, workers: int = 8) -> Dict:
+        """Register schema definitions on a root tenant, skipping ones it already has
+
+        The target is searched once; the missing schemas are created
+        concurrently.
+
+        Args:
+            schemas: Definitions with code, description and definition
+                (as returned by search_schema_definitions)
+            tenant: Target root tenant
+            workers: Concurrent create requests
+
+        Returns:
+            dict: {created, exists, failed}
+        """
+        try:
+            present = {s.get('code') for s in self.search_schema_definitions(tenant)}
+        except Exception:
+            present = set()
+        missing = [s for s in schemas if s.get('code', '') not in present]
+        url = f"{self.mdms_url}/schema/v1/_create"
+
+        def create(schema):
+            code = schema.get('code', '')
+            payload = {
+                "RequestInfo": {
+                    "apiId": "Rainmaker",
+                    "authToken": self.auth_token,
+                    "userInfo": self.user_info
+                },
+                "SchemaDefinition": {
+                    "tenantId": tenant,
+                    "code": code,
+                    "description": schema.get('description', code),
+                    "definition": schema.get('definition', {})
+                }
+            }
+            try:
+                r = self._post(url, json=payload, headers={'Content-Type': 'application/json'},
+                               timeout=self.REQUEST_TIMEOUT)
+                if r.ok:
+                    return 'created'
+                if any(kw in r.text.lower() for kw in ['duplicate', 'already exists', 'unique']):
+                    return 'exists'
+            except Exception:
+                pass
+            return 'failed'
+
+        from concurrent.futures import ThreadPoolExecutor
+        with ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix="schema") as pool:
+            outcomes = list(pool.map(create, missing))
+        return {
+            'created': outcomes.count('created'),
+            'exists': len(schemas) - len(missing) + outcomes.count('exists'),
+            'failed': outcomes.count('failed'),
+        }
+
     def delete_mdms_data(self, schema_code: str, tenant: str, unique_ids: List[str] = None) -> Dict:
         """Soft-delete MDMS data by setting isActive=false
 
@@ -1350,12 +1933,13 @@ class APIUploader:
 
             # Step 2: Update each record with isActive=false
             auth_failed = False
+            self._task(f"delete {schema_code}", len(mdms_records))
             for i, record in enumerate(mdms_records):
                 unique_id = record.get('uniqueIdentifier', 'unknown')
 
                 # Skip if already inactive
                 if not record.get('isActive', True):
-                    print(f"   ⏭️ Already inactive: {unique_id}")
+                    self._row("EXISTS", unique_id, f"   ⏭️ Already inactive: {unique_id}")
                     results['skipped'] += 1
                     continue
 
@@ -1380,7 +1964,7 @@ class APIUploader:
                 try:
                     upd_response = self._request_with_retry(update_url, json=update_payload, headers={'Content-Type': 'application/json'})
                     if upd_response.status_code == 200:
-                        print(f"   ✅ Deleted: {unique_id}")
+                        self._row("SUCCESS", unique_id, f"   ✅ Deleted: {unique_id}")
                         results['deleted'] += 1
                     elif upd_response.status_code == 401:
                         # Fail fast on auth errors
@@ -1393,11 +1977,13 @@ class APIUploader:
                         break
                     else:
                         error_msg = upd_response.text[:100]
-                        print(f"   ❌ Failed to delete {unique_id}: {error_msg}")
+                        self._row("FAILED", unique_id, f"   ❌ Failed to delete {unique_id}: {error_msg}",
+                                  error=error_msg)
                         results['failed'] += 1
                         results['errors'].append({'id': unique_id, 'error': error_msg})
                 except Exception as e:
-                    print(f"   ❌ Error deleting {unique_id}: {str(e)[:50]}")
+                    self._row("FAILED", unique_id, f"   ❌ Error deleting {unique_id}: {str(e)[:50]}",
+                              error=str(e))
                     results['failed'] += 1
                     results['errors'].append({'id': unique_id, 'error': str(e)})
 
@@ -1485,6 +2071,9 @@ class APIUploader:
         Note: row_statuses[*]['row_index'] is expected to be the Excel row number you want to write to.
         If your row_index is zero-based data-row index (0..n-1) change excel_row = header_row + 1 + row_index below.
         """
+        from openpyxl import load_workbook
+        from openpyxl.styles import PatternFill, Font
+        from openpyxl.utils import get_column_letter
         try:
             print(f"\n📝 Updating Excel file: {excel_file}")
             print(f"   Sheet: {sheet_name}")
@@ -1851,6 +2440,18 @@ class APIUploader:
             # Don't fail if protection doesn't work
             print(f"   ⚠️  Could not apply sheet protection: {str(e)}")
 
+    def search_localization_messages(self, tenant: str, locale: str = "en_IN", module: str = None) -> List[Dict]:
+        """Localization messages stored for a tenant and locale"""
+        params = {"tenantId": tenant, "locale": locale}
+        if module:
+            params["module"] = module
+        response = self._request_with_retry(
+            f"{self.localization_url}/messages/v1/_search", params=params,
+            json={"RequestInfo": {"apiId": "Rainmaker", "authToken": self.auth_token}},
+            headers={'Content-Type': 'application/json'})
+        response.raise_for_status()
+        return response.json().get('messages', []) or []
+
     def create_localization_messages(self, localization_list: List[Dict], tenant: str, sheet_name: str = 'Localization'):
         """Upload localization messages via localization service API"""
         url = f"{self.localization_url}/messages/v1/_upsert"
@@ -1884,6 +2485,7 @@ class APIUploader:
         for locale, messages in by_locale.items():
             total_messages = len(messages)
             print(f"   📤 Locale: {locale} - Uploading {total_messages} messages in batches of {BATCH_SIZE}...")
+            self._task(f"localization {locale}", total_messages)
 
             # Split into batches
             for batch_idx in range(0, total_messages, BATCH_SIZE):
@@ -1912,7 +2514,8 @@ class APIUploader:
                     response = self._request_with_retry(url, json=payload, headers=headers, timeout=120)
                     status_code = response.status_code
                     response.raise_for_status()
-                    print(f"      ✅ Batch {batch_num}/{total_batches}: {len(batch)} messages uploaded")
+                    self._batch(len(batch), "SUCCESS",
+                                f"      ✅ Batch {batch_num}/{total_batches}: {len(batch)} messages uploaded")
                     results['created'] += len(batch)
 
                 except requests.exceptions.HTTPError as e:
@@ -1937,13 +2540,15 @@ class APIUploader:
                         'DUPLICATE_RECORDS' in error_text or
                         'DuplicateMessageIdentityException' in error_text or
                         'unique_message_entry' in error_text.lower()):
-                        print(f"      ⚠️ Batch {batch_num}/{total_batches}: {len(batch)} messages already exist")
+                        self._batch(len(batch), "EXISTS",
+                                    f"      ⚠️ Batch {batch_num}/{total_batches}: {len(batch)} messages already exist")
                         results['exists'] += len(batch)
                         # DON'T add to failed_records - already exists is not a failure!
                     else:
                         # True failure
-                        print(f"      ❌ Batch {batch_num}/{total_batches} FAILED (HTTP {status_code})")
-                        print(f"         ERROR: {error_message}")
+                        self._batch(len(batch), "FAILED",
+                                    f"      ❌ Batch {batch_num}/{total_batches} FAILED (HTTP {status_code})\n"
+                                    f"         ERROR: {error_message}", error=error_message)
                         results['failed'] += len(batch)
                         results['errors'].append({
                             'locale': locale,
@@ -1963,7 +2568,9 @@ class APIUploader:
                 except Exception as e:
                     error_message = str(e)[:200]
                     status_code = 0
-                    print(f"      ❌ Batch {batch_num}/{total_batches} ERROR: {error_message}")
+                    self._batch(len(batch), "FAILED",
+                                f"      ❌ Batch {batch_num}/{total_batches} ERROR: {error_message}",
+                                error=error_message)
                     results['failed'] += len(batch)
                     results['errors'].append({
                         'locale': locale,
@@ -2368,20 +2975,14 @@ class APIUploader:
             print(f"❌ Error: {str(e)}")
             return {}
 
-    def poll_boundary_template_status(self, tenant_id: str, hierarchy_type: str, max_attempts: int = 90, delay: int = 2) -> Dict:
-        """Poll for boundary template generation completion
-
-        Args:
-            tenant_id: Tenant ID
-            hierarchy_type: Hierarchy type
-            max_attempts: Maximum polling attempts (defaults give a 180 s window;
-                CI runners are slower than dev boxes, and the previous 60 s default
-                timed out on every CI run with an empty response on every attempt)
-            delay: Delay between attempts (seconds)
+    # Template generation backoff: first re-poll after ~TEMPLATE_POLL_BASE
+    # seconds, doubling up to TEMPLATE_POLL_MAX. Each wait is drawn from
+    # [delay/2, delay] so hierarchies generated together don't poll in lockstep.
+    TEMPLATE_POLL_BASE = 1.0
+    TEMPLATE_POLL_MAX = 10.0
 
-        Returns:
-            Dict with fileStoreId when complete
-        """
+    def _search_boundary_template(self, tenant_id: str, hierarchy_type: str) -> Dict:
+        """One _generate-search call for a (tenant, hierarchyType); the response body"""
         url = f"{self.boundary_mgmt_url}/boundary-management/v1/_generate-search"
 
         params = {
@@ -2403,69 +3004,130 @@ class APIUploader:
             }
         }
 
-
         headers = {'Content-Type': 'application/json'}
 
-        print(f"\n⏳ Polling for template generation (max {max_attempts} attempts)...")
+        response = self._request_with_retry(url, json=payload, headers=headers, params=params)
+        response.raise_for_status()
+        return response.json()
 
-        # Track the last response so a timeout can dump what the server kept
-        # returning — without this the loop is silent on empty arrays and we
-        # can't tell "worker never picked up the task" apart from "worker
-        # wrote under a different key".
-        last_data: Dict = {}
+    def wait_for_boundary_templates(self, jobs: List[tuple], on_complete=None,
+                                    timeout: float = 180) -> Dict:
+        """Poll several boundary template generations from one thread
 
-        for attempt in range(1, max_attempts + 1):
-            try:
-                response = self._request_with_retry(url, json=payload, headers=headers, params=params)
+        Every (tenant, hierarchyType) job keeps its own exponential backoff
+        (TEMPLATE_POLL_BASE doubling to TEMPLATE_POLL_MAX, with jitter), and
+        the loop sleeps only until the next job is due. A job leaves the
+        loop as soon as its status is completed or failed, and on_complete
+        is called right then, so a caller can start that download while the
+        other templates are still generating.
 
-                response.raise_for_status()
-                data = response.json()
-                last_data = data
+        Args:
+            jobs: (tenant_id, hierarchy_type) pairs already sent to _generate
+            on_complete: Optional callback(job, resource) for finished jobs
+            timeout: Seconds to wait for all jobs (CI runners are slower than
+                dev boxes; 60 s timed out on every CI run)
+
+        Returns:
+            Dict of job -> GeneratedResource ({} for jobs that timed out)
+        """
+        import heapq
+        import random
+
+        jobs = list(dict.fromkeys(tuple(job) for job in jobs))
+        results = {}
+        if not jobs:
+            return results
+
+        start = time.monotonic()
+        deadline = start + timeout
+        # (due, seq, job, attempt) - seq breaks ties so jobs are never compared
+        queue = [(start, seq, job, 1) for seq, job in enumerate(jobs)]
+        heapq.heapify(queue)
+        seq = len(queue)
+
+        # Track the last response per job so a timeout can dump what the
+        # server kept returning — without it we can't tell "worker never
+        # picked up the task" apart from "worker wrote under a different key".
+        last_data = {}
+
+        print(f"\n⏳ Waiting for {len(jobs)} template generation(s) (up to {timeout:.0f}s)...")
+
+        while queue:
+            due, _, job, attempt = heapq.heappop(queue)
+            now = time.monotonic()
+            if due > deadline:
+                # Put it back: the timeout report below covers every job left
+                heapq.heappush(queue, (due, seq, job, attempt))
+                break
+            if due > now:
+                time.sleep(due - now)
 
-                resources = data.get('GeneratedResource', [])
+            tenant_id, hierarchy_type = job
+            label = f"{tenant_id}/{hierarchy_type}" if len(jobs) > 1 else f"Attempt {attempt}"
+            resource = None
+            try:
+                data = self._search_boundary_template(tenant_id, hierarchy_type)
+                last_data[job] = data
+                resources = data.get('GeneratedResource', []) if isinstance(data, dict) else []
                 if resources:
                     resource = resources[0]
-                    status = resource.get('status')
-                    filestore_id = resource.get('fileStoreid')
-                    error_details = resource.get('error', 'No error details provided')
-                    additional_details = resource.get('additionalDetails', {})
-
-                    print(f"   Attempt {attempt}/{max_attempts}: Status = {status}")
-
-                    if status == 'completed' and filestore_id:
-                        print(f"\n✅ Template generation complete!")
-                        print(f"   FileStore ID: {filestore_id}")
-                        return resource
-                    elif status == 'failed':
-                        print(f"\n❌ Template generation failed")
-                        print(f"   Error: {error_details}")
-                        if additional_details:
-                            print(f"   Additional Details: {json.dumps(additional_details, indent=2)[:500]}")
-                        print(f"\n📋 Full resource response:")
-                        print(f"   {json.dumps(resource, indent=2)[:1000]}")
-                        return resource
-                else:
+                    print(f"   {label}: Status = {resource.get('status')}")
+                elif attempt == 1 or attempt % 5 == 0:
                     # Empty GeneratedResource — log periodically so a timeout
-                    # tells us *what* the server kept returning. Without this
-                    # the loop is invisible (the previous code only printed
-                    # the Status line on non-empty responses).
-                    if attempt == 1 or attempt % 5 == 0:
-                        keys = list(data.keys()) if isinstance(data, dict) else []
-                        print(f"   Attempt {attempt}/{max_attempts}: GeneratedResource=[] (response keys: {keys})")
+                    # tells us *what* the server kept returning.
+                    keys = list(data.keys()) if isinstance(data, dict) else []
+                    print(f"   {label}: GeneratedResource=[] (response keys: {keys})")
+            except Exception as e:
+                print(f"   {label}: Error - {str(e)[:100]}")
+
+            status = resource.get('status') if resource else None
+            if status == 'completed' and resource.get('fileStoreid'):
+                print(f"\n✅ Template generation complete: {tenant_id}/{hierarchy_type}")
+                print(f"   FileStore ID: {resource.get('fileStoreid')}")
+            elif status == 'failed':
+                print(f"\n❌ Template generation failed: {tenant_id}/{hierarchy_type}")
+                print(f"   Error: {resource.get('error', 'No error details provided')}")
+                if resource.get('additionalDetails'):
+                    print(f"   Additional Details: {json.dumps(resource['additionalDetails'], indent=2)[:500]}")
+                print(f"\n📋 Full resource response:")
+                print(f"   {json.dumps(resource, indent=2)[:1000]}")
+            else:
+                delay = min(self.TEMPLATE_POLL_MAX, self.TEMPLATE_POLL_BASE * 2 ** (attempt - 1))
+                delay = random.uniform(delay / 2, delay)
+                heapq.heappush(queue, (time.monotonic() + delay, seq, job, attempt + 1))
+                seq += 1
+                continue
 
-                time.sleep(delay)
+            results[job] = resource
+            if on_complete:
+                on_complete(job, resource)
+
+        for _, _, job, attempt in sorted(queue):
+            tenant_id, hierarchy_type = job
+            print(f"\n⚠️ Template generation timed out for {tenant_id}/{hierarchy_type} "
+                  f"after {attempt - 1} polls")
+            # Dump the last response so we can see whether the server was always
+            # returning an empty array or some other shape we didn't anticipate.
+            if last_data.get(job):
+                print(f"   Last response body:")
+                print(f"   {json.dumps(last_data[job], indent=2)[:800]}")
+            results[job] = {}
 
-            except Exception as e:
-                print(f"   Attempt {attempt}/{max_attempts}: Error - {str(e)[:100]}")
-                time.sleep(delay)
+        return results
+
+    def poll_boundary_template_status(self, tenant_id: str, hierarchy_type: str, timeout: float = 180) -> Dict:
+        """Poll for boundary template generation completion
+
+        Args:
+            tenant_id: Tenant ID
+            hierarchy_type: Hierarchy type
+            timeout: Seconds to wait (see wait_for_boundary_templates)
 
-        print(f"\n⚠️ Template generation timed out after {max_attempts} attempts")
-        # Dump the last response so we can see whether the server was always
-        # returning an empty array or some other shape we didn't anticipate.
-        if last_data:
-            print(f"   Last response body:")
-            print(f"   {json.dumps(last_data, indent=2)[:800]}")
-        return {}
+        Returns:
+            Dict with fileStoreId when complete
+        """
+        job = (tenant_id, hierarchy_type)
+        return self.wait_for_boundary_templates([job], timeout=timeout)[job]
 
     def download_boundary_template(self, tenant_id: str, filestore_id: str, hierarchy_type: str = "ADMIN", output_path: str = None, return_url: bool = False):
         """Download boundary template from filestore
@@ -2490,7 +3152,7 @@ class APIUploader:
         }
 
         try:
-            response = requests.get(url, params=params)
+            response = self._send("get", url, params=params)
             response.raise_for_status()
             data = response.json()
 
@@ -2587,30 +3249,47 @@ class APIUploader:
             print(f"❌ Download error: {str(e)[:200]}")
             return None
 
-    def upload_file_to_filestore(self, file_path: str, tenant_id: str, module: str = "HCM-ADMIN-CONSOLE") -> str:
+    def upload_file_to_filestore(self, file_path: str, tenant_id: str, module: str = "HCM-ADMIN-CONSOLE",
+                                 use_cache: bool = True) -> str:
         """Upload file to filestore
 
+        The body is streamed from disk. With self.filestore_cache set, a file
+        already uploaded for this tenant and module with the same SHA-256
+        reuses its fileStoreId (after checking the filestore still resolves it).
+
         Args:
             file_path: Path to file to upload
             tenant_id: Tenant ID
             module: Module name
+            use_cache: Reuse a cached fileStoreId for unchanged files
 
         Returns:
             FileStore ID of uploaded file
         """
         import os
         url = f"{self.filestore_url}/v1/files"
+        file_name = os.path.basename(file_path)
 
         try:
-            with open(file_path, 'rb') as f:
-                files = {'file': (os.path.basename(file_path), f, 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet')}
-                data = {
-                    'tenantId': tenant_id,
-                    'module': module
-                }
-
-                print(f"\n📤 Uploading file: {os.path.basename(file_path)}")
-                response = self._request_with_retry(url, files=files, data=data)
+            cache = self.filestore_cache if use_cache else None
+            if cache is not None:
+                sha256 = file_sha256(file_path)
+                cache_key = (self.base_url, tenant_id, module, sha256)
+                cached_id = cache.load(*cache_key)
+                if cached_id and self._filestore_has(tenant_id, cached_id):
+                    print(f"\n📎 {file_name} unchanged (sha256 {sha256[:12]}), reusing upload")
+                    print(f"   FileStore ID: {cached_id}")
+                    return cached_id
+                if cached_id:
+                    cache.discard(*cache_key)
+
+            fields = {
+                'tenantId': tenant_id,
+                'module': module
+            }
+            with MultipartFile(file_path, fields, content_type='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet') as body:
+                print(f"\n📤 Uploading file: {file_name}")
+                response = self._request_with_retry(url, data=body, headers={'Content-Type': body.content_type})
                 response.raise_for_status()
 
                 result = response.json()
@@ -2620,6 +3299,8 @@ class APIUploader:
                     filestore_id = files_data[0].get('fileStoreId')
                     print(f"✅ File uploaded successfully!")
                     print(f"   FileStore ID: {filestore_id}")
+                    if cache is not None and filestore_id:
+                        cache.save(*cache_key, filestore_id, file_name)
                     return filestore_id
                 else:
                     print("❌ No filestore ID in response")
@@ -2629,6 +3310,17 @@ class APIUploader:
             print(f"❌ Upload error: {str(e)[:200]}")
             return None
 
+    def _filestore_has(self, tenant_id: str, filestore_id: str) -> bool:
+        """True if the filestore still resolves a fileStoreId for this tenant"""
+        try:
+            response = self._send("get", f"{self.filestore_url}/v1/files/url",
+                                  params={"tenantId": tenant_id, "fileStoreIds": filestore_id},
+                                  timeout=self.REQUEST_TIMEOUT)
+            response.raise_for_status()
+            return any(f.get('url') for f in response.json().get('fileStoreIds', []))
+        except Exception:
+            return False
+
     def process_boundary_data(self, tenant_id: str, filestore_id: str = None, hierarchy_type: str = "ADMIN", action: str = "create", excel_file: str = None) -> Dict:
         """Process boundary data - creates boundaries one-by-one via direct API
 
@@ -2716,6 +3408,7 @@ class APIUploader:
                     print(f"      Will attempt to map types")
 
                 # Process each row
+                self._task("boundaries", len(df))
                 for idx, row in df.iterrows():
                     code = str(row.get('code', '')).strip()
                     boundary_type = str(row.get('boundaryType', '')).strip()
@@ -2743,9 +3436,11 @@ class APIUploader:
                         )
                     if rel_success:
                         results['relationships_created'] += 1
+                    self._row("SUCCESS" if rel_success else "FAILED", code)
             else:
                 # Handle column-per-level format
                 print("   Using column-per-level format")
+                self._task("boundaries")
                 for boundary_type in boundary_types:
                     if boundary_type not in df.columns:
                         continue
@@ -2774,6 +3469,7 @@ class APIUploader:
                         )
                         if rel_success:
                             results['relationships_created'] += 1
+                        self._row("SUCCESS" if rel_success else "FAILED", boundary_code)
 
             results['status'] = 'completed'
             print(f"\n✅ Boundary processing completed!")
@@ -2787,19 +3483,233 @@ class APIUploader:
 
         return results
 
-    def _get_boundary_hierarchy(self, tenant_id: str, hierarchy_type: str) -> Dict:
-        """Fetch boundary hierarchy definition"""
-        url = f"{self.boundary_url}/boundary-hierarchy-definition/_search"
+    def process_boundary_data_streaming(self, tenant_id: str, excel_file: str,
+                                        hierarchy_type: str = "ADMIN", workers: int = 4,
+                                        queue_size: int = 200, skip_existing: bool = False) -> Dict:
+        """Streaming counterpart of process_boundary_data
 
-        user_info_copy = self.user_info.copy()
-        user_info_copy['tenantId'] = tenant_id
+        Rows are read from a read-only workbook and turned into
+        (code, boundaryType, parent) specs lazily; a pool of workers creates the
+        entity and relationship for each. A child's relationship waits until its
+        parent (if the parent came earlier in the sheet) has been handled, so
+        parent-before-child ordering is kept while siblings upload concurrently.
 
-        payload = {
-            "RequestInfo": {
-                "apiId": "Rainmaker",
-                "authToken": self.auth_token,
-                "userInfo": user_info_copy
-            },
+        Args:
+            tenant_id: Tenant ID
+            excel_file: Path to Excel file with boundary data
+            hierarchy_type: Hierarchy type (default: ADMIN)
+            workers: Number of concurrent upload threads
+            queue_size: Maximum parsed rows waiting for a worker
+            skip_existing: Fetch the tree once (boundary_index) and send
+                nothing for boundaries already in it
+
+        Returns:
+            Dict with processing results (same keys as process_boundary_data)
+        """
+        if not excel_file:
+            print("❌ No Excel file provided")
+            return {
+                'status': 'failed',
+                'boundaries_created': 0,
+                'relationships_created': 0,
+                'errors': ["No Excel file provided"]
+            }
+
+        print(f"\n📖 Streaming boundary data from: {excel_file}")
+        print(f"   Workers: {workers}, queue size: {queue_size}")
+
+        hierarchy = self._get_boundary_hierarchy(tenant_id, hierarchy_type)
+        if hierarchy:
+            boundary_types = [h['boundaryType'] for h in hierarchy.get('boundaryHierarchy', [])]
+            print(f"   Hierarchy: {' → '.join(boundary_types)}")
+        else:
+            print("   ⚠️ Could not fetch hierarchy, will use boundaryType from Excel")
+            boundary_types = []
+
+        return self.create_boundaries_from_specs(
+            tenant_id, hierarchy_type,
+            self._iter_boundary_specs(excel_file, boundary_types),
+            boundary_types=boundary_types, workers=workers, queue_size=queue_size,
+            existing=self.boundary_index(tenant_id, hierarchy_type) if skip_existing else None
+        )
+
+    def create_boundaries_from_specs(self, tenant_id: str, hierarchy_type: str, specs,
+                                     boundary_types: List[str] = None, workers: int = 4,
+                                     queue_size: int = 200, existing: BoundaryIndex = None) -> Dict:
+        """Create boundary entities + relationships from (code, boundaryType, parent) specs
+
+        Used by process_boundary_data_streaming and by payload bundle replay.
+        Specs must list parents before children; a child's relationship waits
+        until a parent queued earlier has been handled.
+
+        Args:
+            tenant_id: Tenant ID
+            hierarchy_type: Hierarchy type
+            specs: Iterable of (code, boundaryType, parentCode) tuples
+            boundary_types: Hierarchy levels, used for the type-mapping fallback
+            workers: Number of concurrent upload threads
+            queue_size: Maximum specs waiting for a worker
+            existing: BoundaryIndex of the tree as it stands; boundaries
+                already in it are counted in 'boundaries_existing' and not sent
+
+        Returns:
+            Dict with processing results (same keys as process_boundary_data,
+            plus 'boundaries_existing')
+        """
+        import threading
+
+        results = {
+            'status': 'processing',
+            'boundaries_created': 0,
+            'relationships_created': 0,
+            'boundaries_existing': 0,
+            'errors': []
+        }
+
+        # Same fallback mapping as process_boundary_data, applied per row when
+        # the sheet's type is not part of the hierarchy
+        type_mapping = {
+            'State': 'Country',
+            'District': 'State',
+            'Tehsil': 'City',
+            'Block': 'Ward',
+            'Village': 'Locality'
+        }
+        hierarchy_set = set(boundary_types or [])
+
+        lock = threading.Lock()
+        settled = threading.Condition(lock)
+        position = {}     # code -> order in which it was queued
+        finished = set()  # codes whose relationship attempt has completed
+        aborted = []
+
+        def sequenced():
+            for seq, (code, boundary_type, parent_code) in enumerate(specs):
+                position.setdefault(code, seq)
+                yield seq, code, boundary_type, parent_code
+
+        def upload(spec):
+            seq, code, boundary_type, parent_code = spec
+            try:
+                # Only wait on parents queued before this row; the queue is
+                # FIFO so they are already with a worker and cannot deadlock
+                if parent_code and position.get(parent_code, seq) < seq:
+                    with settled:
+                        settled.wait_for(lambda: parent_code in finished or aborted)
+                if aborted:
+                    return False
+
+                if existing is not None and code in existing:
+                    with lock:
+                        results['boundaries_existing'] += 1
+                    self._row("EXISTS", code)
+                    return True
+
+                success = self._create_boundary_entity(tenant_id, code)
+
+                rel_success = self._create_boundary_relationship(
+                    tenant_id, hierarchy_type, code, boundary_type, parent_code
+                )
+                mapped_type = type_mapping.get(boundary_type, boundary_type)
+                if (not rel_success and hierarchy_set and boundary_type not in hierarchy_set
+                        and mapped_type != boundary_type):
+                    rel_success = self._create_boundary_relationship(
+                        tenant_id, hierarchy_type, code, mapped_type, parent_code
+                    )
+
+                with lock:
+                    if success:
+                        results['boundaries_created'] += 1
+                    if rel_success:
+                        results['relationships_created'] += 1
+                self._row("SUCCESS" if rel_success else "FAILED", code)
+            except PermissionError as e:
+                with lock:
+                    results['errors'].append(str(e))
+                    aborted.append(code)
+                return False
+            finally:
+                with settled:
+                    finished.add(code)
+                    settled.notify_all()
+
+        self._task("boundaries")
+        try:
+            run_pipeline(sequenced(), upload, workers=workers, queue_size=queue_size)
+        except Exception as e:
+            print(f"❌ Error processing boundaries: {str(e)}")
+            results['status'] = 'failed'
+            results['errors'].append(str(e))
+            return results
+
+        if results['errors']:
+            print(f"❌ Error processing boundaries: {results['errors'][0]}")
+            results['status'] = 'failed'
+            return results
+
+        results['status'] = 'completed'
+        print(f"\n✅ Boundary processing completed!")
+        print(f"   Boundaries created: {results['boundaries_created']}")
+        print(f"   Relationships created: {results['relationships_created']}")
+        if existing is not None:
+            print(f"   Already in the tree: {results['boundaries_existing']}")
+        return results
+
+    @staticmethod
+    def _iter_boundary_specs(excel_file: str, boundary_types: List[str]):
+        """Yield (code, boundaryType, parentCode) for each boundary in a sheet
+
+        Handles both layouts process_boundary_data accepts: the standard
+        code/boundaryType/parentCode columns, and one column per hierarchy level
+        (each code is emitted once, with the value of the level to its left as
+        parent). Parents are always yielded before their children.
+        """
+        rows = iter_sheet_rows(excel_file, ['Boundary', 'Boundary Data'])
+        first = next(rows, None)
+        if first is None:
+            return
+
+        def all_rows():
+            yield first
+            yield from rows
+
+        standard = 'code' in first[1] and 'boundaryType' in first[1]
+        emitted = set()
+
+        for _, row in all_rows():
+            if standard:
+                code = str(row.get('code') or '').strip()
+                boundary_type = str(row.get('boundaryType') or '').strip()
+                parent_code = str(row['parentCode']).strip() if row.get('parentCode') is not None else None
+                if code and boundary_type:
+                    yield code, boundary_type, parent_code
+                continue
+
+            parent_code = None
+            for boundary_type in boundary_types:
+                value = row.get(boundary_type)
+                if value is None or str(value).strip() == '':
+                    parent_code = None
+                    continue
+                code = str(value).strip()
+                if code not in emitted:
+                    emitted.add(code)
+                    yield code, boundary_type, parent_code
+                parent_code = code
+
+    def _get_boundary_hierarchy(self, tenant_id: str, hierarchy_type: str) -> Dict:
+        """Fetch boundary hierarchy definition"""
+        url = f"{self.boundary_url}/boundary-hierarchy-definition/_search"
+
+        user_info_copy = self.user_info.copy()
+        user_info_copy['tenantId'] = tenant_id
+
+        payload = {
+            "RequestInfo": {
+                "apiId": "Rainmaker",
+                "authToken": self.auth_token,
+                "userInfo": user_info_copy
+            },
             "BoundaryTypeHierarchySearchCriteria": {
                 "tenantId": tenant_id,
                 "hierarchyType": hierarchy_type
@@ -2816,6 +3726,62 @@ class APIUploader:
             print(f"   ⚠️ Error fetching hierarchy: {str(e)[:100]}")
             return None
 
+    def search_boundary_tree(self, tenant_id: str, hierarchy_type: str, page_size: int = 100) -> List[Dict]:
+        """Root nodes of a hierarchy's boundary tree ({code, boundaryType, children})
+
+        Roots are paged with limit/offset; each root comes with its whole
+        subtree (includeChildren).
+        """
+        url = f"{self.boundary_url}/boundary-relationships/_search"
+        payload = {
+            "RequestInfo": {
+                "apiId": "Rainmaker",
+                "authToken": self.auth_token,
+                "userInfo": self.user_info
+            }
+        }
+        roots = []
+        seen = set()
+        offset = 0
+        while True:
+            response = self._request_with_retry(
+                url, json=payload, headers={'Content-Type': 'application/json'},
+                params={"tenantId": tenant_id, "hierarchyType": hierarchy_type, "includeChildren": "true",
+                        "limit": page_size, "offset": offset})
+            response.raise_for_status()
+            page = []
+            for tenant_boundary in response.json().get('TenantBoundary', []) or []:
+                page.extend(tenant_boundary.get('boundary', []) or [])
+            # Stop on a short page, or if the service ignored offset and
+            # answered with roots we already have
+            fresh = [root for root in page if root.get('code') not in seen]
+            roots.extend(fresh)
+            seen.update(root.get('code') for root in fresh)
+            if len(page) < page_size or len(fresh) < len(page):
+                return roots
+            offset += page_size
+
+    def boundary_index(self, tenant_id: str, hierarchy_type: str = "ADMIN",
+                       refresh: bool = False) -> BoundaryIndex:
+        """BoundaryIndex of a (tenant, hierarchyType) tree, fetched once per uploader
+
+        Creating a relationship through this uploader drops the cached
+        index for that tree. A failed fetch gives an empty index. Forks and
+        worker threads share the indexes; concurrent callers wait for one fetch.
+        """
+        if self.boundary_indexes is None:
+            self.boundary_indexes = BoundaryIndexes()
+
+        def build():
+            try:
+                roots = self.search_boundary_tree(tenant_id, hierarchy_type)
+            except Exception as e:
+                print(f"   ⚠️  Could not fetch {hierarchy_type} boundaries for {tenant_id}: {str(e)[:200]}")
+                roots = []
+            return BoundaryIndex(tenant_id, hierarchy_type, roots)
+
+        return self.boundary_indexes.get((tenant_id, hierarchy_type), build, refresh=refresh)
+
     def _create_boundary_entity(self, tenant_id: str, code: str) -> bool:
         """Create a single boundary entity"""
         url = f"{self.boundary_url}/boundary/_create"
@@ -2840,7 +3806,7 @@ class APIUploader:
         try:
             response = self._request_with_retry(url, json=payload, headers={'Content-Type': 'application/json'})
             if response.status_code in [200, 201, 202]:
-                print(f"   ✅ Created boundary: {code}")
+                self._row("SUCCESS", code, f"   ✅ Created boundary: {code}", advance=False)
                 return True
             elif response.status_code == 403:
                 raise PermissionError(
@@ -2853,15 +3819,18 @@ class APIUploader:
                 error_code = data.get('Errors', [{}])[0].get('code', '')
                 error_msg = data.get('Errors', [{}])[0].get('message', '')
                 if error_code == 'DUPLICATE_CODE' or 'already exists' in str(error_msg).lower():
-                    print(f"   ⚠️ Boundary exists: {code}")
+                    self._row("EXISTS", code, f"   ⚠️ Boundary exists: {code}", advance=False)
                     return True  # Already exists is OK
                 else:
-                    print(f"   ❌ Failed to create boundary {code}: {error_code or error_msg or response.status_code}")
+                    error = error_code or error_msg or response.status_code
+                    self._row("FAILED", code, f"   ❌ Failed to create boundary {code}: {error}",
+                              error=str(error), advance=False)
                     return False
         except PermissionError:
             raise  # Re-raise 403 errors — don't swallow them
         except Exception as e:
-            print(f"   ❌ Error creating boundary {code}: {str(e)[:100]}")
+            self._row("FAILED", code, f"   ❌ Error creating boundary {code}: {str(e)[:100]}",
+                      error=str(e), advance=False)
             return False
 
     def _create_boundary_relationship(self, tenant_id: str, hierarchy_type: str,
@@ -2893,8 +3862,11 @@ class APIUploader:
         try:
             response = self._request_with_retry(url, json=payload, headers={'Content-Type': 'application/json'})
             if response.status_code in [200, 201, 202]:
+                if self.boundary_indexes is not None:
+                    self.boundary_indexes.discard((tenant_id, hierarchy_type))
                 parent_info = f" (parent: {parent_code})" if parent_code else " (root)"
-                print(f"   ✅ Created relationship: {code} [{boundary_type}]{parent_info}")
+                self._row("SUCCESS", code, f"   ✅ Created relationship: {code} [{boundary_type}]{parent_info}",
+                          advance=False)
                 return True
             elif response.status_code == 403:
                 raise PermissionError(
@@ -2907,97 +3879,151 @@ class APIUploader:
                 error_code = data.get('Errors', [{}])[0].get('code', '')
                 error_msg = data.get('Errors', [{}])[0].get('message', '')
                 if 'already exists' in str(error_msg).lower() or error_code == 'DUPLICATE':
-                    print(f"   ⚠️ Relationship exists: {code}")
+                    self._row("EXISTS", code, f"   ⚠️ Relationship exists: {code}", advance=False)
                     return True
                 else:
-                    print(f"   ❌ Failed relationship {code}: {error_msg[:80] if error_msg else error_code or response.status_code}")
+                    error = error_msg[:80] if error_msg else error_code or response.status_code
+                    self._row("FAILED", code, f"   ❌ Failed relationship {code}: {error}",
+                              error=str(error), advance=False)
                     return False
         except PermissionError:
             raise  # Re-raise 403 errors — don't swallow them
         except Exception as e:
-            print(f"   ❌ Error creating relationship {code}: {str(e)[:100]}")
+            self._row("FAILED", code, f"   ❌ Error creating relationship {code}: {str(e)[:100]}",
+                      error=str(e), advance=False)
             return False
 
-    def delete_all_boundaries(self, tenant_id: str) -> Dict:
+    def search_boundary_codes(self, tenant_id: str, page_size: int = 500) -> List[str]:
+        """Codes of every boundary entity of a tenant, paging boundary/_search"""
+        url = f"{self.boundary_url}/boundary/_search"
+        codes = []
+        seen = set()
+        offset = 0
+        while True:
+            payload = {
+                "RequestInfo": {
+                    "apiId": "asset-services",
+                    "msgId": f"search-{int(time.time()*1000)}",
+                    "authToken": self.auth_token,
+                    "userInfo": self.user_info
+                },
+                "BoundaryCriteria": {
+                    "tenantId": tenant_id,
+                    "limit": page_size,
+                    "offset": offset
+                }
+            }
+            response = self._request_with_retry(url, json=payload, headers={'Content-Type': 'application/json'})
+            response.raise_for_status()
+            page = [b.get('code') for b in response.json().get('Boundary', []) or [] if b.get('code')]
+            fresh = [code for code in page if code not in seen]
+            codes.extend(fresh)
+            seen.update(fresh)
+            # A short page ends the search; so does a page of codes already
+            # seen, in case the service ignores offset
+            if len(page) < page_size or not fresh:
+                return codes
+            offset += page_size
+
+    def delete_all_boundaries(self, tenant_id: str, codes: List[str] = None,
+                              hierarchy_types: List[str] = None, workers: int = 8) -> Dict:
         """Delete all boundary entities for a tenant
 
+        Boundaries are deleted a tree level at a time, deepest first, with
+        up to `workers` _delete calls in flight within a level, so a parent
+        is only deleted once its children are gone.
+
         Args:
             tenant_id: Tenant ID (e.g., 'statea', 'pg.citya')
+            codes: Boundary codes to delete (default: every page of boundary/_search)
+            hierarchy_types: Trees used to order the deletes (default: all of
+                the tenant's hierarchies)
+            workers: Concurrent _delete calls
 
         Returns:
-            dict: {deleted: count, failed: count}
+            dict: {deleted: count, failed: count, codes: [...]}
         """
+        import threading
+        from concurrent.futures import ThreadPoolExecutor
+
         print(f"\n🗑️ Deleting all boundaries for tenant: {tenant_id}")
 
         results = {'deleted': 0, 'failed': 0, 'codes': []}
 
-        # Search for all boundaries
-        url = f"{self.boundary_url}/boundary/_search"
-        payload = {
-            "RequestInfo": {
-                "apiId": "asset-services",
-                "msgId": f"search-{int(time.time()*1000)}",
-                "authToken": self.auth_token,
-                "userInfo": self.user_info
-            },
-            "BoundaryCriteria": {
-                "tenantId": tenant_id,
-                "limit": 500,
-                "offset": 0
-            }
-        }
-
-        try:
-            response = self._request_with_retry(url, json=payload, headers={'Content-Type': 'application/json'})
-            if response.status_code != 200:
-                print(f"   ❌ Failed to search boundaries: {response.status_code}")
-                return results
-
-            data = response.json()
-            boundaries = data.get('Boundary', [])
-
-            if not boundaries:
-                print(f"   ℹ️ No boundaries found for tenant {tenant_id}")
+        if codes is None:
+            try:
+                codes = self.search_boundary_codes(tenant_id)
+            except Exception as e:
+                print(f"   ❌ Error searching boundaries: {str(e)[:50]}")
                 return results
+        codes = list(dict.fromkeys(codes))
 
-            print(f"   Found {len(boundaries)} boundaries to delete")
-
-            # Delete each boundary
-            for boundary in boundaries:
-                code = boundary.get('code')
-                if not code:
-                    continue
+        if not codes:
+            print(f"   ℹ️ No boundaries found for tenant {tenant_id}")
+            return results
 
-                delete_url = f"{self.boundary_url}/boundary/_delete"
-                delete_payload = {
-                    "RequestInfo": {
-                        "apiId": "asset-services",
-                        "msgId": f"delete-{int(time.time()*1000)}",
-                        "authToken": self.auth_token,
-                        "userInfo": self.user_info
-                    }
+        if hierarchy_types is None:
+            hierarchy_types = [h.get('hierarchyType') for h in self.search_boundary_hierarchies(tenant_id)
+                               if h.get('hierarchyType')]
+
+        # Depth of each code in the deepest tree it appears in; codes that are
+        # in no tree have no children and go with the deepest level
+        depth = {}
+        for hierarchy_type in hierarchy_types:
+            index = self.boundary_index(tenant_id, hierarchy_type)
+            for code in index:
+                depth[code] = max(depth.get(code, 0), index.depth(code))
+        deepest = max(depth.values(), default=0)
+        levels = {}
+        for code in codes:
+            levels.setdefault(depth.get(code, deepest), []).append(code)
+
+        print(f"   Found {len(codes)} boundaries to delete "
+              f"({len(levels)} level(s), {workers} worker(s))")
+
+        delete_url = f"{self.boundary_url}/boundary/_delete"
+        lock = threading.Lock()
+
+        def delete(code):
+            delete_payload = {
+                "RequestInfo": {
+                    "apiId": "asset-services",
+                    "msgId": f"delete-{int(time.time()*1000)}",
+                    "authToken": self.auth_token,
+                    "userInfo": self.user_info
                 }
+            }
+            try:
+                del_response = self._request_with_retry(
+                    delete_url,
+                    json=delete_payload,
+                    headers={'Content-Type': 'application/json'},
+                    params={'tenantId': tenant_id, 'code': code}
+                )
+                deleted = del_response.status_code == 200
+                error = None if deleted else str(del_response.status_code)
+            except Exception as e:
+                deleted, error = False, str(e)
 
-                try:
-                    del_response = self._request_with_retry(
-                        f"{delete_url}?tenantId={tenant_id}&code={code}",
-                        json=delete_payload,
-                        headers={'Content-Type': 'application/json'}
-                    )
-
-                    if del_response.status_code == 200:
-                        print(f"   ✅ Deleted: {code}")
-                        results['deleted'] += 1
-                        results['codes'].append(code)
-                    else:
-                        print(f"   ❌ Failed to delete {code}: {del_response.status_code}")
-                        results['failed'] += 1
-                except Exception as e:
-                    print(f"   ❌ Error deleting {code}: {str(e)[:30]}")
+            with lock:
+                if deleted:
+                    results['deleted'] += 1
+                    results['codes'].append(code)
+                else:
                     results['failed'] += 1
+            if deleted:
+                self._row("SUCCESS", code, f"   ✅ Deleted: {code}")
+            else:
+                self._row("FAILED", code, f"   ❌ Failed to delete {code}: {error[:30]}", error=error)
 
-        except Exception as e:
-            print(f"   ❌ Error searching boundaries: {str(e)[:50]}")
+        self._task("delete boundaries", len(codes))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="boundary-delete") as pool:
+            for level in sorted(levels, reverse=True):
+                list(pool.map(delete, levels[level]))
+
+        if self.boundary_indexes is not None:
+            for hierarchy_type in hierarchy_types:
+                self.boundary_indexes.discard((tenant_id, hierarchy_type))
 
         print(f"\n   Summary: Deleted {results['deleted']}, Failed {results['failed']}")
         return results
@@ -3232,73 +4258,37 @@ class APIUploader:
         return True
 
     def fetch_boundaries(self, tenant: str, hierarchy_type: str = "ADMIN") -> List[Dict]:
-        """Fetch boundaries from boundary service v2
+        """Fetch every boundary in a hierarchy, top level first
 
         Args:
             tenant: Tenant ID
             hierarchy_type: Hierarchy type (default: ADMIN)
 
         Returns:
-            List of boundary objects with code and type
+            List of boundary objects with code, type, parent and depth, in tree
+            (preorder) order
         """
-        url = f"{self.boundary_url}/boundary/_search"
-
-        # Override userInfo tenantId
-        user_info_copy = self.user_info.copy()
-        user_info_copy['tenantId'] = tenant
-
-        payload = {
-            "RequestInfo": {
-                "apiId": "Rainmaker",
-                "authToken": self.auth_token,
-                "userInfo": user_info_copy,
-                "msgId": f"{int(time.time() * 1000)}|en_IN"
-            },
-            "Boundary": {
-                "tenantId": tenant,
-                "hierarchyType": hierarchy_type,
-                "limit": 100,
-                "offset": 0
-            }
-        }
-
-        headers = {'Content-Type': 'application/json'}
-
-        try:
-            print(f"📥 Fetching boundaries from boundary service for tenant: {tenant}")
-            response = self._request_with_retry(url, json=payload, headers=headers)
-            response.raise_for_status()
-            data = response.json()
-
-            # Extract boundaries from response
-            # API returns: {"TenantBoundary": [{"hierarchyType": "...", "boundary": [...]}]}
-            tenant_boundaries = data.get('TenantBoundary', [])
-
-            boundaries = []
-            for tb in tenant_boundaries:
-                boundary_list = tb.get('boundary', {}).get('children', [])
-                for boundary in boundary_list:
-                    boundaries.append({
-                        'code': boundary.get('code', ''),
-                        'name': boundary.get('name', ''),
-                        'boundaryType': boundary.get('boundaryType', 'City'),
-                        'label': boundary.get('label', ''),
-                        'latitude': boundary.get('latitude'),
-                        'longitude': boundary.get('longitude')
-                    })
-
-            print(f"   ✅ Found {len(boundaries)} boundarie(s)")
+        print(f"📥 Fetching boundaries from boundary service for tenant: {tenant}")
+        index = self.boundary_index(tenant, hierarchy_type)
+
+        boundaries = []
+        for code in index:
+            node = index.get(code)
+            boundaries.append({
+                'code': code,
+                'name': code,
+                'boundaryType': node['boundaryType'] or 'City',
+                'parent': node['parent'],
+                'depth': node['depth']
+            })
 
-            # If no boundaries found, return default
-            if not boundaries:
-                boundaries = [{"code": tenant.split('.')[0], "name": tenant.split('.')[0], "boundaryType": "City"}]
+        print(f"   ✅ Found {len(boundaries)} boundarie(s)")
 
-            return boundaries
+        # If no boundaries found, return default
+        if not boundaries:
+            boundaries = [{"code": tenant.split('.')[0], "name": tenant.split('.')[0], "boundaryType": "City"}]
 
-        except Exception as e:
-            print(f"   ⚠️  Could not fetch boundaries: {str(e)[:200]}")
-            # Return default boundary
-            return [{"code": tenant.split('.')[0], "name": tenant.split('.')[0], "boundaryType": "City"}]
+        return boundaries
 
     def fetch_gender_types(self, tenant: str) -> list:
         """Fetch Gender types from MDMS
@@ -3605,7 +4595,7 @@ class APIUploader:
         dv_hierarchy.add(f'J2:J1000')
 
         # Boundary Type dropdown (Column K)
-        boundary_types = ','.join(list(set([b.get('boundaryType', 'City') for b in boundaries])))
+        boundary_types = ','.join(dict.fromkeys(b.get('boundaryType', 'City') for b in boundaries))
         dv_boundary_type = DataValidation(type="list", formula1=f'"{boundary_types}"', allow_blank=True)
         ws.add_data_validation(dv_boundary_type)
         dv_boundary_type.add(f'K2:K1000')
@@ -3805,6 +4795,22 @@ class APIUploader:
 
         return output_path
 
+    def _ensure_employee_roles(self, tenant: str):
+        """Pre-check shared by the employee uploaders; returns an error message or None"""
+        # STEP 1: Ensure all required roles exist in MDMS before creating employees
+        print(f"\n{'='*60}")
+        print(f"🔐 PRE-CHECK: Validating Roles in MDMS")
+        print(f"{'='*60}")
+
+        roles_ok = self.ensure_roles_in_mdms(tenant=tenant, auto_create=True)
+
+        if not roles_ok:
+            error_msg = "⚠️  Cannot proceed: Some required roles are missing from MDMS and could not be created."
+            print(f"\n{error_msg}")
+            print(f"   Please ensure roles are created in MDMS before creating employees.")
+            return error_msg
+        return None
+
     def create_employees(self, employee_list: List[Dict], tenant: str,
                         sheet_name: str = None, excel_file: str = None):
         """Bulk create employees via HRMS API with password update support
@@ -3818,17 +4824,8 @@ class APIUploader:
         Returns:
             Dict with creation results
         """
-        # STEP 1: Ensure all required roles exist in MDMS before creating employees
-        print(f"\n{'='*60}")
-        print(f"🔐 PRE-CHECK: Validating Roles in MDMS")
-        print(f"{'='*60}")
-
-        roles_ok = self.ensure_roles_in_mdms(tenant=tenant, auto_create=True)
-
-        if not roles_ok:
-            error_msg = "⚠️  Cannot proceed: Some required roles are missing from MDMS and could not be created."
-            print(f"\n{error_msg}")
-            print(f"   Please ensure roles are created in MDMS before creating employees.")
+        error_msg = self._ensure_employee_roles(tenant)
+        if error_msg:
             return {
                 'created': 0,
                 'exists': 0,
@@ -3856,157 +4853,134 @@ class APIUploader:
 
         # Track row-by-row status for Excel update
         row_statuses = []
+        self._task("hrms.employees", len(employee_list))
 
         for i, employee in enumerate(employee_list, 1):
-            emp_code = employee.get('code', str(i))
+            outcome = self._create_employee_record(employee, tenant, f"{i}/{len(employee_list)}")
 
-            # Extract custom password before creation (if provided)
-            # HRMS _create generates a random password and ignores the passed value,
-            # so we always need to reset it via the user service afterwards.
-            custom_password = employee.get('user', {}).get('password') or 'eGov@123'
+            if outcome['auth_failed']:
+                results['failed'] = len(employee_list)
+                results['errors'].append({'error': 'Authorization failed (401) - endpoint not in whitelist'})
+                return results
 
-            # Override userInfo tenantId to match the request tenant
-            user_info_copy = self.user_info.copy()
-            user_info_copy['tenantId'] = tenant
+            self._tally_employee_outcome(results, outcome)
 
-            payload = {
-                "RequestInfo": {
-                    "apiId": "Rainmaker",
-                    "ver": "1.0",
-                    "action": "_create",
-                    "msgId": f"{int(time.time() * 1000)}",
-                    "authToken": self.auth_token,
-                    "userInfo": user_info_copy
-                },
-                "Employees": [employee]
-            }
+            # Store status for this row
+            row_statuses.append({
+                'row_index': i,
+                'status': outcome['status'],
+                'status_code': outcome['status_code'],
+                'error_message': outcome['error_message']
+            })
 
-            headers = {'Content-Type': 'application/json'}
-            status = "SUCCESS"
-            status_code = 200
-            error_message = ""
+            time.sleep(0.2)
 
-            try:
-                # STEP 2A: Create employee (system generates random password)
-                response = self._request_with_retry(create_url, json=payload, headers=headers)
-                status_code = response.status_code
-                response.raise_for_status()
+        self._finish_employee_upload(results, row_statuses, sheet_name, excel_file)
+        return results
 
-                created_data = response.json()
-                created_employee = created_data.get('Employees', [{}])[0]
+    def create_employees_streaming(self, employees, tenant: str, sheet_name: str = None,
+                                   excel_file: str = None, workers: int = 4,
+                                   queue_size: int = 100):
+        """Create employees from a lazy (row_index, employee) stream
 
-                print(f"   [OK] [{i}/{len(employee_list)}] {emp_code} - Created")
-                results['created'] += 1
+        Payloads are pulled from the generator (see UnifiedExcelReader.iter_employees)
+        into a bounded queue and created by a pool of worker threads, so HRMS
+        calls overlap with reading the sheet and only queue_size payloads are
+        held at a time.
 
-                # STEP 2B: Reset password via user service
-                # HRMS _create generates a random password, so we always
-                # search for the user by UUID and update via user service.
-                if created_employee:
-                    try:
-                        user_uuid = created_employee.get('user', {}).get('uuid')
-                        if not user_uuid:
-                            user_uuid = created_employee.get('uuid')
-
-                        if user_uuid:
-                            # Search user via user service by UUID
-                            user_search_url = f"{self.auth_url}/_search"
-                            user_search_payload = {
-                                "RequestInfo": {
-                                    "apiId": "Rainmaker",
-                                    "authToken": self.auth_token,
-                                    "userInfo": user_info_copy,
-                                    "msgId": f"{int(time.time() * 1000)}|en_IN"
-                                },
-                                "uuid": [user_uuid],
-                                "tenantId": tenant
-                            }
+        Args:
+            employees: Iterable of (row_index, employee) tuples
+            tenant: Tenant ID
+            sheet_name: Excel sheet name to update with status
+            excel_file: Path to the uploaded Excel file
+            workers: Number of concurrent HRMS upload threads
+            queue_size: Maximum parsed payloads waiting for a worker
 
-                            user_search_resp = self._request_with_retry(
-                                user_search_url, json=user_search_payload, headers=headers)
-                            user_search_resp.raise_for_status()
-                            user_data = user_search_resp.json()
-                            users = user_data.get('user', [])
-
-                            if users:
-                                # Update password via user service _updatenovalidate
-                                user_obj = users[0]
-                                user_obj['password'] = custom_password
-                                user_update_url = f"{self.auth_url}/users/_updatenovalidate"
-                                user_update_payload = {
-                                    "RequestInfo": {
-                                        "apiId": "Rainmaker",
-                                        "authToken": self.auth_token,
-                                        "userInfo": user_info_copy,
-                                        "msgId": f"{int(time.time() * 1000)}|en_IN"
-                                    },
-                                    "User": user_obj
-                                }
-
-                                user_update_resp = self._request_with_retry(
-                                    user_update_url, json=user_update_payload, headers=headers)
-                                user_update_resp.raise_for_status()
-
-                                print(f"   [✓] [{i}/{len(employee_list)}] {emp_code} - Password set via user service")
-                                results['password_updated'] += 1
-                            else:
-                                print(f"   [⚠] [{i}/{len(employee_list)}] {emp_code} - User not found by UUID for password update")
-                        else:
-                            print(f"   [⚠] [{i}/{len(employee_list)}] {emp_code} - No user UUID in HRMS response for password update")
-
-                    except Exception as pwd_error:
-                        # Don't fail the entire creation if password update fails
-                        print(f"   [⚠] [{i}/{len(employee_list)}] {emp_code} - Password update failed: {str(pwd_error)[:100]}")
-                        # Status remains SUCCESS since employee was created
-
-            except requests.exceptions.HTTPError as e:
-                status_code = e.response.status_code if hasattr(e, 'response') and e.response is not None else 500
-                error_text = e.response.text if hasattr(e, 'response') and e.response is not None else str(e)
-
-                # Extract clean error message from API response
-                error_message = self._extract_error_message(error_text) if error_text else str(e)[:200]
-
-                # Fail fast on auth errors
-                if status_code == 401:
-                    print(f"\n   ❌ AUTHORIZATION FAILED - Cannot create employees")
-                    print(f"   The endpoint /egov-hrms/employees/_create requires authentication.")
-                    print(f"   Ask admin to add it to EGOV_OPEN_ENDPOINTS_WHITELIST.")
-                    results['failed'] = len(employee_list)
-                    results['errors'].append({'error': 'Authorization failed (401) - endpoint not in whitelist'})
-                    return results
-
-                # Check for duplicate/already exists
-                if ('already exists' in error_text.lower() or
-                    'duplicate' in error_text.lower() or
-                    'user_username_unique_key' in error_text.lower() or
-                    'eg_user_username_key' in error_text.lower()):
-                    print(f"   [EXISTS] [{i}/{len(employee_list)}] {emp_code} (HTTP {status_code})")
-                    results['exists'] += 1
-                    status = "EXISTS"
-                else:
-                    print(f"   [FAILED] [{i}/{len(employee_list)}] {emp_code} (HTTP {status_code})")
-                    print(f"   ERROR: {error_message}")
-                    results['failed'] += 1
-                    results['errors'].append({'id': emp_code, 'error': error_message})
-                    status = "FAILED"
+        Returns:
+            Dict with creation results (same keys and counts as create_employees:
+            every row is failed when the role pre-check or authorization fails)
+        """
+        import threading
 
-            except Exception as e:
-                error_message = str(e)[:200]
-                status_code = 0
-                status = "FAILED"
-                print(f"   [ERROR] [{i}/{len(employee_list)}] {emp_code} - {error_message[:100]}")
-                results['failed'] += 1
-                results['errors'].append({'id': emp_code, 'error': error_message})
+        rows = iter(employees)
+        results = {
+            'created': 0,
+            'exists': 0,
+            'failed': 0,
+            'errors': [],
+            'password_updated': 0
+        }
 
-            # Store status for this row
-            row_statuses.append({
-                'row_index': i,
-                'status': status,
-                'status_code': status_code,
-                'error_message': error_message
-            })
+        error_msg = self._ensure_employee_roles(tenant)
+        if error_msg:
+            results['failed'] = sum(1 for _ in rows)
+            results['errors'].append(error_msg)
+            return results
 
-            time.sleep(0.2)
+        print(f"\n{'='*60}")
+        print(f"[UPLOADING] HRMS Employees (streaming)")
+        print(f"   Tenant: {tenant}")
+        print(f"   Workers: {workers}, queue size: {queue_size}")
+        print(f"   API URL: {self.hrms_url}/employees/_create")
+        print("="*60)
 
+        row_statuses = []
+        lock = threading.Lock()
+        read = 0
+        auth_failed = threading.Event()
+        self._task("hrms.employees")
+
+        def counted():
+            nonlocal read
+            for item in rows:
+                read += 1
+                yield item
+
+        def upload(item):
+            row_index, employee = item
+            outcome = self._create_employee_record(employee, tenant, f"row {row_index}")
+
+            with lock:
+                if outcome['auth_failed']:
+                    if not auth_failed.is_set():
+                        auth_failed.set()
+                        results['errors'].append({'error': 'Authorization failed (401) - endpoint not in whitelist'})
+                    return False
+                self._tally_employee_outcome(results, outcome)
+                row_statuses.append({
+                    'row_index': row_index,
+                    'status': outcome['status'],
+                    'status_code': outcome['status_code'],
+                    'error_message': outcome['error_message']
+                })
+
+        run_pipeline(counted(), upload, workers=workers, queue_size=queue_size)
+
+        if auth_failed.is_set():
+            # Like create_employees: every row of the sheet counts as failed
+            results['failed'] = read + sum(1 for _ in rows)
+            return results
+
+        row_statuses.sort(key=lambda r: r['row_index'])
+        self._finish_employee_upload(results, row_statuses, sheet_name, excel_file)
+        return results
+
+    @staticmethod
+    def _tally_employee_outcome(results: Dict, outcome: Dict):
+        """Fold one _create_employee_record outcome into the running results"""
+        if outcome['status'] == "SUCCESS":
+            results['created'] += 1
+        elif outcome['status'] == "EXISTS":
+            results['exists'] += 1
+        else:
+            results['failed'] += 1
+            results['errors'].append({'id': outcome['code'], 'error': outcome['error_message']})
+        if outcome['password_updated']:
+            results['password_updated'] += 1
+
+    def _finish_employee_upload(self, results: Dict, row_statuses: List[Dict],
+                                sheet_name: str = None, excel_file: str = None):
+        """Print the employee summary and write status columns back to the sheet"""
         # Summary
         print("="*60)
         print(f"[SUMMARY] Created: {results['created']}")
@@ -4024,7 +4998,195 @@ class APIUploader:
                 schema_code='hrms.employees'
             )
 
-        return results
+    def _jurisdiction_warning(self, employee: Dict) -> str:
+        """Why an employee's jurisdiction boundary looks wrong, or '' if it does not
+
+        Checked against boundary_index(). A boundary equal to the tenant code,
+        or to its state part (how the employee templates and
+        _employee_from_row's default fill it), is accepted, and a tree that
+        is empty or could not be fetched is not checked. HRMS has the final say.
+        """
+        for jurisdiction in employee.get('jurisdictions') or []:
+            boundary = jurisdiction.get('boundary')
+            hierarchy = jurisdiction.get('hierarchy') or 'ADMIN'
+            tenant = jurisdiction.get('tenantId') or employee.get('tenantId')
+            if not boundary or not tenant or boundary.lower() in (tenant.lower(), tenant.split('.')[0].lower()):
+                continue
+            index = self.boundary_index(tenant, hierarchy)
+            if len(index) and boundary not in index:
+                return f"Boundary {boundary} is not in the {hierarchy} hierarchy of {tenant}"
+        return ''
+
+    def _create_employee_record(self, employee: Dict, tenant: str, label: str) -> Dict:
+        """Create one employee via HRMS and reset its password
+
+        Args:
+            employee: HRMS employee object
+            tenant: Tenant ID
+            label: Progress label used in log lines (e.g. "3/20")
+
+        Returns:
+            Dict with code, status (SUCCESS/EXISTS/FAILED), status_code,
+            error_message, password_updated and auth_failed
+        """
+        create_url = f"{self.hrms_url}/employees/_create"
+        emp_code = employee.get('code', label)
+
+        # Extract custom password before creation (if provided)
+        # HRMS _create generates a random password and ignores the passed value,
+        # so we always need to reset it via the user service afterwards.
+        custom_password = employee.get('user', {}).get('password') or 'eGov@123'
+
+        # Override userInfo tenantId to match the request tenant
+        user_info_copy = self.user_info.copy()
+        user_info_copy['tenantId'] = tenant
+
+        payload = {
+            "RequestInfo": {
+                "apiId": "Rainmaker",
+                "ver": "1.0",
+                "action": "_create",
+                "msgId": f"{int(time.time() * 1000)}",
+                "authToken": self.auth_token,
+                "userInfo": user_info_copy
+            },
+            "Employees": [employee]
+        }
+
+        headers = {'Content-Type': 'application/json'}
+        outcome = {
+            'code': emp_code,
+            'status': "SUCCESS",
+            'status_code': 200,
+            'error_message': "",
+            'password_updated': False,
+            'auth_failed': False
+        }
+
+        # Flag a jurisdiction outside the cached boundary tree; HRMS decides
+        jurisdiction_warning = self._jurisdiction_warning(employee)
+        if jurisdiction_warning:
+            print(f"   ⚠️  [{label}] {emp_code}: {jurisdiction_warning}")
+
+        try:
+            # STEP 2A: Create employee (system generates random password)
+            response = self._request_with_retry(create_url, json=payload, headers=headers)
+            outcome['status_code'] = response.status_code
+            response.raise_for_status()
+
+            created_data = response.json()
+            created_employee = created_data.get('Employees', [{}])[0]
+
+            self._row("SUCCESS", emp_code, f"   [OK] [{label}] {emp_code} - Created")
+
+            # STEP 2B: Reset password via user service
+            # HRMS _create generates a random password, so we always
+            # search for the user by UUID and update via user service.
+            if created_employee:
+                try:
+                    user_uuid = created_employee.get('user', {}).get('uuid')
+                    if not user_uuid:
+                        user_uuid = created_employee.get('uuid')
+
+                    if user_uuid:
+                        # Search user via user service by UUID
+                        user_search_url = f"{self.auth_url}/_search"
+                        user_search_payload = {
+                            "RequestInfo": {
+                                "apiId": "Rainmaker",
+                                "authToken": self.auth_token,
+                                "userInfo": user_info_copy,
+                                "msgId": f"{int(time.time() * 1000)}|en_IN"
+                            },
+                            "uuid": [user_uuid],
+                            "tenantId": tenant
+                        }
+
+                        user_search_resp = self._request_with_retry(
+                            user_search_url, json=user_search_payload, headers=headers)
+                        user_search_resp.raise_for_status()
+                        user_data = user_search_resp.json()
+                        users = user_data.get('user', [])
+
+                        if users:
+                            # Update password via user service _updatenovalidate
+                            user_obj = users[0]
+                            user_obj['password'] = custom_password
+                            user_update_url = f"{self.auth_url}/users/_updatenovalidate"
+                            user_update_payload = {
+                                "RequestInfo": {
+                                    "apiId": "Rainmaker",
+                                    "authToken": self.auth_token,
+                                    "userInfo": user_info_copy,
+                                    "msgId": f"{int(time.time() * 1000)}|en_IN"
+                                },
+                                "User": user_obj
+                            }
+
+                            user_update_resp = self._request_with_retry(
+                                user_update_url, json=user_update_payload, headers=headers)
+                            user_update_resp.raise_for_status()
+
+                            self._row("SUCCESS", emp_code, f"   [✓] [{label}] {emp_code} - Password set via user service",
+                                      advance=False)
+                            outcome['password_updated'] = True
+                        else:
+                            self._row("SUCCESS", emp_code,
+                                      f"   [⚠] [{label}] {emp_code} - User not found by UUID for password update",
+                                      advance=False)
+                    else:
+                        self._row("SUCCESS", emp_code,
+                                  f"   [⚠] [{label}] {emp_code} - No user UUID in HRMS response for password update",
+                                  advance=False)
+
+                except Exception as pwd_error:
+                    # Don't fail the entire creation if password update fails
+                    self._row("SUCCESS", emp_code,
+                              f"   [⚠] [{label}] {emp_code} - Password update failed: {str(pwd_error)[:100]}",
+                              error=str(pwd_error), advance=False)
+                    # Status remains SUCCESS since employee was created
+
+        except requests.exceptions.HTTPError as e:
+            status_code = e.response.status_code if hasattr(e, 'response') and e.response is not None else 500
+            error_text = e.response.text if hasattr(e, 'response') and e.response is not None else str(e)
+            outcome['status_code'] = status_code
+
+            # Extract clean error message from API response
+            error_message = self._extract_error_message(error_text) if error_text else str(e)[:200]
+
+            # Fail fast on auth errors
+            if status_code == 401:
+                print(f"\n   ❌ AUTHORIZATION FAILED - Cannot create employees")
+                print(f"   The endpoint /egov-hrms/employees/_create requires authentication.")
+                print(f"   Ask admin to add it to EGOV_OPEN_ENDPOINTS_WHITELIST.")
+                outcome['status'] = "FAILED"
+                outcome['error_message'] = error_message
+                outcome['auth_failed'] = True
+                return outcome
+
+            # Check for duplicate/already exists
+            if ('already exists' in error_text.lower() or
+                'duplicate' in error_text.lower() or
+                'user_username_unique_key' in error_text.lower() or
+                'eg_user_username_key' in error_text.lower()):
+                self._row("EXISTS", emp_code, f"   [EXISTS] [{label}] {emp_code} (HTTP {status_code})")
+                outcome['status'] = "EXISTS"
+            else:
+                self._row("FAILED", emp_code,
+                          f"   [FAILED] [{label}] {emp_code} (HTTP {status_code})\n"
+                          f"   ERROR: {error_message}", error=error_message)
+                outcome['status'] = "FAILED"
+                outcome['error_message'] = error_message
+
+        except Exception as e:
+            error_message = str(e)[:200]
+            self._row("FAILED", emp_code, f"   [ERROR] [{label}] {emp_code} - {error_message[:100]}",
+                      error=error_message)
+            outcome['status'] = "FAILED"
+            outcome['status_code'] = 0
+            outcome['error_message'] = error_message
+
+        return outcome
 
     # =========================================================================
     # WORKFLOW SERVICE METHODS
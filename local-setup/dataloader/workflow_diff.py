@@ -0,0 +1,153 @@
+"""
+Workflow diff - compare BusinessService configs by content
+
+The workflow service returns a business service with server-side fields
+(uuids, auditDetails, tenantId) and with action nextState/currentState as
+state uuids, while the JSON templates use state names. canonical_workflow()
+reduces either form to the same structure:
+
+    {businessService, business, businessServiceSla, ...,
+     states: [{state, applicationStatus, ..., actions: [{action, nextState, roles, ...}]}]}
+
+with server fields and nulls dropped, nextState as a state name, states
+sorted by name, actions by (action, nextState) and roles sorted. Two configs
+with the same workflow_hash() need no update.
+
+diff_workflows() reports which top-level fields and states differ, and
+update_payload() builds the _update request body from only those states
+(plus the states their actions lead to, so nextState names resolve).
+
+The service cannot remove states through _update; removed states are
+reported but not sent.
+"""
+
+import hashlib
+import json
+import os
+import threading
+from typing import Dict
+
+# Fields the service assigns or derives; never part of the comparison
+SERVER_FIELDS = frozenset({
+    'uuid', 'id', 'tenantId', 'auditDetails', 'businessServiceId', 'currentState',
+})
+
+
+def _state_names(business_service: Dict) -> Dict:
+    """State uuid -> state name, for configs returned by the service"""
+    return {s['uuid']: s.get('state') for s in business_service.get('states', []) or [] if s.get('uuid')}
+
+
+def _strip(obj: Dict, skip=()) -> Dict:
+    return {k: v for k, v in obj.items() if v is not None and k not in SERVER_FIELDS and k not in skip}
+
+
+def _canonical_state(state: Dict, names: Dict) -> Dict:
+    actions = []
+    for action in state.get('actions', []) or []:
+        canonical = _strip(action)
+        if 'nextState' in canonical:
+            canonical['nextState'] = names.get(canonical['nextState'], canonical['nextState'])
+        if isinstance(canonical.get('roles'), list):
+            canonical['roles'] = sorted(canonical['roles'])
+        actions.append(canonical)
+    canonical = _strip(state, skip=('actions',))
+    canonical['actions'] = sorted(actions, key=lambda a: (str(a.get('action')), str(a.get('nextState'))))
+    return canonical
+
+
+def _state_key(state: Dict):
+    # The start state is usually unnamed (state: null)
+    return state.get('state') or ''
+
+
+def canonical_workflow(business_service: Dict) -> Dict:
+    """Server-independent form of a business service (see module docstring)"""
+    names = _state_names(business_service)
+    canonical = _strip(business_service, skip=('states',))
+    states = [_canonical_state(s, names) for s in business_service.get('states', []) or []]
+    canonical['states'] = sorted(states, key=_state_key)
+    return canonical
+
+
+def workflow_hash(business_service: Dict) -> str:
+    """SHA-256 of the canonical form"""
+    data = json.dumps(canonical_workflow(business_service), sort_keys=True, separators=(',', ':'))
+    return hashlib.sha256(data.encode('utf-8')).hexdigest()
+
+
+def diff_workflows(existing: Dict, new: Dict) -> Dict:
+    """What changes between the deployed business service and a new config
+
+    Returns:
+        dict: {changed: bool, fields: [top-level field names],
+               added: [state], changed_states: [state], removed: [state]}
+               (the start state is reported as '')
+    """
+    old_canonical = canonical_workflow(existing)
+    new_canonical = canonical_workflow(new)
+    old_states = {_state_key(s): s for s in old_canonical.pop('states')}
+    new_states = {_state_key(s): s for s in new_canonical.pop('states')}
+
+    fields = sorted(k for k in set(old_canonical) | set(new_canonical)
+                    if old_canonical.get(k) != new_canonical.get(k))
+    added = [k for k in new_states if k not in old_states]
+    changed_states = [k for k in new_states if k in old_states and new_states[k] != old_states[k]]
+    removed = [k for k in old_states if k not in new_states]
+    return {
+        'changed': bool(fields or added or changed_states),
+        'fields': fields,
+        'added': added,
+        'changed_states': changed_states,
+        'removed': removed,
+    }
+
+
+def update_payload(new: Dict, diff: Dict) -> Dict:
+    """new with only the added/changed states and the states they lead to"""
+    sent = set(diff['added']) | set(diff['changed_states'])
+    wanted = set(sent)
+    states = new.get('states', []) or []
+    for state in states:
+        if _state_key(state) in sent:
+            wanted.update(a.get('nextState') or '' for a in state.get('actions', []) or [])
+
+    payload = {k: v for k, v in new.items() if k != 'states'}
+    payload['states'] = [s for s in states if _state_key(s) in wanted]
+    return payload
+
+
+def instantiate(template, tenant: str):
+    """Deep copy of a parsed template with {tenantid} replaced in every string"""
+    if isinstance(template, dict):
+        return {k: instantiate(v, tenant) for k, v in template.items()}
+    if isinstance(template, list):
+        return [instantiate(v, tenant) for v in template]
+    if isinstance(template, str) and '{tenantid}' in template:
+        return template.replace('{tenantid}', tenant)
+    return template
+
+
+_templates = {}
+_templates_lock = threading.Lock()
+
+
+def load_workflow_template(json_path: str) -> Dict:
+    """First BusinessService of a workflow JSON, parsed once per file version
+
+    The returned dict is shared; instantiate() it before changing anything.
+
+    Raises:
+        OSError, ValueError: Unreadable file, invalid JSON or no BusinessServices
+    """
+    stat = os.stat(json_path)
+    key = (os.path.abspath(json_path), stat.st_mtime_ns, stat.st_size)
+    with _templates_lock:
+        if key not in _templates:
+            with open(json_path, 'r') as f:
+                data = json.load(f)
+            business_services = data.get('BusinessServices', [])
+            if not business_services:
+                raise ValueError("No BusinessServices found in JSON")
+            _templates[key] = business_services[0]
+        return _templates[key]
@@ -0,0 +1,434 @@
+#!/usr/bin/env python3
+"""
+Dataloader scale benchmark - times each CRSLoader phase against a fake gateway.
+
+Generates onboarding workbooks at a configurable scale (with the writers in
+generate-sample-from-xlsx.py), starts the in-process FakeGateway from
+dataloader/fake_gateway.py, and runs each phase in its own Python process so
+peak RSS is per phase:
+
+  tenant -> boundaries -> common_masters -> employees -> localizations -> workflow
+
+For every phase it records records/sec, peak RSS and HTTP calls per record,
+writes them to a JSON file, and optionally compares them with a stored
+baseline (like performance/results/baseline does for the k6 runs). Run files
+land in performance/results/<timestamp>_local_dataloader_<scale>/, which git
+ignores; only the baseline is committed.
+
+Usage:
+  python3 bench-dataloader.py                          # smoke scale (1%)
+  python3 bench-dataloader.py --scale full             # 10k employees, 100k boundaries, ...
+  python3 bench-dataloader.py --phases boundaries,employees --stream --workers 8
+  python3 bench-dataloader.py --baseline ../../performance/results/baseline/dataloader-smoke.json
+  python3 bench-dataloader.py --update-baseline        # re-record the baseline for this scale
+
+Full scale is 10,000 employees, a 100,000-node boundary tree, 50,000
+localization messages and 5,000 complaint sub-types. read_localization()
+files every message under en_IN, so messages are generated for that locale
+only. Timings depend on the machine, so record the baseline on the machine
+that runs the comparison.
+
+Exit status is 1 if any phase regressed by more than --tolerance against the
+baseline, failed more records than the baseline did, or failed outright.
+"""
+
+import argparse
+import importlib.util
+import json
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+DATALOADER_DIR = os.path.join(SCRIPT_DIR, "..", "dataloader")
+TEMPLATES_DIR = os.path.join(DATALOADER_DIR, "templates")
+REPO_ROOT = os.path.abspath(os.path.join(SCRIPT_DIR, "..", ".."))
+RESULTS_DIR = os.path.join(REPO_ROOT, "performance", "results")
+BASELINE_DIR = os.path.join(RESULTS_DIR, "baseline")
+sys.path.insert(0, DATALOADER_DIR)
+
+PHASES = ["tenant", "boundaries", "common_masters", "employees", "localizations", "workflow"]
+
+FULL_SCALE = {
+    "employees": 10000,
+    "boundaries": 100000,
+    "messages": 50000,
+    "complaint_types": 5000,
+}
+SCALES = {"smoke": 0.01, "ci": 0.1, "full": 1.0}
+
+ROOT_TENANT = "pg"
+TARGET_TENANT = "pg.bench"
+USERNAME = "ADMIN"
+PASSWORD = "eGov@123"
+
+DEPARTMENTS = [f"Department {i:02d}" for i in range(1, 11)]
+SUBCOUNTIES_PER_COUNTY = 20
+WARDS_PER_SUBCOUNTY = 50
+RESULT_MARKER = "BENCH_RESULT "
+
+
+def _load_generators():
+    """Import generate-sample-from-xlsx.py (hyphenated, so not importable by name)"""
+    path = os.path.join(SCRIPT_DIR, "generate-sample-from-xlsx.py")
+    spec = importlib.util.spec_from_file_location("generate_sample_from_xlsx", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+# ============================================================================
+# WORKBOOK GENERATION
+# ============================================================================
+
+def boundary_rows(total_nodes: int):
+    """County/SubCounty/Ward rows whose tree has about total_nodes nodes"""
+    rows = []
+    nodes = 0
+    county = 0
+    while nodes < total_nodes:
+        county += 1
+        nodes += 1
+        for sc in range(1, SUBCOUNTIES_PER_COUNTY + 1):
+            if nodes >= total_nodes:
+                break
+            nodes += 1
+            for w in range(1, WARDS_PER_SUBCOUNTY + 1):
+                if nodes >= total_nodes:
+                    break
+                nodes += 1
+                rows.append({
+                    "county": f"County {county:03d}",
+                    "subcounty": f"SubCounty {county:03d} {sc:02d}",
+                    "ward": f"Ward {county:03d} {sc:02d} {w:02d}",
+                    "lat": None,
+                    "lon": None,
+                })
+    return rows
+
+
+def complaint_rows(count: int):
+    """Revised-sheet rows: count sub-types, 25 per complaint type"""
+    return [{
+        "complaint_type": f"Complaint Type {i // 25:04d}",
+        "sub_type": f"Complaint Sub Type {i:05d}",
+        "department": DEPARTMENTS[(i // 25) % len(DEPARTMENTS)],
+        "sla_raw": "24-72 hrs",
+        "keywords": f"bench, type {i // 25}, sub type {i}",
+    } for i in range(count)]
+
+
+def localization_rows(count: int):
+    for i in range(count):
+        yield (f"BENCH_MSG_{i:06d}", f"Benchmark message {i}", "rainmaker-common", "en_IN")
+
+
+def generate_workbooks(work_dir: str, counts: dict) -> dict:
+    """Write the phase inputs into work_dir; reused while the counts match
+
+    Returns:
+        dict: phase -> {'path': input file, 'records': records the phase uploads}
+    """
+    manifest_path = os.path.join(work_dir, "manifest.json")
+    if os.path.exists(manifest_path):
+        with open(manifest_path) as f:
+            manifest = json.load(f)
+        if manifest.get("counts") == counts:
+            print(f"Reusing workbooks in {work_dir}")
+            return manifest["inputs"]
+
+    os.makedirs(work_dir, exist_ok=True)
+    gen = _load_generators()
+    print(f"Generating workbooks in {work_dir}")
+
+    tenant_path = os.path.join(work_dir, "Tenant And Branding Master.xlsx")
+    shutil.copyfile(os.path.join(TEMPLATES_DIR, "Tenant And Branding Master.xlsx"), tenant_path)
+
+    bnd_rows = boundary_rows(counts["boundaries"])
+    boundary_path = os.path.join(work_dir, "Boundary_Master.xlsx")
+    gen.generate_boundary_xlsx(bnd_rows, boundary_path)
+    boundary_nodes = (len({r["county"] for r in bnd_rows})
+                      + len({r["subcounty"] for r in bnd_rows}) + len(bnd_rows))
+
+    ct_rows = complaint_rows(counts["complaint_types"])
+    common_path = os.path.join(work_dir, "Common and Complaint Master.xlsx")
+    gen.generate_common_master_xlsx(ct_rows, {}, common_path)
+    departments = {r["department"] for r in ct_rows} or set(DEPARTMENTS[:1])
+
+    employee_path = os.path.join(work_dir, "Employee_Master.xlsx")
+    gen.generate_employee_xlsx(departments, TARGET_TENANT, employee_path, count=counts["employees"])
+
+    localization_path = os.path.join(work_dir, "localization.xlsx")
+    gen.generate_localization_xlsx(localization_rows(counts["messages"]), localization_path)
+
+    inputs = {
+        "tenant": {"path": tenant_path, "records": 1},
+        "boundaries": {"path": boundary_path, "records": boundary_nodes},
+        "common_masters": {"path": common_path,
+                           "records": len(departments) + 5 + len(ct_rows)},
+        "employees": {"path": employee_path, "records": max(counts["employees"], 3)},
+        "localizations": {"path": localization_path, "records": counts["messages"]},
+        "workflow": {"path": os.path.join(TEMPLATES_DIR, "PgrWorkflowConfig.json"), "records": 1},
+    }
+    with open(manifest_path, "w") as f:
+        json.dump({"counts": counts, "inputs": inputs}, f, indent=2)
+    return inputs
+
+
+# ============================================================================
+# PHASE RUNNER (child process)
+# ============================================================================
+
+def _peak_rss_mb() -> float:
+    # Linux keeps ru_maxrss across fork+exec, so a phase process would report
+    # the driver's peak (pandas, generated workbooks); VmHWM starts at exec
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    import resource
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS bytes
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def _failed_count(result) -> int:
+    """Sum every 'failed' counter in a phase result"""
+    if isinstance(result, dict):
+        total = result.get("failed", 0) if isinstance(result.get("failed"), int) else 0
+        return total + sum(_failed_count(v) for v in result.values() if isinstance(v, dict))
+    return 0
+
+
+def run_phase(phase: str, gateway_url: str, input_path: str, stream: bool, workers: int):
+    """Run one loader phase and print its timing as a RESULT_MARKER line"""
+    from crs_loader import CRSLoader
+
+    loader = CRSLoader(gateway_url)
+    if not loader.login(USERNAME, PASSWORD, tenant_id=ROOT_TENANT):
+        sys.exit("login against the fake gateway failed")
+
+    calls = {
+        "tenant": lambda: loader.load_tenant(input_path, target_tenant=TARGET_TENANT),
+        "boundaries": lambda: loader.load_boundaries(input_path, target_tenant=TARGET_TENANT,
+                                                     stream=stream, workers=workers),
+        "common_masters": lambda: loader.load_common_masters(input_path, target_tenant=TARGET_TENANT),
+        "employees": lambda: loader.load_employees(input_path, target_tenant=TARGET_TENANT,
+                                                   stream=stream, workers=workers),
+        "localizations": lambda: loader.load_localizations(input_path, target_tenant=TARGET_TENANT),
+        "workflow": lambda: loader.load_workflow(input_path, target_tenant=TARGET_TENANT),
+    }
+
+    start = time.perf_counter()
+    result = calls[phase]()
+    elapsed = time.perf_counter() - start
+
+    status = result.get("status") if isinstance(result, dict) else None
+    print(RESULT_MARKER + json.dumps({
+        "seconds": elapsed,
+        "peak_rss_mb": _peak_rss_mb(),
+        "failed": _failed_count(result) + (1 if status == "failed" else 0),
+    }))
+
+
+# ============================================================================
+# BENCHMARK DRIVER
+# ============================================================================
+
+def run_benchmark(inputs: dict, phases: list, latency: float, stream: bool, workers: int,
+                  verbose: bool = False) -> dict:
+    """Run phases in order against one FakeGateway; returns per-phase metrics"""
+    from fake_gateway import FakeGateway
+    from unified_loader import APIUploader
+
+    env = dict(os.environ, TELEMETRY="false")
+    results = {}
+
+    with FakeGateway(default_latency=latency) as gateway:
+        # A real environment already has the access-control roles
+        roles = APIUploader._get_default_roles(None)
+        for tenant in (ROOT_TENANT, TARGET_TENANT):
+            gateway.seed_mdms(tenant, "ACCESSCONTROL-ROLES.roles", roles)
+
+        for phase in phases:
+            gateway.reset_stats()
+            print(f"\n▶ {phase} ({inputs[phase]['records']} records)")
+            proc = subprocess.run(
+                [sys.executable, os.path.abspath(__file__), "--run-phase", phase,
+                 "--gateway", gateway.url, "--input", inputs[phase]["path"],
+                 "--workers", str(workers)] + (["--stream"] if stream else []),
+                capture_output=True, text=True, env=env,
+            )
+            if verbose:
+                print(proc.stdout)
+            marker = [l for l in proc.stdout.splitlines() if l.startswith(RESULT_MARKER)]
+            if proc.returncode != 0 or not marker:
+                print(proc.stdout[-2000:])
+                print(proc.stderr[-2000:], file=sys.stderr)
+                results[phase] = {"records": inputs[phase]["records"], "error": f"exit {proc.returncode}"}
+                print(f"   ❌ {phase} did not complete")
+                continue
+
+            child = json.loads(marker[-1][len(RESULT_MARKER):])
+            stats = gateway.stats()
+            # Every phase process logs in once; that call is not per-record work
+            http_calls = sum(s["calls"] for route, s in stats.items() if route != "user/oauth")
+            records = inputs[phase]["records"]
+            results[phase] = {
+                "records": records,
+                "seconds": round(child["seconds"], 3),
+                "records_per_sec": round(records / child["seconds"], 2) if child["seconds"] else None,
+                "peak_rss_mb": round(child["peak_rss_mb"], 1),
+                "http_calls": http_calls,
+                "http_calls_per_record": round(http_calls / records, 3),
+                "http_errors": sum(s["errors"] for s in stats.values()),
+                "bytes_sent": sum(s["bytes_in"] for s in stats.values()),
+                "failed_records": child["failed"],
+                "calls_by_route": {route: s["calls"] for route, s in sorted(stats.items())},
+            }
+            r = results[phase]
+            print(f"   {r['seconds']:.2f}s  {r['records_per_sec']} rec/s  "
+                  f"{r['peak_rss_mb']} MB  {r['http_calls_per_record']} calls/rec")
+    return results
+
+
+def compare_with_baseline(results: dict, baseline: dict, tolerance: float) -> list:
+    """Regressions beyond tolerance, as printable strings"""
+    regressions = []
+    print(f"\n{'phase':<16}{'rec/s':>12}{'base':>12}{'RSS MB':>10}{'base':>8}{'calls/rec':>11}{'base':>8}")
+    for phase, base in baseline.get("phases", {}).items():
+        cur = results.get(phase)
+        if not cur or "error" in base:
+            continue
+        if "error" in cur:
+            regressions.append(f"{phase}: did not complete")
+            continue
+        print(f"{phase:<16}{cur['records_per_sec']:>12}{base['records_per_sec']:>12}"
+              f"{cur['peak_rss_mb']:>10}{base['peak_rss_mb']:>8}"
+              f"{cur['http_calls_per_record']:>11}{base['http_calls_per_record']:>8}")
+        if cur["records"] != base["records"]:
+            print(f"   ⚠️  {phase}: {cur['records']} records vs {base['records']} in baseline")
+        if cur["records_per_sec"] < base["records_per_sec"] * (1 - tolerance):
+            regressions.append(f"{phase}: {cur['records_per_sec']} rec/s vs {base['records_per_sec']} baseline")
+        if cur["peak_rss_mb"] > base["peak_rss_mb"] * (1 + tolerance):
+            regressions.append(f"{phase}: peak RSS {cur['peak_rss_mb']} MB vs {base['peak_rss_mb']} MB baseline")
+        if cur["http_calls_per_record"] > base["http_calls_per_record"] * (1 + tolerance):
+            regressions.append(f"{phase}: {cur['http_calls_per_record']} calls/record vs "
+                               f"{base['http_calls_per_record']} baseline")
+        # Failing records make a phase look cheaper, so any increase counts
+        if cur.get("failed_records", 0) > base.get("failed_records", 0):
+            regressions.append(f"{phase}: {cur['failed_records']} failed records vs "
+                               f"{base.get('failed_records', 0)} baseline")
+    return regressions
+
+
+def resolve_counts(args) -> dict:
+    factor = SCALES.get(args.scale)
+    if factor is None:
+        try:
+            factor = float(args.scale)
+        except ValueError:
+            sys.exit(f"--scale must be one of {', '.join(SCALES)} or a number")
+    counts = {key: max(1, int(value * factor)) for key, value in FULL_SCALE.items()}
+    for key in FULL_SCALE:
+        override = getattr(args, key)
+        if override is not None:
+            counts[key] = override
+    return counts
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--scale", default="smoke",
+                    help=f"{', '.join(f'{k} ({v:g})' for k, v in SCALES.items())} or a fraction of full scale")
+    ap.add_argument("--employees", type=int, help="override the employee count")
+    ap.add_argument("--boundaries", type=int, help="override the boundary node count")
+    ap.add_argument("--messages", type=int, help="override the localization message count")
+    ap.add_argument("--complaint-types", dest="complaint_types", type=int,
+                    help="override the complaint sub-type count")
+    ap.add_argument("--phases", default=",".join(PHASES), help="comma-separated phases to run")
+    ap.add_argument("--latency", type=float, default=0.002, help="fake gateway latency per call (seconds)")
+    ap.add_argument("--stream", action="store_true", help="use the streaming boundary/employee loaders")
+    ap.add_argument("--workers", type=int, default=4, help="upload threads in streaming mode")
+    ap.add_argument("--work-dir", help="where workbooks are generated (reused across runs if counts match)")
+    ap.add_argument("--output", help="results JSON path (default: performance/results/<ts>_local_dataloader_<scale>/)")
+    ap.add_argument("--baseline", help="baseline JSON to compare against")
+    ap.add_argument("--tolerance", type=float, default=0.3, help="allowed regression fraction (default 0.3)")
+    ap.add_argument("--update-baseline", action="store_true",
+                    help="write results to performance/results/baseline/dataloader-<scale>.json")
+    ap.add_argument("--note", help="free-text note stored with the results (e.g. the machine used)")
+    ap.add_argument("--verbose", action="store_true", help="show loader output")
+    # Internal: run a single phase in this process
+    ap.add_argument("--run-phase", help=argparse.SUPPRESS)
+    ap.add_argument("--gateway", help=argparse.SUPPRESS)
+    ap.add_argument("--input", help=argparse.SUPPRESS)
+    args = ap.parse_args()
+
+    if args.run_phase:
+        run_phase(args.run_phase, args.gateway, args.input, args.stream, args.workers)
+        return 0
+
+    phases = [p.strip() for p in args.phases.split(",") if p.strip()]
+    unknown = set(phases) - set(PHASES)
+    if unknown:
+        sys.exit(f"Unknown phase(s): {', '.join(sorted(unknown))}. Choose from {', '.join(PHASES)}")
+    phases = [p for p in PHASES if p in phases]
+
+    counts = resolve_counts(args)
+    work_dir = args.work_dir or tempfile.mkdtemp(prefix="crs-bench-")
+    print(f"Scale: {args.scale}  {counts}")
+    inputs = generate_workbooks(work_dir, counts)
+
+    phase_results = run_benchmark(inputs, phases, args.latency, args.stream, args.workers, args.verbose)
+
+    results = {
+        "benchmark": "dataloader",
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "scale": args.scale,
+        "counts": counts,
+        "gateway_latency": args.latency,
+        "stream": args.stream,
+        "workers": args.workers,
+        "machine": {"python": platform.python_version(), "platform": platform.platform(),
+                    "cpus": os.cpu_count()},
+        "note": args.note,
+        "phases": phase_results,
+    }
+
+    output = args.output
+    if args.update_baseline:
+        output = os.path.join(BASELINE_DIR, f"dataloader-{args.scale}.json")
+    elif not output:
+        stamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+        output = os.path.join(RESULTS_DIR, f"{stamp}_local_dataloader_{args.scale}", "dataloader.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, "w") as f:
+        json.dump(results, f, indent=2)
+    print(f"\nResults: {output}")
+
+    if not args.work_dir:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    failed = [p for p, r in phase_results.items() if "error" in r]
+    regressions = []
+    if args.baseline:
+        with open(args.baseline) as f:
+            regressions = compare_with_baseline(phase_results, json.load(f), args.tolerance)
+        for line in regressions:
+            print(f"   ❌ {line}")
+        if not regressions:
+            print(f"   ✅ Within {args.tolerance:.0%} of baseline")
+
+    return 1 if failed or regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -25,6 +25,8 @@ Environment variables:
   ROOT_TENANT      - Root tenant for login (default: pg)
   BOOT_TENANT      - Cross-root tenant to create (default: ke.bomet)
   INPUT_XLSX       - Path to county input XLSX (default: county-data.xlsx)
+  PAYLOAD_BUNDLE_DIR - If set, cache compiled template payloads here and replay
+                       them instead of re-reading the generated XLSX on every run
 """
 
 import os
@@ -49,6 +51,7 @@ PASSWORD = os.environ.get("DIGIT_PASSWORD", "eGov@123")
 ROOT_TENANT = os.environ.get("ROOT_TENANT", "pg")
 BOOT_TENANT = os.environ.get("BOOT_TENANT", "ke.bomet")
 INPUT_XLSX = os.environ.get("INPUT_XLSX", "county-data.xlsx")
+BUNDLE_DIR = os.environ.get("PAYLOAD_BUNDLE_DIR")
 
 BOOT_ROOT = BOOT_TENANT.split(".")[0]
 REQUEST_TIMEOUT = 30
@@ -581,7 +584,14 @@ def main():
     for target in [BOOT_ROOT, BOOT_TENANT]:
         print(f"\n   Loading to: {target}")
         try:
-            results = loader.load_common_masters(masters_xlsx, target_tenant=target)
+            if BUNDLE_DIR:
+                # Templates are regenerated each run, so key the cache on the input XLSX
+                from payload_bundle import file_sha256
+                results = loader.load_via_bundle("common_masters", masters_xlsx,
+                                                 target_tenant=target, bundle_dir=BUNDLE_DIR,
+                                                 source_hash=file_sha256(INPUT_XLSX))
+            else:
+                results = loader.load_common_masters(masters_xlsx, target_tenant=target)
             ct_result = results.get("complaint_types", {})
             if isinstance(ct_result, dict):
                 created = ct_result.get("created", 0)
@@ -18,6 +18,8 @@ Environment variables:
   DIGIT_PASSWORD   - Password (default: eGov@123)
   ROOT_TENANT      - Root tenant for login (default: pg)
   TARGET_TENANT    - Tenant to create and load data into (default: pg.citest)
+  PAYLOAD_BUNDLE_DIR - If set, cache compiled template payloads here and replay
+                       them instead of re-reading the XLSX on every run
 """
 
 import os
@@ -39,6 +41,7 @@ PASSWORD = os.environ.get("DIGIT_PASSWORD", "eGov@123")
 ROOT_TENANT = os.environ.get("ROOT_TENANT", "pg")
 TARGET_TENANT = os.environ.get("TARGET_TENANT", "pg.citest")
 TEMPLATES_DIR = os.path.join(DATALOADER_DIR, "templates")
+BUNDLE_DIR = os.environ.get("PAYLOAD_BUNDLE_DIR")
 
 # CI test user credentials (used by Postman collection)
 CI_USER = "CI-ADMIN"
@@ -135,7 +138,11 @@ def main():
     if not os.path.exists(common_file):
         print(f"FATAL: {common_file} not found")
         return 1
-    loader.load_common_masters(common_file, target_tenant=TARGET_TENANT)
+    if BUNDLE_DIR:
+        loader.load_via_bundle("common_masters", common_file,
+                               target_tenant=TARGET_TENANT, bundle_dir=BUNDLE_DIR)
+    else:
+        loader.load_common_masters(common_file, target_tenant=TARGET_TENANT)
 
     # Step 4: Look up a leaf complaint type and ensure its department exists at city level
     print("\n[4/6] Look up complaint type department")
@@ -234,8 +234,13 @@ def generate_boundary_xlsx(boundary_rows, output_path):
     print(f"  Created: {output_path} ({total} boundaries)")
 
 
-def generate_employee_xlsx(departments, tenant_code, output_path):
-    """Generate Employee_Master.xlsx with sample employees."""
+def generate_employee_xlsx(departments, tenant_code, output_path, count: int = 3):
+    """Generate Employee_Master.xlsx with sample employees.
+
+    The first three rows are the fixed GRO/LME/ADMIN accounts; any rows past
+    that (count > 3) are synthetic field workers spread over the departments,
+    for scale runs.
+    """
     wb = openpyxl.Workbook()
 
     # Instructions sheet
@@ -286,6 +291,18 @@ def generate_employee_xlsx(departments, tenant_code, output_path):
         "2024-01-01", "2024-01-01",
     ])
 
+    # Synthetic employees for scale runs
+    dept_names = sorted(departments) or [dept]
+    for i in range(1, count - 2):
+        ws_emp.append([
+            f"BENCH_EMP_{i:05d}", str(9200000000 + i), "eGov@123",
+            dept_names[i % len(dept_names)], "Field Worker",
+            "EMPLOYEE,PGR_LME",
+            "EMPLOYED", "PERMANENT", "FEMALE" if i % 2 else "MALE",
+            "ADMIN", "City", tenant_code,
+            "2024-01-01", "2024-01-01",
+        ])
+
     # Ref sheets for dropdowns
     ws_ref_dept = wb.create_sheet("Ref_Departments")
     ws_ref_dept.append(["Department Code", "Department Name"])
@@ -313,7 +330,23 @@ def generate_employee_xlsx(departments, tenant_code, output_path):
     ws_ref_bnd.append([tenant_code, "City"])
 
     wb.save(output_path)
-    print(f"  Created: {output_path} (3 employees)")
+    print(f"  Created: {output_path} ({max(count, 3)} employees)")
+
+
+def generate_localization_xlsx(messages, output_path):
+    """Generate a localization.xlsx that CRSLoader.load_localizations() reads.
+
+    messages: iterable of (code, message, module, locale) tuples
+    """
+    wb = openpyxl.Workbook(write_only=True)
+    ws = wb.create_sheet("Localization")
+    ws.append(["Code", "Message", "Module", "Locale"])
+    total = 0
+    for row in messages:
+        ws.append(list(row))
+        total += 1
+    wb.save(output_path)
+    print(f"  Created: {output_path} ({total} messages)")
 
 
 def main():
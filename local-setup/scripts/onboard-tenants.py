@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Onboard many tenants in parallel from a manifest (see dataloader/multi_tenant.py).
+
+    python3 scripts/onboard-tenants.py tenants.json --workers 6
+    python3 scripts/onboard-tenants.py tenants.json --concurrency egov-hrms=2,default=8
+
+Each tenant's phases run in order; tenants run concurrently within the
+per-service request budget. Logs and workbook copies go to the work dir,
+next to report.json. Exits 1 if any tenant failed or had failed records.
+
+Environment variables:
+  DIGIT_URL        - Kong gateway URL (default: http://localhost:18000)
+  DIGIT_USERNAME   - Superuser username (default: ADMIN)
+  DIGIT_PASSWORD   - Password (default: eGov@123)
+  ROOT_TENANT      - Root tenant for login (default: pg)
+"""
+
+import argparse
+import os
+import sys
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+DATALOADER_DIR = os.path.join(SCRIPT_DIR, "..", "dataloader")
+sys.path.insert(0, DATALOADER_DIR)
+
+from crs_loader import CRSLoader
+from multi_tenant import MultiTenantLoader, load_manifest
+
+BASE_URL = os.environ.get("DIGIT_URL", "http://localhost:18000")
+USERNAME = os.environ.get("DIGIT_USERNAME", "ADMIN")
+PASSWORD = os.environ.get("DIGIT_PASSWORD", "eGov@123")
+ROOT_TENANT = os.environ.get("ROOT_TENANT", "pg")
+
+
+def parse_concurrency(text):
+    """"egov-hrms=2,default=8" -> {"egov-hrms": 2, "default": 8}"""
+    budget = {}
+    for part in filter(None, (p.strip() for p in (text or "").split(","))):
+        service, _, limit = part.partition("=")
+        budget[service] = int(limit)
+    return budget
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("manifest", help="JSON manifest of tenants and workbooks")
+    ap.add_argument("--workers", type=int, default=4, help="tenants processed at once (default 4)")
+    ap.add_argument("--concurrency", help="per-service request budget, e.g. egov-hrms=2,default=8 "
+                                          "(the manifest's 'concurrency' wins)")
+    ap.add_argument("--work-dir", help="workbook copies, logs and report.json "
+                                       "(default: ./multi-tenant-<timestamp>)")
+    ap.add_argument("--progress", default="quiet",
+                    help="per-tenant progress sinks written to each tenant's log (default: quiet)")
+    args = ap.parse_args()
+
+    loader = CRSLoader(BASE_URL)
+    if not loader.login(username=USERNAME, password=PASSWORD, tenant_id=ROOT_TENANT):
+        print("FATAL: login failed")
+        sys.exit(1)
+
+    orchestrator = MultiTenantLoader(loader, workers=args.workers,
+                                     concurrency=parse_concurrency(args.concurrency),
+                                     work_dir=args.work_dir, progress=args.progress)
+    report = orchestrator.run(load_manifest(args.manifest))
+
+    clean = report["summary"]["errors"] == 0 and report["summary"]["failed"] == 0
+    sys.exit(0 if clean else 1)
+
+
+if __name__ == "__main__":
+    main()
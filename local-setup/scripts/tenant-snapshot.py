@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Clone a tenant's configuration through a snapshot file.
+
+    python3 scripts/tenant-snapshot.py export pg.citya --localizations --boundaries
+    python3 scripts/tenant-snapshot.py import pg.citya.snapshot.ndjson.gz ke.nairobi
+
+export streams the tenant's schemas and MDMS records (optionally localization
+messages and boundaries) into a gzip NDJSON snapshot; import replays it into
+another tenant, skipping whatever the target already has.
+
+Environment variables:
+  DIGIT_URL        - Kong gateway URL (default: http://localhost:18000)
+  DIGIT_USERNAME   - Superuser username (default: ADMIN)
+  DIGIT_PASSWORD   - Password (default: eGov@123)
+  ROOT_TENANT      - Root tenant for login (default: pg)
+"""
+
+import argparse
+import os
+import sys
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+DATALOADER_DIR = os.path.join(SCRIPT_DIR, "..", "dataloader")
+sys.path.insert(0, DATALOADER_DIR)
+
+from crs_loader import CRSLoader
+
+BASE_URL = os.environ.get("DIGIT_URL", "http://localhost:18000")
+USERNAME = os.environ.get("DIGIT_USERNAME", "ADMIN")
+PASSWORD = os.environ.get("DIGIT_PASSWORD", "eGov@123")
+ROOT_TENANT = os.environ.get("ROOT_TENANT", "pg")
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    sub = ap.add_subparsers(dest="command", required=True)
+
+    exp = sub.add_parser("export", help="write a tenant snapshot")
+    exp.add_argument("tenant")
+    exp.add_argument("-o", "--output", help="snapshot path (default: ./<tenant>.snapshot.ndjson.gz)")
+    exp.add_argument("--localizations", action="store_true", help="include localization messages")
+    exp.add_argument("--locales", default="en_IN", help="comma-separated locales (default: en_IN)")
+    exp.add_argument("--boundaries", action="store_true", help="include boundary hierarchies and trees")
+
+    imp = sub.add_parser("import", help="replay a snapshot into a tenant")
+    imp.add_argument("snapshot")
+    imp.add_argument("target_tenant", nargs="?", help="default: the exported tenant")
+    imp.add_argument("--workers", type=int, default=8, help="concurrent writes (default 8)")
+    args = ap.parse_args()
+
+    loader = CRSLoader(BASE_URL)
+    if not loader.login(username=USERNAME, password=PASSWORD, tenant_id=ROOT_TENANT):
+        print("FATAL: login failed")
+        sys.exit(1)
+
+    if args.command == "export":
+        loader.export_tenant_snapshot(args.tenant, args.output, localizations=args.localizations,
+                                      locales=tuple(args.locales.split(",")), boundaries=args.boundaries)
+        return
+
+    results = loader.import_tenant_snapshot(args.snapshot, args.target_tenant, workers=args.workers)
+    failed = sum(r.get("failed", 0) for r in results.values() if isinstance(r, dict))
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+import io
+import os
+import subprocess
+import sys
+import unittest
+from contextlib import redirect_stdout
+from unittest import mock
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DATALOADER_DIR = os.path.join(REPO_ROOT, "dataloader")
+sys.path.insert(0, DATALOADER_DIR)
+
+from crs_loader import CRSLoader
+from fake_gateway import FakeGateway
+
+# One state, three districts, 200 wards each: more than one boundary/_search page
+SPECS = [("S1", "State", None)] + [(f"D{d}", "District", "S1") for d in range(3)] + \
+        [(f"D{d}_W{w}", "Ward", f"D{d}") for d in range(3) for w in range(200)]
+
+
+class BoundaryDeleteTests(unittest.TestCase):
+    def setUp(self):
+        self.gateway = FakeGateway()
+        self.gateway.start()
+        self.loader = CRSLoader(self.gateway.url, progress="quiet")
+        with redirect_stdout(io.StringIO()):
+            self.loader.login("ADMIN", "eGov@123", tenant_id="pg")
+            uploader = self.loader.uploader
+            uploader.create_boundary_hierarchy({
+                "tenantId": "pg.citya", "hierarchyType": "ADMIN",
+                "boundaryHierarchy": [{"boundaryType": "State", "parentBoundaryType": None},
+                                      {"boundaryType": "District", "parentBoundaryType": "State"},
+                                      {"boundaryType": "Ward", "parentBoundaryType": "District"}]})
+            uploader.create_boundaries_from_specs("pg.citya", "ADMIN", SPECS, workers=8)
+            # An entity that never got a relationship
+            uploader.create_boundaries_from_specs("pg.citya", "ADMIN", [("LOOSE", "Ward", None)])
+            self.gateway.relationships[("pg.citya", "ADMIN")].pop("LOOSE")
+
+    def tearDown(self):
+        self.gateway.stop()
+
+    def test_every_page_is_deleted_children_before_parents(self):
+        with redirect_stdout(io.StringIO()):
+            result = self.loader.delete_boundaries("pg.citya", bulk_threshold=1000, workers=8)
+
+        self.assertEqual(result["status"], "success")
+        self.assertEqual(result["method"], "api")
+        self.assertEqual(result["deleted"], len(SPECS) + 1)
+        self.assertEqual(result["tables"], {"boundary": len(SPECS) + 1})
+        self.assertFalse([key for key in self.gateway.boundaries if key[0] == "pg.citya"])
+        with redirect_stdout(io.StringIO()):
+            self.assertEqual(len(self.loader.uploader.search_boundary_hierarchies("pg.citya")), 1)
+
+        order = {code: i for i, code in enumerate(self.gateway.boundary_deletes)}
+        for code, _, parent in SPECS:
+            if parent:
+                self.assertLess(order[code], order[parent])
+
+    def test_large_tenants_use_the_bulk_sql_path(self):
+        calls = []
+        self.loader._delete_boundaries_bulk = lambda plan: calls.append(plan) or {
+            "status": "success", "method": "db", "deleted": len(plan["boundary_codes"])}
+
+        with redirect_stdout(io.StringIO()):
+            result = self.loader.delete_boundaries("pg.citya", bulk_threshold=100)
+
+        self.assertEqual(result["method"], "db")
+        self.assertEqual(len(calls[0]["boundary_codes"]), len(SPECS) + 1)
+        self.assertEqual(calls[0]["hierarchy_types"], ["ADMIN"])
+        self.assertFalse(calls[0]["include_hierarchies"])
+        self.assertNotIn("boundary/_delete", self.gateway.stats())
+
+    def test_hierarchies_are_only_deleted_when_asked(self):
+        with redirect_stdout(io.StringIO()):
+            result = self.loader.delete_boundaries("pg.citya", bulk_threshold=1000, include_hierarchies=True)
+            remaining = self.loader.uploader.search_boundary_hierarchies("pg.citya")
+
+        self.assertEqual(result["status"], "success")
+        self.assertEqual(result["tables"], {"boundary": len(SPECS) + 1, "boundary_hierarchy": 1})
+        self.assertFalse(remaining)
+
+    def test_bulk_sql_goes_to_psql_on_stdin(self):
+        plan = {"tenant": "pg.citya", "hierarchy_types": ["ADMIN"], "include_hierarchies": False,
+                "boundary_codes": [f"PG_CITYA_WARD_{i:06d}" for i in range(10000)]}
+        runs = []
+
+        def run(command, **kwargs):
+            runs.append((command, kwargs.get("input")))
+            if command[:3] == ["kubectl", "get", "secret"]:
+                return subprocess.CompletedProcess(command, 0, "c2VjcmV0", "")
+            if "psql" in command:
+                return subprocess.CompletedProcess(command, 0, "DELETE 10000\nDELETE 10000\n", "")
+            return subprocess.CompletedProcess(command, 0, "", "")
+
+        with mock.patch("subprocess.run", side_effect=run), redirect_stdout(io.StringIO()):
+            result = self.loader._delete_boundaries_via_db(plan)
+
+        command, sql = runs[-1]
+        self.assertEqual(result["tables"], {"boundary_relationship": 10000, "boundary": 10000})
+        self.assertLess(max(len(arg) for arg in command), 1024)
+        self.assertEqual(command[-2:], ["-f", "-"])
+        self.assertIn("'PG_CITYA_WARD_009999'", sql)
+        self.assertNotIn("boundary_hierarchy", sql)
+
+        with mock.patch("subprocess.run", side_effect=lambda command, **kwargs: (
+                run(command) if "psql" not in command else (_ for _ in ()).throw(OSError(7, "E2BIG")))), \
+                redirect_stdout(io.StringIO()):
+            failed = self.loader._delete_boundaries_via_db(plan)
+        self.assertEqual(failed["status"], "failed")
+
+
+if __name__ == "__main__":
+    unittest.main()
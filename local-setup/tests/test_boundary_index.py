@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+import io
+import os
+import copy
+import sys
+import threading
+import unittest
+from contextlib import redirect_stdout
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DATALOADER_DIR = os.path.join(REPO_ROOT, "dataloader")
+sys.path.insert(0, DATALOADER_DIR)
+
+from boundary_index import BoundaryIndex
+from fake_gateway import FakeGateway
+from unified_loader import APIUploader, UnifiedExcelReader
+
+EMPLOYEE_TEMPLATE = os.path.join(DATALOADER_DIR, "templates", "Employee_Master_Dynamic_statea.xlsx")
+
+# Two states, each with districts and wards
+SPECS = [("S1", "State", None), ("D1", "District", "S1"), ("W1", "Ward", "D1"), ("W2", "Ward", "D1"),
+         ("D2", "District", "S1"), ("W3", "Ward", "D2"),
+         ("S2", "State", None), ("D3", "District", "S2")]
+
+
+def _tree(specs):
+    nodes = {code: {"code": code, "boundaryType": btype, "children": []} for code, btype, _ in specs}
+    roots = []
+    for code, _, parent in specs:
+        (nodes[parent]["children"] if parent else roots).append(nodes[code])
+    return roots
+
+
+class BoundaryIndexTests(unittest.TestCase):
+    def test_index_answers_tree_questions_from_memory(self):
+        index = BoundaryIndex("pg", "ADMIN", _tree(SPECS))
+
+        self.assertEqual(list(index), ["S1", "D1", "W1", "W2", "D2", "W3", "S2", "D3"])
+        self.assertEqual(index.roots, ["S1", "S2"])
+        self.assertEqual(index.parent("W3"), "D2")
+        self.assertEqual(index.depth("W3"), 2)
+        self.assertEqual(index.path("W3"), ("S1", "D2", "W3"))
+        self.assertEqual(index.ancestors("W3"), ("D2", "S1"))
+        self.assertEqual(index.subtree_size("S1"), 6)
+        self.assertEqual(index.descendants("D1"), ["W1", "W2"])
+        self.assertEqual(index.children("S1"), ["D1", "D2"])
+        self.assertTrue(index.is_within("W2", "S1"))
+        self.assertFalse(index.is_within("W2", "D2"))
+        self.assertFalse(index.is_within("W2", "UNKNOWN"))
+        self.assertEqual(index.codes_of_type("Ward"), ["W1", "W2", "W3"])
+        self.assertEqual(index.boundary_types(), ["State", "District", "Ward"])
+
+
+class BoundaryIndexGatewayTests(unittest.TestCase):
+    def setUp(self):
+        self.gateway = FakeGateway()
+        self.gateway.start()
+        with redirect_stdout(io.StringIO()):
+            self.uploader = APIUploader(self.gateway.url, "ADMIN", "eGov@123", tenant_id="pg",
+                                        token_cache=False)
+            roots = [(f"R{i}", "State", None) for i in range(12)]
+            self.uploader.create_boundaries_from_specs("pg", "ADMIN", roots + SPECS, workers=1)
+
+    def tearDown(self):
+        self.gateway.stop()
+
+    def test_full_tree_is_paged_and_fetched_once(self):
+        self.gateway.reset_stats()
+        with redirect_stdout(io.StringIO()):
+            boundaries = self.uploader.fetch_boundaries("pg")
+            self.uploader.fetch_boundaries("pg")
+
+        self.assertEqual(len(boundaries), 20)
+        self.assertEqual([b["code"] for b in boundaries if b["depth"] == 2], ["W1", "W2", "W3"])
+        # default page of 100 roots; the fake's own default limit is 10
+        self.assertEqual(self.gateway.stats()["boundary-relationships/_search"]["calls"], 1)
+
+        with redirect_stdout(io.StringIO()):
+            roots = self.uploader.search_boundary_tree("pg", "ADMIN", page_size=5)
+        self.assertEqual(len(roots), 14)
+        self.assertEqual(self.gateway.stats()["boundary-relationships/_search"]["calls"], 4)
+
+    def test_concurrent_workers_and_forks_fetch_the_tree_once(self):
+        self.gateway.configure("boundary-relationships/_search", latency=0.1)
+        self.gateway.reset_stats()
+        forks = [copy.copy(self.uploader) for _ in range(3)]
+        indexes = []
+
+        def lookup(uploader):
+            indexes.append(uploader.boundary_index("pg", "ADMIN"))
+
+        threads = [threading.Thread(target=lookup, args=(u,)) for u in forks + [self.uploader] * 5]
+        with redirect_stdout(io.StringIO()):
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+
+        self.assertEqual(len(indexes), 8)
+        self.assertTrue(all(index is indexes[0] for index in indexes))
+        self.assertEqual(len(indexes[0]), 20)
+        self.assertEqual(self.gateway.stats()["boundary-relationships/_search"]["calls"], 1)
+
+    def test_existing_boundaries_skip_the_service_and_unknown_jurisdictions_only_warn(self):
+        self.gateway.reset_stats()
+        with redirect_stdout(io.StringIO()):
+            result = self.uploader.create_boundaries_from_specs(
+                "pg", "ADMIN", SPECS + [("W4", "Ward", "D3")], workers=2,
+                existing=self.uploader.boundary_index("pg", "ADMIN"))
+            outcome = self.uploader._create_employee_record(
+                {"code": "EMP1", "tenantId": "pg",
+                 "jurisdictions": [{"hierarchy": "ADMIN", "boundary": "NOWHERE", "tenantId": "pg"}]},
+                "pg", "1/1")
+
+        self.assertEqual(result["boundaries_existing"], 8)
+        self.assertEqual(result["relationships_created"], 1)
+        stats = self.gateway.stats()
+        self.assertEqual(stats["boundary/_create"]["calls"], 1)
+        self.assertEqual(outcome["status"], "SUCCESS")
+        self.assertEqual(stats["hrms/_create"]["calls"], 1)
+        self.assertIn("W4", self.uploader.boundary_index("pg", "ADMIN"))
+
+    def test_template_jurisdiction_on_the_tenant_code_is_accepted(self):
+        # The shipped template puts the tenant itself ("statea") in Boundary Code
+        with redirect_stdout(io.StringIO()):
+            self.uploader.create_boundaries_from_specs("statea", "ADMIN4", SPECS, workers=1)
+            employee = UnifiedExcelReader(EMPLOYEE_TEMPLATE).read_employees_bulk("statea", self.uploader)[0]
+            log = io.StringIO()
+            with redirect_stdout(log):
+                outcome = self.uploader._create_employee_record(employee, "statea", "1/1")
+
+        self.assertEqual(employee["jurisdictions"][0]["boundary"], "statea")
+        self.assertEqual(employee["jurisdictions"][0]["hierarchy"], "ADMIN4")
+        self.assertEqual(outcome["status"], "SUCCESS")
+        self.assertNotIn("is not in the", log.getvalue())
+
+
+if __name__ == "__main__":
+    unittest.main()
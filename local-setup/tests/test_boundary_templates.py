@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+import io
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from unittest import mock
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DATALOADER_DIR = os.path.join(REPO_ROOT, "dataloader")
+sys.path.insert(0, DATALOADER_DIR)
+
+from crs_loader import CRSLoader
+from fake_gateway import FakeGateway
+from unified_loader import APIUploader
+
+
+class BoundaryTemplateTests(unittest.TestCase):
+    def setUp(self):
+        self.gateway = FakeGateway(template_polls=3)
+        self.gateway.start()
+        self.tmp_dir = tempfile.mkdtemp()
+        self.loader = CRSLoader(self.gateway.url, progress="quiet")
+        with redirect_stdout(io.StringIO()):
+            self.loader.login("ADMIN", "eGov@123", tenant_id="pg")
+        patcher = mock.patch.object(APIUploader, "TEMPLATE_POLL_BASE", 0.02)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        self.gateway.stop()
+        shutil.rmtree(self.tmp_dir)
+
+    def test_templates_are_generated_and_downloaded_together(self):
+        hierarchies = {"ADMIN": ["State", "District", "Ward"],
+                       "REVENUE": ["State", "Zone"],
+                       "ELECTION": ["State", "Constituency"]}
+
+        with redirect_stdout(io.StringIO()):
+            paths = self.loader.load_hierarchies(hierarchies, "pg.citya", output_dir=self.tmp_dir)
+
+        self.assertEqual(set(paths), set(hierarchies))
+        for name, path in paths.items():
+            self.assertEqual(path, os.path.join(self.tmp_dir, f"Boundary_Template_pg.citya_{name}.xlsx"))
+            self.assertTrue(os.path.exists(path))
+        stats = self.gateway.stats()
+        self.assertEqual(stats["boundary-management/_generate-search"]["calls"], 9)
+        self.assertEqual(stats["filestore/file"]["calls"], 3)
+
+    def test_finished_jobs_are_reported_while_others_time_out(self):
+        uploader = self.loader.uploader
+        with redirect_stdout(io.StringIO()):
+            self.loader.load_hierarchy("ADMIN", ["State", "Ward"], "pg", output_dir=self.tmp_dir)
+            uploader.generate_boundary_template("pg", "ADMIN")
+            uploader.generate_boundary_template("pg", "MISSING")
+            completed = []
+            results = uploader.wait_for_boundary_templates(
+                [("pg", "MISSING"), ("pg", "ADMIN"), ("pg", "NEVER_GENERATED")],
+                on_complete=lambda job, resource: completed.append(job), timeout=1)
+
+        self.assertEqual(completed, [("pg", "MISSING"), ("pg", "ADMIN")])
+        self.assertEqual(results[("pg", "MISSING")]["status"], "failed")
+        self.assertEqual(results[("pg", "ADMIN")]["status"], "completed")
+        self.assertEqual(results[("pg", "NEVER_GENERATED")], {})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+import io
+import os
+import sys
+import unittest
+from contextlib import redirect_stdout
+from unittest import mock
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DATALOADER_DIR = os.path.join(REPO_ROOT, "dataloader")
+sys.path.insert(0, DATALOADER_DIR)
+
+from circuit_breaker import CircuitBreakers, ServiceUnavailable
+from fake_gateway import FakeGateway
+from unified_loader import APIUploader
+
+
+class CircuitBreakerTests(unittest.TestCase):
+    def setUp(self):
+        self.gateway = FakeGateway()
+        self.gateway.start()
+        self.now = 0.0
+        with redirect_stdout(io.StringIO()):
+            self.uploader = APIUploader(self.gateway.url, "ADMIN", "eGov@123", tenant_id="pg",
+                                        token_cache=False)
+        self.uploader.breakers = CircuitBreakers(failure_threshold=3, reset_timeout=10,
+                                                 clock=lambda: self.now)
+        self.hrms_url = f"{self.uploader.hrms_url}/employees/_create"
+        self.mdms_url = f"{self.uploader.mdms_url}/v2/_search"
+
+    def tearDown(self):
+        self.gateway.stop()
+
+    def _call(self, url):
+        try:
+            return self.uploader._request_with_retry(url, json={"RequestInfo": {}}).status_code
+        except ServiceUnavailable:
+            return "fast-fail"
+
+    def test_dead_service_fails_fast_then_recovers_through_a_probe(self):
+        self.gateway.configure("hrms/_create", error_rate=1.0, error_status=502)
+        with redirect_stdout(io.StringIO()):
+            outcomes = [self._call(self.hrms_url) for _ in range(10)]
+            mdms = self._call(self.mdms_url)
+
+        self.assertEqual(outcomes, [502] * 3 + ["fast-fail"] * 7)
+        self.assertEqual(self.gateway.stats()["hrms/_create"]["calls"], 3)
+        self.assertEqual(mdms, 200)
+        self.assertEqual(self.uploader.breakers.states(), {"egov-hrms": "open", "mdms-v2": "closed"})
+
+        # Still down when probed: one call, then fast failures again
+        self.now = 11
+        with redirect_stdout(io.StringIO()):
+            self.assertEqual([self._call(self.hrms_url) for _ in range(3)], [502, "fast-fail", "fast-fail"])
+        self.assertEqual(self.gateway.stats()["hrms/_create"]["calls"], 4)
+
+        self.gateway.configure("hrms/_create")
+        self.now = 22
+        with redirect_stdout(io.StringIO()):
+            self.assertEqual(self._call(self.hrms_url), 200)
+        self.assertEqual(self.uploader.breakers.states()["egov-hrms"], "closed")
+
+    def test_retried_attempts_count_as_one_failure(self):
+        self.gateway.configure("hrms/_create", error_rate=1.0, error_status=503)
+        with redirect_stdout(io.StringIO()), mock.patch("unified_loader.time.sleep"):
+            outcomes = [self._call(self.hrms_url) for _ in range(4)]
+
+        # Three attempts per request, but one failure each: open after the third request
+        self.assertEqual(outcomes, [503] * 3 + ["fast-fail"])
+        self.assertEqual(self.gateway.stats()["hrms/_create"]["calls"], 9)
+        self.assertEqual(self.uploader.breakers.states()["egov-hrms"], "open")
+
+        # A retry that succeeds counts as a success
+        self.gateway.configure("hrms/_create")
+        self.now = 11
+        with redirect_stdout(io.StringIO()):
+            self.assertEqual(self._call(self.hrms_url), 200)
+        self.assertEqual(self.uploader.breakers.states()["egov-hrms"], "closed")
+
+    def test_rows_of_an_unavailable_service_report_it(self):
+        self.gateway.configure("hrms/_create", error_rate=1.0, error_status=503)
+        self.uploader.breakers = CircuitBreakers(failure_threshold=1, clock=lambda: self.now)
+        with redirect_stdout(io.StringIO()), mock.patch("unified_loader.time.sleep"):
+            self._call(self.hrms_url)
+            outcome = self.uploader._create_employee_record(
+                {"code": "EMP1", "tenantId": "pg", "jurisdictions": []}, "pg", "1/1")
+
+        self.assertEqual(outcome["status"], "FAILED")
+        self.assertTrue(outcome["error_message"].startswith("SERVICE_UNAVAILABLE: egov-hrms"))
+        # The retried request's attempts, none for the row
+        self.assertEqual(self.gateway.stats()["hrms/_create"]["calls"], 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
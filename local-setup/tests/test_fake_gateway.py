@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+import io
+import os
+import sys
+import unittest
+from contextlib import redirect_stdout
+
+import requests
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(REPO_ROOT, "dataloader"))
+
+from fake_gateway import FakeGateway, route_for
+from unified_loader import APIUploader
+
+
+def _uploader(gateway):
+    with redirect_stdout(io.StringIO()):
+        return APIUploader(gateway.url, "ADMIN", "eGov@123", tenant_id="pg")
+
+
+class FakeGatewayTests(unittest.TestCase):
+    def setUp(self):
+        self.gateway = FakeGateway()
+        self.gateway.start()
+
+    def tearDown(self):
+        self.gateway.stop()
+
+    def test_routes_match_default_service_paths(self):
+        self.assertEqual(route_for("/mdms-v2/v2/_create/common-masters.Department"), "mdms/_create")
+        self.assertEqual(route_for("/mdms-v2/schema/v1/_search"), "mdms/schema/_search")
+        self.assertEqual(route_for("/boundary-service/boundary-relationships/_create"),
+                         "boundary-relationships/_create")
+        self.assertEqual(route_for("/egov-hrms/employees/_create"), "hrms/_create")
+        self.assertEqual(route_for("/filestore/v1/files"), "filestore/upload")
+        self.assertEqual(route_for("/localization/messages/v1/_search"), "localization/_search")
+        self.assertIsNone(route_for("/unknown/_search"))
+
+    def test_mdms_duplicates_are_reported_as_exists(self):
+        uploader = _uploader(self.gateway)
+        departments = [{"code": "DEPT_1", "name": "Health", "active": True}]
+
+        with redirect_stdout(io.StringIO()):
+            first = uploader.create_mdms_data("common-masters.Department", departments, "pg")
+            second = uploader.create_mdms_data("common-masters.Department", departments, "pg")
+
+        self.assertEqual((first["created"], first["exists"]), (1, 0))
+        self.assertEqual((second["created"], second["exists"]), (0, 1))
+        # the second pass finds the record by search and never re-posts it
+        self.assertEqual(self.gateway.stats()["mdms/_create"]["calls"], 1)
+
+    def test_injected_throttling_sends_retry_after(self):
+        self.gateway.configure("localization/_search", throttle_rate=1.0, retry_after=7)
+
+        response = requests.post(f"{self.gateway.url}/localization/messages/v1/_search",
+                                 params={"tenantId": "pg", "locale": "en_IN"}, json={})
+
+        self.assertEqual(response.status_code, 429)
+        self.assertEqual(response.headers["Retry-After"], "7")
+        self.assertEqual(self.gateway.stats()["localization/_search"]["throttled"], 1)
+
+    def test_injected_errors_are_repeatable_for_a_seed(self):
+        def failures(seed):
+            with FakeGateway(seed=seed) as gateway:
+                gateway.configure("*", error_rate=0.5, error_status=503)
+                return [requests.post(f"{gateway.url}/localization/messages/v1/_search", json={}).status_code
+                        for _ in range(20)]
+
+        self.assertEqual(failures(3), failures(3))
+        self.assertIn(503, failures(3))
+
+    def test_boundary_upload_links_children_to_existing_parents(self):
+        uploader = _uploader(self.gateway)
+        specs = [("PB", "State", None), ("AMR", "District", "PB"), ("AMR_W1", "Ward", "AMR")]
+
+        with redirect_stdout(io.StringIO()):
+            result = uploader.create_boundaries_from_specs("pg", "ADMIN", specs, workers=3)
+            again = uploader.create_boundaries_from_specs("pg", "ADMIN", specs, workers=3)
+
+        self.assertEqual(result["boundaries_created"], 3)
+        self.assertEqual(result["relationships_created"], 3)
+        # duplicate entities are answered DUPLICATE_CODE, which the uploader treats as done
+        self.assertEqual(self.gateway.stats()["boundary/_create"]["errors"], 3)
+        self.assertEqual(again["relationships_created"], 3)
+        tree = self.gateway.relationships[("pg", "ADMIN")]
+        self.assertEqual(tree["AMR_W1"]["parent"], "AMR")
+
+    def test_phantom_duplicate_mode_answers_empty_200(self):
+        self.gateway.duplicate_mode = "phantom"
+        body = {"Mdms": {"tenantId": "pg", "schemaCode": "s", "uniqueIdentifier": "X", "data": {}}}
+        url = f"{self.gateway.url}/mdms-v2/v2/_create/s"
+
+        requests.post(url, json=body)
+        response = requests.post(url, json=body)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["mdms"], [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+import io
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+
+from openpyxl import load_workbook
+from openpyxl.worksheet.datavalidation import DataValidation
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DATALOADER_DIR = os.path.join(REPO_ROOT, "dataloader")
+sys.path.insert(0, DATALOADER_DIR)
+
+import fetch_localization_preserve as flp
+from fake_gateway import FakeGateway
+
+
+class FetchLocalizationPreserveTests(unittest.TestCase):
+    def setUp(self):
+        self.gateway = FakeGateway()
+        self.gateway.start()
+        self.tmp_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmp_dir, "localization.xlsx")
+        for locale in ("en_IN", "hi_IN"):
+            self.gateway.messages[("pg", locale)] = {
+                (module, f"CODE_{i}"): {"code": f"CODE_{i}", "message": f"{locale} {i}",
+                                        "module": module, "locale": locale}
+                for module in ("rainmaker-common", "rainmaker-pgr") for i in range(30)}
+
+    def tearDown(self):
+        self.gateway.stop()
+        shutil.rmtree(self.tmp_dir)
+
+    def _export(self, locales, modules=None):
+        with redirect_stdout(io.StringIO()):
+            fetched = flp.fetch_all_messages(self.gateway.url, "pg", locales, modules=modules,
+                                             page_size=25, workers=4)
+            df = flp.pd.concat([flp.create_dataframe(fetched[l], l) for l in locales], ignore_index=True)
+            df = flp.merge_translations(df, flp.read_existing_translations(self.path, flp.SHEET_NAME))
+            flp.preserve_validations_and_save(df, self.path, flp.SHEET_NAME)
+        return fetched, df
+
+    def test_locales_and_modules_are_fetched_in_parallel_and_deduplicated(self):
+        self.gateway.reset_stats()
+        fetched, df = self._export(["en_IN", "hi_IN"], modules=["rainmaker-common", "rainmaker-pgr"])
+
+        self.assertEqual({l: len(m) for l, m in fetched.items()}, {"en_IN": 60, "hi_IN": 60})
+        # the fake ignores limit/offset: page 2 repeats page 1 and ends the fetch
+        self.assertEqual(self.gateway.stats()["localization/_search"]["calls"], 8)
+        self.assertEqual(len(df), 120)
+
+    def test_translations_and_validations_survive_a_re_export(self):
+        self._export(["hi_IN"], modules=["rainmaker-pgr"])
+        wb = load_workbook(self.path)
+        ws = wb[flp.SHEET_NAME]
+        ws["E2"] = "अनुवाद"
+        dv = DataValidation(type="list", formula1='"done,todo"')
+        dv.add("E2:E10")
+        ws.add_data_validation(dv)
+        ws["A40"] = "STALE_ROW"
+        wb.save(self.path)
+
+        _, df = self._export(["hi_IN"], modules=["rainmaker-pgr"])
+
+        ws = load_workbook(self.path)[flp.SHEET_NAME]
+        self.assertEqual(ws.max_row, 31)
+        code = ws["A2"].value
+        self.assertEqual(df.loc[df["Code"] == code, "Translation"].item(), "अनुवाद")
+        self.assertEqual(ws["E2"].value, "अनुवाद")
+        validations = ws.data_validations.dataValidation
+        self.assertEqual([str(v.sqref) for v in validations], ["E2:E31"])
+        self.assertTrue(ws["A1"].font.bold)
+
+    def test_translations_carry_over_to_another_locale(self):
+        self._export(["en_IN"], modules=["rainmaker-pgr"])
+        wb = load_workbook(self.path)
+        ws = wb[flp.SHEET_NAME]
+        code = ws["A2"].value
+        ws["E2"] = "translated"
+        wb.save(self.path)
+
+        _, df = self._export(["hi_IN"], modules=["rainmaker-pgr"])
+        self.assertEqual(df.loc[df["Code"] == code, "Translation"].item(), "translated")
+
+        # Within one sheet each locale keeps its own translation
+        existing = flp.pd.DataFrame({"Code": [code, code], "Locale": ["en_IN", "hi_IN"],
+                                     "Translation": ["english", "hindi"]})
+        both = flp.pd.DataFrame({"Code": [code, code], "Locale": ["en_IN", "hi_IN"], "Translation": ["", ""]})
+        with redirect_stdout(io.StringIO()):
+            merged = flp.merge_translations(both, existing)
+        self.assertEqual(merged["Translation"].tolist(), ["english", "hindi"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+import io
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DATALOADER_DIR = os.path.join(REPO_ROOT, "dataloader")
+sys.path.insert(0, DATALOADER_DIR)
+
+from fake_gateway import FakeGateway
+from filestore_cache import FilestoreCache, MultipartFile
+from unified_loader import APIUploader
+
+
+class FilestoreCacheTests(unittest.TestCase):
+    def setUp(self):
+        self.gateway = FakeGateway()
+        self.gateway.start()
+        self.tmp_dir = tempfile.mkdtemp()
+        self.cache = FilestoreCache(os.path.join(self.tmp_dir, "cache"))
+        self.workbook = os.path.join(self.tmp_dir, "Boundary Master.xlsx")
+        with open(self.workbook, "wb") as f:
+            f.write(os.urandom(300_000))
+        with redirect_stdout(io.StringIO()):
+            self.uploader = APIUploader(self.gateway.url, "ADMIN", "eGov@123", tenant_id="pg",
+                                        token_cache=False, filestore_cache=self.cache)
+
+    def tearDown(self):
+        self.gateway.stop()
+        shutil.rmtree(self.tmp_dir)
+
+    def upload(self, tenant="pg"):
+        with redirect_stdout(io.StringIO()):
+            return self.uploader.upload_file_to_filestore(self.workbook, tenant)
+
+    def uploads(self):
+        return self.gateway.stats().get("filestore/upload", {}).get("calls", 0)
+
+    def test_unchanged_file_reuses_its_filestore_id_per_tenant(self):
+        first = self.upload()
+        second = self.upload()
+        other_tenant = self.upload("pg.citya")
+
+        self.assertEqual(first, second)
+        self.assertNotEqual(first, other_tenant)
+        self.assertEqual(self.uploads(), 2)
+        self.assertGreater(self.gateway.stats()["filestore/upload"]["bytes_in"], 2 * 300_000)
+
+        with open(self.workbook, "ab") as f:
+            f.write(b"edited")
+        self.assertNotEqual(self.upload(), first)
+        self.assertEqual(self.uploads(), 3)
+
+    def test_id_the_filestore_no_longer_knows_is_uploaded_again(self):
+        first = self.upload()
+        self.gateway.reset_state()
+
+        second = self.upload()
+
+        self.assertNotEqual(first, second)
+        self.assertEqual(self.uploads(), 2)
+        self.assertEqual(self.upload(), second)
+
+    def test_multipart_body_reads_in_chunks_and_rewinds(self):
+        with MultipartFile(self.workbook, {"tenantId": "pg"}) as body:
+            whole = body.read()
+            body.seek(0)
+            chunks = iter(lambda: body.read(8192), b"")
+            self.assertEqual(b"".join(chunks), whole)
+
+        with open(self.workbook, "rb") as f:
+            content = f.read()
+        self.assertEqual(len(whole), len(body))
+        self.assertIn(content, whole)
+        self.assertIn(b'name="tenantId"\r\n\r\npg\r\n', whole)
+        self.assertIn(b'filename="Boundary Master.xlsx"', whole)
+        self.assertTrue(whole.endswith(body.content_type.split("boundary=")[1].encode() + b"--\r\n"))
+
+
+if __name__ == "__main__":
+    unittest.main()
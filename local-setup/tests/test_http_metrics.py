@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+import io
+import json
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DATALOADER_DIR = os.path.join(REPO_ROOT, "dataloader")
+sys.path.insert(0, DATALOADER_DIR)
+
+from crs_loader import CRSLoader
+from fake_gateway import FakeGateway
+from http_metrics import HttpMetrics, split_endpoint
+
+
+class HttpMetricsTests(unittest.TestCase):
+    def test_split_endpoint_drops_schema_code_and_host(self):
+        self.assertEqual(split_endpoint("http://gw/mdms-v2/v2/_create/common-masters.Department"),
+                         ("mdms-v2", "/v2/_create"))
+        self.assertEqual(split_endpoint("https://gw:8443/egov-hrms/employees/_create?tenantId=pg"),
+                         ("egov-hrms", "/employees/_create"))
+        self.assertEqual(split_endpoint("http://gw/user/oauth/token"), ("user", "/oauth/token"))
+
+    def test_snapshot_percentiles_status_and_retries(self):
+        metrics = HttpMetrics()
+        url = "http://gw/boundary-service/boundary/_create"
+        for i in range(1, 101):
+            metrics.observe(url, 200 if i <= 98 else 400, i / 1000, bytes_sent=10, bytes_received=5)
+        metrics.observe(url, "ConnectTimeout", 2.0)
+        metrics.observe_retry(url, 1.5)
+
+        endpoint = metrics.snapshot()["boundary-service"]["endpoints"]["/boundary/_create"]
+
+        self.assertEqual(endpoint["requests"], 101)
+        self.assertEqual(endpoint["errors"], 3)
+        self.assertEqual(endpoint["p50"], 0.051)
+        self.assertEqual(endpoint["p99"], 0.1)
+        self.assertEqual(endpoint["max"], 2.0)
+        self.assertEqual(endpoint["status"], {"200": 98, "400": 2, "ConnectTimeout": 1})
+        self.assertEqual((endpoint["bytes_sent"], endpoint["bytes_received"]), (1000, 500))
+        self.assertEqual((endpoint["retries"], endpoint["backoff_seconds"]), (1, 1.5))
+
+    def test_prometheus_histogram_is_cumulative(self):
+        metrics = HttpMetrics()
+        for seconds in (0.001, 0.02, 0.3):
+            metrics.observe("http://gw/localization/messages/v1/_upsert", 200, seconds)
+
+        text = metrics.to_prometheus()
+
+        labels = 'service="localization",endpoint="/messages/v1/_upsert"'
+        self.assertIn(f'crs_dataloader_http_requests_total{{{labels},status="200"}} 3', text)
+        self.assertIn(f'crs_dataloader_http_request_duration_seconds_bucket{{{labels},le="0.005"}} 1', text)
+        self.assertIn(f'crs_dataloader_http_request_duration_seconds_bucket{{{labels},le="0.5"}} 3', text)
+        self.assertIn(f'crs_dataloader_http_request_duration_seconds_count{{{labels}}} 3', text)
+
+
+class PhaseMetricsTests(unittest.TestCase):
+    def setUp(self):
+        self.gateway = FakeGateway()
+        self.gateway.start()
+        self.metrics_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        self.gateway.stop()
+        shutil.rmtree(self.metrics_dir)
+
+    def test_workflow_phase_writes_its_metrics(self):
+        self.gateway.configure("workflow/_search", throttle_rate=1.0, retry_after=0)
+        loader = CRSLoader(self.gateway.url, metrics_format="json", metrics_dir=self.metrics_dir)
+        with redirect_stdout(io.StringIO()):
+            loader.login("ADMIN", "eGov@123", tenant_id="pg")
+            loader.load_workflow(os.path.join(DATALOADER_DIR, "templates", "PgrWorkflowConfig.json"),
+                                 target_tenant="pg.citya")
+
+        with open(os.path.join(self.metrics_dir, "workflow.metrics.json")) as f:
+            dumped = json.load(f)
+        workflow = dumped["egov-workflow-v2"]["endpoints"]
+        self.assertEqual(workflow["/egov-wf/businessservice/_search"]["status"], {"429": 3})
+        self.assertEqual(workflow["/egov-wf/businessservice/_search"]["retries"], 2)
+        self.assertNotIn("user", dumped)  # login happened before the phase
+        self.assertIs(loader.phase_metrics["workflow"], loader.metrics)
+
+
+if __name__ == "__main__":
+    unittest.main()
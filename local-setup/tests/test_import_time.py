@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""Import-time benchmark for the dataloader.
+
+CI scripts import CRSLoader in every process, so startup has to stay cheap:
+pandas/openpyxl/jsonschema may only load once an Excel or validation path runs.
+
+    python tests/test_import_time.py        # print timings
+    pytest tests/test_import_time.py        # fail on regression
+
+DATALOADER_IMPORT_BUDGET_MS overrides the time budget (default 350ms, best of 3).
+"""
+import json
+import os
+import subprocess
+import sys
+import unittest
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DATALOADER_DIR = os.path.join(REPO_ROOT, "dataloader")
+
+HEAVY_MODULES = ("pandas", "numpy", "openpyxl", "jsonschema")
+IMPORT_BUDGET_MS = float(os.environ.get("DATALOADER_IMPORT_BUDGET_MS", "350"))
+RUNS = 3
+
+PROBE = """
+import json, sys, time
+sys.path.insert(0, {path!r})
+start = time.perf_counter()
+import {module}
+elapsed = (time.perf_counter() - start) * 1000
+print(json.dumps({{"ms": elapsed, "loaded": sorted(m for m in {heavy!r} if m in sys.modules)}}))
+"""
+
+
+def measure_import(module: str) -> dict:
+    """Import module in a fresh interpreter; returns {'ms': float, 'loaded': [...]}"""
+    code = PROBE.format(path=DATALOADER_DIR, module=module, heavy=HEAVY_MODULES)
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True,
+                         check=True, cwd=DATALOADER_DIR)
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def best_of(module: str, runs: int = RUNS) -> dict:
+    results = [measure_import(module) for _ in range(runs)]
+    return min(results, key=lambda r: r["ms"])
+
+
+class ImportTimeTests(unittest.TestCase):
+    def test_crs_loader_does_not_import_excel_or_validation_stack(self):
+        result = measure_import("crs_loader")
+        self.assertEqual(result["loaded"], [])
+
+    def test_unified_loader_does_not_import_excel_or_validation_stack(self):
+        result = measure_import("unified_loader")
+        self.assertEqual(result["loaded"], [])
+
+    def test_crs_loader_import_within_budget(self):
+        result = best_of("crs_loader")
+        self.assertLess(
+            result["ms"], IMPORT_BUDGET_MS,
+            f"import crs_loader took {result['ms']:.0f}ms (budget {IMPORT_BUDGET_MS:.0f}ms)"
+        )
+
+
+if __name__ == "__main__":
+    for module in ("crs_loader", "unified_loader", "payload_bundle"):
+        result = best_of(module)
+        loaded = ", ".join(result["loaded"]) or "none"
+        print(f"{module:<16} {result['ms']:7.1f} ms   heavy modules: {loaded}")
+    print(f"budget           {IMPORT_BUDGET_MS:7.1f} ms")
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+import json
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DATALOADER_DIR = os.path.join(REPO_ROOT, "dataloader")
+sys.path.insert(0, DATALOADER_DIR)
+
+import localization_index
+from localization_index import BUNDLED_DIR, LocalizationIndex, compile_messages, load_bundled_index
+
+
+def _msg(code, message, module="rainmaker-common"):
+    return {"code": code, "message": message, "module": module, "locale": "en_IN"}
+
+
+class LocalizationIndexTests(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.sources = os.path.join(self.tmp_dir, "sources")
+        os.makedirs(self.sources)
+        self._write("a-common.json", [_msg("B_CODE", "Bee"), _msg("A_CODE", "Ay"), _msg("", "no code")])
+        self._write("b-pgr.json", [_msg("A_CODE", "Later"), _msg("Ü_CODE", "Umlaut ü", "rainmaker-pgr")])
+        patcher = mock.patch.object(localization_index, "LOCALIZATION_INDEX_DIR",
+                                    os.path.join(self.tmp_dir, "cache"))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(localization_index._loaded.clear)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def _write(self, name, messages):
+        with open(os.path.join(self.sources, name), "w", encoding="utf-8") as f:
+            json.dump(messages, f)
+
+    def test_index_is_compiled_once_and_looked_up_by_code(self):
+        index = load_bundled_index(self.sources)
+
+        self.assertIs(load_bundled_index(self.sources), index)
+        self.assertEqual(len(os.listdir(os.path.join(self.tmp_dir, "cache"))), 1)
+        self.assertEqual(len(index), 3)
+        self.assertEqual(index.get("A_CODE")["message"], "Ay")
+        self.assertEqual(index.get("Ü_CODE"), _msg("Ü_CODE", "Umlaut ü", "rainmaker-pgr"))
+        self.assertIsNone(index.get("MISSING"))
+        self.assertNotIn("", index)
+        self.assertEqual([m["code"] for m in index.messages()], ["A_CODE", "B_CODE", "Ü_CODE"])
+        self.assertEqual(index.sources, ["a-common.json", "b-pgr.json"])
+
+    def test_edited_sources_compile_a_new_index(self):
+        load_bundled_index(self.sources)
+        self._write("b-pgr.json", [_msg("C_CODE", "Sea")])
+        localization_index._loaded.clear()
+
+        with mock.patch.object(localization_index, "compile_messages",
+                               wraps=compile_messages) as compiled:
+            index = load_bundled_index(self.sources)
+            LocalizationIndex.open(localization_index.index_path(
+                localization_index.sources_digest(self.sources)))
+
+        compiled.assert_called_once()
+        self.assertIn("C_CODE", index)
+        self.assertNotIn("Ü_CODE", index)
+        self.assertEqual(len(os.listdir(os.path.join(self.tmp_dir, "cache"))), 2)
+
+    def test_bundled_templates_match_the_json_files(self):
+        index = LocalizationIndex(localization_index.build_index(compile_messages(BUNDLED_DIR)))
+        expected = {m["code"]: m for m in compile_messages(BUNDLED_DIR)}
+
+        self.assertEqual(len(index), len(expected))
+        self.assertEqual({m["code"]: m for m in index.messages()},
+                         {code: dict(m, message=m.get("message", code)) for code, m in expected.items()})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+import io
+import json
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from contextlib import redirect_stdout
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DATALOADER_DIR = os.path.join(REPO_ROOT, "dataloader")
+sys.path.insert(0, DATALOADER_DIR)
+
+from crs_loader import CRSLoader
+from fake_gateway import FakeGateway
+from multi_tenant import MultiTenantLoader, ReferenceCache, ServiceLimiter
+from unified_loader import APIUploader
+
+
+class SharedStateTests(unittest.TestCase):
+    def test_reference_cache_fetches_once_for_concurrent_callers(self):
+        cache = ReferenceCache()
+        calls = []
+
+        def fetch():
+            calls.append(1)
+            time.sleep(0.05)
+            return [{"code": "EMPLOYEE"}]
+
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(cache.get(("roles", "ke"), fetch)))
+                   for _ in range(5)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(results, [[{"code": "EMPLOYEE"}]] * 5)
+        results[0][0]["code"] = "mutated"
+        self.assertEqual(cache.get(("roles", "ke"), fetch), [{"code": "EMPLOYEE"}])
+
+        cache.invalidate("roles")
+        cache.get(("roles", "ke"), fetch)
+        self.assertEqual(len(calls), 2)
+
+    def test_reference_cache_is_shared_by_cities_of_one_root(self):
+        gateway = FakeGateway()
+        gateway.start()
+        self.addCleanup(gateway.stop)
+        # Only the root holds the reference data, as on a real deployment
+        gateway.seed_mdms("pg", "ACCESSCONTROL-ROLES.roles", [{"code": "EMPLOYEE", "name": "Employee"}])
+        gateway.seed_mdms("pg", "common-masters.GenderType", [{"code": "FEMALE", "active": True}])
+        with redirect_stdout(io.StringIO()):
+            uploader = APIUploader(gateway.url, "ADMIN", "eGov@123", tenant_id="pg", token_cache=False)
+            uploader.reference_cache = cache = ReferenceCache()
+            fetched = [([r["code"] for r in uploader.fetch_roles(city)], uploader.fetch_gender_types(city))
+                       for city in ("pg.a", "pg.b", "pg.c")]
+
+        self.assertEqual(fetched, [(["EMPLOYEE"], ["FEMALE"])] * 3)
+        self.assertGreater(cache.misses, 0)
+        self.assertEqual(cache.hits, 2 * cache.misses)
+
+    def test_limiter_budget_is_per_service(self):
+        limiter = ServiceLimiter({"default": 3, "egov-hrms": 1})
+
+        self.assertIs(limiter.slot("http://gw/egov-hrms/employees/_create"),
+                      limiter.slot("http://gw/egov-hrms/employees/_search"))
+        self.assertEqual(limiter.slot("http://gw/egov-hrms/employees/_create")._value, 1)
+        self.assertEqual(limiter.slot("http://gw/mdms-v2/v2/_search")._value, 3)
+
+
+class MultiTenantLoaderTests(unittest.TestCase):
+    def setUp(self):
+        self.gateway = FakeGateway()
+        self.gateway.start()
+        self.work_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        self.gateway.stop()
+        shutil.rmtree(self.work_dir)
+
+    def test_tenants_run_in_parallel_on_copies_with_one_report(self):
+        self.gateway.configure("*", latency=0.02)
+        template = os.path.join(DATALOADER_DIR, "templates", "PgrWorkflowConfig.json")
+        with open(template, "rb") as f:
+            original = f.read()
+        manifest = {
+            "base_dir": os.path.join(DATALOADER_DIR, "templates"),
+            "defaults": {"workflow": "PgrWorkflowConfig.json"},
+            "concurrency": {"default": 2},
+            "tenants": [{"code": f"pg.city{i}"} for i in range(3)],
+        }
+
+        loader = CRSLoader(self.gateway.url)
+        with redirect_stdout(io.StringIO()) as console:
+            loader.login("ADMIN", "eGov@123", tenant_id="pg")
+            report = MultiTenantLoader(loader, workers=3, work_dir=self.work_dir).run(manifest)
+
+        self.assertEqual(report["summary"], {"ok": 3, "errors": 0, "failed": 0})
+        self.assertEqual(report["phases"]["workflow"]["ok"], 3)
+        self.assertGreater(report["services"]["egov-workflow-v2"]["requests"], 0)
+        for i in range(3):
+            tenant_dir = os.path.join(self.work_dir, f"pg.city{i}")
+            self.assertTrue(os.path.exists(os.path.join(tenant_dir, "PgrWorkflowConfig.json")))
+            with open(os.path.join(tenant_dir, "loader.log")) as f:
+                self.assertIn("pg.city", f.read())
+        with open(os.path.join(self.work_dir, "report.json")) as f:
+            self.assertEqual(json.load(f)["summary"]["ok"], 3)
+        with open(template, "rb") as f:
+            self.assertEqual(f.read(), original)
+        self.assertIn("Multi-tenant summary", console.getvalue())
+        self.assertIsNone(loader.uploader.limiter)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+import json
+import os
+import sys
+import tempfile
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "dataloader")))
+
+from unified_loader import UnifiedExcelReader, normalize_frame
+
+
+def test_normalize_frame_converts_missing_dates_and_upcast_ints_in_place():
+    df = pd.DataFrame(
+        {
+            "mobile": [9999999999, np.nan, 8888888888],
+            "lat": [12.5, np.nan, 13.25],
+            "joined": [pd.Timestamp("2024-06-20"), pd.NaT, pd.Timestamp("2024-09-05 10:30:00")],
+            "name": ["a", None, np.nan],
+            "mixed": ["x", pd.Timestamp("2024-01-01"), np.nan],
+            "count": [1, 2, 3],
+        }
+    )
+
+    result = normalize_frame(df)
+
+    assert result is df
+    records = df.to_dict("records")
+    assert records[0] == {
+        "mobile": 9999999999,
+        "lat": 12.5,
+        "joined": "2024-06-20T00:00:00",
+        "name": "a",
+        "mixed": "x",
+        "count": 1,
+    }
+    assert records[1] == {
+        "mobile": None, "lat": None, "joined": None, "name": None, "mixed": "2024-01-01T00:00:00", "count": 2,
+    }
+    assert records[2]["joined"] == "2024-09-05T10:30:00"
+    assert records[2]["name"] is None
+    assert records[2]["mixed"] is None
+    # Everything is JSON-serialisable without a clean_nans pass.
+    json.dumps(records, allow_nan=False)
+
+
+def test_normalize_frame_leaves_clean_columns_untouched():
+    df = pd.DataFrame({"count": [1, 2], "ratio": [0.5, 1.5], "label": ["x", "y"]})
+    columns = {col: df[col] for col in df.columns}
+
+    normalize_frame(df)
+
+    for col, series in columns.items():
+        assert df[col] is series or df[col].equals(series)
+    assert str(df["count"].dtype) == "int64"
+    assert str(df["ratio"].dtype) == "float64"
+
+
+def test_read_localization_skips_blank_rows_after_normalisation():
+    df = pd.DataFrame(
+        [
+            {"Code": "SERVICEDFS.X", "Message": "X"},
+            {"Code": None, "Message": "orphan"},
+            {"Code": "COMMON_MASTERS_DEPT_1", "Message": np.nan},
+            {"Code": "CORE_COMMON_LOGIN", "Message": "Login"},
+        ]
+    )
+
+    with tempfile.NamedTemporaryFile(suffix=".xlsx", delete=False) as handle:
+        excel_path = handle.name
+
+    try:
+        with pd.ExcelWriter(excel_path, engine="openpyxl") as writer:
+            df.to_excel(writer, index=False, sheet_name="Localization")
+
+        messages = UnifiedExcelReader(excel_path).read_localization()
+    finally:
+        os.unlink(excel_path)
+
+    assert messages == [
+        {"code": "SERVICEDFS.X", "message": "X", "module": "rainmaker-pgr", "locale": "en_IN"},
+        {"code": "CORE_COMMON_LOGIN", "message": "Login", "module": "rainmaker-common", "locale": "en_IN"},
+    ]
@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+import gzip
+import json
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from unittest.mock import Mock, patch
+
+from openpyxl import Workbook
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DATALOADER_DIR = os.path.join(REPO_ROOT, "dataloader")
+sys.path.insert(0, DATALOADER_DIR)
+
+import crs_loader
+from crs_loader import CRSLoader
+from payload_bundle import read_bundle_header, iter_bundle_records
+from unified_loader import UnifiedExcelReader
+
+COMMON_MASTER = os.path.join(DATALOADER_DIR, "templates", "Common and Complaint Master.xlsx")
+
+
+def _authenticated_loader():
+    loader = CRSLoader("http://localhost:8080")
+    loader._authenticated = True
+    loader.tenant_id = "pg"
+    loader.uploader = Mock()
+    loader.uploader.create_mdms_data.return_value = {'created': 1, 'exists': 0, 'failed': 0, 'errors': []}
+    return loader
+
+
+class PayloadBundleTests(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def test_compile_common_masters_writes_gzip_ndjson_in_upload_order(self):
+        loader = CRSLoader("http://localhost:8080")
+        path = loader.compile_bundle("common_masters", COMMON_MASTER, target_tenant="pg.citya",
+                                     output_path=os.path.join(self.tmp_dir, "cm.ndjson.gz"))
+
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            header = json.loads(f.readline())
+        self.assertEqual(header["phase"], "common_masters")
+        self.assertEqual(header["tenant"], "pg.citya")
+        self.assertEqual(header["source"], "Common and Complaint Master.xlsx")
+
+        reader = UnifiedExcelReader(COMMON_MASTER)
+        depts, desigs, _, _, name_to_code = reader.read_departments_designations("pg.citya")
+        complaints, _ = reader.read_complaint_types("pg.citya", name_to_code)
+
+        records = list(iter_bundle_records(path))
+        mdms = [(r["schema"], r["data"]) for r in records if r["kind"] == "mdms"]
+        self.assertEqual(
+            [schema for schema, _ in mdms],
+            ["common-masters.Department"] * len(depts)
+            + ["common-masters.Designation"] * len(desigs)
+            + ["RAINMAKER-PGR.ComplaintHierarchyDefinition"]
+            + ["RAINMAKER-PGR.ComplaintHierarchy"] * len(complaints),
+        )
+        self.assertEqual([d for s, d in mdms if s == "RAINMAKER-PGR.ComplaintHierarchy"], complaints)
+
+    def test_replay_uploads_bundle_without_reading_excel(self):
+        path = CRSLoader("http://localhost:8080").compile_bundle(
+            "common_masters", COMMON_MASTER, target_tenant="pg.citya",
+            output_path=os.path.join(self.tmp_dir, "cm.ndjson"))
+        loader = _authenticated_loader()
+
+        with patch.object(crs_loader, "UnifiedExcelReader", side_effect=AssertionError("Excel read")):
+            results = loader.replay_bundle(path)
+
+        schemas = [c.kwargs["schema_code"] for c in loader.uploader.create_mdms_data.call_args_list]
+        self.assertEqual(schemas, [
+            "common-masters.Department",
+            "common-masters.Designation",
+            "RAINMAKER-PGR.ComplaintHierarchyDefinition",
+            "RAINMAKER-PGR.ComplaintHierarchy",
+        ])
+        self.assertTrue(all(c.kwargs["tenant"] == "pg.citya" for c in loader.uploader.create_mdms_data.call_args_list))
+        self.assertEqual(set(results), {"departments", "designations", "complaint_hierarchy_definition", "complaint_types"})
+        self.assertTrue(loader.uploader.create_localization_messages.called)
+
+    def test_load_via_bundle_compiles_once_and_reuses_until_template_changes(self):
+        excel_path = os.path.join(self.tmp_dir, "Boundary.xlsx")
+        wb = Workbook()
+        ws = wb.active
+        ws.title = "Boundary"
+        ws.append(["code", "name", "boundaryType", "parentCode"])
+        ws.append(["PB", "Punjab", "State", None])
+        ws.append(["AMR", "Amritsar", "District", "PB"])
+        wb.save(excel_path)
+
+        loader = _authenticated_loader()
+        loader.uploader._get_boundary_hierarchy.return_value = None
+        captured = []
+        loader.uploader.create_boundaries_from_specs.side_effect = \
+            lambda tenant, hierarchy_type, specs, **kw: captured.append(
+                (tenant, hierarchy_type, list(specs), kw.get("boundary_types"))) or {}
+
+        with patch.object(loader, "compile_bundle", wraps=loader.compile_bundle) as compile_spy:
+            loader.load_via_bundle("boundaries", excel_path, target_tenant="pg", hierarchy_type="REVENUE")
+            loader.load_via_bundle("boundaries", excel_path, target_tenant="pg", hierarchy_type="REVENUE")
+            self.assertEqual(compile_spy.call_count, 1)
+
+            ws.append(["LDH", "Ludhiana", "District", "PB"])
+            wb.save(excel_path)
+            loader.load_via_bundle("boundaries", excel_path, target_tenant="pg", hierarchy_type="REVENUE")
+            self.assertEqual(compile_spy.call_count, 2)
+
+            # The hierarchy's levels changed on the gateway
+            loader.uploader._get_boundary_hierarchy.return_value = {
+                "boundaryHierarchy": [{"boundaryType": "State"}, {"boundaryType": "District"}]}
+            loader.load_via_bundle("boundaries", excel_path, target_tenant="pg", hierarchy_type="REVENUE")
+            self.assertEqual(compile_spy.call_count, 3)
+
+        self.assertEqual(captured[0], ("pg", "REVENUE", [("PB", "State", None), ("AMR", "District", "PB")], []))
+        self.assertEqual(len(captured[2][2]), 3)
+        self.assertEqual(captured[3][3], ["State", "District"])
+        header = read_bundle_header(os.path.join(self.tmp_dir, "pg.boundaries.ndjson.gz"))
+        self.assertEqual(header["phase"], "boundaries")
+
+    def test_bundle_is_recompiled_for_another_gateway_or_changed_masters(self):
+        loader = _authenticated_loader()
+        loader.uploader.fetch_departments.return_value = [{"code": "DEPT_1", "name": "Water"}]
+        loader.uploader.fetch_designations.return_value = [{"code": "DESIG_1", "name": "Engineer"}]
+
+        def load():
+            loader.load_via_bundle("common_masters", COMMON_MASTER, target_tenant="pg.citya",
+                                   bundle_dir=self.tmp_dir)
+
+        with patch.object(loader, "compile_bundle", wraps=loader.compile_bundle) as compile_spy:
+            load()
+            load()
+            self.assertEqual(compile_spy.call_count, 1)
+
+            loader.uploader.fetch_departments.return_value = [{"code": "DEPT_7", "name": "Water"}]
+            load()
+            self.assertEqual(compile_spy.call_count, 2)
+
+            loader.base_url = "http://other-gateway:8080"
+            load()
+            self.assertEqual(compile_spy.call_count, 3)
+
+        header = read_bundle_header(os.path.join(self.tmp_dir, "pg.citya.common_masters.ndjson.gz"))
+        self.assertEqual(header["context"]["gateway"], "http://other-gateway:8080")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+import io
+import os
+import shutil
+import sys
+import tempfile
+import time
+import unittest
+from contextlib import redirect_stdout
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DATALOADER_DIR = os.path.join(REPO_ROOT, "dataloader")
+sys.path.insert(0, DATALOADER_DIR)
+
+from crs_loader import CRSLoader
+from fake_gateway import FakeGateway
+from phase_dag import ONBOARDING_STEPS, PhaseScheduler, critical_path
+
+
+def _sleep(seconds, result=None, error=None):
+    def run(loader, tenant, spec, results):
+        time.sleep(seconds)
+        print(f"{tenant} done")
+        if error:
+            raise RuntimeError(error)
+        return result or {"created": 1}
+    return run
+
+
+class PlanTests(unittest.TestCase):
+    def test_missing_workbooks_drop_steps_and_their_edges(self):
+        plan = PhaseScheduler(None).plan({"common_masters": "c.xlsx", "employees": "e.xlsx"})
+
+        self.assertEqual(set(plan), {"common_masters", "master_localizations", "employees"})
+        self.assertEqual(plan["employees"][0], ("common_masters",))
+        self.assertEqual(plan["common_masters"][0], ())
+
+    def test_unknown_step_and_cycle_are_rejected(self):
+        with self.assertRaises(ValueError):
+            PhaseScheduler(None).plan({"billing": "b.xlsx"})
+        steps = {"a": (("b",), None), "b": (("a",), None)}
+        with self.assertRaises(ValueError):
+            PhaseScheduler(None, steps=steps).plan({"a": "x", "b": "y"})
+
+    def test_critical_path_follows_the_slowest_chain(self):
+        outcomes = {"tenant": {"seconds": 1.0}, "boundaries": {"seconds": 3.0},
+                    "common_masters": {"seconds": 2.0}, "employees": {"seconds": 1.5},
+                    "workflow": {"seconds": 0.5}}
+
+        path, seconds = critical_path(ONBOARDING_STEPS, outcomes)
+
+        self.assertEqual(path, ["tenant", "boundaries", "employees"])
+        self.assertEqual(seconds, 5.5)
+
+
+class SchedulerTests(unittest.TestCase):
+    def setUp(self):
+        self.gateway = FakeGateway()
+        self.gateway.start()
+        self.loader = CRSLoader(self.gateway.url, progress="quiet")
+        with redirect_stdout(io.StringIO()):
+            self.loader.login("ADMIN", "eGov@123", tenant_id="pg")
+
+    def tearDown(self):
+        self.gateway.stop()
+
+    def test_independent_steps_overlap_and_failures_skip_dependents(self):
+        steps = {
+            "root": ((), _sleep(0.05)),
+            "left": (("root",), _sleep(0.3)),
+            "right": (("root",), _sleep(0.3)),
+            "broken": (("root",), _sleep(0.0, error="no sheet")),
+            "after_broken": (("broken",), _sleep(0.0)),
+            "join": (("left", "right"), _sleep(0.05)),
+        }
+        workbooks = {name: f"{name}.xlsx" for name in steps}
+
+        with redirect_stdout(io.StringIO()) as out:
+            report = PhaseScheduler(self.loader, workers=3, steps=steps).run(workbooks, "pg.citya")
+
+        statuses = {name: step["status"] for name, step in report["steps"].items()}
+        self.assertEqual(statuses, {"root": "ok", "left": "ok", "right": "ok", "broken": "failed",
+                                    "after_broken": "skipped", "join": "ok"})
+        self.assertLess(report["seconds"], report["serial_seconds"])
+        self.assertLess(abs(report["steps"]["left"]["start"] - report["steps"]["right"]["start"]), 0.2)
+        self.assertEqual(report["critical_path"]["steps"][0], "root")
+        self.assertEqual(report["critical_path"]["steps"][-1], "join")
+        self.assertIn("RuntimeError: no sheet", report["steps"]["broken"]["error"])
+        self.assertIn("── left (ok", out.getvalue())
+        self.assertIn("pg.citya done", out.getvalue())
+
+    def test_onboard_runs_workflow_on_a_fork(self):
+        work_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, work_dir)
+        workflow = shutil.copy(os.path.join(DATALOADER_DIR, "templates", "PgrWorkflowConfig.json"), work_dir)
+
+        with redirect_stdout(io.StringIO()):
+            report = self.loader.onboard({"workflow": workflow}, target_tenant="pg.citya")
+
+        self.assertEqual(report["steps"]["workflow"]["status"], "ok")
+        self.assertEqual(report["critical_path"]["steps"], ["workflow"])
+        self.assertIn("workflow", self.loader.phase_metrics)
+
+
+if __name__ == "__main__":
+    unittest.main()
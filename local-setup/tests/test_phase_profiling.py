@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+import io
+import os
+import pstats
+import shutil
+import sys
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DATALOADER_DIR = os.path.join(REPO_ROOT, "dataloader")
+sys.path.insert(0, DATALOADER_DIR)
+
+from crs_loader import CRSLoader
+from fake_gateway import FakeGateway
+
+
+class PhaseProfilingTests(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.workflow_json = os.path.join(self.tmp_dir, "PgrWorkflowConfig.json")
+        shutil.copyfile(os.path.join(DATALOADER_DIR, "templates", "PgrWorkflowConfig.json"),
+                        self.workflow_json)
+        self.gateway = FakeGateway()
+        self.gateway.start()
+
+    def tearDown(self):
+        self.gateway.stop()
+        shutil.rmtree(self.tmp_dir)
+
+    def _run_workflow(self, **loader_kwargs):
+        loader = CRSLoader(self.gateway.url, **loader_kwargs)
+        with redirect_stdout(io.StringIO()):
+            loader.login("ADMIN", "eGov@123", tenant_id="pg")
+            return loader.load_workflow(self.workflow_json, target_tenant="pg.citya")
+
+    def test_profile_reports_are_written_next_to_the_input(self):
+        result = self._run_workflow(profile=True)
+
+        self.assertEqual(result["status"], "created")
+        base = self.workflow_json + ".workflow"
+        stats = pstats.Stats(base + ".pstats")
+        self.assertTrue(any(func[2] == "load_workflow" for func in stats.stats))
+        with open(base + ".profile.txt") as f:
+            self.assertIn("cumulative", f.read())
+        with open(base + ".alloc.txt") as f:
+            self.assertIn("Peak traced memory", f.read())
+
+    def test_profiling_is_off_by_default(self):
+        self._run_workflow(profile=False)
+
+        self.assertEqual(sorted(os.listdir(self.tmp_dir)), ["PgrWorkflowConfig.json"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+import io
+import json
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DATALOADER_DIR = os.path.join(REPO_ROOT, "dataloader")
+sys.path.insert(0, DATALOADER_DIR)
+
+from crs_loader import CRSLoader
+from fake_gateway import FakeGateway
+from progress import CallbackSink, Cancelled, make_progress
+
+
+class ProgressTests(unittest.TestCase):
+    def test_counts_and_timing_reach_phase_end(self):
+        events = []
+        progress = make_progress([CallbackSink(events.append)])
+
+        progress.phase_start("employees")
+        progress.task("hrms.employees", 3)
+        progress.row("SUCCESS", "E1")
+        progress.row("SUCCESS", "E1", message="password set", advance=False)
+        progress.row("FAILED", "E2", error="bad dept")
+        progress.batch(5, "EXISTS")
+        progress.phase_end()
+
+        self.assertEqual([e["event"] for e in events],
+                         ["phase_start", "task_start", "row", "row", "row", "batch", "phase_end"])
+        self.assertEqual(events[4]["done"], 2)
+        self.assertEqual(events[4]["total"], 3)
+        self.assertEqual(events[4]["task"], "hrms.employees")
+        self.assertEqual(events[-1]["counts"], {"SUCCESS": 1, "FAILED": 1, "EXISTS": 5})
+        self.assertGreaterEqual(events[-1]["seconds"], 0)
+
+    def test_summary_prints_failures_only(self):
+        progress = make_progress("summary")
+        out = io.StringIO()
+        with redirect_stdout(out):
+            progress.phase_start("common_masters")
+            progress.row("SUCCESS", "D1", message="   [OK] [1/2] D1")
+            progress.row("FAILED", "D2", message="   [FAILED] [2/2] D2")
+            progress.phase_end()
+
+        text = out.getvalue()
+        self.assertNotIn("[OK]", text)
+        self.assertIn("[FAILED] [2/2] D2", text)
+        self.assertIn("FAILED=1  SUCCESS=1", text)
+
+    def test_cancel_wakes_waiters_and_blocks_new_tasks(self):
+        progress = make_progress("quiet")
+        progress.task("first", 2)
+
+        progress.cancel()
+
+        self.assertTrue(progress.cancelled)
+        self.assertTrue(progress.wait(5))
+        with self.assertRaises(Cancelled):
+            progress.task("second", 2)
+
+    def test_unknown_sink_is_rejected(self):
+        with self.assertRaises(ValueError):
+            make_progress("fancy")
+
+
+class LoaderProgressTests(unittest.TestCase):
+    def setUp(self):
+        self.gateway = FakeGateway()
+        self.gateway.start()
+        self.tmp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        self.gateway.stop()
+        shutil.rmtree(self.tmp_dir)
+
+    def test_mdms_rows_are_streamed_to_jsonl_without_printing(self):
+        events_path = os.path.join(self.tmp_dir, "events.jsonl")
+        loader = CRSLoader(self.gateway.url, progress=f"quiet,jsonl:{events_path}")
+        departments = [{"code": "DEPT_1", "name": "Roads"}, {"code": "DEPT_2", "name": "Water"}]
+
+        with redirect_stdout(io.StringIO()) as out:
+            loader.login("ADMIN", "eGov@123", tenant_id="pg")
+            loader.progress.phase_start("common_masters")
+            loader.uploader.create_mdms_data("common-masters.Department", departments, "pg.citya")
+            loader.uploader.create_mdms_data("common-masters.Department", departments, "pg.citya")
+            loader.progress.phase_end()
+        loader.progress.close()
+
+        self.assertNotIn("[OK]", out.getvalue())
+        with open(events_path) as f:
+            events = [json.loads(line) for line in f]
+        rows = [(e["status"], e["id"]) for e in events if e["event"] == "row"]
+        self.assertEqual(rows, [("SUCCESS", "DEPT_1"), ("SUCCESS", "DEPT_2"),
+                                ("EXISTS", "DEPT_1"), ("EXISTS", "DEPT_2")])
+        self.assertEqual(events[-1]["counts"], {"SUCCESS": 2, "EXISTS": 2})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+import io
+import os
+import sys
+import unittest
+from contextlib import redirect_stdout
+from unittest import mock
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DATALOADER_DIR = os.path.join(REPO_ROOT, "dataloader")
+sys.path.insert(0, DATALOADER_DIR)
+
+from crs_loader import CRSLoader
+from fake_gateway import FakeGateway
+
+
+class RootBootstrapTests(unittest.TestCase):
+    def setUp(self):
+        self.gateway = FakeGateway()
+        self.gateway.start()
+        for i in range(30):
+            code = f"module.Schema{i}"
+            self.gateway.schemas[("pg", code)] = {"tenantId": "pg", "code": code, "definition": {}}
+        self.gateway.schemas[("ethiopia", "module.Schema0")] = {"tenantId": "ethiopia",
+                                                                "code": "module.Schema0"}
+        self.gateway.seed_mdms("pg", "common-masters.Department",
+                               [{"code": f"DEPT_{i}", "name": f"Dept {i}"} for i in range(25)])
+        self.gateway.seed_mdms("pg", "common-masters.IdFormat",
+                               [{"idname": "pgr.servicerequestid", "format": "PG-PGR-[cy:yyyy-MM-dd]-[SEQ]"}],
+                               key="idname")
+        self.loader = CRSLoader(self.gateway.url, progress="quiet")
+        with redirect_stdout(io.StringIO()):
+            self.loader.login("ADMIN", "eGov@123", tenant_id="pg")
+
+    def tearDown(self):
+        self.gateway.stop()
+
+    def bootstrap(self):
+        self.gateway.reset_stats()
+        with redirect_stdout(io.StringIO()) as out, mock.patch("time.sleep"):
+            ok = self.loader._bootstrap_tenant_root("ethiopia", source_tenant="pg")
+        return ok, out.getvalue(), self.gateway.stats()
+
+    def test_only_missing_schemas_are_created_and_seed_data_keeps_identifiers(self):
+        ok, out, stats = self.bootstrap()
+
+        self.assertTrue(ok)
+        self.assertEqual(stats["mdms/schema/_create"]["calls"], 29)
+        self.assertIn("29 copied, 1 already existed, 0 failed", out)
+        departments = self.gateway.mdms[("ethiopia", "common-masters.Department")]
+        self.assertEqual(len(departments), 25)
+        self.assertIn("pgr.servicerequestid", self.gateway.mdms[("ethiopia", "common-masters.IdFormat")])
+
+    def test_rerun_sends_no_creates(self):
+        self.bootstrap()
+        ok, out, stats = self.bootstrap()
+
+        self.assertTrue(ok)
+        self.assertNotIn("mdms/schema/_create", stats)
+        self.assertNotIn("mdms/_create", stats)
+        self.assertIn("0 records copied, 26 already existed", out)
+
+
+if __name__ == "__main__":
+    unittest.main()
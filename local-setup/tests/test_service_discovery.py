@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+import io
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from unittest import mock
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DATALOADER_DIR = os.path.join(REPO_ROOT, "dataloader")
+sys.path.insert(0, DATALOADER_DIR)
+
+from fake_gateway import FakeGateway
+from service_discovery import SERVICES, ServicePathCache
+from unified_loader import APIUploader
+
+AUTO_DETECT = {env: "" for env, *_ in SERVICES.values()}
+
+
+class ServiceDiscoveryTests(unittest.TestCase):
+    def setUp(self):
+        self.gateway = FakeGateway()
+        self.gateway.start()
+        self.cache_dir = tempfile.mkdtemp()
+        self.cache = ServicePathCache(self.cache_dir)
+
+    def tearDown(self):
+        self.gateway.stop()
+        shutil.rmtree(self.cache_dir)
+
+    def uploader(self, base_url=None):
+        with redirect_stdout(io.StringIO()):
+            return APIUploader(base_url or self.gateway.url, tenant_id="pg", service_cache=self.cache)
+
+    def probes(self):
+        return sum(s["calls"] for s in self.gateway.stats().values())
+
+    def test_auto_detected_paths_are_probed_once_then_cached(self):
+        self.gateway.configure("hrms/_search", error_rate=1.0, error_status=404)
+        with mock.patch.dict(os.environ, AUTO_DETECT):
+            first = self.uploader()
+            probed = self.probes()
+            second = self.uploader()
+
+        candidates = sum(len(spec[1]) for spec in SERVICES.values())
+        self.assertEqual(probed, candidates)
+        self.assertEqual(self.probes(), probed)
+        # Probes go through _send_once: metered and seen by the breakers
+        metered = first.metrics.snapshot()
+        self.assertEqual(sum(svc["requests"] for svc in metered.values()), candidates)
+        self.assertEqual(first.breakers.states()["egov-hrms"], "closed")
+        self.assertFalse(second.metrics.snapshot())
+        self.assertEqual(first.mdms_url, f"{self.gateway.url}/mdms-v2")
+        self.assertEqual(first.boundary_mgmt_url, f"{self.gateway.url}/egov-bndry-mgmnt")
+        self.assertEqual(first.hrms_url, f"{self.gateway.url}/egov-hrms")
+        self.assertEqual(second.filestore_url, first.filestore_url)
+        self.assertEqual(second.workflow_url, first.workflow_url)
+
+    def test_expired_entries_and_unreachable_gateways(self):
+        with mock.patch.dict(os.environ, AUTO_DETECT):
+            self.uploader()
+            self.cache.ttl = 0
+            self.uploader()
+            self.assertEqual(self.probes(), 2 * sum(len(spec[1]) for spec in SERVICES.values()))
+
+            self.gateway.stop()
+            unreachable = self.uploader(self.gateway.url.replace("127.0.0.1", "127.0.0.2"))
+        self.assertEqual(unreachable.mdms_url.rsplit("/", 1)[1], "mdms-v2")
+        self.assertIsNone(ServicePathCache(self.cache_dir).load(unreachable.base_url))
+
+    def test_configured_and_unset_services_are_not_probed(self):
+        env = {k: v for k, v in os.environ.items() if k not in AUTO_DETECT}
+        env["HRMS_SERVICE"] = "/hrms"
+        with mock.patch.dict(os.environ, env, clear=True):
+            uploader = self.uploader()
+
+        self.assertEqual(self.probes(), 0)
+        self.assertEqual(uploader.hrms_url, f"{self.gateway.url}/hrms")
+        self.assertEqual(uploader.mdms_url, f"{self.gateway.url}/mdms-v2")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,245 @@
+#!/usr/bin/env python3
+import os
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from datetime import datetime
+from unittest.mock import patch
+
+from openpyxl import Workbook
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(REPO_ROOT, "dataloader"))
+
+from unified_loader import APIUploader, UnifiedExcelReader, iter_sheet_rows, run_pipeline
+
+
+def write_workbook(path, sheet_name, rows):
+    wb = Workbook()
+    ws = wb.active
+    ws.title = sheet_name
+    for row in rows:
+        ws.append(row)
+    wb.save(path)
+
+
+class StreamingPipelineTests(unittest.TestCase):
+    def setUp(self):
+        handle = tempfile.NamedTemporaryFile(suffix=".xlsx", delete=False)
+        handle.close()
+        self.excel_path = handle.name
+
+    def tearDown(self):
+        os.unlink(self.excel_path)
+
+    def _build_uploader(self):
+        uploader = APIUploader.__new__(APIUploader)
+        uploader.boundary_url = 'http://example.local/boundary-service'
+        uploader.hrms_url = 'http://example.local/egov-hrms'
+        uploader.auth_token = 'token'
+        uploader.user_info = {'id': 1, 'tenantId': 'pg'}
+        return uploader
+
+    def test_iter_sheet_rows_skips_blank_rows_and_normalises_cells(self):
+        write_workbook(self.excel_path, 'Employee Master', [
+            ['User Name*', 'Mobile Number*', 'Date of Appointment*'],
+            ['Asha', 9999999999, datetime(2024, 6, 20)],
+            [None, '  ', None],
+            ['Ravi', 8888888888, None],
+        ])
+
+        rows = list(iter_sheet_rows(self.excel_path, 'Employee Master'))
+
+        self.assertEqual(rows, [
+            (1, {'User Name*': 'Asha', 'Mobile Number*': 9999999999,
+                 'Date of Appointment*': '2024-06-20T00:00:00'}),
+            (3, {'User Name*': 'Ravi', 'Mobile Number*': 8888888888,
+                 'Date of Appointment*': None}),
+        ])
+
+    def test_iter_employees_matches_bulk_reader(self):
+        write_workbook(self.excel_path, 'Employee Master', [
+            ['User Name*', 'Mobile Number*', 'Department Name*', 'Designation Name*',
+             'Role Names (comma separated)*', 'Date of Appointment*'],
+            ['Asha K', 9999999999, 'Health', 'Inspector', 'Employee, GRO', datetime(2024, 6, 20)],
+            [None, None, None, None, None, None],
+            ['Ravi', 8888888888, 'Health', 'Clerk', 'Employee', None],
+        ])
+        uploader = self._build_uploader()
+        uploader.fetch_departments = lambda tenant: [{'name': 'Health', 'code': 'DEPT_1'}]
+        uploader.fetch_designations = lambda tenant: [{'name': 'Inspector', 'code': 'DESIG_1'}]
+        uploader.fetch_roles = lambda tenant: [{'name': 'GRO', 'code': 'GRO'}]
+        reader = UnifiedExcelReader(self.excel_path)
+
+        streamed = list(reader.iter_employees('pg.citya', uploader))
+
+        self.assertEqual([row_index for row_index, _ in streamed], [1, 3])
+        self.assertEqual([emp for _, emp in streamed], reader.read_employees_bulk('pg.citya', uploader))
+
+    def test_run_pipeline_keeps_producer_within_queue_bound(self):
+        produced = []
+        handled = []
+        lock = threading.Lock()
+        max_ahead = [0]
+
+        def items():
+            for i in range(20):
+                with lock:
+                    produced.append(i)
+                    max_ahead[0] = max(max_ahead[0], len(produced) - len(handled))
+                yield i
+
+        def handle(item):
+            time.sleep(0.005)
+            with lock:
+                handled.append(item)
+
+        fed = run_pipeline(items(), handle, workers=2, queue_size=3)
+
+        self.assertEqual(fed, 20)
+        self.assertEqual(sorted(handled), list(range(20)))
+        # queue + one item per worker + the one being put
+        self.assertLessEqual(max_ahead[0], 3 + 2 + 1)
+
+    def test_run_pipeline_skips_queued_items_after_a_stop(self):
+        handled = []
+
+        def handle(item):
+            handled.append(item)
+            return item != 2
+
+        count = run_pipeline(iter(range(10)), handle, workers=1, queue_size=5)
+
+        self.assertEqual(handled, [0, 1, 2])
+        self.assertEqual(count, 3)
+
+    def test_streaming_boundaries_create_parents_before_children(self):
+        write_workbook(self.excel_path, 'Boundary', [
+            ['code', 'name', 'boundaryType', 'parentCode'],
+            ['PB', 'Punjab', 'State', None],
+            ['AMR', 'Amritsar', 'District', 'PB'],
+            ['LDH', 'Ludhiana', 'District', 'PB'],
+            ['AMR_W1', 'Ward 1', 'Ward', 'AMR'],
+            ['LDH_W1', 'Ward 1', 'Ward', 'LDH'],
+        ])
+        uploader = self._build_uploader()
+        linked = []
+        lock = threading.Lock()
+
+        def fake_relationship(tenant_id, hierarchy_type, code, boundary_type, parent_code=None):
+            if code == 'PB':
+                time.sleep(0.02)
+            with lock:
+                linked.append((code, parent_code))
+            return True
+
+        with patch.object(uploader, '_get_boundary_hierarchy', return_value=None), \
+             patch.object(uploader, '_create_boundary_entity', return_value=True), \
+             patch.object(uploader, '_create_boundary_relationship', side_effect=fake_relationship):
+            result = uploader.process_boundary_data_streaming(
+                'pg', excel_file=self.excel_path, hierarchy_type='ADMIN', workers=4
+            )
+
+        self.assertEqual(result['status'], 'completed')
+        self.assertEqual(result['boundaries_created'], 5)
+        self.assertEqual(result['relationships_created'], 5)
+        order = [code for code, _ in linked]
+        for code, parent in linked:
+            if parent:
+                self.assertLess(order.index(parent), order.index(code))
+
+    def test_streaming_boundaries_column_per_level_format(self):
+        write_workbook(self.excel_path, 'Boundary Data', [
+            ['State', 'District', 'Ward'],
+            ['PB', 'AMR', 'AMR_W1'],
+            ['PB', 'AMR', 'AMR_W2'],
+            ['PB', 'LDH', None],
+        ])
+
+        specs = list(APIUploader._iter_boundary_specs(self.excel_path, ['State', 'District', 'Ward']))
+
+        self.assertEqual(specs, [
+            ('PB', 'State', None),
+            ('AMR', 'District', 'PB'),
+            ('AMR_W1', 'Ward', 'AMR'),
+            ('AMR_W2', 'Ward', 'AMR'),
+            ('LDH', 'District', 'PB'),
+        ])
+
+    def test_streaming_employees_collects_statuses_in_row_order(self):
+        uploader = self._build_uploader()
+        outcomes = {
+            'A': 'SUCCESS',
+            'B': 'EXISTS',
+            'C': 'FAILED',
+        }
+
+        def fake_create(employee, tenant, label):
+            return {
+                'code': employee['code'],
+                'status': outcomes[employee['code']],
+                'status_code': 400 if employee['code'] == 'C' else 200,
+                'error_message': 'bad' if employee['code'] == 'C' else '',
+                'password_updated': employee['code'] == 'A',
+                'auth_failed': False,
+            }
+
+        written = {}
+
+        def fake_write(excel_file, sheet_name, row_statuses, schema_code):
+            written['rows'] = row_statuses
+
+        employees = iter([(1, {'code': 'A'}), (2, {'code': 'B'}), (4, {'code': 'C'})])
+        with patch.object(uploader, 'ensure_roles_in_mdms', return_value=True), \
+             patch.object(uploader, '_create_employee_record', side_effect=fake_create), \
+             patch.object(uploader, '_write_status_to_excel', side_effect=fake_write):
+            results = uploader.create_employees_streaming(
+                employees, 'pg.citya', sheet_name='Employee Master',
+                excel_file=self.excel_path, workers=3
+            )
+
+        self.assertEqual(results['created'], 1)
+        self.assertEqual(results['exists'], 1)
+        self.assertEqual(results['failed'], 1)
+        self.assertEqual(results['password_updated'], 1)
+        self.assertEqual(results['errors'], [{'id': 'C', 'error': 'bad'}])
+        self.assertEqual([r['row_index'] for r in written['rows']], [1, 2, 4])
+
+    def test_streaming_employees_fail_every_row_like_the_bulk_path(self):
+        uploader = self._build_uploader()
+        employees = [{'code': c} for c in 'ABCDE']
+
+        def fake_create(employee, tenant, label):
+            unauthorized = employee['code'] == 'B'
+            return {
+                'code': employee['code'],
+                'status': 'FAILED' if unauthorized else 'SUCCESS',
+                'status_code': 401 if unauthorized else 200,
+                'error_message': '',
+                'password_updated': False,
+                'auth_failed': unauthorized,
+            }
+
+        def both():
+            bulk = uploader.create_employees(employees, 'pg.citya')
+            streamed = uploader.create_employees_streaming(
+                iter(enumerate(employees, 1)), 'pg.citya', workers=1, queue_size=1)
+            return bulk, streamed
+
+        with patch.object(uploader, '_create_employee_record', side_effect=fake_create), \
+             patch('unified_loader.time.sleep'):
+            with patch.object(uploader, 'ensure_roles_in_mdms', return_value=True):
+                bulk, streamed = both()
+            self.assertEqual(streamed['failed'], 5)
+            self.assertEqual((streamed['failed'], streamed['errors']), (bulk['failed'], bulk['errors']))
+
+            with patch.object(uploader, 'ensure_roles_in_mdms', return_value=False):
+                bulk, streamed = both()
+            self.assertEqual(streamed['failed'], 5)
+            self.assertEqual({k: streamed[k] for k in bulk}, bulk)
+
+
+if __name__ == "__main__":
+    unittest.main()
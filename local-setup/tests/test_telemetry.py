@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+import json
+import os
+import sys
+import threading
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DATALOADER_DIR = os.path.join(REPO_ROOT, "dataloader")
+sys.path.insert(0, DATALOADER_DIR)
+
+from telemetry import TelemetrySender
+
+
+class _Matomo(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        self.server.bulks.append([parse_qs(r.lstrip("?")) for r in body["requests"]])
+        self.server.connections.add(self.client_address)
+        time.sleep(self.server.delay)
+        self.send_response(self.server.status)
+        self.send_header("Content-Length", "2")
+        self.end_headers()
+        self.wfile.write(b"{}")
+
+    def log_message(self, *args):
+        pass
+
+
+class TelemetrySenderTests(unittest.TestCase):
+    def setUp(self):
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), _Matomo)
+        self.server.bulks, self.server.connections, self.server.delay = [], set(), 0
+        self.server.status = 200
+        threading.Thread(target=self.server.serve_forever, args=(0.05,), daemon=True).start()
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}/matomo.php"
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_events_go_out_in_bulk_over_one_connection(self):
+        sender = TelemetrySender(self.url, batch_size=10, batch_wait=0.2)
+        for i in range(25):
+            self.assertTrue(sender.enqueue("dataloader", "load", f"phase{i}"))
+        sender.flush(timeout=5)
+
+        self.assertEqual([len(b) for b in self.server.bulks], [10, 10, 5])
+        self.assertEqual(len(self.server.connections), 1)
+        self.assertEqual(self.server.bulks[0][3]["e_n"], ["phase3"])
+        self.assertEqual(self.server.bulks[0][0]["e_c"], ["dataloader"])
+        self.assertEqual(sender.sent, 25)
+        self.assertFalse(sender.enqueue("dataloader", "load", "after-exit"))
+
+    def test_rejected_batches_count_as_dropped(self):
+        self.server.status = 400
+        sender = TelemetrySender(self.url, batch_size=10, batch_wait=0.2)
+        for i in range(15):
+            sender.enqueue("dataloader", "load", str(i))
+        sender.flush(timeout=5)
+
+        self.assertEqual([len(b) for b in self.server.bulks], [10, 5])
+        self.assertEqual((sender.sent, sender.dropped), (0, 15))
+
+    def test_enqueue_never_blocks_and_drops_on_overflow(self):
+        self.server.delay = 0.5
+        sender = TelemetrySender(self.url, queue_size=5, batch_size=1, batch_wait=0)
+
+        started = time.monotonic()
+        accepted = sum(sender.enqueue("dataloader", "load", str(i)) for i in range(50))
+        self.assertLess(time.monotonic() - started, 0.2)
+        self.assertLessEqual(accepted, 6)
+        self.assertEqual(sender.dropped, 50 - accepted)
+
+        started = time.monotonic()
+        sender.flush(timeout=0.3)
+        self.assertLess(time.monotonic() - started, 0.5)
+
+
+if __name__ == "__main__":
+    unittest.main()
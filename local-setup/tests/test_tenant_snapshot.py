@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+import io
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from unittest import mock
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DATALOADER_DIR = os.path.join(REPO_ROOT, "dataloader")
+sys.path.insert(0, DATALOADER_DIR)
+
+from crs_loader import CRSLoader
+from fake_gateway import FakeGateway
+from payload_bundle import iter_bundle_records, read_bundle_header
+
+
+class TenantSnapshotTests(unittest.TestCase):
+    def setUp(self):
+        self.gateway = FakeGateway()
+        self.gateway.start()
+        self.tmp_dir = tempfile.mkdtemp()
+        gw = self.gateway
+        gw.schemas[("pg", "RAINMAKER-PGR.ComplaintHierarchy")] = {
+            "tenantId": "pg", "code": "RAINMAKER-PGR.ComplaintHierarchy",
+            "definition": {"x-ref-schema": [{"fieldPath": "department",
+                                             "schemaCode": "common-masters.Department"}]}}
+        gw.schemas[("pg", "common-masters.Department")] = {
+            "tenantId": "pg", "code": "common-masters.Department", "definition": {}}
+        gw.seed_mdms("pg.citya", "common-masters.Department",
+                     [{"code": f"DEPT_{i}", "name": f"Dept {i}"} for i in range(250)])
+        gw.seed_mdms("pg.citya", "RAINMAKER-PGR.ComplaintHierarchy",
+                     [{"code": "StreetLight", "department": "DEPT_1"}])
+
+        self.loader = CRSLoader(gw.url, progress="quiet")
+        with redirect_stdout(io.StringIO()):
+            self.loader.login("ADMIN", "eGov@123", tenant_id="pg")
+            self.loader.uploader.create_boundary_hierarchy({
+                "tenantId": "pg.citya", "hierarchyType": "ADMIN",
+                "boundaryHierarchy": [{"boundaryType": "City", "parentBoundaryType": None},
+                                      {"boundaryType": "Ward", "parentBoundaryType": "City"}]})
+            self.loader.uploader.create_boundaries_from_specs(
+                "pg.citya", "ADMIN", [("CITYA", "City", None), ("W1", "Ward", "CITYA")])
+            self.loader.uploader.create_localization_messages(
+                [{"code": "DEPT_1", "message": "Roads", "module": "rainmaker-pgr", "locale": "en_IN"}],
+                "pg.citya")
+
+    def tearDown(self):
+        self.gateway.stop()
+        shutil.rmtree(self.tmp_dir)
+
+    def export(self):
+        path = os.path.join(self.tmp_dir, "citya.snapshot.ndjson.gz")
+        with redirect_stdout(io.StringIO()):
+            return self.loader.export_tenant_snapshot("pg.citya", path, localizations=True,
+                                                      boundaries=True, page_size=100)
+
+    def test_export_pages_through_records_with_referenced_schemas_first(self):
+        path = self.export()
+
+        header = read_bundle_header(path)
+        records = list(iter_bundle_records(path))
+        kinds = [r["kind"] for r in records]
+
+        self.assertEqual(header["phase"], "snapshot")
+        self.assertEqual([r["code"] for r in records if r["kind"] == "schema"],
+                         ["common-masters.Department", "RAINMAKER-PGR.ComplaintHierarchy"])
+        self.assertEqual(kinds.count("mdms"), 251)
+        self.assertEqual([r["code"] for r in records if r["kind"] == "boundary"], ["CITYA", "W1"])
+        self.assertEqual(kinds[-4:], ["localization", "hierarchy", "boundary", "boundary"])
+        self.assertNotIn("_isActive", records[2]["data"])
+
+    def test_import_clones_into_another_root_and_is_idempotent(self):
+        path = self.export()
+
+        with redirect_stdout(io.StringIO()), mock.patch("time.sleep"):
+            first = self.loader.import_tenant_snapshot(path, "ke.nairobi")
+            self.gateway.reset_stats()
+            second = self.loader.import_tenant_snapshot(path, "ke.nairobi")
+
+        gw = self.gateway
+        self.assertEqual(first["schemas"]["created"], 2)
+        self.assertEqual(first["common-masters.Department"]["created"], 250)
+        self.assertIn(("ke", "common-masters.Department"), gw.schemas)
+        self.assertEqual(len(gw.mdms[("ke.nairobi", "common-masters.Department")]), 250)
+        self.assertEqual(set(gw.relationships[("ke.nairobi", "ADMIN")]), {"CITYA", "W1"})
+        self.assertIn(("rainmaker-pgr", "DEPT_1"), gw.messages[("ke.nairobi", "en_IN")])
+
+        self.assertEqual(second["common-masters.Department"], {"created": 0, "exists": 250,
+                                                               "failed": 0, "errors": []})
+        stats = gw.stats()
+        self.assertNotIn("mdms/_create", stats)
+        self.assertNotIn("mdms/schema/_create", stats)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+import io
+import os
+import sys
+import threading
+import unittest
+from contextlib import redirect_stdout
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(REPO_ROOT, "dataloader"))
+
+from thread_output import thread_stdout
+
+
+class ThreadStdoutTests(unittest.TestCase):
+    def test_each_thread_writes_to_its_own_stream(self):
+        console, logs = io.StringIO(), [io.StringIO() for _ in range(3)]
+
+        def work(log, i):
+            with stdout.to(log):
+                print(f"worker {i}")
+
+        with redirect_stdout(console), thread_stdout() as stdout:
+            threads = [threading.Thread(target=work, args=(log, i)) for i, log in enumerate(logs)]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+            print("driver")
+
+        self.assertEqual([log.getvalue() for log in logs], [f"worker {i}\n" for i in range(3)])
+        self.assertEqual(console.getvalue(), "driver\n")
+
+    def test_overlapping_runners_share_one_proxy_and_restore_stdout(self):
+        console = io.StringIO()
+        with redirect_stdout(console):
+            first = thread_stdout()
+            second = thread_stdout()
+            outer = first.__enter__()
+            inner = second.__enter__()
+            self.assertIs(outer, inner)
+            self.assertIs(sys.stdout, outer)
+
+            # The first runner finishes while the second is still going
+            first.__exit__(None, None, None)
+            self.assertIs(sys.stdout, inner)
+            second.__exit__(None, None, None)
+            self.assertIs(sys.stdout, console)
+
+            with thread_stdout() as again:
+                self.assertIsNot(again, outer)
+                self.assertIs(again.fallback, console)
+            self.assertIs(sys.stdout, console)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+import io
+import json
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from contextlib import redirect_stdout
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DATALOADER_DIR = os.path.join(REPO_ROOT, "dataloader")
+sys.path.insert(0, DATALOADER_DIR)
+
+from crs_loader import CRSLoader
+from fake_gateway import FakeGateway
+from token_cache import TokenCache
+from unified_loader import APIUploader
+
+
+class TokenCacheTests(unittest.TestCase):
+    def setUp(self):
+        self.gateway = FakeGateway()
+        self.gateway.start()
+        self.cache_dir = tempfile.mkdtemp()
+        self.cache = TokenCache(self.cache_dir)
+
+    def tearDown(self):
+        self.gateway.stop()
+        shutil.rmtree(self.cache_dir)
+
+    def uploader(self, password="eGov@123"):
+        with redirect_stdout(io.StringIO()):
+            return APIUploader(self.gateway.url, "ADMIN", password, tenant_id="pg",
+                               token_cache=self.cache)
+
+    def logins(self):
+        return self.gateway.stats().get("user/oauth", {}).get("calls", 0)
+
+    def test_second_login_reuses_the_cached_token(self):
+        first = self.uploader()
+        second = self.uploader()
+
+        self.assertEqual(self.logins(), 1)
+        self.assertTrue(second.authenticated)
+        self.assertEqual(second.auth_token, first.auth_token)
+        self.assertEqual(second.user_info["userName"], "ADMIN")
+        (name,) = os.listdir(self.cache_dir)
+        self.assertEqual(os.stat(os.path.join(self.cache_dir, name)).st_mode & 0o777, 0o600)
+        with open(os.path.join(self.cache_dir, name)) as f:
+            self.assertNotIn("eGov@123", f.read())
+
+    def test_token_is_not_reused_with_another_password(self):
+        first = self.uploader()
+        self.uploader(password="definitely-wrong")
+        self.uploader()
+
+        # The fake accepts any password, so both mismatching logins reach it
+        self.assertEqual(self.logins(), 3)
+        self.assertIsNone(self.cache.load(self.gateway.url, "ADMIN", "pg", "EMPLOYEE", first.password + "x"))
+
+    def test_expiring_token_is_not_reused(self):
+        self.uploader()
+        (name,) = os.listdir(self.cache_dir)
+        path = os.path.join(self.cache_dir, name)
+        with open(path) as f:
+            entry = json.load(f)
+        entry["expires_at"] = time.time() + 60
+        with open(path, "w") as f:
+            json.dump(entry, f)
+
+        self.uploader()
+
+        self.assertEqual(self.logins(), 2)
+
+    def test_401_logs_in_once_and_retries_every_request(self):
+        uploader = self.uploader()
+        fork = CRSLoader(self.gateway.url, progress="quiet")
+        fork.uploader, fork.tenant_id, fork._authenticated = uploader, "pg", True
+        fork = fork.fork(progress="quiet")
+        self.gateway.seed_mdms("pg", "common-masters.Department", [{"code": "DEPT_1"}])
+        self.gateway.expire_tokens()
+
+        results = []
+        with redirect_stdout(io.StringIO()) as out:
+            threads = [threading.Thread(target=lambda u=u: results.append(
+                           u.search_mdms_data("common-masters.Department", "pg")))
+                       for u in [uploader, fork.uploader] * 4]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+
+        self.assertEqual(self.logins(), 2)
+        self.assertEqual([len(r) for r in results], [1] * 8)
+        self.assertEqual(out.getvalue().count("Token rejected"), 1)
+        self.assertEqual(fork.uploader.auth_token, uploader.auth_token)
+        self.assertEqual(self.cache.load(self.gateway.url, "ADMIN", "pg", "EMPLOYEE", "eGov@123")["access_token"],
+                         uploader.auth_token)
+
+
+if __name__ == "__main__":
+    unittest.main()
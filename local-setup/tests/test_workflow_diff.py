@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+import copy
+import io
+import json
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+import uuid
+from contextlib import redirect_stdout
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DATALOADER_DIR = os.path.join(REPO_ROOT, "dataloader")
+sys.path.insert(0, DATALOADER_DIR)
+
+from crs_loader import CRSLoader
+from fake_gateway import FakeGateway
+from workflow_diff import diff_workflows, instantiate, load_workflow_template, workflow_hash
+
+WORKFLOW_JSON = os.path.join(DATALOADER_DIR, "templates", "PgrWorkflowConfig.json")
+TENANTS = ["pg.citya", "pg.cityb", "pg.cityc"]
+
+
+def _as_deployed(config):
+    """config the way the workflow service returns it: uuids, uuid state references, reordered"""
+    deployed = copy.deepcopy(config)
+    deployed["uuid"] = str(uuid.uuid4())
+    deployed["auditDetails"] = {"createdBy": "someone"}
+    ids = {s.get("state"): str(uuid.uuid4()) for s in deployed["states"]}
+    for state in deployed["states"]:
+        state["uuid"] = ids[state.get("state")]
+        for action in state.get("actions") or []:
+            action["uuid"] = str(uuid.uuid4())
+            action["currentState"] = state["uuid"]
+            action["nextState"] = ids.get(action["nextState"], action["nextState"])
+            action["roles"] = list(reversed(action["roles"]))
+        state["actions"] = list(reversed(state.get("actions") or []))
+    deployed["states"].reverse()
+    return deployed
+
+
+class WorkflowDiffTests(unittest.TestCase):
+    def test_deployed_form_hashes_like_the_template(self):
+        config = instantiate(load_workflow_template(WORKFLOW_JSON), "pg.citya")
+        deployed = _as_deployed(config)
+        self.assertEqual(workflow_hash(deployed), workflow_hash(config))
+
+        config["states"][1]["actions"][0]["roles"].append("GRO")
+        config["states"].append({"state": "ARCHIVED", "applicationStatus": "ARCHIVED", "actions": []})
+        diff = diff_workflows(deployed, config)
+        self.assertEqual(diff["added"], ["ARCHIVED"])
+        self.assertEqual(diff["changed_states"], [config["states"][1]["state"]])
+        self.assertEqual(diff["removed"], [])
+        self.assertEqual(diff["fields"], [])
+
+
+class WorkflowFanOutTests(unittest.TestCase):
+    def setUp(self):
+        self.gateway = FakeGateway()
+        self.gateway.start()
+        self.tmp_dir = tempfile.mkdtemp()
+        self.loader = CRSLoader(self.gateway.url, progress="quiet")
+        with redirect_stdout(io.StringIO()):
+            self.loader.login("ADMIN", "eGov@123", tenant_id="pg")
+
+    def tearDown(self):
+        self.gateway.stop()
+        shutil.rmtree(self.tmp_dir)
+
+    def _load(self, path):
+        self.gateway.reset_stats()
+        with redirect_stdout(io.StringIO()):
+            return self.loader.load_workflows(path, TENANTS, workers=3)
+
+    def test_unchanged_tenants_cost_one_search_and_changes_send_only_their_states(self):
+        created = self._load(WORKFLOW_JSON)
+        self.assertEqual({r["status"] for r in created.values()}, {"created"})
+
+        unchanged = self._load(WORKFLOW_JSON)
+        self.assertEqual({r["status"] for r in unchanged.values()}, {"exists"})
+        self.assertEqual(set(self.gateway.stats()), {"workflow/_search"})
+        self.assertEqual(self.gateway.stats()["workflow/_search"]["calls"], 3)
+
+        with open(WORKFLOW_JSON) as f:
+            data = json.load(f)
+        states = data["BusinessServices"][0]["states"]
+        edited = next(s for s in states if s.get("state") == "RESOLVED")
+        edited["actions"][0]["roles"].append("GRO")
+        path = os.path.join(self.tmp_dir, "workflow.json")
+        with open(path, "w") as f:
+            json.dump(data, f)
+
+        updated = self._load(path)
+        self.assertEqual({r["status"] for r in updated.values()}, {"updated"})
+        self.assertEqual(updated["pg.cityb"]["changed"], ["RESOLVED"])
+        self.assertEqual(self.gateway.stats()["workflow/_update"]["calls"], 3)
+
+        stored = self.gateway.workflows[("pg.cityb", "PGR")]
+        self.assertEqual(len(stored["states"]), len(states))
+        config = instantiate(load_workflow_template(path), "pg.cityb")
+        self.assertEqual(workflow_hash(stored), workflow_hash(config))
+
+
+if __name__ == "__main__":
+    unittest.main()
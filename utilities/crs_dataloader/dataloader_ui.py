@@ -10,8 +10,8 @@ from datetime import datetime
 
 # ── imports that may not be installed yet at module load ──────────────────────
 def _get_loader_imports():
-    from unified_loader_v1 import UnifiedExcelReader, APIUploader, clean_nans
-    return UnifiedExcelReader, APIUploader, clean_nans
+    from unified_loader_v1 import UnifiedExcelReader, APIUploader
+    return UnifiedExcelReader, APIUploader
 
 def _uploader(state):
     """Return the authenticated uploader from state, or raise a clear error."""
@@ -44,6 +44,8 @@ class State:
         self.result_ct              = None
         self.result_ct_def          = None
         self.result_employees       = None
+        # background upload queue (see _JobRunner)
+        self.jobs                   = _JobRunner(self)
 
 
 # ═════════════════════════════════════════════════════════════════════════════
@@ -57,11 +59,11 @@ def setup_env(base_url, username, password, user_type, tenant_id):
     import warnings
     warnings.filterwarnings("ignore")
 
-    for _mod in ("unified_loader_v1", "mdms_validator", "dataloader_ui"):
+    for _mod in ("unified_loader_v1", "progress", "mdms_validator", "dataloader_ui"):
         if _mod in sys.modules:
             del sys.modules[_mod]
 
-    _, APIUploader, _ = _get_loader_imports()
+    _, APIUploader = _get_loader_imports()
 
     os.makedirs("upload", exist_ok=True)
     for _f in os.listdir("upload"):
@@ -176,7 +178,7 @@ def new_tenant_ui(state: State, base_url_ref: list, username_ref: list,
             new_tid = state.config.get("tenant_id", "")
             print(f"Re-authenticating as {username_ref[0]} @ {base_url_ref[0]} "
                   f"with tenant {new_tid} ...")
-            _, APIUploader, _ = _get_loader_imports()
+            _, APIUploader = _get_loader_imports()
             uploader = APIUploader(
                 base_url_ref[0], username_ref[0], password_ref[0],
                 user_type_ref[0], new_tid,
@@ -264,6 +266,214 @@ def _save_upload(file_widget, dest_path):
         f.write(file_widget.value[0]["content"])
     return dest_path
 
+class _ProgressPanel:
+    """Progress bar, status line and Cancel button for one upload panel.
+
+    Fed by the uploader's progress events while the panel's job runs on the
+    background worker; failed records are printed into the job's Output.
+    """
+    def __init__(self):
+        self.bar    = widgets.IntProgress(value=0, min=0, max=1, bar_style="info",
+                                          layout=widgets.Layout(width="60%"))
+        self.cancel_btn = widgets.Button(description="Cancel", button_style="danger",
+                                         icon="stop", layout=widgets.Layout(width="auto"))
+        self.label  = widgets.HTML("")
+        self.widget = widgets.VBox([widgets.HBox([self.bar, self.cancel_btn]), self.label],
+                                   layout=widgets.Layout(display="none"))
+        self.job    = None
+        self.counts = {}
+        self.cancel_btn.on_click(lambda b: self.job and self.job.cancel())
+
+    @property
+    def busy(self):
+        return self.job is not None and not self.job.done
+
+    def _status(self, text, color="#555"):
+        self.label.value = f"<span style='color:{color}'>{text}</span>"
+
+    def queued(self, job, ahead):
+        self.job    = job
+        self.counts = {}
+        self.bar.value, self.bar.max, self.bar.bar_style = 0, 1, "info"
+        self.cancel_btn.disabled = False
+        self.widget.layout.display = ""
+        self._status(f"<b>{job.name}</b> queued -- {ahead} job(s) ahead" if ahead
+                     else f"<b>{job.name}</b> starting ...")
+
+    def started(self, job):
+        self._status(f"<b>{job.name}</b> running ...")
+
+    def finished(self, job, status):
+        self.cancel_btn.disabled = True
+        self.bar.bar_style = {"done": "success" if self.bar.bar_style == "info" else "warning",
+                              "cancelled": "", "error": "danger"}[status]
+        tally = ", ".join(f"{k.lower()} {v}" for k, v in sorted(self.counts.items()))
+        color = {"done": "#28a745", "cancelled": "#6c757d", "error": "#dc3545"}[status]
+        self._status(f"<b>{job.name}</b> {status}{' -- ' + tally if tally else ''}", color)
+
+    def handle(self, event):
+        kind = event["event"]
+        if kind == "task_start":
+            self.bar.max   = max(event.get("total") or 1, 1)
+            self.bar.value = 0
+        elif kind in ("row", "batch"):
+            if event.get("status") == "FAILED":
+                self.bar.bar_style = "warning"
+                if event.get("message"):
+                    print(event["message"])
+            self.bar.value = min(event["done"], self.bar.max)
+            self.counts    = dict(self.job.progress.counts)
+        else:
+            return
+        total = event.get("total")
+        done  = f"{event.get('done') or 0}/{total}" if total else f"{event.get('done') or 0}"
+        self._status(f"<b>{event.get('task') or ''}</b> {done}")
+
+
+# ═════════════════════════════════════════════════════════════════════════════
+# Background uploads
+# ═════════════════════════════════════════════════════════════════════════════
+class _Job:
+    """One queued upload: a callable plus the widgets that show its output."""
+    def __init__(self, name, fn, panel, out):
+        import threading
+        self.name     = name
+        self.fn       = fn
+        self.panel    = panel
+        self.out      = out
+        self.progress = None
+        self.done     = False
+        self._cancel  = threading.Event()
+
+    @property
+    def cancelled(self):
+        return self._cancel.is_set()
+
+    def cancel(self):
+        """Drop the job if still queued, else stop at the next record/batch."""
+        self._cancel.set()
+        if self.progress is not None:
+            self.progress.cancel()
+        self.panel.cancel_btn.disabled = True
+        self.panel._status(f"<b>{self.name}</b> cancelling ...", "#6c757d")
+
+
+class _WidgetStream:
+    """File-like stream appending to a job's Output widget. The worker thread
+    is routed to it through thread_output.ThreadStdout; prints from anywhere
+    else still go to the notebook's own stream."""
+    def __init__(self, out):
+        self.out    = out
+        self.buffer = ""
+
+    def write(self, text):
+        # Whole lines only -- print() writes the text and the newline separately
+        self.buffer += text
+        if "\n" in self.buffer:
+            head, _, self.buffer = self.buffer.rpartition("\n")
+            self.out.append_stdout(head + "\n")
+        return len(text)
+
+    def flush(self):
+        if self.buffer:
+            self.out.append_stdout(self.buffer)
+            self.buffer = ""
+
+
+class _JobRunner:
+    """Runs uploads one at a time on a daemon thread, in the order they were
+    clicked, so the notebook stays responsive and phases can be queued."""
+    def __init__(self, state):
+        import queue, threading
+        self.state   = state
+        self.queue   = queue.Queue()
+        self.pending = []
+        self.current = None
+        self._lock   = threading.Lock()
+        self._thread = None
+
+    def submit(self, name, fn, panel, out):
+        import threading
+        job = _Job(name, fn, panel, out)
+        with self._lock:
+            ahead = len(self.pending) + (1 if self.current else 0)
+            self.pending.append(job)
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._work, name="dataloader-uploads",
+                                                daemon=True)
+                self._thread.start()
+        panel.queued(job, ahead)
+        self.queue.put(job)
+        return job
+
+    def cancel_all(self):
+        with self._lock:
+            jobs = list(self.pending) + ([self.current] if self.current else [])
+        for job in jobs:
+            job.cancel()
+
+    def _work(self):
+        from thread_output import thread_stdout
+
+        # The worker lives as long as the kernel, so the proxy stays installed
+        with thread_stdout() as stdout:
+            while True:
+                job = self.queue.get()
+                with self._lock:
+                    self.pending.remove(job)
+                    self.current = job
+                try:
+                    self._run(job, stdout)
+                finally:
+                    job.done = True
+                    with self._lock:
+                        self.current = None
+
+    def _run(self, job, stdout):
+        from progress import Progress, CallbackSink, Cancelled
+
+        if job.cancelled:
+            job.panel.finished(job, "cancelled")
+            return
+        uploader = self.state.uploader
+        job.progress = Progress([CallbackSink(job.panel.handle)])
+        if job.cancelled:
+            job.progress.cancel()
+        previous = uploader.progress if uploader else None
+        if uploader:
+            uploader.progress = job.progress
+
+        job.panel.started(job)
+        status = "done"
+        try:
+            with stdout.to(_WidgetStream(job.out)):
+                try:
+                    job.fn()
+                    if job.cancelled:
+                        status = "cancelled"
+                except Cancelled:
+                    print("⏹ Cancelled")
+                    status = "cancelled"
+                except Exception as ex:
+                    print(f"Error: {ex}")
+                    status = "error"
+        finally:
+            if uploader:
+                uploader.progress = previous
+            job.panel.finished(job, status)
+
+
+def _busy(panel):
+    """True (with a note) if the panel already has an upload queued or running."""
+    if panel.busy:
+        print(f"'{panel.job.name}' is already queued or running -- cancel it first")
+    return panel.busy
+
+def _submit(state, name, fn, panel, out):
+    """Queue fn on the shared background worker; returns the _Job."""
+    return state.jobs.submit(name, fn, panel, out)
+
+
 def _validate(file_path, tenant_id, schema_code, uploader):
     """Run MDMS schema validation; returns True if passed or validator unavailable."""
     try:
@@ -289,15 +499,17 @@ def _validate(file_path, tenant_id, schema_code, uploader):
 # ═════════════════════════════════════════════════════════════════════════════
 def tenant_ui(state: State):
     """Phase 1: upload Tenant Master Excel."""
-    UnifiedExcelReader, _, clean_nans = _get_loader_imports()
+    UnifiedExcelReader, _ = _get_loader_imports()
 
     t_w    = _txt("Tenant ID:", state.config.get("tenant_id", "pg"))
     file_w = _upload_w()
     btn    = _btn("Upload Tenant Master")
+    prog   = _ProgressPanel()
     out    = widgets.Output()
 
     def on_upload(b):
         with out:
+            if _busy(prog): return
             clear_output()
             try:
                 uploader = _uploader(state)
@@ -305,32 +517,34 @@ def tenant_ui(state: State):
                 print(str(e)); return
             if not t_w.value.strip():  print("Tenant ID required"); return
             if not file_w.value:       print("Select an Excel file"); return
-            state.config["tenant_id"] = t_w.value.strip().lower()
+            tenant = state.config["tenant_id"] = t_w.value.strip().lower()
             dest = os.path.join("upload", "Tenant_Master.xlsx")
             _save_upload(file_w, dest)
             print(f"Saved: {dest}")
-            if not _validate(dest, state.config["tenant_id"],
-                             "tenant.masterschemavalidation", uploader):
-                return
-            state.tenant_file = dest
-            reader = UnifiedExcelReader(dest)
-            tenants_data, tenants_loc = reader.read_tenant_info()
-            state.uploaded_tenants = [t["code"] for t in tenants_data]
-            print(f"Uploading {len(tenants_data)} tenant(s): {', '.join(state.uploaded_tenants)}")
-            state.result_tenants = uploader.create_mdms_data(
-                "tenant.tenants", clean_nans(tenants_data),
-                state.config["tenant_id"], "Tenant Info", dest)
-            uploader.create_localization_messages(
-                clean_nans(tenants_loc), state.config["tenant_id"], "Tenants_Localization")
-            branding = reader.read_tenant_branding(state.config["tenant_id"])
-            if branding:
-                print(f"Uploading {len(branding)} branding record(s) ...")
-                state.result_branding = uploader.create_mdms_data(
-                    "common-masters.StateInfo", clean_nans(branding),
-                    state.config["tenant_id"], "Tenant Branding Details", dest)
-            ok = state.result_tenants.get("failed", 0) == 0
-            print("Phase 1 complete!" if ok
-                  else "Done with errors -- check status columns in the Excel.")
+
+            def upload():
+                if not _validate(dest, tenant, "tenant.masterschemavalidation", uploader):
+                    return
+                state.tenant_file = dest
+                reader = UnifiedExcelReader(dest)
+                tenants_data, tenants_loc = reader.read_tenant_info()
+                state.uploaded_tenants = [t["code"] for t in tenants_data]
+                print(f"Uploading {len(tenants_data)} tenant(s): {', '.join(state.uploaded_tenants)}")
+                state.result_tenants = uploader.create_mdms_data(
+                    "tenant.tenants", tenants_data,
+                    tenant, "Tenant Info", dest)
+                uploader.create_localization_messages(
+                    tenants_loc, tenant, "Tenants_Localization")
+                branding = reader.read_tenant_branding(tenant)
+                if branding:
+                    print(f"Uploading {len(branding)} branding record(s) ...")
+                    state.result_branding = uploader.create_mdms_data(
+                        "common-masters.StateInfo", branding,
+                        tenant, "Tenant Branding Details", dest)
+                ok = state.result_tenants.get("failed", 0) == 0
+                print("Phase 1 complete!" if ok
+                      else "Done with errors -- check status columns in the Excel.")
+            _submit(state, "Phase 1 - Tenant Master", upload, prog, out)
 
     btn.on_click(on_upload)
     return widgets.VBox([
@@ -345,7 +559,7 @@ def tenant_ui(state: State):
             "</ol>"
         ),
         _template_link("Tenant And Branding Master.xlsx", "Download Tenant Master Template"),
-        t_w, file_w, btn, out,
+        t_w, file_w, btn, prog.widget, out,
     ])
 
 
@@ -593,10 +807,12 @@ def boundary_ui(state: State):
     # ── Step 2b: upload boundary data ────────────────────────────────────────
     bnd_file_w     = _upload_w("Filled template:")
     upload_bnd_btn = _btn("Upload & Process Boundary")
+    bnd_prog       = _ProgressPanel()
     bnd_out        = widgets.Output()
 
     def on_upload_bnd(b):
         with bnd_out:
+            if _busy(bnd_prog): return
             clear_output()
             try:
                 uploader = _uploader(state)
@@ -606,34 +822,34 @@ def boundary_ui(state: State):
                 print("Complete Step 2a first"); return
             if not bnd_file_w.value:
                 print("Select a filled template Excel"); return
-            path = os.path.join(
-                "upload",
-                f"boundary_{state.boundary_tenant}_{state.boundary_hierarchy_type}.xlsx")
+            tenant, hierarchy_type = state.boundary_tenant, state.boundary_hierarchy_type
+            path = os.path.join("upload", f"boundary_{tenant}_{hierarchy_type}.xlsx")
             _save_upload(bnd_file_w, path)
             print(f"Saved: {path}")
-            # Upload to filestore, then submit to boundary management process API
-            fst_id = uploader.upload_file_to_filestore(
-                path, state.boundary_tenant, "HCM-ADMIN-CONSOLE")
-            if not fst_id:
-                print("Filestore upload failed -- aborting"); return
-            resource = uploader.process_boundary_data(
-                state.boundary_tenant,
-                filestore_id=fst_id,
-                hierarchy_type=state.boundary_hierarchy_type,
-                action="create",
-            )
-            if not resource:
-                print("Boundary processing failed — could not submit job."); return
-            # Poll until the boundary management service finishes processing
-            final = uploader.poll_boundary_process_status(
-                state.boundary_tenant, state.boundary_hierarchy_type)
-            if final.get("status") == "completed":
-                print(f"Phase 2 complete! Boundary data processed successfully.")
-                processed_id = final.get("processedFileStoreId")
-                if processed_id:
-                    print(f"   Processed FileStore ID: {processed_id}")
-            else:
-                print(f"Boundary processing ended with status: {final.get('status', 'unknown')}")
+
+            def upload():
+                # Upload to filestore, then submit to boundary management process API
+                fst_id = uploader.upload_file_to_filestore(path, tenant, "HCM-ADMIN-CONSOLE")
+                if not fst_id:
+                    print("Filestore upload failed -- aborting"); return
+                resource = uploader.process_boundary_data(
+                    tenant,
+                    filestore_id=fst_id,
+                    hierarchy_type=hierarchy_type,
+                    action="create",
+                )
+                if not resource:
+                    print("Boundary processing failed — could not submit job."); return
+                # Poll until the boundary management service finishes processing
+                final = uploader.poll_boundary_process_status(tenant, hierarchy_type)
+                if final.get("status") == "completed":
+                    print(f"Phase 2 complete! Boundary data processed successfully.")
+                    processed_id = final.get("processedFileStoreId")
+                    if processed_id:
+                        print(f"   Processed FileStore ID: {processed_id}")
+                else:
+                    print(f"Boundary processing ended with status: {final.get('status', 'unknown')}")
+            _submit(state, "Phase 2 - Boundaries", upload, bnd_prog, bnd_out)
     upload_bnd_btn.on_click(on_upload_bnd)
 
     acc = widgets.Accordion(children=[
@@ -670,7 +886,7 @@ def boundary_ui(state: State):
                 "Leave deeper columns empty when defining a higher-level boundary.</p>"
                 "</div>"
             ),
-            bnd_file_w, upload_bnd_btn, bnd_out,
+            bnd_file_w, upload_bnd_btn, bnd_prog.widget, bnd_out,
         ]),
     ])
     acc.set_title(0, "Step 2a -- Hierarchy Setup & Template Download")
@@ -684,15 +900,17 @@ def boundary_ui(state: State):
 # ═════════════════════════════════════════════════════════════════════════════
 def common_masters_ui(state: State):
     """Phase 3: upload departments, designations, complaint types."""
-    UnifiedExcelReader, _, clean_nans = _get_loader_imports()
+    UnifiedExcelReader, _ = _get_loader_imports()
 
     t_w    = _txt("Tenant ID:", state.config.get("tenant_id", "pg"))
     file_w = _upload_w()
     btn    = _btn("Upload Common Master")
+    prog   = _ProgressPanel()
     out    = widgets.Output()
 
     def on_upload(b):
         with out:
+            if _busy(prog): return
             clear_output()
             try:
                 uploader = _uploader(state)
@@ -700,63 +918,66 @@ def common_masters_ui(state: State):
                 print(str(e)); return
             if not t_w.value.strip():  print("Tenant ID required"); return
             if not file_w.value:       print("Select an Excel file"); return
-            state.selected_tenant = t_w.value.strip().lower()
+            tenant = state.selected_tenant = t_w.value.strip().lower()
             dest = os.path.join("upload", "Common_Master.xlsx")
             _save_upload(file_w, dest)
             print(f"Saved: {dest}")
-            if not _validate(dest, state.selected_tenant,
-                             "common.masterschemavalidation", uploader):
-                return
-            state.common_master_file = dest
-            reader = UnifiedExcelReader(dest)
-            (dept_data, desig_data,
-             dept_loc, desig_loc,
-             dept_name_to_code) = reader.read_departments_designations(
-                state.selected_tenant, uploader)
-            if dept_data:
-                state.result_dept = uploader.create_mdms_data(
-                    "common-masters.Department", clean_nans(dept_data),
-                    state.selected_tenant, "Department And Desgination Mast", dest)
-                r = state.result_dept
-                print(f"Departments: {r.get('created',0)} created, "
-                      f"{r.get('exists',0)} exist, {r.get('failed',0)} failed")
-            if dept_loc:
-                uploader.create_localization_messages(
-                    clean_nans(dept_loc), state.selected_tenant, "Department_Localization")
-            if desig_data:
-                state.result_desig = uploader.create_mdms_data(
-                    "common-masters.Designation", clean_nans(desig_data),
-                    state.selected_tenant, "Department And Desgination Mast", dest)
-                r = state.result_desig
-                print(f"Designations: {r.get('created',0)} created, "
-                      f"{r.get('exists',0)} exist, {r.get('failed',0)} failed")
-            if desig_loc:
-                uploader.create_localization_messages(
-                    clean_nans(desig_loc), state.selected_tenant, "Designation_Localization")
-            ct_data, ct_loc = reader.read_complaint_types(state.selected_tenant, dept_name_to_code)
-            if ct_data:
-                # Merged 2-master model: ComplaintHierarchyDefinition (levels) first,
-                # then ComplaintHierarchy (interior CATEGORY nodes + leaf SUB_TYPE rows).
-                hierarchy_def = reader.complaint_hierarchy_definition()
-                state.result_ct_def = uploader.create_mdms_data(
-                    "RAINMAKER-PGR.ComplaintHierarchyDefinition", clean_nans([hierarchy_def]),
-                    state.selected_tenant, "Complaint Type Master", dest)
-                state.result_ct = uploader.create_mdms_data(
-                    "RAINMAKER-PGR.ComplaintHierarchy", clean_nans(ct_data),
-                    state.selected_tenant, "Complaint Type Master", dest)
-                r = state.result_ct
-                print(f"Complaint Hierarchy: {r.get('created',0)} created, "
-                      f"{r.get('exists',0)} exist, {r.get('failed',0)} failed")
-            if ct_loc:
-                uploader.create_localization_messages(
-                    clean_nans(ct_loc), state.selected_tenant, "ComplaintType_Localization")
-            all_ok = all(
-                (r or {}).get("failed", 0) == 0
-                for r in [state.result_dept, state.result_desig, state.result_ct]
-                if r
-            )
-            print("Phase 3 complete!" if all_ok
-                  else "Done with errors -- check status columns in the Excel.")
+
+            def upload():
+                if not _validate(dest, tenant,
+                                 "common.masterschemavalidation", uploader):
+                    return
+                state.common_master_file = dest
+                reader = UnifiedExcelReader(dest)
+                (dept_data, desig_data,
+                 dept_loc, desig_loc,
+                 dept_name_to_code) = reader.read_departments_designations(
+                    tenant, uploader)
+                if dept_data:
+                    state.result_dept = uploader.create_mdms_data(
+                        "common-masters.Department", dept_data,
+                        tenant, "Department And Desgination Mast", dest)
+                    r = state.result_dept
+                    print(f"Departments: {r.get('created',0)} created, "
+                          f"{r.get('exists',0)} exist, {r.get('failed',0)} failed")
+                if dept_loc:
+                    uploader.create_localization_messages(
+                        dept_loc, tenant, "Department_Localization")
+                if desig_data:
+                    state.result_desig = uploader.create_mdms_data(
+                        "common-masters.Designation", desig_data,
+                        tenant, "Department And Desgination Mast", dest)
+                    r = state.result_desig
+                    print(f"Designations: {r.get('created',0)} created, "
+                          f"{r.get('exists',0)} exist, {r.get('failed',0)} failed")
+                if desig_loc:
+                    uploader.create_localization_messages(
+                        desig_loc, tenant, "Designation_Localization")
+                ct_data, ct_loc = reader.read_complaint_types(tenant, dept_name_to_code)
+                if ct_data:
+                    # Merged 2-master model: ComplaintHierarchyDefinition (levels) first,
+                    # then ComplaintHierarchy (interior CATEGORY nodes + leaf SUB_TYPE rows).
+                    hierarchy_def = reader.complaint_hierarchy_definition()
+                    state.result_ct_def = uploader.create_mdms_data(
+                        "RAINMAKER-PGR.ComplaintHierarchyDefinition", [hierarchy_def],
+                        tenant, "Complaint Type Master", dest)
+                    state.result_ct = uploader.create_mdms_data(
+                        "RAINMAKER-PGR.ComplaintHierarchy", ct_data,
+                        tenant, "Complaint Type Master", dest)
+                    r = state.result_ct
+                    print(f"Complaint Hierarchy: {r.get('created',0)} created, "
+                          f"{r.get('exists',0)} exist, {r.get('failed',0)} failed")
+                if ct_loc:
+                    uploader.create_localization_messages(
+                        ct_loc, tenant, "ComplaintType_Localization")
+                all_ok = all(
+                    (r or {}).get("failed", 0) == 0
+                    for r in [state.result_dept, state.result_desig, state.result_ct]
+                    if r
+                )
+                print("Phase 3 complete!" if all_ok
+                      else "Done with errors -- check status columns in the Excel.")
+            _submit(state, "Phase 3 - Common Masters", upload, prog, out)
 
     btn.on_click(on_upload)
     return widgets.VBox([
@@ -772,7 +993,7 @@ def common_masters_ui(state: State):
             "</ol>"
         ),
         _template_link("Common and Complaint Master.xlsx", "Download Common Masters Template"),
-        t_w, file_w, btn, out,
+        t_w, file_w, btn, prog.widget, out,
     ])
 
 
@@ -781,7 +1002,7 @@ def common_masters_ui(state: State):
 # ═════════════════════════════════════════════════════════════════════════════
 def employee_ui(state: State):
     """Phase 4: generate employee template and bulk-create employees."""
-    UnifiedExcelReader, _, clean_nans = _get_loader_imports()
+    UnifiedExcelReader, _ = _get_loader_imports()
 
     # ── Step 4a: generate ────────────────────────────────────────────────────
     eg_t_w  = _txt("Tenant ID:", state.config.get("tenant_id", "pg"))
@@ -817,10 +1038,12 @@ def employee_ui(state: State):
     eu_t_w   = _txt("Tenant ID:", state.config.get("tenant_id", "pg"))
     eu_file_w = _upload_w()
     eu_btn   = _btn("Upload Employees")
+    eu_prog  = _ProgressPanel()
     eu_out   = widgets.Output()
 
     def on_emp_upload(b):
         with eu_out:
+            if _busy(eu_prog): return
             clear_output()
             try:
                 uploader = _uploader(state)
@@ -832,15 +1055,18 @@ def employee_ui(state: State):
             dest   = os.path.join("upload", "Employee_Master.xlsx")
             _save_upload(eu_file_w, dest)
             print(f"Saved: {dest}")
-            state.employee_master_file = dest
-            reader    = UnifiedExcelReader(dest)
-            employees = reader.read_employees_bulk(tenant, uploader)
-            print(f"Found {len(employees)} employee(s)")
-            state.result_employees = uploader.create_employees(
-                clean_nans(employees), tenant, "Employee Master", dest)
-            ok = state.result_employees.get("failed", 0) == 0
-            print("Phase 4 complete!" if ok
-                  else "Done with errors -- check status columns in the Excel.")
+
+            def upload():
+                state.employee_master_file = dest
+                reader    = UnifiedExcelReader(dest)
+                employees = reader.read_employees_bulk(tenant, uploader)
+                print(f"Found {len(employees)} employee(s)")
+                state.result_employees = uploader.create_employees(
+                    employees, tenant, "Employee Master", dest)
+                ok = state.result_employees.get("failed", 0) == 0
+                print("Phase 4 complete!" if ok
+                      else "Done with errors -- check status columns in the Excel.")
+            _submit(state, "Phase 4 - Employees", upload, eu_prog, eu_out)
     eu_btn.on_click(on_emp_upload)
 
     acc4 = widgets.Accordion(children=[
@@ -852,7 +1078,7 @@ def employee_ui(state: State):
         widgets.VBox([
             widgets.HTML("<p style='color:#555'>Upload the filled template to "
                          "bulk-create employees in HRMS.</p>"),
-            eu_t_w, eu_file_w, eu_btn, eu_out,
+            eu_t_w, eu_file_w, eu_btn, eu_prog.widget, eu_out,
         ]),
     ])
     acc4.set_title(0, "Step 4a -- Generate Template")
@@ -909,6 +1135,7 @@ def workflow_ui(state: State):
                                    style={"description_width": "140px"},
                                    layout=widgets.Layout(width="70%"))
     up_wf_btn = _btn("Apply Workflow")
+    up_wf_prog = _ProgressPanel()
     up_wf_out = widgets.Output()
     wf_file   = [None]
 
@@ -930,6 +1157,7 @@ def workflow_ui(state: State):
 
     def on_up_wf(b):
         with up_wf_out:
+            if _busy(up_wf_prog): return
             clear_output()
             try:
                 uploader = _uploader(state)
@@ -938,32 +1166,39 @@ def workflow_ui(state: State):
             path = wf_file[0]
             if not path or not os.path.exists(path):
                 print("Download the template (Step 5a) or upload a JSON file first"); return
-            try:
+            tenant = wf_t_w.value.strip()
+
+            def upload():
                 with open(path) as f:
                     data = json.load(f)
                 # Support both full request body {BusinessServices:[...]} and bare object
                 services = data.get("BusinessServices") if isinstance(data, dict) else None
                 if services is None:
                     services = [data]
-                tenant = wf_t_w.value.strip()
+                uploader._task("workflow", len(services))
                 for svc_obj in services:
+                    if uploader._cancelled():
+                        print("⏹ Cancelled"); break
                     svc_obj["tenantId"] = tenant or svc_obj.get("tenantId", "")
                     svc_code = svc_obj.get("businessService", "?")
                     existing = uploader.search_workflow(svc_obj["tenantId"], svc_code)
                     if existing:
                         result = uploader.update_workflow(svc_obj["tenantId"], svc_obj)
                         if result.get("updated", False):
-                            print(f"✅ Workflow '{svc_code}' successfully updated for tenant '{svc_obj['tenantId']}'")
+                            uploader._row("SUCCESS", svc_code,
+                                          f"✅ Workflow '{svc_code}' successfully updated for tenant '{svc_obj['tenantId']}'")
                         else:
-                            print(f"❌ Workflow '{svc_code}' update failed — {result.get('error', 'unknown error')}")
+                            uploader._row("FAILED", svc_code,
+                                          f"❌ Workflow '{svc_code}' update failed — {result.get('error', 'unknown error')}")
                     else:
                         result = uploader.create_workflow(svc_obj["tenantId"], svc_obj)
                         if result.get("created", False):
-                            print(f"✅ Workflow '{svc_code}' successfully loaded for tenant '{svc_obj['tenantId']}'")
+                            uploader._row("SUCCESS", svc_code,
+                                          f"✅ Workflow '{svc_code}' successfully loaded for tenant '{svc_obj['tenantId']}'")
                         else:
-                            print(f"❌ Workflow '{svc_code}' load failed — {result.get('error', 'unknown error')}")
-            except Exception as ex:
-                print(f"Error: {ex}")
+                            uploader._row("FAILED", svc_code,
+                                          f"❌ Workflow '{svc_code}' load failed — {result.get('error', 'unknown error')}")
+            _submit(state, "Phase 5 - Workflow", upload, up_wf_prog, up_wf_out)
     up_wf_btn.on_click(on_up_wf)
 
     acc5 = widgets.Accordion(children=[
@@ -975,7 +1210,7 @@ def workflow_ui(state: State):
         widgets.VBox([
             widgets.HTML("<p style='color:#555'>Upload your modified JSON. Applies create or "
                          "update based on whether the business service already exists.</p>"),
-            wf_file_w, up_wf_btn, up_wf_out,
+            wf_file_w, up_wf_btn, up_wf_prog.widget, up_wf_out,
         ]),
     ])
     acc5.set_title(0, "Step 5a -- Download Workflow Template")
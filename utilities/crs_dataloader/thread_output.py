@@ -0,0 +1,81 @@
+"""
+Per-thread console output - send each worker thread's print() to its own stream
+
+The multi-tenant runner writes each tenant's output to its own loader.log,
+the phase DAG buffers each step's output and prints it as one block, and
+the notebook UI sends a job's output to its Output widget. All of them
+replace sys.stdout with one ThreadStdout:
+
+    with thread_stdout() as stdout:
+        ...                              # on each worker thread:
+        with stdout.to(log):
+            loader.load_employees(...)   # print() lands in log
+
+Threads that have not chosen a stream write to the stdout that was there
+before. The proxy is installed once and counted: runners that overlap or
+nest share it, and the previous sys.stdout comes back when the last one
+leaves (unless something else has replaced sys.stdout in the meantime).
+"""
+
+import contextlib
+import sys
+import threading
+
+
+class ThreadStdout:
+    """sys.stdout proxy writing each thread's output to the stream it chose"""
+
+    def __init__(self, fallback):
+        self.fallback = fallback
+        self.local = threading.local()
+
+    def _target(self):
+        return getattr(self.local, "stream", None) or self.fallback
+
+    def write(self, text):
+        return self._target().write(text)
+
+    def flush(self):
+        return self._target().flush()
+
+    @contextlib.contextmanager
+    def to(self, stream):
+        """Send this thread's output to stream inside the block"""
+        previous = getattr(self.local, "stream", None)
+        self.local.stream = stream
+        try:
+            yield stream
+        finally:
+            try:
+                stream.flush()
+            finally:
+                self.local.stream = previous
+
+    def __getattr__(self, name):
+        return getattr(self.fallback, name)
+
+
+_lock = threading.Lock()
+_proxy = None
+_users = 0
+
+
+@contextlib.contextmanager
+def thread_stdout():
+    """Install the shared ThreadStdout as sys.stdout for the block; yields it"""
+    global _proxy, _users
+    with _lock:
+        if _proxy is None:
+            _proxy = ThreadStdout(sys.stdout)
+            sys.stdout = _proxy
+        _users += 1
+        proxy = _proxy
+    try:
+        yield proxy
+    finally:
+        with _lock:
+            _users -= 1
+            if _users == 0:
+                if sys.stdout is proxy:
+                    sys.stdout = proxy.fallback
+                _proxy = None
@@ -31,6 +31,9 @@ load_dotenv()
 def clean_nans(obj):
     """
     Recursively clean NaN values and convert dates for JSON serialization
+
+    The sheet readers no longer need it (they run normalize_frame); it stays
+    importable for payloads built by hand.
     """
     if isinstance(obj, dict):
         cleaned = {}
@@ -49,6 +52,61 @@ def clean_nans(obj):
         return obj  # Keep None as None (will be null in JSON)
 
 
+def _iso_or_none(value):
+    """ISO string for datetime-like cells, None for missing ones, else unchanged"""
+    if isinstance(value, (pd.Timestamp, datetime)):
+        return None if pd.isna(value) else value.isoformat()
+    if value is None or (isinstance(value, float) and math.isnan(value)) or value is pd.NaT:
+        return None
+    return value
+
+
+def normalize_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """Make a sheet DataFrame JSON-ready, one column at a time.
+
+    Dtype-aware replacement for running clean_nans over every payload:
+    - datetime64 columns become ISO strings (NaT -> None)
+    - float columns that pandas upcast only to hold NaN go back to ints
+      (so a mobile number is 9999999999, not 9999999999.0)
+    - object columns get NaN/NaT -> None, and stray Timestamps -> ISO, but the
+      per-cell pass only runs when pandas infers mixed/date content
+    - int/bool columns and columns with nothing missing are left untouched
+
+    A converted column is replaced by a new object column (datetime and float
+    columns are copied through astype(object)), so the cost is one copy per
+    converted column rather than one walk per payload. The DataFrame itself
+    is updated and returned, so callers can chain off pd.read_excel().
+    """
+    for col in df.columns:
+        series = df[col]
+        present = series.notna()
+        missing = not present.all()
+
+        if pd.api.types.is_datetime64_any_dtype(series):
+            values = series.astype(object).to_numpy()
+            mask = present.to_numpy()
+            values[~mask] = None
+            values[mask] = [ts.isoformat() for ts in series[present]]
+            df[col] = pd.Series(values, index=df.index, dtype=object)
+        elif pd.api.types.is_float_dtype(series):
+            if not missing:
+                continue
+            values = series.astype(object).to_numpy()
+            values[~present.to_numpy()] = None
+            kept = series[present]
+            if len(kept) and (kept % 1 == 0).all():
+                values[present.to_numpy()] = kept.astype('int64').tolist()
+            df[col] = pd.Series(values, index=df.index, dtype=object)
+        elif pd.api.types.is_object_dtype(series):
+            inferred = pd.api.types.infer_dtype(series, skipna=True)
+            if inferred in ('datetime', 'datetime64', 'date', 'mixed'):
+                df[col] = series.map(_iso_or_none)
+            elif missing:
+                df[col] = series.where(present, None)
+
+    return df
+
+
 # ============================================================================
 # EXCEL READER CLASS
 # ============================================================================
@@ -59,6 +117,15 @@ class UnifiedExcelReader:
     def __init__(self, excel_file: str):
         self.excel_file = excel_file
 
+    def _read_sheet(self, sheet_name):
+        """Read a sheet and normalise it (NaN -> None, dates -> ISO) before extraction"""
+        return normalize_frame(pd.read_excel(self.excel_file, sheet_name=sheet_name))
+
+    @staticmethod
+    def _records(df: pd.DataFrame) -> List[Dict]:
+        """Row dicts of a normalised sheet; keys are the column headers"""
+        return df.to_dict('records')
+
     # ========================================================================
     # TENANT MASTER READERS (PHASE 1)
     # ========================================================================
@@ -78,14 +145,14 @@ class UnifiedExcelReader:
         - Tenant Website
         """
 
-        df = pd.read_excel(self.excel_file, sheet_name='Tenant Info')
+        df = self._read_sheet('Tenant Info')
 
         tenants = []
         localizations = []
         district_counter = {}  # For auto-generating district codes
         city_counter = {}   
 
-        for _, row in df.iterrows():
+        for row in self._records(df):
             
             # Skip empty rows
             if pd.isna(row.get('Tenant Display Name*')) or pd.isna(row.get('Tenant Code*\n(To be filled by ADMIN)')):
@@ -95,13 +162,13 @@ class UnifiedExcelReader:
             tenant_code_col = 'Tenant Code*\n(To be filled by ADMIN)'
             tenant_code = str(row[tenant_code_col]).strip().lower()
 
-            tenant_type = str(row.get('Tenant Type*', '')).strip()
-            logo_path = str(row.get('Logo File Path*', '')).strip()
+            tenant_type = str(row.get('Tenant Type*') or '').strip()
+            logo_path = str(row.get('Logo File Path*') or '').strip()
 
-            city_name = str(row.get('City Name', '')).strip()
-            district_name = str(row.get('District Name', '')).strip()
-            address = str(row.get('Address', '')).strip()
-            website = str(row.get('Tenant Website', '')).strip()
+            city_name = str(row.get('City Name') or '').strip()
+            district_name = str(row.get('District Name') or '').strip()
+            address = str(row.get('Address') or '').strip()
+            website = str(row.get('Tenant Website') or '').strip()
 
             latitude = float(row['Latitude']) if pd.notna(row.get('Latitude')) else 0.0
             longitude = float(row['Longitude']) if pd.notna(row.get('Longitude')) else 0.0
@@ -168,13 +235,13 @@ class UnifiedExcelReader:
             list: Branding information records for MDMS upload
         """
         try:
-            df = pd.read_excel(self.excel_file, sheet_name='Tenant Branding Details')
+            df = self._read_sheet('Tenant Branding Details')
         except Exception as e:
             print(f"⚠️ Could not read 'Tenant Branding Details' sheet: {str(e)}")
             return []
 
         branding_list = []
-        for _, row in df.iterrows():
+        for row in self._records(df):
                 branding_record = {
                      'code':tenant_id,
                     'name':tenant_id,
@@ -203,7 +270,7 @@ class UnifiedExcelReader:
         Returns:
             tuple: (departments_list, designations_list, dept_localization, desig_localization, dept_name_to_code_mapping)
         """
-        df = pd.read_excel(self.excel_file, sheet_name='Department And Desgination Mast')
+        df = self._read_sheet('Department And Desgination Mast')
 
         departments = []
         designations = []
@@ -255,7 +322,7 @@ class UnifiedExcelReader:
         else:
             dept_start_counter = 1
 
-        for _, row in df.iterrows():
+        for row in self._records(df):
             dept_name = row.get('Department Name*')
             desig_name = row.get('Designation Name*')
 
@@ -370,7 +437,7 @@ class UnifiedExcelReader:
                    For the ComplaintHierarchyDefinition record, call complaint_hierarchy_definition().
         """
         hierarchy_type = hierarchy_type or self.COMPLAINT_HIERARCHY_TYPE
-        df = pd.read_excel(self.excel_file, sheet_name='Complaint Type Master')
+        df = self._read_sheet('Complaint Type Master')
 
         category_nodes = []   # interior nodes (RAINMAKER-PGR.ComplaintHierarchy, no department/slaHours)
         leaf_rows = []        # leaf complaint types (code == serviceCode verbatim)
@@ -382,7 +449,7 @@ class UnifiedExcelReader:
         if dept_name_to_code is None:
             dept_name_to_code = {}
 
-        for _, row in df.iterrows():
+        for row in self._records(df):
             # Check if this is a parent row (has Complaint Type* filled)
             if pd.notna(row.get('Complaint Type*')):
                 parent_type = str(row['Complaint Type*']).strip()
@@ -496,7 +563,7 @@ class UnifiedExcelReader:
         if uploader is None:
             raise ValueError("uploader parameter is required. Pass an authenticated APIUploader instance.")
 
-        df = pd.read_excel(self.excel_file, sheet_name='Employee Master')
+        df = self._read_sheet('Employee Master')
 
         # Fetch departments and create name->code mapping
         departments = uploader.fetch_departments(tenant_id)
@@ -514,7 +581,7 @@ class UnifiedExcelReader:
         print(f"   Available role codes: {', '.join(sorted(valid_role_codes))}")
 
         employees = []
-        for idx, row in df.iterrows():
+        for idx, row in enumerate(self._records(df)):
             # Skip empty rows
             if pd.isna(row.get('User Name*')):
                 continue
@@ -567,11 +634,11 @@ class UnifiedExcelReader:
                 appointment_date = 1718841600000  # Default
 
             # Convert department NAME to CODE
-            dept_name = str(row.get('Department Name*', '')).strip()
+            dept_name = str(row.get('Department Name*') or '').strip()
             department = dept_name_to_code.get(dept_name, dept_name)  # Fallback to name if not found
 
             # Convert designation NAME to CODE
-            desig_name = str(row.get('Designation Name*', '')).strip()
+            desig_name = str(row.get('Designation Name*') or '').strip()
             designation = desig_name_to_code.get(desig_name, desig_name)  # Fallback to name if not found
 
             # Parse roles — accept both role names and role codes, comma/newline-separated.
@@ -617,16 +684,16 @@ class UnifiedExcelReader:
                 continue
 
             # Get boundary info (defaults to City level)
-            hierarchy = str(row.get('Hierarchy Type', 'ADMIN')).strip()
-            boundary_type = str(row.get('Boundary Type', 'City')).strip()
-            boundary = str(row.get('Boundary Code', tenant_id.split('.')[0])).strip()
+            hierarchy = str(row.get('Hierarchy Type') or 'ADMIN').strip()
+            boundary_type = str(row.get('Boundary Type') or 'City').strip()
+            boundary = str(row.get('Boundary Code') or tenant_id.split('.')[0]).strip()
 
             # Build employee object
             emp = {
                 'tenantId': tenant_id,
                 'code': emp_code,
-                'employeeStatus': str(row.get('Employee Status', 'EMPLOYED')).strip(),
-                'employeeType': str(row.get('Employee Type', 'PERMANENT')).strip(),
+                'employeeStatus': str(row.get('Employee Status') or 'EMPLOYED').strip(),
+                'employeeType': str(row.get('Employee Type') or 'PERMANENT').strip(),
                 'dateOfAppointment': appointment_date,
                 'assignments': [{
                     'fromDate': from_date,
@@ -667,11 +734,11 @@ class UnifiedExcelReader:
     def read_localization(self):
         """Read localization with auto-determination of module and locale based on code pattern"""
         try:
-            df = pd.read_excel(self.excel_file, sheet_name='Localization')
+            df = self._read_sheet('Localization')
         except:
             # Try lowercase sheet name
             try:
-                df = pd.read_excel(self.excel_file, sheet_name='localization')
+                df = self._read_sheet('localization')
             except:
                 return []
 
@@ -680,7 +747,7 @@ class UnifiedExcelReader:
 
         localizations = []
 
-        for _, row in df.iterrows():
+        for row in self._records(df):
             # Skip rows with missing required fields
             if pd.notna(row.get('Code')) and pd.notna(row.get('Message')):
                 code = str(row['Code']).strip()
@@ -790,6 +857,10 @@ class APIUploader:
         self.user_info = None
         self.authenticated = False
 
+        # (tenant, module, sha256 of file) -> fileStoreId, so re-running a
+        # phase with the same workbook doesn't upload it again
+        self.uploaded_files = {}
+
         # Auto-authenticate if credentials provided
         if self.username and self.password:
             self.authenticate()
@@ -895,6 +966,40 @@ class APIUploader:
             print(f"❌ Authentication error: {str(e)}")
             return False
 
+    # Optional progress.Progress; set by the notebook UI to drive a progress bar.
+    # None keeps the per-record print lines.
+    progress = None
+
+    def _task(self, name: str, total: int = None):
+        """Start a progress task (one sheet/schema of records)"""
+        if self.progress is not None:
+            self.progress.task(name, total)
+
+    def _row(self, status: str, id=None, message: str = None, error: str = None, advance: bool = True):
+        """Report one record's outcome; prints the message when there is no progress"""
+        if self.progress is not None:
+            self.progress.row(status, id=id, message=message, error=error, advance=advance)
+        elif message:
+            print(message)
+
+    def _batch(self, size: int, status: str, message: str = None, error: str = None):
+        """Report a batch of records sent in one call; prints when there is no progress"""
+        if self.progress is not None:
+            self.progress.batch(size, status, message=message, error=error)
+        elif message:
+            print(message)
+
+    def _cancelled(self) -> bool:
+        """True once the attached progress has been cancelled (notebook Cancel button)"""
+        return self.progress is not None and self.progress.cancelled
+
+    def _wait(self, seconds: float) -> bool:
+        """Sleep, waking early on cancel; True if cancelled"""
+        if self.progress is not None:
+            return self.progress.wait(seconds)
+        time.sleep(seconds)
+        return False
+
     def _extract_error_message(self, error_text: str) -> str:
         """Extract clean error message from API error response
 
@@ -1043,8 +1148,12 @@ class APIUploader:
 
             # Track row-by-row status for Excel update
             row_statuses = []
+            self._task(schema_code, len(data_list))
 
             for i, data_obj in enumerate(data_list, 1):
+                if self._cancelled():
+                    print(f"   ⏹ Cancelled after {i - 1}/{len(data_list)} records")
+                    break
                 unique_id = (
                     data_obj.get('code') or
                     data_obj.get('serviceCode') or
@@ -1078,7 +1187,7 @@ class APIUploader:
                     response = requests.post(url, json=payload, headers=headers)
                     status_code = response.status_code
                     response.raise_for_status()
-                    print(f"   [OK] [{i}/{len(data_list)}] {unique_id}")
+                    self._row("SUCCESS", unique_id, f"   [OK] [{i}/{len(data_list)}] {unique_id}")
                     results['created'] += 1
 
                 except requests.exceptions.HTTPError as e:
@@ -1099,12 +1208,14 @@ class APIUploader:
                         return results
 
                     if 'already exists' in error_text.lower() or 'duplicate' in error_text.lower():
-                        print(f"   [EXISTS] [{i}/{len(data_list)}] {unique_id} (HTTP {status_code})")
+                        self._row("EXISTS", unique_id,
+                                  f"   [EXISTS] [{i}/{len(data_list)}] {unique_id} (HTTP {status_code})")
                         results['exists'] += 1
                         status = "EXISTS"
                     else:
-                        print(f"   [FAILED] [{i}/{len(data_list)}] {unique_id} (HTTP {status_code})")
-                        print(f"   ERROR: {error_message}")
+                        self._row("FAILED", unique_id,
+                                  f"   [FAILED] [{i}/{len(data_list)}] {unique_id} (HTTP {status_code})\n"
+                                  f"   ERROR: {error_message}", error=error_message)
                         results['failed'] += 1
                         results['errors'].append({'id': unique_id, 'error': error_message})
                         status = "FAILED"
@@ -1113,7 +1224,9 @@ class APIUploader:
                     error_message = str(e)[:200]
                     status_code = 0
                     status = "FAILED"
-                    print(f"   [ERROR] [{i}/{len(data_list)}] {unique_id} - {error_message[:100]}")
+                    self._row("FAILED", unique_id,
+                              f"   [ERROR] [{i}/{len(data_list)}] {unique_id} - {error_message[:100]}",
+                              error=error_message)
                     results['failed'] += 1
                     results['errors'].append({'id': unique_id, 'error': error_message})
 
@@ -1704,9 +1817,13 @@ class APIUploader:
         for locale, messages in by_locale.items():
             total_messages = len(messages)
             print(f"   📤 Locale: {locale} - Uploading {total_messages} messages in batches of {BATCH_SIZE}...")
+            self._task(f"localization {locale}", total_messages)
 
             # Split into batches
             for batch_idx in range(0, total_messages, BATCH_SIZE):
+                if self._cancelled():
+                    print(f"      ⏹ Cancelled after {batch_idx}/{total_messages} messages")
+                    break
                 batch = messages[batch_idx:batch_idx + BATCH_SIZE]
                 batch_num = (batch_idx // BATCH_SIZE) + 1
                 total_batches = (total_messages + BATCH_SIZE - 1) // BATCH_SIZE
@@ -1732,7 +1849,8 @@ class APIUploader:
                     response = requests.post(url, json=payload, headers=headers, timeout=120)
                     status_code = response.status_code
                     response.raise_for_status()
-                    print(f"      ✅ Batch {batch_num}/{total_batches}: {len(batch)} messages uploaded")
+                    self._batch(len(batch), "SUCCESS",
+                                f"      ✅ Batch {batch_num}/{total_batches}: {len(batch)} messages uploaded")
                     results['created'] += len(batch)
 
                 except requests.exceptions.HTTPError as e:
@@ -1757,13 +1875,15 @@ class APIUploader:
                         'DUPLICATE_RECORDS' in error_text or
                         'DuplicateMessageIdentityException' in error_text or
                         'unique_message_entry' in error_text.lower()):
-                        print(f"      ⚠️ Batch {batch_num}/{total_batches}: {len(batch)} messages already exist")
+                        self._batch(len(batch), "EXISTS",
+                                    f"      ⚠️ Batch {batch_num}/{total_batches}: {len(batch)} messages already exist")
                         results['exists'] += len(batch)
                         # DON'T add to failed_records - already exists is not a failure!
                     else:
                         # True failure
-                        print(f"      ❌ Batch {batch_num}/{total_batches} FAILED (HTTP {status_code})")
-                        print(f"         ERROR: {error_message}")
+                        self._batch(len(batch), "FAILED",
+                                    f"      ❌ Batch {batch_num}/{total_batches} FAILED (HTTP {status_code})\n"
+                                    f"         ERROR: {error_message}", error=error_message)
                         results['failed'] += len(batch)
                         results['errors'].append({
                             'locale': locale,
@@ -1783,7 +1903,9 @@ class APIUploader:
                 except Exception as e:
                     error_message = str(e)[:200]
                     status_code = 0
-                    print(f"      ❌ Batch {batch_num}/{total_batches} ERROR: {error_message}")
+                    self._batch(len(batch), "FAILED",
+                                f"      ❌ Batch {batch_num}/{total_batches} ERROR: {error_message}",
+                                error=error_message)
                     results['failed'] += len(batch)
                     results['errors'].append({
                         'locale': locale,
@@ -2334,6 +2456,9 @@ class APIUploader:
     def upload_file_to_filestore(self, file_path: str, tenant_id: str, module: str = "HCM-ADMIN-CONSOLE") -> str:
         """Upload file to filestore
 
+        A file already uploaded by this uploader for the same tenant and
+        module with identical contents (SHA-256) reuses its fileStoreId.
+
         Args:
             file_path: Path to file to upload
             tenant_id: Tenant ID
@@ -2343,9 +2468,21 @@ class APIUploader:
             FileStore ID of uploaded file
         """
         import os
+        import hashlib
         url = f"{self.filestore_url}/v1/files"
 
         try:
+            digest = hashlib.sha256()
+            with open(file_path, 'rb') as f:
+                for block in iter(lambda: f.read(1024 * 1024), b''):
+                    digest.update(block)
+            cache_key = (tenant_id, module, digest.hexdigest())
+            if cache_key in self.uploaded_files:
+                filestore_id = self.uploaded_files[cache_key]
+                print(f"\n📎 {os.path.basename(file_path)} unchanged, reusing upload")
+                print(f"   FileStore ID: {filestore_id}")
+                return filestore_id
+
             with open(file_path, 'rb') as f:
                 files = {'file': (os.path.basename(file_path), f, 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet')}
                 data = {
@@ -2369,6 +2506,8 @@ class APIUploader:
                     filestore_id = files_data[0].get('fileStoreId')
                     print(f"✅ File uploaded successfully!")
                     print(f"   FileStore ID: {filestore_id}")
+                    if filestore_id:
+                        self.uploaded_files[cache_key] = filestore_id
                     return filestore_id
                 else:
                     print("❌ No filestore ID in response")
@@ -2521,7 +2660,8 @@ class APIUploader:
                 resources = data.get('ResourceDetails', [])
                 if not resources:
                     print(f"   Attempt {attempt}: No ResourceDetails found yet")
-                    time.sleep(delay)
+                    if self._wait(delay):
+                        break
                     continue
 
                 latest = sorted(resources,
@@ -2556,11 +2696,17 @@ class APIUploader:
                         print(f"   Details: {error_detail[:300]}")
                     return latest
 
-                time.sleep(delay)
+                if self._wait(delay):
+                    break
 
             except Exception as e:
                 print(f"   Attempt {attempt}: Error polling status — {str(e)[:100]}")
-                time.sleep(delay)
+                if self._wait(delay):
+                    break
+
+        if self._cancelled():
+            print(f"\n⏹ Polling cancelled -- the boundary job keeps running on the server")
+            return {'status': 'cancelled'}
 
         print(f"\n⚠️ Polling timed out after {max_attempts} attempts")
         return {}
@@ -3535,8 +3681,12 @@ class APIUploader:
 
         # Track row-by-row status for Excel update
         row_statuses = []
+        self._task("hrms.employees", len(employee_list))
 
         for i, employee in enumerate(employee_list, 1):
+            if self._cancelled():
+                print(f"   ⏹ Cancelled after {i - 1}/{len(employee_list)} employees")
+                break
             emp_code = employee.get('code', str(i))
 
             # Extract custom password before creation (if provided)
@@ -3573,7 +3723,7 @@ class APIUploader:
                 created_data = response.json()
                 created_employee = created_data.get('Employees', [{}])[0]
 
-                print(f"   [OK] [{i}/{len(employee_list)}] {emp_code} - Created")
+                self._row("SUCCESS", emp_code, f"   [OK] [{i}/{len(employee_list)}] {emp_code} - Created")
                 results['created'] += 1
 
                 # STEP 2B: Update password if custom password was provided
@@ -3624,14 +3774,20 @@ class APIUploader:
                             update_response = requests.post(update_url, json=update_payload, headers=headers)
                             update_response.raise_for_status()
 
-                            print(f"   [✓] [{i}/{len(employee_list)}] {emp_code} - Password updated")
+                            self._row("SUCCESS", emp_code,
+                                      f"   [✓] [{i}/{len(employee_list)}] {emp_code} - Password updated",
+                                      advance=False)
                             results['password_updated'] += 1
                         else:
-                            print(f"   [⚠] [{i}/{len(employee_list)}] {emp_code} - Could not fetch employee for password update")
+                            self._row("SUCCESS", emp_code,
+                                      f"   [⚠] [{i}/{len(employee_list)}] {emp_code} - Could not fetch employee for password update",
+                                      advance=False)
 
                     except Exception as pwd_error:
                         # Don't fail the entire creation if password update fails
-                        print(f"   [⚠] [{i}/{len(employee_list)}] {emp_code} - Password update failed: {str(pwd_error)[:100]}")
+                        self._row("SUCCESS", emp_code,
+                                  f"   [⚠] [{i}/{len(employee_list)}] {emp_code} - Password update failed: {str(pwd_error)[:100]}",
+                                  error=str(pwd_error), advance=False)
                         # Status remains SUCCESS since employee was created
 
             except requests.exceptions.HTTPError as e:
@@ -3655,12 +3811,13 @@ class APIUploader:
                     'duplicate' in error_text.lower() or
                     'user_username_unique_key' in error_text.lower() or
                     'eg_user_username_key' in error_text.lower()):
-                    print(f"   [EXISTS] [{i}/{len(employee_list)}] {emp_code} (HTTP {status_code})")
+                    self._row("EXISTS", emp_code, f"   [EXISTS] [{i}/{len(employee_list)}] {emp_code} (HTTP {status_code})")
                     results['exists'] += 1
                     status = "EXISTS"
                 else:
-                    print(f"   [FAILED] [{i}/{len(employee_list)}] {emp_code} (HTTP {status_code})")
-                    print(f"   ERROR: {error_message}")
+                    self._row("FAILED", emp_code,
+                              f"   [FAILED] [{i}/{len(employee_list)}] {emp_code} (HTTP {status_code})\n"
+                              f"   ERROR: {error_message}", error=error_message)
                     results['failed'] += 1
                     results['errors'].append({'id': emp_code, 'error': error_message})
                     status = "FAILED"
@@ -3669,7 +3826,8 @@ class APIUploader:
                 error_message = str(e)[:200]
                 status_code = 0
                 status = "FAILED"
-                print(f"   [ERROR] [{i}/{len(employee_list)}] {emp_code} - {error_message[:100]}")
+                self._row("FAILED", emp_code, f"   [ERROR] [{i}/{len(employee_list)}] {emp_code} - {error_message[:100]}",
+                          error=error_message)
                 results['failed'] += 1
                 results['errors'].append({'id': emp_code, 'error': error_message})
 